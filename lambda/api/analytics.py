@@ -0,0 +1,188 @@
+"""
+NFL Tackle Leaders - Vectorized Leader Analytics
+Per-game rates, pace projections and historical percentile bands computed in
+batch over a (season, week, stat) NumPy cube
+"""
+from typing import Dict, Any, List, Iterable, Optional
+import numpy as np
+from models import LeaderRecord
+
+MAX_WEEKS = 18
+SEASON_GAMES = 17
+BAND_PERCENTILES = [10, 50, 90]
+
+
+class HistoryCube:
+    """
+    Leader values indexed by (season, week, stat)
+
+    stat_value is the leader's season-to-date total, so values[s, w, k] is
+    the #1 total after week w + 1. Missing weeks are NaN.
+    """
+
+    def __init__(self, seasons: List[str], stats: List[str], values: np.ndarray):
+        self.seasons = seasons
+        self.stats = stats
+        self.values = values
+        self.season_index = {season: i for i, season in enumerate(seasons)}
+        self.stat_index = {stat: i for i, stat in enumerate(stats)}
+
+
+def build_cube(items: Iterable[LeaderRecord]) -> HistoryCube:
+    """
+    Load leader items into a dense NumPy cube
+
+    Args:
+        items: Leader records (any seasons and stats)
+
+    Returns:
+        HistoryCube: values shaped (seasons, MAX_WEEKS, stats)
+    """
+    items = list(items)
+    seasons = sorted({str(item.season) for item in items})
+    stats = sorted({item.stat_type for item in items})
+    season_index = {season: i for i, season in enumerate(seasons)}
+    stat_index = {stat: i for i, stat in enumerate(stats)}
+
+    count = len(items)
+    s_idx = np.fromiter((season_index[str(item.season)] for item in items), dtype=np.intp, count=count)
+    w_idx = np.fromiter((item.week - 1 for item in items), dtype=np.intp, count=count)
+    k_idx = np.fromiter((stat_index[item.stat_type] for item in items), dtype=np.intp, count=count)
+    vals = np.fromiter((float(item.value) for item in items), dtype=np.float64, count=count)
+
+    values = np.full((len(seasons), MAX_WEEKS, len(stats)), np.nan)
+    in_range = (w_idx >= 0) & (w_idx < MAX_WEEKS)
+    values[s_idx[in_range], w_idx[in_range], k_idx[in_range]] = vals[in_range]
+
+    return HistoryCube(seasons, stats, values)
+
+
+def compute_metrics(cube: HistoryCube) -> Dict[str, np.ndarray]:
+    """
+    Compute every metric for every season, week and stat at once
+
+    Per-game rates divide by the week number (bye weeks are not modelled).
+    Projection bands scale the current total by the historical spread of
+    final_total / total_at_week over completed seasons.
+
+    Args:
+        cube: History cube
+
+    Returns:
+        dict: per_game and pace (S, W, K); value_bands and ratio_bands (3, W, K)
+    """
+    values = cube.values
+    games = np.arange(1, MAX_WEEKS + 1, dtype=np.float64)[None, :, None]
+
+    per_game = values / games
+    pace = per_game * SEASON_GAMES
+
+    # Completed seasons are those with a final-week value
+    final = values[:, -1:, :]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratio = np.where(values > 0, final / values, np.nan)
+
+    return {
+        'per_game': per_game,
+        'pace': pace,
+        'value_bands': nan_percentiles(values, BAND_PERCENTILES),
+        'ratio_bands': nan_percentiles(ratio, BAND_PERCENTILES)
+    }
+
+
+def nan_percentiles(values: np.ndarray, percentiles: List[float]) -> np.ndarray:
+    """
+    Linear-interpolation percentiles over axis 0, ignoring NaN
+
+    Equivalent to np.nanpercentile(values, percentiles, axis=0), but done
+    with one sort and a gather instead of a per-slice Python loop.
+
+    Args:
+        values: Array shaped (N, ...)
+        percentiles: Percentiles in [0, 100]
+
+    Returns:
+        np.ndarray: Shaped (len(percentiles), ...); NaN where no values exist
+    """
+    ordered = np.sort(values, axis=0)  # NaN sorts last
+    valid = np.sum(~np.isnan(values), axis=0)
+
+    fractions = np.asarray(percentiles, dtype=np.float64).reshape((-1,) + (1,) * valid.ndim) / 100
+    ranks = (np.maximum(valid, 1) - 1) * fractions
+    low = np.floor(ranks).astype(np.intp)
+    high = np.minimum(low + 1, np.maximum(valid - 1, 0)[None, ...])
+    fraction = ranks - low
+
+    bands = []
+    for i in range(len(percentiles)):
+        low_values = np.take_along_axis(ordered, low[i][None, ...], axis=0)[0]
+        high_values = np.take_along_axis(ordered, high[i][None, ...], axis=0)[0]
+        bands.append(low_values + (high_values - low_values) * fraction[i])
+
+    result = np.stack(bands)
+    result[:, valid == 0] = np.nan
+    return result
+
+
+def stat_report(cube: HistoryCube, metrics: Dict[str, np.ndarray],
+                season: str, stat_type: str) -> Optional[Dict[str, Any]]:
+    """
+    Slice the precomputed metrics for one season and stat
+
+    Args:
+        cube: History cube
+        metrics: Output of compute_metrics
+        season: Season to report on
+        stat_type: Stat to report on
+
+    Returns:
+        dict: JSON-ready report, or None if the season/stat has no data
+    """
+    s = cube.season_index.get(season)
+    k = cube.stat_index.get(stat_type)
+    if s is None or k is None:
+        return None
+
+    values = cube.values[s, :, k]
+    recorded = np.flatnonzero(~np.isnan(values))
+    if recorded.size == 0:
+        return None
+
+    latest = int(recorded[-1])
+    low, mid, high = (values[latest] * metrics['ratio_bands'][:, latest, k]).tolist()
+
+    weeks = [
+        {
+            'week': int(w) + 1,
+            'value': _number(values[w]),
+            'per_game': _number(metrics['per_game'][s, w, k]),
+            'pace': _number(metrics['pace'][s, w, k]),
+            'history_p10': _number(metrics['value_bands'][0, w, k]),
+            'history_p50': _number(metrics['value_bands'][1, w, k]),
+            'history_p90': _number(metrics['value_bands'][2, w, k])
+        }
+        for w in recorded
+    ]
+
+    return {
+        'season': season,
+        'stat_type': stat_type,
+        'seasons_in_history': len(cube.seasons),
+        'latest_week': latest + 1,
+        'projection': {
+            'games': SEASON_GAMES,
+            'pace': _number(metrics['pace'][s, latest, k]),
+            'p10': _number(low),
+            'p50': _number(mid),
+            'p90': _number(high)
+        },
+        'weeks': weeks
+    }
+
+
+def _number(value) -> Optional[float]:
+    """Round a NumPy scalar for JSON, mapping NaN to None"""
+    value = float(value)
+    if np.isnan(value):
+        return None
+    return round(value, 3)
@@ -0,0 +1,362 @@
+"""
+NFL Tackle Leaders - API DynamoDB access
+Query helpers used when no SQLite snapshot is available
+"""
+from datetime import datetime
+from decimal import Decimal
+import os
+import time
+from typing import Dict, Any, Callable, List, Optional, Tuple
+import boto3
+from boto3.dynamodb.conditions import Key
+from models import LeaderRecord
+from telemetry import registry
+from tracked_stats import TRACKED_STATS
+
+# Environment variables
+TABLE_NAME = os.environ['TABLE_NAME']
+DIMENSION_CACHE_SECONDS = int(os.environ.get('DIMENSION_CACHE_SECONDS', '900'))
+
+# Unknown IDs trigger a reload (a new player was just stored), at most this often
+DIMENSION_MISS_RELOAD_SECONDS = 30
+
+# Dimension partitions written by ingest: PK -> descriptive attributes
+PLAYER_PARTITION = 'DIM#PLAYER'
+TEAM_PARTITION = 'DIM#TEAM'
+DIMENSION_ATTRIBUTES = {
+    PLAYER_PARTITION: ('player_name', 'player_short_name'),
+    TEAM_PARTITION: ('team_name', 'team_abbreviation')
+}
+
+# Append-only change log written by ingest (SK = SEQ#<zero-padded sequence>)
+CHANGE_LOG_PARTITION = 'CHANGELOG'
+
+# Player search prefix index written by ingest (gzip-compressed JSON)
+SEARCH_INDEX_KEY = {'PK': {'S': 'INDEX#SEARCH'}, 'SK': {'S': 'PLAYER'}}
+
+# Warm-container cache of player/team names joined onto leader facts
+_dimension_cache = {'loaded_at': 0.0, 'expires_at': 0.0, 'dimensions': None}
+
+# AWS clients (leader and dimension queries use the low-level client so items
+# are parsed straight into LeaderRecords instead of through boto3's
+# TypeDeserializer)
+dynamodb = boto3.resource('dynamodb')
+table = dynamodb.Table(TABLE_NAME)
+client = boto3.client('dynamodb')
+
+
+def query_season_items(season: str) -> List[LeaderRecord]:
+    """
+    Get every leader for a season
+
+    Args:
+        season: NFL season (e.g., "2025")
+
+    Returns:
+        list: Leader records
+    """
+    return _query_leaders(
+        KeyConditionExpression='PK = :pk AND begins_with(SK, :prefix)',
+        ExpressionAttributeValues={':pk': {'S': f"SEASON#{season}"}, ':prefix': {'S': 'WEEK#'}}
+    )
+
+
+def query_week_items(season: str, week: int) -> List[LeaderRecord]:
+    """
+    Get the leaders for one week
+
+    Args:
+        season: NFL season
+        week: Week number (1-18)
+
+    Returns:
+        list: Leader records
+    """
+    return _query_leaders(
+        KeyConditionExpression='PK = :pk AND begins_with(SK, :prefix)',
+        ExpressionAttributeValues={':pk': {'S': f"SEASON#{season}"}, ':prefix': {'S': f"WEEK#{week:02d}#"}}
+    )
+
+
+def query_stat_items(stat_type: str) -> List[LeaderRecord]:
+    """
+    Get every leader for a stat type via the StatTypeIndex GSI
+
+    Args:
+        stat_type: TOTAL_TACKLES or SACKS
+
+    Returns:
+        list: Leader records
+    """
+    return _query_leaders(
+        IndexName='StatTypeIndex',
+        KeyConditionExpression='stat_type = :stat_type',
+        ExpressionAttributeValues={':stat_type': {'S': stat_type}}
+    )
+
+
+def query_leader_items() -> List[LeaderRecord]:
+    """
+    Get every leader for every season and stat
+
+    Reads each stat type's StatTypeIndex partition rather than scanning:
+    only leader facts are in the index, so the per-game player lines and
+    change-log entries sharing the table are never read or billed.
+
+    Returns:
+        list: Leader records
+    """
+    records = []
+    for stat_type in TRACKED_STATS:
+        records.extend(query_stat_items(stat_type))
+    return records
+
+
+def query_season_summaries(season: str) -> List[Dict[str, Any]]:
+    """
+    Get the incrementally maintained summary item of every stat in a season
+
+    Args:
+        season: NFL season
+
+    Returns:
+        list: Raw DynamoDB summary items
+    """
+    return _query_all(
+        KeyConditionExpression=Key('PK').eq(f"SUMMARY#{season}")
+    )
+
+
+def query_changes_after(sequence: int, limit: int) -> Tuple[List[Dict[str, Any]], bool]:
+    """
+    Get change-log entries with a sequence greater than the given one
+
+    Args:
+        sequence: Last sequence the client has applied (0 for everything)
+        limit: Maximum entries to return
+
+    Returns:
+        tuple: (changes in sequence order, whether more are available)
+    """
+    request = {
+        'TableName': TABLE_NAME,
+        'KeyConditionExpression': 'PK = :pk AND SK > :after',
+        'ExpressionAttributeValues': {
+            ':pk': {'S': CHANGE_LOG_PARTITION},
+            ':after': {'S': f"SEQ#{sequence:012d}"}
+        },
+        'Limit': limit + 1
+    }
+    entries = []
+
+    while len(entries) <= limit:
+        response = _call(client.query, request)
+        entries.extend(response.get('Items', []))
+
+        last_key = response.get('LastEvaluatedKey')
+        if not last_key:
+            break
+        request['ExclusiveStartKey'] = last_key
+
+    return _parse_changes(entries[:limit]), len(entries) > limit
+
+
+def query_changes_since(timestamp: datetime, limit: int) -> Tuple[List[Dict[str, Any]], bool, int]:
+    """
+    Get change-log entries logged after a point in time
+
+    Reads the log newest-first and stops at the first older entry, so the
+    cost is proportional to the number of changes since the timestamp.
+
+    Args:
+        timestamp: Timezone-aware lower bound (exclusive)
+        limit: Maximum entries to return (the oldest ones first)
+
+    Returns:
+        tuple: (changes in sequence order, whether more are available,
+                sequence of the newest entry at or before the timestamp)
+    """
+    request = {
+        'TableName': TABLE_NAME,
+        'KeyConditionExpression': 'PK = :pk',
+        'ExpressionAttributeValues': {':pk': {'S': CHANGE_LOG_PARTITION}},
+        'ScanIndexForward': False,
+        'Limit': 100
+    }
+    newer = []
+    floor = None
+
+    while floor is None:
+        response = _call(client.query, request)
+        for entry in response.get('Items', []):
+            if datetime.fromisoformat(entry['changed_at']['S']) <= timestamp:
+                floor = int(entry['sequence']['N'])
+                break
+            newer.append(entry)
+
+        last_key = response.get('LastEvaluatedKey')
+        if not last_key:
+            break
+        request['ExclusiveStartKey'] = last_key
+
+    newer.reverse()
+    return _parse_changes(newer[:limit]), len(newer) > limit, floor or 0
+
+
+def load_dimensions(force: bool = False) -> Dict[str, Dict[str, Tuple]]:
+    """
+    Get every player and team name, cached per container
+
+    Args:
+        force: Reload even if the cache has not expired
+
+    Returns:
+        dict: partition -> {id: descriptive attribute values}
+    """
+    now = time.monotonic()
+    hit = not force and _dimension_cache['dimensions'] is not None and now < _dimension_cache['expires_at']
+    registry.record_cache('dimensions', hit)
+    if not hit:
+        dimensions = {}
+        for partition, attributes in DIMENSION_ATTRIBUTES.items():
+            dimensions[partition] = {}
+            request = {
+                'TableName': TABLE_NAME,
+                'KeyConditionExpression': 'PK = :pk',
+                'ProjectionExpression': ', '.join(('SK',) + attributes),
+                'ExpressionAttributeValues': {':pk': {'S': partition}}
+            }
+            while True:
+                response = _call(client.query, request)
+                for item in response.get('Items', []):
+                    dimensions[partition][item['SK']['S']] = tuple(
+                        item.get(attribute, {}).get('S') for attribute in attributes
+                    )
+                last_key = response.get('LastEvaluatedKey')
+                if not last_key:
+                    break
+                request['ExclusiveStartKey'] = last_key
+
+        _dimension_cache.update(
+            dimensions=dimensions,
+            loaded_at=now,
+            expires_at=now + DIMENSION_CACHE_SECONDS
+        )
+
+    return _dimension_cache['dimensions']
+
+
+def get_search_index(known_version: int = 0) -> Tuple[int, Optional[bytes]]:
+    """
+    Get the player search index item
+
+    The version is read first (a small projected read) and the index body
+    only when it differs from the one the caller already has.
+
+    Args:
+        known_version: Version the caller has cached (0 for none)
+
+    Returns:
+        tuple: (version, gzip-compressed index or None if unchanged or
+            never written)
+    """
+    item = _call(client.get_item, {
+        'TableName': TABLE_NAME,
+        'Key': SEARCH_INDEX_KEY,
+        'ProjectionExpression': 'version'
+    }).get('Item')
+    version = int(item['version']['N']) if item else 0
+    if not version or version == known_version:
+        return version, None
+
+    item = _call(client.get_item, {'TableName': TABLE_NAME, 'Key': SEARCH_INDEX_KEY}).get('Item')
+    return int(item['version']['N']), item['index']['B']
+
+
+def join_dimensions(records: List[LeaderRecord]) -> List[LeaderRecord]:
+    """
+    Fill leader facts' player/team names from the dimension cache
+
+    Facts written before the dimension split keep their own names when
+    no dimension item exists.
+
+    Args:
+        records: Leader records parsed from facts
+
+    Returns:
+        list: The same records, joined in place
+    """
+    dimensions = load_dimensions()
+
+    if time.monotonic() - _dimension_cache['loaded_at'] >= DIMENSION_MISS_RELOAD_SECONDS and any(
+        (record.player_name is None and record.player_id is not None
+         and record.player_id not in dimensions[PLAYER_PARTITION])
+        or (record.team_name is None and record.team_id is not None
+            and record.team_id not in dimensions[TEAM_PARTITION])
+        for record in records
+    ):
+        dimensions = load_dimensions(force=True)
+
+    players = dimensions[PLAYER_PARTITION]
+    teams = dimensions[TEAM_PARTITION]
+    for record in records:
+        player = players.get(record.player_id)
+        if player is not None:
+            record.player_name, record.player_short_name = player
+        team = teams.get(record.team_id)
+        if team is not None:
+            record.team_name, record.team_abbreviation = team
+
+    return records
+
+
+def _parse_changes(entries: List[Dict[str, Dict[str, str]]]) -> List[Dict[str, Any]]:
+    """Parse low-level change-log entries (joining the leaders' names)"""
+    changes = [
+        {
+            'sequence': int(entry['sequence']['N']),
+            'changed_at': entry['changed_at']['S'],
+            'record': LeaderRecord.from_attribute_map(entry['leader']['M']),
+            'previous_player_id': entry.get('previous_player_id', {}).get('S'),
+            'previous_value': Decimal(entry['previous_value']['N']) if 'N' in entry.get('previous_value', {}) else None
+        }
+        for entry in entries
+    ]
+    join_dimensions([change['record'] for change in changes])
+    return changes
+
+
+def _query_leaders(**request) -> List[LeaderRecord]:
+    """Run a low-level leader query until LastEvaluatedKey is exhausted"""
+    records = []
+    request['TableName'] = TABLE_NAME
+
+    while True:
+        response = _call(client.query, request)
+        records.extend(LeaderRecord.from_attribute_map(item) for item in response.get('Items', []))
+
+        last_key = response.get('LastEvaluatedKey')
+        if not last_key:
+            return join_dimensions(records)
+        request['ExclusiveStartKey'] = last_key
+
+
+def _query_all(**request) -> List[Dict[str, Any]]:
+    """Run a query until LastEvaluatedKey is exhausted"""
+    items = []
+
+    while True:
+        response = _call(table.query, request)
+        items.extend(response.get('Items', []))
+
+        last_key = response.get('LastEvaluatedKey')
+        if not last_key:
+            return items
+        request['ExclusiveStartKey'] = last_key
+
+
+def _call(operation: Callable, request: Dict[str, Any]) -> Dict[str, Any]:
+    """Run a DynamoDB read, recording the call and the read units it consumed"""
+    response = operation(ReturnConsumedCapacity='TOTAL', **request)
+    registry.record_dynamodb(operation.__name__, response.get('ConsumedCapacity', {}).get('CapacityUnits', 0.0))
+    return response
@@ -2,13 +2,28 @@
 NFL Tackle Leaders - API Lambda Handler
 Serves data from DynamoDB via Lambda Function URL
 """
+import base64
+from concurrent.futures import Future, ThreadPoolExecutor
+import contextvars
+from datetime import datetime, timezone
 from decimal import Decimal
+import hmac
 import json
 import os
 import logging
-from typing import Dict, Any, List, Optional
-import boto3
-from boto3.dynamodb.conditions import Key
+import re
+import threading
+import time
+from typing import Dict, Any, Callable, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+import analytics
+import dynamodb_client
+from models import LeaderRecord
+from profiling import profiled
+import search
+import snapshot
+import telemetry
+from tracked_stats import TRACKED_STATS
 
 # Configure logging
 logger = logging.getLogger()
@@ -22,15 +37,157 @@ class DecimalEncoder(json.JSONEncoder):
             return int(obj) if obj % 1 == 0 else float(obj)
         return super(DecimalEncoder, self).default(obj)
 
+# /changes page size
+DEFAULT_CHANGES_LIMIT = 500
+MAX_CHANGES_LIMIT = 1000
+
+# /search result count
+DEFAULT_SEARCH_LIMIT = 10
+MAX_SEARCH_LIMIT = 50
+
 # Environment variables
-TABLE_NAME = os.environ['TABLE_NAME']
 CURRENT_SEASON = os.environ['CURRENT_SEASON']
+ANALYTICS_CACHE_SECONDS = int(os.environ.get('ANALYTICS_CACHE_SECONDS', '300'))
+RESPONSE_CACHE_SECONDS = int(os.environ.get('RESPONSE_CACHE_SECONDS', '60'))
+WARMUP_ON_INIT = os.environ.get('WARMUP_ON_INIT', 'false').lower() == 'true'
+WARMUP_BUDGET_SECONDS = float(os.environ.get('WARMUP_BUDGET_SECONDS', '3'))
+BATCH_MAX_PATHS = int(os.environ.get('BATCH_MAX_PATHS', '10'))
+INTERNAL_ROUTES_TOKEN = os.environ.get('INTERNAL_ROUTES_TOKEN')  # unset: /metrics and /debug/stats are off
+
+# Warm-container cache of the analytics cube and its computed metrics
+_analytics_cache = {'expires_at': 0.0, 'cube': None, 'metrics': None}
+
+# Warm-container cache of fully built responses for the hottest paths
+# (path -> (expires_at, response)), seeded during init by warm_up()
+_response_cache: Dict[str, Any] = {}
+
+# Data-access results shared by the paths of the /batch request being served
+_batch_queries: contextvars.ContextVar = contextvars.ContextVar('batch_queries', default=None)
+
+
+class SharedQueries:
+    """Runs each distinct data-access call once per batch, even when requested concurrently"""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._results: Dict[str, Future] = {}
+        self.shared = 0
+    
+    def run(self, func: Callable, *args):
+        key = f"{func.__module__}.{func.__name__}:{json.dumps(args, sort_keys=True, default=str)}"
+        
+        with self._lock:
+            future = self._results.get(key)
+            owner = future is None
+            if owner:
+                future = self._results[key] = Future()
+            else:
+                self.shared += 1
+        
+        if owner:
+            try:
+                future.set_result(func(*args))
+            except Exception as e:
+                future.set_exception(e)
+        
+        return future.result()
+
+
+# Route table: (methods, path pattern, handler). {name:type} segments are
+# path parameters; handlers get a request dict with method, params, query,
+# filters and event. HEAD and OPTIONS are answered by the router itself.
+ROUTES = [
+    (('GET',), '/', lambda request: cached_response('/current', get_current_week_leaders)),
+    (('GET',), '/current', lambda request: cached_response('/current', get_current_week_leaders)),
+    (('GET',), '/week/{week:int}', lambda request: get_week_leaders(request['params']['week'])),
+    (('GET',), '/season', lambda request: get_season_leaders(request['filters'])),
+    (('GET',), '/season/summary', lambda request: cached_response('/season/summary', get_season_summary)),
+    (('GET',), '/stat/{stat_type:upper}',
+     lambda request: get_stat_history(request['params']['stat_type'], request['filters'])),
+    (('GET',), '/analytics/{stat_type:upper}',
+     lambda request: get_stat_analytics(request['params']['stat_type'])),
+    (('GET',), '/changes', lambda request: get_changes(request['query'])),
+    (('GET',), '/search', lambda request: get_search(request['query'])),
+    (('GET', 'POST'), '/batch', lambda request: get_batch(request['method'], request['query'], request['event'])),
+    (('GET',), '/metrics', lambda request: internal_route(request, get_metrics)),
+    (('GET',), '/debug/stats', lambda request: internal_route(request, get_debug_stats)),
+    (('GET',), '/health', lambda request: success_response({'status': 'healthy'}))
+]
+
+# Path parameter type -> converter (a ValueError means a 400)
+PATH_PARAMETER_TYPES = {'int': int, 'str': str, 'upper': str.upper}
+
+PATH_PARAMETER_PATTERN = re.compile(r'\{(\w+):(\w+)\}')
+
+# Seconds browsers may reuse a preflight answer
+PREFLIGHT_MAX_AGE = '86400'
+
 
-# AWS clients
-dynamodb = boto3.resource('dynamodb')
-table = dynamodb.Table(TABLE_NAME)
+def compile_routes(routes: List[Tuple]) -> Tuple[Dict[str, Tuple], List[Tuple]]:
+    """
+    Compile the route table for matching
+    
+    Static paths go in a dict (one lookup); parameterized paths become
+    anchored regexes tried in table order.
+    
+    Args:
+        routes: ROUTES-style (methods, pattern, handler) entries
+    
+    Returns:
+        tuple: (path -> (methods, handler, pattern),
+                [(regex, converters, methods, handler, pattern)])
+    """
+    static, dynamic = {}, []
+    
+    for methods, pattern, handler in routes:
+        methods = frozenset(methods)
+        converters = {name: PATH_PARAMETER_TYPES[kind] for name, kind in PATH_PARAMETER_PATTERN.findall(pattern)}
+        if not converters:
+            static[pattern] = (methods, handler, pattern)
+            continue
+        
+        regex = re.compile('^' + PATH_PARAMETER_PATTERN.sub(
+            lambda match: f"(?P<{match.group(1)}>[^/]+)", pattern) + '$')
+        dynamic.append((regex, converters, methods, handler, pattern))
+    
+    return static, dynamic
 
 
+_static_routes, _dynamic_routes = compile_routes(ROUTES)
+
+
+def match_route(path: str) -> Optional[Tuple[frozenset, Callable, Dict[str, Any], str]]:
+    """
+    Find the route for a path and convert its path parameters
+    
+    Args:
+        path: Request path
+    
+    Returns:
+        tuple: (allowed methods, handler, path parameters, route pattern) or None
+    
+    Raises:
+        ValueError: If a path parameter does not convert to its type
+    """
+    route = _static_routes.get(path)
+    if route is not None:
+        return route[0], route[1], {}, route[2]
+    
+    for regex, converters, methods, handler, pattern in _dynamic_routes:
+        match = regex.match(path)
+        if match:
+            params = {}
+            for name, value in match.groupdict().items():
+                try:
+                    params[name] = converters[name](value)
+                except ValueError:
+                    raise ValueError(f"Invalid {name}: {value}")
+            return methods, handler, params, pattern
+    
+    return None
+
+
+@profiled
 def lambda_handler(event, context):
     """
     Main API handler - routes requests to appropriate functions
@@ -39,7 +196,23 @@ def lambda_handler(event, context):
     - GET /current - Get current week leaders
     - GET /week/{week_number} - Get specific week leaders
     - GET /season - Get all weeks for season
+    - GET /season/summary - Get weeks led, streaks and leader changes
     - GET /stat/{stat_type} - Get all weeks for a stat type
+    - GET /analytics/{stat_type} - Get per-game rates, pace and projections
+    - GET /changes?since={sequence|timestamp} - Get leader changes for incremental sync
+    - GET /batch?paths=/current,/stat/SACKS (or POST {"paths": [...]}) -
+      Run several read routes concurrently and return all their responses
+    - GET /metrics - Get this container's metrics (Prometheus text format)
+    - GET /debug/stats - Get the same metrics as JSON
+    (both internal: only with INTERNAL_ROUTES_TOKEN as a bearer token)
+    
+    /season and /stat accept optional player, team, from_week and
+    to_week query parameters. OPTIONS (CORS preflight) and HEAD on any
+    route are answered without touching the data; other methods get 405.
+    
+    Reads come from the SQLite snapshot when one is published, and
+    from DynamoDB otherwise. /current and /season/summary responses are
+    cached per container (and prefetched during init with WARMUP_ON_INIT).
     
     Args:
         event: Lambda event (from Function URL)
@@ -48,43 +221,77 @@ def lambda_handler(event, context):
     Returns:
         dict: HTTP response
     """
+    start = time.perf_counter()
+    
+    # /batch routes its paths through here too; only the outer call is an invocation
+    if _batch_queries.get() is None:
+        telemetry.registry.record_invocation()
+    
+    http_method = event.get('requestContext', {}).get('http', {}).get('method', 'GET').upper()
+    route, response = dispatch(http_method, event)
+    
+    telemetry.registry.observe_request(route or 'unmatched', http_method, response['statusCode'],
+                                       time.perf_counter() - start)
+    return response
+
+
+def dispatch(http_method: str, event: Dict[str, Any]) -> Tuple[Optional[str], Dict[str, Any]]:
+    """
+    Route a request to its handler
+    
+    Args:
+        http_method: Upper-case HTTP method
+        event: Lambda event
+    
+    Returns:
+        tuple: (matched route pattern or None, HTTP response)
+    """
+    pattern = None
+    
     try:
         # Parse request
-        http_method = event.get('requestContext', {}).get('http', {}).get('method', 'GET')
         raw_path = event.get('rawPath', '/')
         query_params = event.get('queryStringParameters') or {}
         
         logger.info(f"Request: {http_method} {raw_path}")
         logger.info(f"Query params: {query_params}")
         
-        # Route based on path
-        if raw_path == '/current' or raw_path == '/':
-            return get_current_week_leaders()
+        try:
+            route = match_route(raw_path)
+        except ValueError as e:
+            return None, error_response(400, str(e))
         
-        elif raw_path.startswith('/week/'):
-            week_str = raw_path.split('/')[-1]
-            try:
-                week = int(week_str)
-                return get_week_leaders(week)
-            except ValueError:
-                return error_response(400, f"Invalid week number: {week_str}")
+        if route is None:
+            return None, error_response(404, f"Endpoint not found: {raw_path}")
         
-        elif raw_path == '/season':
-            return get_season_leaders()
+        methods, handler, params, pattern = route
         
-        elif raw_path.startswith('/stat/'):
-            stat_type = raw_path.split('/')[-1].upper()
-            return get_stat_history(stat_type)
+        # Answered from the route table alone: no data access
+        if http_method == 'OPTIONS':
+            return pattern, preflight_response(methods)
+        if http_method == 'HEAD' and 'GET' in methods:
+            return pattern, dict(success_response({}), body='')
+        if http_method not in methods:
+            response = error_response(405, f"Method {http_method} not allowed for {raw_path}")
+            response['headers']['Allow'] = allowed_methods(methods)
+            return pattern, response
         
-        elif raw_path == '/health':
-            return success_response({'status': 'healthy'})
+        try:
+            filters = parse_filters(query_params)
+        except ValueError as e:
+            return pattern, error_response(400, str(e))
         
-        else:
-            return error_response(404, f"Endpoint not found: {raw_path}")
+        return pattern, handler({
+            'method': http_method,
+            'params': params,
+            'query': query_params,
+            'filters': filters,
+            'event': event
+        })
         
     except Exception as e:
         logger.error(f"Error in lambda_handler: {str(e)}", exc_info=True)
-        return error_response(500, str(e))
+        return pattern, error_response(500, str(e))
 
 
 def get_current_week_leaders() -> Dict[str, Any]:
@@ -95,24 +302,23 @@ def get_current_week_leaders() -> Dict[str, Any]:
         dict: HTTP response with current week leaders
     """
     try:
-        # Query all items for current season
-        response = table.query(
-            KeyConditionExpression=Key('PK').eq(f"SEASON#{CURRENT_SEASON}")
-        )
+        current_leaders = shared_query(snapshot.query_current_week_items, CURRENT_SEASON)
         
-        items = response.get('Items', [])
+        if current_leaders is None:
+            # Query all items for current season
+            items = shared_query(dynamodb_client.query_season_items, CURRENT_SEASON)
+            
+            # Filter to just the most recent week's leaders
+            max_week = max((item.week for item in items), default=None)
+            current_leaders = [
+                item for item in items 
+                if item.week == max_week
+            ]
         
-        if not items:
+        if not current_leaders:
             return error_response(404, "No data found for current season")
         
-        # Find the most recent week
-        max_week = max(item['week_number'] for item in items)
-        
-        # Filter to just that week's leaders
-        current_leaders = [
-            item for item in items 
-            if item['week_number'] == max_week
-        ]
+        max_week = current_leaders[0].week
         
         return success_response({
             'season': CURRENT_SEASON,
@@ -140,12 +346,9 @@ def get_week_leaders(week: int) -> Dict[str, Any]:
             return error_response(400, "Week must be between 1 and 18")
         
         # Query for specific week
-        response = table.query(
-            KeyConditionExpression=Key('PK').eq(f"SEASON#{CURRENT_SEASON}") & 
-                                  Key('SK').begins_with(f"WEEK#{week:02d}#")
-        )
-        
-        items = response.get('Items', [])
+        items = shared_query(snapshot.query_week_items, CURRENT_SEASON, week)
+        if items is None:
+            items = shared_query(dynamodb_client.query_week_items, CURRENT_SEASON, week)
         
         if not items:
             return error_response(404, f"No data found for week {week}")
@@ -161,20 +364,21 @@ def get_week_leaders(week: int) -> Dict[str, Any]:
         return error_response(500, str(e))
 
 
-def get_season_leaders() -> Dict[str, Any]:
+def get_season_leaders(filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
     Get all leaders for entire season
     
+    Args:
+        filters: Optional player/team/week range filters
+    
     Returns:
         dict: HTTP response with all season data
     """
     try:
         # Query all items for current season
-        response = table.query(
-            KeyConditionExpression=Key('PK').eq(f"SEASON#{CURRENT_SEASON}")
-        )
-        
-        items = response.get('Items', [])
+        items = shared_query(snapshot.query_season_items, CURRENT_SEASON, filters)
+        if items is None:
+            items = filter_items(shared_query(dynamodb_client.query_season_items, CURRENT_SEASON), filters)
         
         if not items:
             return error_response(404, "No data found for current season")
@@ -182,7 +386,7 @@ def get_season_leaders() -> Dict[str, Any]:
         # Group by week
         weeks_data = {}
         for item in items:
-            week = item['week_number']
+            week = item.week
             if week not in weeks_data:
                 weeks_data[week] = []
             weeks_data[week].append(item)
@@ -207,40 +411,60 @@ def get_season_leaders() -> Dict[str, Any]:
         return error_response(500, str(e))
 
 
-def get_stat_history(stat_type: str) -> Dict[str, Any]:
+def get_season_summary() -> Dict[str, Any]:
+    """
+    Get the per-stat season aggregates maintained by ingest
+    
+    Returns:
+        dict: HTTP response with weeks led, streaks and leader changes
+    """
+    try:
+        items = shared_query(dynamodb_client.query_season_summaries, CURRENT_SEASON)
+        
+        if not items:
+            return error_response(404, "No summary found for current season")
+        
+        return success_response({
+            'season': CURRENT_SEASON,
+            'stats': [format_summary_item(item) for item in sorted(items, key=lambda x: x['summary_stat'])]
+        })
+        
+    except Exception as e:
+        logger.error(f"Error getting season summary: {str(e)}")
+        return error_response(500, str(e))
+
+
+def get_stat_history(stat_type: str, filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
     Get history for a specific stat across all weeks
     
     Args:
         stat_type: TOTAL_TACKLES or SACKS
+        filters: Optional player/team/week range filters
     
     Returns:
         dict: HTTP response with stat history
     """
     try:
-        valid_stats = ['TOTAL_TACKLES', 'SACKS']
-        if stat_type not in valid_stats:
-            return error_response(400, f"Invalid stat type. Must be: {', '.join(valid_stats)}")
-        
-        # Use GSI to query by stat_type
-        response = table.query(
-            IndexName='StatTypeIndex',
-            KeyConditionExpression=Key('stat_type').eq(stat_type)
-        )
+        if stat_type not in TRACKED_STATS:
+            return error_response(400, f"Invalid stat type. Must be: {', '.join(TRACKED_STATS)}")
         
-        items = response.get('Items', [])
+        items = shared_query(snapshot.query_stat_items, stat_type, filters)
+        if items is None:
+            # Use GSI to query by stat_type
+            items = filter_items(shared_query(dynamodb_client.query_stat_items, stat_type), filters)
         
         if not items:
             return error_response(404, f"No data found for {stat_type}")
         
         # Sort by week
-        items_sorted = sorted(items, key=lambda x: x['week_number'])
+        items_sorted = sorted(items, key=lambda x: x.week)
         
         return success_response({
             'season': CURRENT_SEASON,
             'stat_type': stat_type,
             'total_weeks': len(items_sorted),
-            'history': [format_leader_item(item) for item in items_sorted]
+            'history': format_leaders(items_sorted)
         })
         
     except Exception as e:
@@ -248,49 +472,491 @@ def get_stat_history(stat_type: str) -> Dict[str, Any]:
         return error_response(500, str(e))
 
 
-def format_leaders(items: List[Dict]) -> List[Dict[str, Any]]:
+def get_stat_analytics(stat_type: str) -> Dict[str, Any]:
+    """
+    Get per-game rates, pace projection and historical bands for a stat
+    
+    Args:
+        stat_type: Any tracked stat type (e.g. TOTAL_TACKLES)
+    
+    Returns:
+        dict: HTTP response with the analytics report
+    """
+    try:
+        cube, metrics = load_analytics()
+        report = analytics.stat_report(cube, metrics, CURRENT_SEASON, stat_type)
+        
+        if report is None:
+            return error_response(404, f"No data found for {stat_type}")
+        
+        return success_response(report)
+        
+    except Exception as e:
+        logger.error(f"Error getting analytics for {stat_type}: {str(e)}")
+        return error_response(500, str(e))
+
+
+def get_changes(query_params: Dict[str, str]) -> Dict[str, Any]:
     """
-    Format leader items for API response
+    Get leader changes after a sequence or timestamp, oldest first
+    
+    Clients keep next_since and pass it back as since; with has_more they
+    should call again straight away.
     
     Args:
-        items: Raw DynamoDB items
+        query_params: since (sequence number or ISO-8601 timestamp,
+            default 0) and limit (default 500, max 1000)
+    
+    Returns:
+        dict: HTTP response with the changes and the next cursor
+    """
+    since = (query_params.get('since') or '0').strip()
+    
+    try:
+        limit = int(query_params.get('limit') or DEFAULT_CHANGES_LIMIT)
+    except ValueError:
+        return error_response(400, f"Invalid limit: {query_params['limit']}")
+    if limit < 1 or limit > MAX_CHANGES_LIMIT:
+        return error_response(400, f"limit must be between 1 and {MAX_CHANGES_LIMIT}")
+    
+    try:
+        if since.isdigit():
+            changes, has_more = dynamodb_client.query_changes_after(int(since), limit)
+            floor = int(since)
+        else:
+            try:
+                timestamp = datetime.fromisoformat(since)
+            except ValueError:
+                return error_response(400, f"Invalid since (sequence or ISO-8601 timestamp): {since}")
+            if timestamp.tzinfo is None:
+                timestamp = timestamp.replace(tzinfo=timezone.utc)
+            changes, has_more, floor = dynamodb_client.query_changes_since(timestamp, limit)
+        
+        return success_response({
+            'since': since,
+            'changes': [format_change(change) for change in changes],
+            'next_since': changes[-1]['sequence'] if changes else floor,
+            'has_more': has_more
+        })
+        
+    except Exception as e:
+        logger.error(f"Error getting changes since {since}: {str(e)}")
+        return error_response(500, str(e))
+
+
+def get_search(query_params: Dict[str, str]) -> Dict[str, Any]:
+    """
+    Autocomplete players by name prefix from the in-memory search index
+    
+    Each result's player_id works as the player filter of /season and
+    /stat/{stat_type} (e.g. /stat/SACKS?player=<player_id>).
+    
+    Args:
+        query_params: q (name, last name, short name or ID prefix) and
+            limit (default 10, max 50)
+    
+    Returns:
+        dict: HTTP response with the matching players
+    """
+    query = (query_params.get('q') or '').strip()
+    if not query:
+        return error_response(400, "Missing search query: q")
+    
+    try:
+        limit = int(query_params.get('limit') or DEFAULT_SEARCH_LIMIT)
+    except ValueError:
+        return error_response(400, f"Invalid limit: {query_params['limit']}")
+    if limit < 1 or limit > MAX_SEARCH_LIMIT:
+        return error_response(400, f"limit must be between 1 and {MAX_SEARCH_LIMIT}")
+    
+    try:
+        results = search.search_players(query, limit)
+        return success_response({
+            'query': query,
+            'results': results,
+            'count': len(results)
+        })
+        
+    except Exception as e:
+        logger.error(f"Error searching players for {query}: {str(e)}")
+        return error_response(500, str(e))
+
+
+def get_batch(http_method: str, query_params: Dict[str, str], event: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Run several read routes in one invocation and combine their responses
+    
+    Paths are routed concurrently through lambda_handler; identical
+    snapshot/DynamoDB queries among them run once and are shared.
+    
+    Args:
+        http_method: GET (comma-separated paths query parameter) or POST
+            (JSON body {"paths": [...]}); paths may carry query strings
+        query_params: Request query string parameters
+        event: Lambda event (for the POST body)
+    
+    Returns:
+        dict: HTTP response {"responses": [{"path", "status", "body"}, ...]}
+            in request order
+    """
+    if http_method == 'POST':
+        body = event.get('body') or ''
+        if event.get('isBase64Encoded'):
+            body = base64.b64decode(body).decode('utf-8')
+        try:
+            paths = json.loads(body).get('paths')
+        except (ValueError, AttributeError):
+            return error_response(400, 'Body must be JSON: {"paths": [...]}')
+    else:
+        paths = [path.strip() for path in (query_params.get('paths') or '').split(',') if path.strip()]
+    
+    if not paths or not isinstance(paths, list) or not all(isinstance(path, str) for path in paths):
+        return error_response(400, "paths must list at least one route")
+    if len(paths) > BATCH_MAX_PATHS:
+        return error_response(400, f"At most {BATCH_MAX_PATHS} paths per batch")
+    
+    queries = SharedQueries()
+    token = _batch_queries.set(queries)
+    try:
+        with ThreadPoolExecutor(max_workers=len(paths)) as executor:
+            futures = [
+                executor.submit(contextvars.copy_context().run, route_batch_path, path)
+                for path in paths
+            ]
+            responses = [future.result() for future in futures]
+    finally:
+        _batch_queries.reset(token)
+    
+    logger.info(f"Batch of {len(paths)} paths shared {queries.shared} queries")
+    
+    # Sub-response bodies are already JSON; splice them in rather than re-encode
+    entries = ', '.join(
+        f'{{"path": {json.dumps(path)}, "status": {response["statusCode"]}, "body": {response["body"]}}}'
+        for path, response in zip(paths, responses)
+    )
+    return dict(success_response({}), body=f'{{"responses": [{entries}]}}')
+
+
+def internal_route(request: Dict[str, Any], build: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Serve an internal route only to callers holding INTERNAL_ROUTES_TOKEN
+    
+    The token is sent as "Authorization: Bearer <token>". Without it, or
+    when no token is configured, the route answers 404 like an unknown
+    path, so it does not advertise itself (/batch paths never carry it).
+    
+    Args:
+        request: Routed request
+        build: Response builder of the internal route
+    
+    Returns:
+        dict: HTTP response
+    """
+    headers = {name.lower(): value for name, value in (request['event'].get('headers') or {}).items()}
+    presented = headers.get('authorization', '').encode()
+    if not INTERNAL_ROUTES_TOKEN or not hmac.compare_digest(presented, f"Bearer {INTERNAL_ROUTES_TOKEN}".encode()):
+        return error_response(404, f"Endpoint not found: {request['event'].get('rawPath', '/')}")
+    return build()
+
+
+def get_metrics() -> Dict[str, Any]:
+    """
+    Get this container's metrics in the Prometheus text format
+    
+    Returns:
+        dict: HTTP response (text/plain)
+    """
+    response = success_response({})
+    response['headers']['Content-Type'] = telemetry.PROMETHEUS_CONTENT_TYPE
+    response['body'] = telemetry.registry.prometheus()
+    return response
+
+
+def get_debug_stats() -> Dict[str, Any]:
+    """
+    Get this container's metrics as JSON, with the state of its caches
+    
+    Returns:
+        dict: HTTP response
+    """
+    now = time.monotonic()
+    stats = telemetry.registry.stats()
+    stats['response_cache'] = {
+        key: {'expires_in_seconds': round(expires_at - now, 1)}
+        for key, (expires_at, _) in list(_response_cache.items())
+    }
+    stats['analytics_cache'] = {
+        'loaded': _analytics_cache['cube'] is not None,
+        'expires_in_seconds': round(_analytics_cache['expires_at'] - now, 1) if _analytics_cache['cube'] else None
+    }
+    stats['search_index'] = search.index_stats()
+    return success_response(stats)
+
+
+def route_batch_path(path: str) -> Dict[str, Any]:
+    """
+    Route one path of a batch as a GET request
+    
+    Args:
+        path: Route with optional query string (e.g. /season?team=MIA)
+    
+    Returns:
+        dict: HTTP response
+    """
+    parts = urlsplit(path)
+    if parts.path == '/batch':
+        return error_response(400, "Batches cannot be nested")
+    
+    return lambda_handler({
+        'requestContext': {'http': {'method': 'GET'}},
+        'rawPath': parts.path,
+        'queryStringParameters': dict(parse_qsl(parts.query)) or None
+    }, None)
+
+
+def shared_query(func: Callable, *args):
+    """
+    Call a data-access function, sharing the result within a /batch request
+    
+    Args:
+        func: snapshot or dynamodb_client query function
+        *args: Its arguments (JSON-serializable)
+    
+    Returns:
+        Whatever func returns
+    """
+    queries = _batch_queries.get()
+    if queries is None:
+        return func(*args)
+    return queries.run(func, *args)
+
+
+def load_analytics():
+    """
+    Load full history into the analytics cube, cached per container
+    
+    Returns:
+        tuple: (HistoryCube, metrics dict)
+    """
+    now = time.monotonic()
+    hit = _analytics_cache['cube'] is not None and now < _analytics_cache['expires_at']
+    telemetry.registry.record_cache('analytics', hit)
+    if not hit:
+        items = snapshot.query_all_items()
+        if items is None:
+            items = dynamodb_client.query_leader_items()
+        
+        cube = analytics.build_cube(items)
+        _analytics_cache.update(
+            cube=cube,
+            metrics=analytics.compute_metrics(cube),
+            expires_at=now + ANALYTICS_CACHE_SECONDS
+        )
+    
+    return _analytics_cache['cube'], _analytics_cache['metrics']
+
+
+def cached_response(key: str, build: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Serve a response from the warm-container cache, building it on a miss
+    
+    Only successful responses are cached, for RESPONSE_CACHE_SECONDS.
+    
+    Args:
+        key: Cache key (the request path)
+        build: Function that builds the response
+    
+    Returns:
+        dict: HTTP response
+    """
+    now = time.monotonic()
+    entry = _response_cache.get(key)
+    telemetry.registry.record_cache('response', entry is not None and now < entry[0])
+    if entry is not None and now < entry[0]:
+        response = entry[1]
+        return dict(response, headers=dict(response['headers']))
+    
+    response = build()
+    if response['statusCode'] == 200 and RESPONSE_CACHE_SECONDS > 0:
+        _response_cache[key] = (now + RESPONSE_CACHE_SECONDS, response)
+    
+    return dict(response, headers=dict(response['headers']))
+
+
+def warm_up(budget_seconds: float = WARMUP_BUDGET_SECONDS) -> Dict[str, Any]:
+    """
+    Prefetch /current and /season/summary into the response cache
+    
+    Runs during the init phase so a cold container answers its first
+    request from memory. The work runs on a daemon thread and init waits
+    at most budget_seconds for it; anything not cached by then (or that
+    fails) is simply built on demand by the first request instead.
+    
+    Args:
+        budget_seconds: Longest time init may spend waiting
+    
+    Returns:
+        dict: warmed paths, elapsed seconds and whether the budget ran out
+    """
+    start = time.monotonic()
+    warmed = []
+    
+    def prefetch():
+        for key, build in (('/current', get_current_week_leaders), ('/season/summary', get_season_summary)):
+            try:
+                if cached_response(key, build)['statusCode'] == 200:
+                    warmed.append(key)
+            except Exception as e:
+                logger.warning(f"Warmup of {key} failed: {str(e)}")
+    
+    worker = threading.Thread(target=prefetch, name='api-warmup', daemon=True)
+    worker.start()
+    worker.join(budget_seconds)
+    
+    result = {
+        'warmed': list(warmed),
+        'seconds': round(time.monotonic() - start, 3),
+        'timed_out': worker.is_alive()
+    }
+    logger.info(f"Init warmup: {result}")
+    return result
+
+
+def parse_filters(query_params: Dict[str, str]) -> Dict[str, Any]:
+    """
+    Parse optional ad-hoc filters from query parameters
+    
+    Args:
+        query_params: Request query string parameters
+    
+    Returns:
+        dict: player, team, from_week and to_week (missing ones omitted)
+    
+    Raises:
+        ValueError: If a week bound is not an integer
+    """
+    filters = {}
+    
+    for name in ('player', 'team'):
+        if query_params.get(name):
+            filters[name] = query_params[name].strip()
+    
+    for name in ('from_week', 'to_week'):
+        if query_params.get(name):
+            try:
+                filters[name] = int(query_params[name])
+            except ValueError:
+                raise ValueError(f"Invalid {name}: {query_params[name]}")
+    
+    return filters
+
+
+def filter_items(items: List[LeaderRecord], filters: Optional[Dict[str, Any]]) -> List[LeaderRecord]:
+    """
+    Apply ad-hoc filters to DynamoDB leaders (snapshot queries filter in SQL)
+    
+    Args:
+        items: Leader records
+        filters: Filters from parse_filters
+    
+    Returns:
+        list: Matching items
+    """
+    if not filters:
+        return items
+    
+    player = filters.get('player', '').lower()
+    team = filters.get('team', '').lower()
+    from_week = filters.get('from_week')
+    to_week = filters.get('to_week')
+    
+    return [
+        item for item in items
+        if (not player or item.player_id == filters['player'] or player in (item.player_name or '').lower())
+        and (not team or (item.team_abbreviation or '').lower() == team)
+        and (from_week is None or item.week >= from_week)
+        and (to_week is None or item.week <= to_week)
+    ]
+
+
+def format_leaders(items: List[LeaderRecord]) -> List[Dict[str, Any]]:
+    """
+    Format leader records for API response
+    
+    Args:
+        items: Leader records
     
     Returns:
         list: Formatted leader data
     """
-    return [format_leader_item(item) for item in items]
+    return [item.to_response() for item in items]
 
 
-def format_leader_item(item: Dict) -> Dict[str, Any]:
+def format_change(change: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Format a single leader item
+    Format a single change-log entry
     
     Args:
-        item: Raw DynamoDB item
+        change: Parsed entry from dynamodb_client
     
     Returns:
-        dict: Formatted leader
+        dict: Sequence, time, key and the new leader row
     """
-    # Convert Decimal to int/float for JSON serialization
-    stat_value = item['stat_value']
-    if isinstance(stat_value, Decimal):
-        stat_value = int(stat_value) if stat_value % 1 == 0 else float(stat_value)
+    record = change['record']
+    previous = None
+    if change['previous_player_id'] is not None:
+        previous = {'player_id': change['previous_player_id'], 'value': change['previous_value']}
     
     return {
-        'stat_type': item['stat_type'],
-        'stat_name': item['stat_display_name'],
-        'player': {
-            'id': item['player_id'],
-            'name': item['player_name'],
-            'short_name': item['player_short_name']
-        },
-        'team': {
-            'id': item['team_id'],
-            'name': item['team_name'],
-            'abbreviation': item['team_abbreviation']
-        },
-        'value': stat_value,
-        'display_value': item['stat_display_value'],
+        'sequence': change['sequence'],
+        'changed_at': change['changed_at'],
+        'season': record.season,
+        'week': record.week,
+        'leader': record.to_response(),
+        'previous': previous
+    }
+
+
+def format_summary_item(item: Dict) -> Dict[str, Any]:
+    """
+    Format a single season summary item
+    
+    Args:
+        item: Raw DynamoDB summary item
+    
+    Returns:
+        dict: Formatted summary
+    """
+    players = item['players']
+    
+    def player_ref(player_id):
+        player = players.get(player_id, {})
+        return {
+            'id': player_id,
+            'name': player.get('name'),
+            'team': player.get('team')
+        }
+    
+    weeks_led = sorted(item['weeks_led'].items(), key=lambda entry: (-entry[1], entry[0]))
+    
+    return {
+        'stat_type': item['summary_stat'],
+        'weeks_tracked': item['weeks_tracked'],
+        'last_week': item['last_week'],
+        'current_leader': dict(
+            player_ref(item['leader_id']),
+            value=item['leader_value'],
+            streak=item['current_streak']
+        ),
+        'longest_streak': dict(
+            player_ref(item['longest_streak_player_id']),
+            weeks=item['longest_streak']
+        ),
+        'leader_changes': item['leader_changes'],
+        'weeks_led': [
+            dict(player_ref(player_id), weeks=weeks)
+            for player_id, weeks in weeks_led
+        ],
         'updated_at': item['updated_at']
     }
 
@@ -305,18 +971,59 @@ def success_response(data: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         dict: HTTP response
     """
+    start = time.perf_counter()
+    body = json.dumps(data, cls=DecimalEncoder)  # ← UPDATED
+    telemetry.registry.observe_serialization(time.perf_counter() - start)
+    
     return {
         'statusCode': 200,
         'headers': {
             'Content-Type': 'application/json',
             'Access-Control-Allow-Origin': '*',
-            'Access-Control-Allow-Methods': 'GET, OPTIONS',
+            'Access-Control-Allow-Methods': 'GET, POST, OPTIONS',
             'Access-Control-Allow-Headers': 'Content-Type'
         },
-        'body': json.dumps(data, cls=DecimalEncoder)  # ← UPDATED
+        'body': body
     }
 
 
+def preflight_response(methods: frozenset) -> Dict[str, Any]:
+    """
+    Answer a CORS preflight for a route
+    
+    Args:
+        methods: Methods the route allows
+    
+    Returns:
+        dict: HTTP 204 response
+    """
+    return {
+        'statusCode': 204,
+        'headers': {
+            'Access-Control-Allow-Origin': '*',
+            'Access-Control-Allow-Methods': allowed_methods(methods),
+            'Access-Control-Allow-Headers': 'Content-Type',
+            'Access-Control-Max-Age': PREFLIGHT_MAX_AGE,
+            'Allow': allowed_methods(methods)
+        },
+        'body': ''
+    }
+
+
+def allowed_methods(methods: frozenset) -> str:
+    """
+    List a route's methods for Allow headers (HEAD and OPTIONS included)
+    
+    Args:
+        methods: Methods the route allows
+    
+    Returns:
+        str: e.g. "GET, HEAD, OPTIONS"
+    """
+    extra = ('HEAD', 'OPTIONS') if 'GET' in methods else ('OPTIONS',)
+    return ', '.join(sorted(methods) + list(extra))
+
+
 def error_response(status_code: int, message: str) -> Dict[str, Any]:
     """
     Create an error HTTP response
@@ -338,6 +1045,10 @@ def error_response(status_code: int, message: str) -> Dict[str, Any]:
     }
 
 
+if WARMUP_ON_INIT:
+    warm_up()
+
+
 # For local testing
 if __name__ == "__main__":
     # Mock event for testing
@@ -0,0 +1,125 @@
+"""
+NFL Tackle Leaders - API Models
+Compact leader record parsed straight from DynamoDB attribute maps or
+snapshot rows and serialized straight to the response shape
+"""
+from decimal import Decimal
+from typing import Dict, Any, Mapping
+
+# Stand-in for attributes a fact does not carry
+_ABSENT: Dict[str, str] = {}
+
+
+class LeaderRecord:
+    """One stat leader for a (season, week, stat)"""
+
+    __slots__ = (
+        'season', 'week', 'stat_type', 'stat_display_name',
+        'player_id', 'player_name', 'player_short_name',
+        'team_id', 'team_name', 'team_abbreviation',
+        'value', 'display_value', 'updated_at'
+    )
+
+    def __init__(self, season: str, week: int, stat_type: str, stat_display_name: str,
+                 player_id: str, player_name: str, player_short_name: str,
+                 team_id: str, team_name: str, team_abbreviation: str,
+                 value: Decimal, display_value: str, updated_at: str):
+        self.season = season
+        self.week = week
+        self.stat_type = stat_type
+        self.stat_display_name = stat_display_name
+        self.player_id = player_id
+        self.player_name = player_name
+        self.player_short_name = player_short_name
+        self.team_id = team_id
+        self.team_name = team_name
+        self.team_abbreviation = team_abbreviation
+        self.value = value
+        self.display_value = display_value
+        self.updated_at = updated_at
+
+    @classmethod
+    def from_item(cls, item: Mapping[str, Any]) -> 'LeaderRecord':
+        """
+        Build a record from a deserialized leader item or a snapshot row
+
+        Args:
+            item: Leader item (boto3 resource item, dict or sqlite3.Row)
+
+        Returns:
+            LeaderRecord: Record with the value as a Decimal
+        """
+        value = item['stat_value']
+        return cls(
+            season=item['season'],
+            week=int(item['week_number']),
+            stat_type=item['stat_type'],
+            stat_display_name=item['stat_display_name'],
+            player_id=item['player_id'],
+            player_name=item['player_name'],
+            player_short_name=item['player_short_name'],
+            team_id=item['team_id'],
+            team_name=item['team_name'],
+            team_abbreviation=item['team_abbreviation'],
+            value=value if isinstance(value, Decimal) else Decimal(str(value)),
+            display_value=item['stat_display_value'],
+            updated_at=item['updated_at']
+        )
+
+    @classmethod
+    def from_attribute_map(cls, attributes: Dict[str, Dict[str, str]]) -> 'LeaderRecord':
+        """
+        Build a record from a raw DynamoDB attribute map ({'S': ...}/{'N': ...})
+
+        Reads only the attributes it needs, skipping boto3's generic
+        TypeDeserializer. Descriptive strings and ids stored as NULL become
+        None, as do player/team names, which facts leave to the dimension items
+        (see dynamodb_client.join_dimensions).
+
+        Args:
+            attributes: Low-level client item
+
+        Returns:
+            LeaderRecord: Record
+        """
+        return cls(
+            attributes['season']['S'],
+            int(attributes['week_number']['N']),
+            attributes['stat_type']['S'],
+            attributes['stat_display_name'].get('S'),
+            attributes['player_id'].get('S'),
+            attributes.get('player_name', _ABSENT).get('S'),
+            attributes.get('player_short_name', _ABSENT).get('S'),
+            attributes['team_id'].get('S'),
+            attributes.get('team_name', _ABSENT).get('S'),
+            attributes.get('team_abbreviation', _ABSENT).get('S'),
+            Decimal(attributes['stat_value']['N']),
+            attributes['stat_display_value'].get('S'),
+            attributes['updated_at'].get('S')
+        )
+
+    def to_response(self) -> Dict[str, Any]:
+        """
+        Serialize to the API leader shape
+
+        Returns:
+            dict: Formatted leader (value as int or float)
+        """
+        value = self.value
+        return {
+            'stat_type': self.stat_type,
+            'stat_name': self.stat_display_name,
+            'player': {
+                'id': self.player_id,
+                'name': self.player_name,
+                'short_name': self.player_short_name
+            },
+            'team': {
+                'id': self.team_id,
+                'name': self.team_name,
+                'abbreviation': self.team_abbreviation
+            },
+            'value': int(value) if value % 1 == 0 else float(value),
+            'display_value': self.display_value,
+            'updated_at': self.updated_at
+        }
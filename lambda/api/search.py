@@ -0,0 +1,98 @@
+"""
+NFL Tackle Leaders - Player Search
+Prefix lookups in the player search index built by ingest, held in memory
+for the life of a warm container
+"""
+import bisect
+import gzip
+import json
+import logging
+import os
+import threading
+import time
+from typing import Dict, Any, List, Optional
+import dynamodb_client
+from names import normalize_name
+from telemetry import registry
+
+logger = logging.getLogger()
+
+# Environment variables
+SEARCH_CHECK_SECONDS = int(os.environ.get('SEARCH_CHECK_SECONDS', '60'))
+
+# Loaded index: sorted keys, the player ID of each key and player names
+_index: Dict[str, Any] = {'version': 0, 'keys': [], 'ids': [], 'players': {}}
+_last_check = float('-inf')
+_lock = threading.Lock()
+
+
+def search_players(query: str, limit: int) -> List[Dict[str, Any]]:
+    """
+    Find players whose name, any later part of it (last name), short name
+    or ID starts with the query
+
+    Args:
+        query: Search text
+        limit: Most players returned
+
+    Returns:
+        list: {'player_id', 'player_name', 'player_short_name'} in key
+            order, each player once
+    """
+    index = get_index()
+    prefix = normalize_name(query)
+    if not prefix:
+        return []
+
+    keys, ids = index['keys'], index['ids']
+    results = []
+    seen = set()
+    position = bisect.bisect_left(keys, prefix)
+    while position < len(keys) and len(results) < limit and keys[position].startswith(prefix):
+        player_id = ids[position]
+        if player_id not in seen:
+            seen.add(player_id)
+            name, short_name = index['players'][player_id]
+            results.append({'player_id': player_id, 'player_name': name, 'player_short_name': short_name})
+        position += 1
+
+    return results
+
+
+def get_index() -> Dict[str, Any]:
+    """
+    Return the cached index, reloading it when ingest has published a new
+    version (checked at most every SEARCH_CHECK_SECONDS)
+
+    Returns:
+        dict: version, keys, ids and players (empty until ingest has built it)
+    """
+    global _index, _last_check
+
+    now = time.monotonic()
+    hit = now - _last_check < SEARCH_CHECK_SECONDS
+    registry.record_cache('search_index', hit)
+    if hit:
+        return _index
+
+    with _lock:
+        if now - _last_check >= SEARCH_CHECK_SECONDS:
+            try:
+                version, body = dynamodb_client.get_search_index(_index['version'])
+                if body is not None:
+                    loaded = json.loads(gzip.decompress(body))
+                    _index = dict(loaded, version=version)
+                    logger.info(f"Loaded search index v{version}: {len(_index['players'])} players")
+            except Exception as e:
+                # Keep serving the index we have
+                logger.warning(f"Search index refresh failed: {str(e)}")
+            _last_check = now
+
+    return _index
+
+
+def index_stats() -> Optional[Dict[str, Any]]:
+    """Version and size of the loaded index, for /debug/stats"""
+    if not _index['version']:
+        return None
+    return {'version': _index['version'], 'players': len(_index['players']), 'keys': len(_index['keys'])}
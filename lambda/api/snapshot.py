@@ -0,0 +1,286 @@
+"""
+NFL Tackle Leaders - SQLite Read Replica
+Hydrates the ingest-built snapshot into /tmp and serves reads from it
+"""
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Any, List, Optional, Tuple
+import boto3
+from models import LeaderRecord
+from telemetry import registry
+
+logger = logging.getLogger()
+
+# Environment variables
+SNAPSHOT_LOCATION = os.environ.get('SNAPSHOT_LOCATION')  # local file or s3://bucket/key
+SNAPSHOT_CHECK_SECONDS = int(os.environ.get('SNAPSHOT_CHECK_SECONDS', '60'))
+SNAPSHOT_DIR = os.environ.get('SNAPSHOT_DIR', '/tmp')
+
+# Must match SNAPSHOT_SCHEMA_VERSION in the ingest snapshot builder
+SUPPORTED_SCHEMA_VERSION = '1'
+
+LEADER_COLUMNS = [
+    'season', 'week_number', 'stat_type', 'stat_display_name',
+    'player_id', 'player_name', 'player_short_name',
+    'team_id', 'team_name', 'team_abbreviation',
+    'stat_value', 'stat_display_value', 'updated_at'
+]
+
+
+class OpenSnapshot:
+    """
+    A hydrated snapshot file and its connection
+
+    Queries pin the snapshot they run on (readers); one replaced by a newer
+    version is retired and closed by whichever query releases it last.
+    """
+
+    def __init__(self, connection: sqlite3.Connection, path: str, version: str):
+        self.connection = connection
+        self.path = path
+        self.version = version
+        self.readers = 0
+        self.retired = False
+
+
+# Warm-container state (_lock serializes refreshes, _pin_lock reader counts)
+_current: Optional[OpenSnapshot] = None
+_last_check = 0.0
+_lock = threading.Lock()
+_pin_lock = threading.Lock()
+
+
+def query_season_items(season: str, filters: Optional[Dict[str, Any]] = None) -> Optional[List[LeaderRecord]]:
+    """
+    Get every leader item for a season
+
+    Args:
+        season: NFL season
+        filters: Optional player/team/from_week/to_week filters
+
+    Returns:
+        list: Leader records, or None if no snapshot
+    """
+    where, params = _filter_clause(filters)
+    return _select(f"season = ?{where}", [season] + params)
+
+
+def query_week_items(season: str, week: int) -> Optional[List[LeaderRecord]]:
+    """
+    Get the leader items for one week
+
+    Args:
+        season: NFL season
+        week: Week number
+
+    Returns:
+        list: Leader records, or None if no snapshot
+    """
+    return _select("season = ? AND week_number = ?", [season, week])
+
+
+def query_current_week_items(season: str) -> Optional[List[LeaderRecord]]:
+    """
+    Get the leader items for the most recent week of a season
+
+    Args:
+        season: NFL season
+
+    Returns:
+        list: Leader records, or None if no snapshot
+    """
+    return _select(
+        "season = ? AND week_number = (SELECT MAX(week_number) FROM leaders WHERE season = ?)",
+        [season, season]
+    )
+
+
+def query_stat_items(stat_type: str, filters: Optional[Dict[str, Any]] = None) -> Optional[List[LeaderRecord]]:
+    """
+    Get every leader item for a stat type
+
+    Args:
+        stat_type: TOTAL_TACKLES or SACKS
+        filters: Optional player/team/from_week/to_week filters
+
+    Returns:
+        list: Leader records, or None if no snapshot
+    """
+    where, params = _filter_clause(filters)
+    return _select(f"stat_type = ?{where}", [stat_type] + params)
+
+
+def query_all_items() -> Optional[List[LeaderRecord]]:
+    """
+    Get every leader item for every season and stat
+
+    Returns:
+        list: Leader records, or None if no snapshot
+    """
+    return _select("1 = 1", [])
+
+
+def acquire() -> Optional[OpenSnapshot]:
+    """
+    Pin the newest snapshot for a query, downloading it when needed
+
+    The published version is re-checked at most every SNAPSHOT_CHECK_SECONDS.
+    Every snapshot returned must be handed back to release(), so a refresh
+    never closes a connection a query (e.g. a /batch worker thread) is
+    still reading.
+
+    Returns:
+        OpenSnapshot: Pinned snapshot or None if unavailable
+    """
+    global _last_check
+
+    if not SNAPSHOT_LOCATION:
+        return None
+
+    now = time.monotonic()
+    if _current is None or now - _last_check >= SNAPSHOT_CHECK_SECONDS:
+        with _lock:
+            if _current is None or now - _last_check >= SNAPSHOT_CHECK_SECONDS:
+                try:
+                    _refresh()
+                except Exception as e:
+                    # Keep serving the snapshot we have; callers fall back to DynamoDB without one
+                    logger.warning(f"Snapshot refresh failed: {str(e)}")
+                _last_check = now
+
+    with _pin_lock:
+        snapshot = _current
+        if snapshot is not None:
+            snapshot.readers += 1
+    return snapshot
+
+
+def release(snapshot: OpenSnapshot):
+    """
+    Unpin a snapshot from acquire(), closing it if it was retired meanwhile
+
+    Args:
+        snapshot: Snapshot returned by acquire()
+    """
+    with _pin_lock:
+        snapshot.readers -= 1
+        unused = snapshot.retired and not snapshot.readers
+    if unused:
+        _close(snapshot)
+
+
+def _refresh():
+    """Hydrate a new snapshot into /tmp if the published version changed"""
+    global _current
+
+    version, fetch = _published_version()
+    if _current is not None and version == _current.version:
+        return
+
+    local_path = os.path.join(SNAPSHOT_DIR, f"leaders-{version}.sqlite")
+    if not os.path.exists(local_path):
+        fetch(local_path)
+
+    connection = sqlite3.connect(f"file:{local_path}?mode=ro", uri=True, check_same_thread=False)
+    connection.row_factory = sqlite3.Row
+
+    meta = dict(connection.execute("SELECT key, value FROM snapshot_meta").fetchall())
+    if meta.get('schema_version') != SUPPORTED_SCHEMA_VERSION:
+        connection.close()
+        raise ValueError(f"Unsupported snapshot schema {meta.get('schema_version')}")
+
+    with _pin_lock:
+        old, _current = _current, OpenSnapshot(connection, local_path, version)
+        if old is not None:
+            old.retired = True
+        unused = old is not None and not old.readers
+    logger.info(f"Loaded snapshot {meta.get('data_version')} from {SNAPSHOT_LOCATION}")
+
+    # Otherwise the last query still reading the old snapshot closes it
+    if unused:
+        _close(old)
+
+
+def _close(snapshot: OpenSnapshot):
+    """Close a retired snapshot and remove its file (unless the current one reuses it)"""
+    snapshot.connection.close()
+    current = _current
+    if (current is None or current.path != snapshot.path) and os.path.exists(snapshot.path):
+        os.remove(snapshot.path)
+
+
+def _published_version() -> Tuple[str, Any]:
+    """
+    Look up the published snapshot version without downloading it
+
+    Returns:
+        tuple: (version string, function that downloads to a local path)
+    """
+    if SNAPSHOT_LOCATION.startswith('s3://'):
+        bucket, _, key = SNAPSHOT_LOCATION[len('s3://'):].partition('/')
+        s3 = boto3.client('s3')
+        head = s3.head_object(Bucket=bucket, Key=key)
+        version = head['ETag'].strip('"')
+
+        def fetch(path):
+            s3.download_file(bucket, key, f"{path}.tmp")
+            os.replace(f"{path}.tmp", path)
+
+        return version, fetch
+
+    stat = os.stat(SNAPSHOT_LOCATION)
+    version = f"{stat.st_mtime_ns:x}-{stat.st_size:x}"
+
+    def fetch(path):
+        # Local snapshots (development, benchmarks) are read in place
+        os.symlink(os.path.abspath(SNAPSHOT_LOCATION), path)
+
+    return version, fetch
+
+
+def _filter_clause(filters: Optional[Dict[str, Any]]) -> Tuple[str, List[Any]]:
+    """Translate API query filters into a SQL fragment and parameters"""
+    if not filters:
+        return '', []
+
+    clauses = []
+    params = []
+
+    if filters.get('player'):
+        clauses.append("(player_id = ? OR player_name LIKE ?)")
+        params.extend([filters['player'], f"%{filters['player']}%"])
+    if filters.get('team'):
+        clauses.append("team_abbreviation = ? COLLATE NOCASE")
+        params.append(filters['team'])
+    if filters.get('from_week') is not None:
+        clauses.append("week_number >= ?")
+        params.append(filters['from_week'])
+    if filters.get('to_week') is not None:
+        clauses.append("week_number <= ?")
+        params.append(filters['to_week'])
+
+    return ''.join(f" AND {clause}" for clause in clauses), params
+
+
+def _select(where: str, params: List[Any]) -> Optional[List[LeaderRecord]]:
+    """Run a leaders query and convert rows into leader records"""
+    snapshot = acquire()
+    if SNAPSHOT_LOCATION:
+        # A miss means the caller falls back to DynamoDB
+        registry.record_cache('snapshot', snapshot is not None)
+    if snapshot is None:
+        return None
+
+    try:
+        rows = snapshot.connection.execute(
+            f"SELECT {', '.join(LEADER_COLUMNS)} FROM leaders WHERE {where} "
+            "ORDER BY season, week_number, stat_type",
+            params
+        ).fetchall()
+    finally:
+        release(snapshot)
+
+    return [LeaderRecord.from_item(row) for row in rows]
@@ -0,0 +1,259 @@
+"""
+NFL Tackle Leaders - API Metrics Registry
+In-process counters and latency histograms for a warm container, served by
+/metrics (Prometheus text) and /debug/stats (JSON)
+"""
+import bisect
+import threading
+import time
+from typing import Dict, Any, List, Optional, Tuple
+
+# Histogram bucket upper bounds in seconds (+Inf is implicit)
+LATENCY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+SERIALIZATION_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1)
+
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+PROMETHEUS_PREFIX = 'nfl_api'
+
+
+class Histogram:
+    """Fixed-bucket histogram (Prometheus-style, cumulative on export)"""
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate a quantile as the upper bound of the bucket that holds it
+
+        Args:
+            q: Quantile (0-1)
+
+        Returns:
+            float: Bucket upper bound (the largest bound for the +Inf bucket),
+                or None before any observation
+        """
+        if not self.count:
+            return None
+
+        rank = q * self.count
+        cumulative = 0
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            if cumulative >= rank:
+                return bound
+        return self.buckets[-1]
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        """(le, cumulative count) pairs including +Inf"""
+        pairs, cumulative = [], 0
+        for bound, count in zip(self.buckets + (float('inf'),), self.counts):
+            cumulative += count
+            pairs.append(('+Inf' if bound == float('inf') else f"{bound:g}", cumulative))
+        return pairs
+
+
+class MetricsRegistry:
+    """
+    Metrics of one warm container since it started
+
+    Requests are keyed by route pattern (not the raw path) so the number
+    of series stays bounded; paths that match no route count as 'unmatched'.
+    """
+
+    def __init__(self):
+        self.started_at = time.time()
+        self._started = time.monotonic()
+        self._lock = threading.Lock()
+        self.invocations = 0
+        self.requests: Dict[Tuple[str, str], Histogram] = {}
+        self.responses: Dict[Tuple[str, int], int] = {}
+        self.dynamodb_calls: Dict[str, int] = {}
+        self.read_units: Dict[str, float] = {}
+        self.caches: Dict[str, List[int]] = {}
+        self.serialization = Histogram(SERIALIZATION_BUCKETS)
+
+    def record_invocation(self):
+        """Count a Lambda invocation (/batch sub-requests are not invocations)"""
+        with self._lock:
+            self.invocations += 1
+
+    def observe_request(self, route: str, method: str, status: int, seconds: float):
+        """
+        Record one routed request
+
+        Args:
+            route: Route pattern (e.g. /stat/{stat_type:upper})
+            method: HTTP method
+            status: Response status code
+            seconds: Handling time
+        """
+        with self._lock:
+            histogram = self.requests.get((route, method))
+            if histogram is None:
+                histogram = self.requests[(route, method)] = Histogram()
+            histogram.observe(seconds)
+            self.responses[(route, status)] = self.responses.get((route, status), 0) + 1
+
+    def record_dynamodb(self, operation: str, capacity_units: float):
+        """
+        Record a DynamoDB call and the read capacity it consumed
+
+        Args:
+            operation: e.g. query, scan
+            capacity_units: ConsumedCapacity.CapacityUnits (0 if not returned)
+        """
+        with self._lock:
+            self.dynamodb_calls[operation] = self.dynamodb_calls.get(operation, 0) + 1
+            self.read_units[operation] = self.read_units.get(operation, 0.0) + capacity_units
+
+    def record_cache(self, cache: str, hit: bool):
+        """Count a lookup in a warm-container cache"""
+        with self._lock:
+            counts = self.caches.setdefault(cache, [0, 0])
+            counts[0 if hit else 1] += 1
+
+    def observe_serialization(self, seconds: float):
+        """Record the time spent encoding one response body"""
+        with self._lock:
+            self.serialization.observe(seconds)
+
+    def container_age(self) -> float:
+        """Seconds since the container loaded this module"""
+        return time.monotonic() - self._started
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Summarize the registry for /debug/stats
+
+        Returns:
+            dict: Container, per-route latency (ms), DynamoDB, cache and
+                serialization figures
+        """
+        with self._lock:
+            routes = {}
+            for (route, method), histogram in sorted(self.requests.items()):
+                routes.setdefault(route, {})[method] = _histogram_stats(histogram, 1000)
+            statuses = {}
+            for (route, status), count in sorted(self.responses.items()):
+                statuses.setdefault(route, {})[str(status)] = count
+
+            return {
+                'container': {
+                    'started_at': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(self.started_at)),
+                    'age_seconds': round(self.container_age(), 1),
+                    'invocations': self.invocations
+                },
+                'routes': {
+                    route: {'latency_ms': latency, 'statuses': statuses.get(route, {})}
+                    for route, latency in routes.items()
+                },
+                'dynamodb': {
+                    operation: {'calls': calls, 'read_units': round(self.read_units.get(operation, 0.0), 1)}
+                    for operation, calls in sorted(self.dynamodb_calls.items())
+                },
+                'caches': {
+                    cache: {'hits': hits, 'misses': misses,
+                            'hit_ratio': round(hits / (hits + misses), 3) if hits + misses else None}
+                    for cache, (hits, misses) in sorted(self.caches.items())
+                },
+                'serialization_ms': _histogram_stats(self.serialization, 1000)
+            }
+
+    def prometheus(self) -> str:
+        """
+        Render the registry in the Prometheus text exposition format
+
+        Returns:
+            str: Exposition text
+        """
+        p = PROMETHEUS_PREFIX
+        lines = [
+            f"# HELP {p}_container_age_seconds Seconds since the container started",
+            f"# TYPE {p}_container_age_seconds gauge",
+            f"{p}_container_age_seconds {self.container_age():.3f}",
+            f"# HELP {p}_invocations_total Lambda invocations served by this container",
+            f"# TYPE {p}_invocations_total counter",
+            f"{p}_invocations_total {self.invocations}"
+        ]
+
+        with self._lock:
+            lines += [
+                f"# HELP {p}_request_duration_seconds Request handling time by route",
+                f"# TYPE {p}_request_duration_seconds histogram"
+            ]
+            for (route, method), histogram in sorted(self.requests.items()):
+                lines += _histogram_lines(f"{p}_request_duration_seconds", histogram,
+                                          {'route': route, 'method': method})
+
+            lines += [f"# HELP {p}_responses_total Responses by route and status",
+                      f"# TYPE {p}_responses_total counter"]
+            lines += [f"{p}_responses_total{_labels({'route': route, 'status': status})} {count}"
+                      for (route, status), count in sorted(self.responses.items())]
+
+            lines += [f"# HELP {p}_dynamodb_calls_total DynamoDB calls by operation",
+                      f"# TYPE {p}_dynamodb_calls_total counter"]
+            lines += [f"{p}_dynamodb_calls_total{_labels({'operation': operation})} {calls}"
+                      for operation, calls in sorted(self.dynamodb_calls.items())]
+
+            lines += [f"# HELP {p}_dynamodb_read_units_total Consumed read capacity units by operation",
+                      f"# TYPE {p}_dynamodb_read_units_total counter"]
+            lines += [f"{p}_dynamodb_read_units_total{_labels({'operation': operation})} {units:g}"
+                      for operation, units in sorted(self.read_units.items())]
+
+            lines += [f"# HELP {p}_cache_lookups_total Warm-container cache lookups by result",
+                      f"# TYPE {p}_cache_lookups_total counter"]
+            for cache, (hits, misses) in sorted(self.caches.items()):
+                lines.append(f"{p}_cache_lookups_total{_labels({'cache': cache, 'result': 'hit'})} {hits}")
+                lines.append(f"{p}_cache_lookups_total{_labels({'cache': cache, 'result': 'miss'})} {misses}")
+
+            lines += [f"# HELP {p}_serialization_seconds Response body encoding time",
+                      f"# TYPE {p}_serialization_seconds histogram"]
+            lines += _histogram_lines(f"{p}_serialization_seconds", self.serialization, {})
+
+        return '\n'.join(lines) + '\n'
+
+
+def _histogram_stats(histogram: Histogram, scale: float) -> Dict[str, Any]:
+    """Count, mean and bucket-estimated percentiles of a histogram, scaled (e.g. to ms)"""
+    def scaled(value):
+        return round(value * scale, 3) if value is not None else None
+
+    return {
+        'count': histogram.count,
+        'mean': scaled(histogram.sum / histogram.count) if histogram.count else None,
+        'p50': scaled(histogram.quantile(0.5)),
+        'p95': scaled(histogram.quantile(0.95)),
+        'p99': scaled(histogram.quantile(0.99))
+    }
+
+
+def _histogram_lines(name: str, histogram: Histogram, labels: Dict[str, Any]) -> List[str]:
+    """Exposition lines (_bucket, _sum, _count) of one histogram series"""
+    lines = [f"{name}_bucket{_labels(dict(labels, le=le))} {count}" for le, count in histogram.cumulative()]
+    lines.append(f"{name}_sum{_labels(labels)} {histogram.sum:.6f}")
+    lines.append(f"{name}_count{_labels(labels)} {histogram.count}")
+    return lines
+
+
+def _labels(labels: Dict[str, Any]) -> str:
+    """Format a label set, escaping values"""
+    if not labels:
+        return ''
+    pairs = []
+    for name, value in labels.items():
+        value = str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+        pairs.append(f'{name}="{value}"')
+    return '{' + ','.join(pairs) + '}'
+
+
+# One registry per container
+registry = MetricsRegistry()
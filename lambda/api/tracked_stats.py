@@ -0,0 +1 @@
+../shared/tracked_stats.py
\ No newline at end of file
@@ -0,0 +1,199 @@
+"""
+NFL Tackle Leaders - Columnar History Archive
+Writes leader history as season-partitioned Parquet files (local or S3)
+"""
+from decimal import Decimal
+import io
+import logging
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Iterable
+import boto3
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from dimensions import join_dimensions, load_dimensions
+from dynamodb_client import query_season_items
+
+logger = logging.getLogger()
+
+ARCHIVE_FILE_NAME = 'leaders.parquet'
+
+# Low-cardinality text columns are dictionary-encoded so each player/team
+# string is stored once per file instead of once per row
+DICTIONARY_COLUMNS = [
+    'stat_type', 'stat_display_name',
+    'player_id', 'player_name', 'player_short_name',
+    'team_id', 'team_name', 'team_abbreviation'
+]
+
+ARCHIVE_SCHEMA = pa.schema([
+    ('season', pa.string()),
+    ('week_number', pa.int16()),
+    ('stat_type', pa.dictionary(pa.int16(), pa.string())),
+    ('stat_display_name', pa.dictionary(pa.int16(), pa.string())),
+    ('player_id', pa.dictionary(pa.int32(), pa.string())),
+    ('player_name', pa.dictionary(pa.int32(), pa.string())),
+    ('player_short_name', pa.dictionary(pa.int32(), pa.string())),
+    ('team_id', pa.dictionary(pa.int16(), pa.string())),
+    ('team_name', pa.dictionary(pa.int16(), pa.string())),
+    ('team_abbreviation', pa.dictionary(pa.int16(), pa.string())),
+    ('stat_value', pa.float64()),
+    ('stat_display_value', pa.string()),
+    ('updated_at', pa.string()),
+])
+
+
+def items_to_table(items: Iterable[Dict[str, Any]]) -> pa.Table:
+    """
+    Convert DynamoDB leader items into an Arrow table
+
+    Args:
+        items: Raw DynamoDB items
+
+    Returns:
+        pa.Table: Rows sorted by week then stat type
+    """
+    rows = sorted(items, key=lambda item: (int(item['week_number']), item['stat_type']))
+
+    columns = {name: [] for name in ARCHIVE_SCHEMA.names}
+    for item in rows:
+        for name in ARCHIVE_SCHEMA.names:
+            columns[name].append(item.get(name))
+
+    columns['season'] = [str(season) for season in columns['season']]
+    columns['week_number'] = [int(week) for week in columns['week_number']]
+    columns['stat_value'] = [
+        float(value) if isinstance(value, Decimal) else value
+        for value in columns['stat_value']
+    ]
+
+    return pa.table(
+        [pa.array(columns[field.name]).cast(field.type) for field in ARCHIVE_SCHEMA],
+        schema=ARCHIVE_SCHEMA
+    )
+
+
+def season_archive_key(prefix: str, season: str) -> str:
+    """
+    Build the Hive-style partition path for a season archive
+
+    Args:
+        prefix: Archive prefix (directory or S3 key prefix)
+        season: NFL season
+
+    Returns:
+        str: e.g. "archive/season=2025/leaders.parquet"
+    """
+    prefix = prefix.strip('/')
+    key = f"season={season}/{ARCHIVE_FILE_NAME}"
+    return f"{prefix}/{key}" if prefix else key
+
+
+def write_season_archive(items: List[Dict[str, Any]], season: str,
+                         destination: str) -> Dict[str, Any]:
+    """
+    Write one season of leader history as a Parquet file
+
+    Args:
+        items: Raw DynamoDB items for the season
+        season: NFL season
+        destination: Local directory or "s3://bucket/prefix"
+
+    Returns:
+        dict: Archive summary (location, rows, bytes)
+    """
+    arrow_table = items_to_table(items)
+
+    buffer = io.BytesIO()
+    pq.write_table(
+        arrow_table,
+        buffer,
+        compression='zstd',
+        use_dictionary=DICTIONARY_COLUMNS
+    )
+    payload = buffer.getvalue()
+
+    if destination.startswith('s3://'):
+        bucket, _, prefix = destination[len('s3://'):].partition('/')
+        key = season_archive_key(prefix, season)
+        boto3.client('s3').put_object(Bucket=bucket, Key=key, Body=payload)
+        location = f"s3://{bucket}/{key}"
+    else:
+        path = Path(destination) / season_archive_key('', season)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(payload)
+        location = str(path)
+
+    logger.info(f"Archived {arrow_table.num_rows} leaders for {season} to {location}")
+
+    return {
+        'season': season,
+        'location': location,
+        'rows': arrow_table.num_rows,
+        'bytes': len(payload)
+    }
+
+
+def archive_season(table, season: str, destination: str) -> Dict[str, Any]:
+    """
+    Read a season (joined with its dimensions) and write its columnar archive
+
+    Args:
+        table: DynamoDB table resource
+        season: NFL season
+        destination: Local directory or "s3://bucket/prefix"
+
+    Returns:
+        dict: Archive summary
+    """
+    items = join_dimensions(query_season_items(table, season), load_dimensions(table))
+    return write_season_archive(items, season, destination)
+
+
+def read_archive(destination: str, seasons: Optional[List[str]] = None) -> pa.Table:
+    """
+    Read archived seasons back into a single Arrow table
+
+    Args:
+        destination: Local directory or "s3://bucket/prefix"
+        seasons: Seasons to load (None for every archived season)
+
+    Returns:
+        pa.Table: Concatenated history
+    """
+    tables = []
+
+    if destination.startswith('s3://'):
+        bucket, _, prefix = destination[len('s3://'):].partition('/')
+        s3 = boto3.client('s3')
+
+        if seasons is None:
+            paginator = s3.get_paginator('list_objects_v2')
+            list_prefix = f"{prefix.strip('/')}/" if prefix.strip('/') else ''
+            keys = [
+                obj['Key']
+                for page in paginator.paginate(Bucket=bucket, Prefix=list_prefix)
+                for obj in page.get('Contents', [])
+                if obj['Key'].endswith(ARCHIVE_FILE_NAME)
+            ]
+        else:
+            keys = [season_archive_key(prefix, season) for season in seasons]
+
+        for key in sorted(keys):
+            body = s3.get_object(Bucket=bucket, Key=key)['Body'].read()
+            tables.append(pq.read_table(pa.BufferReader(body)))
+    else:
+        root = Path(destination)
+        if seasons is None:
+            paths = sorted(root.glob(f"season=*/{ARCHIVE_FILE_NAME}"))
+        else:
+            paths = [root / season_archive_key('', season) for season in seasons]
+
+        for path in paths:
+            tables.append(pq.read_table(path))
+
+    if not tables:
+        return ARCHIVE_SCHEMA.empty_table()
+
+    # Dictionaries differ per file, so unify them before handing back one table
+    return pa.concat_tables(tables).unify_dictionaries()
@@ -0,0 +1,116 @@
+"""
+NFL Tackle Leaders - Leader Change Log
+Append-only log of leader rows that actually changed, ordered by a
+monotonically increasing sequence, for incremental sync (/changes)
+"""
+from datetime import datetime
+import logging
+from typing import Dict, Any, Optional
+from boto3.dynamodb.conditions import Key
+from botocore.exceptions import ClientError
+
+logger = logging.getLogger()
+
+CHANGE_LOG_PARTITION = 'CHANGELOG'
+
+# Concurrent workers race for the next sequence; a lost race rereads the
+# newest entry and tries the one after it
+MAX_APPEND_ATTEMPTS = 10
+
+# Fact attributes that make a leader row different (updated_at alone does not)
+COMPARED_ATTRIBUTES = ('player_id', 'team_id', 'stat_value', 'stat_display_value')
+
+
+def entry_key(sequence: int) -> Dict[str, str]:
+    """
+    Build the DynamoDB key of a change-log entry
+
+    Entries share one partition, sorted by zero-padded sequence, so a
+    reader pages through everything after a sequence with one query.
+
+    Args:
+        sequence: Change sequence number
+
+    Returns:
+        dict: PK/SK key
+    """
+    return {'PK': CHANGE_LOG_PARTITION, 'SK': f"SEQ#{sequence:012d}"}
+
+
+def record_change(table, item: Dict[str, Any]) -> Optional[int]:
+    """
+    Append a change-log entry if a leader fact differs from the stored row
+
+    Called before the fact is written, so a failure between the two at
+    worst logs the same change twice on retry; it is never lost.
+
+    The newest entry is the sequence counter: the entry after it is put
+    only if nobody else has taken that sequence, so entries become visible
+    strictly in sequence order and a /changes?since= reader can never skip
+    one that commits late.
+
+    Args:
+        table: DynamoDB table resource
+        item: Leader fact about to be stored (LeaderRecord.to_item())
+
+    Returns:
+        int: Sequence of the new entry, or None if nothing changed
+
+    Raises:
+        ClientError: If the append keeps losing races (after MAX_APPEND_ATTEMPTS)
+    """
+    previous = table.get_item(
+        Key={'PK': item['PK'], 'SK': item['SK']},
+        ProjectionExpression=', '.join(COMPARED_ATTRIBUTES)
+    ).get('Item')
+
+    if previous is not None and all(previous.get(name) == item[name] for name in COMPARED_ATTRIBUTES):
+        return None
+
+    # The fact is nested so the entry has no top-level stat_type/week_number
+    # and stays out of StatTypeIndex
+    entry = {'leader': {name: value for name, value in item.items() if name not in ('PK', 'SK')}}
+    if previous is not None:
+        entry['previous_player_id'] = previous.get('player_id')
+        entry['previous_value'] = previous.get('stat_value')
+
+    for attempt in range(1, MAX_APPEND_ATTEMPTS + 1):
+        sequence = last_sequence(table) + 1
+        try:
+            table.put_item(
+                Item=dict(
+                    entry,
+                    **entry_key(sequence),
+                    sequence=sequence,
+                    changed_at=datetime.utcnow().isoformat() + 'Z'
+                ),
+                ConditionExpression='attribute_not_exists(PK)'
+            )
+            break
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'ConditionalCheckFailedException' or attempt == MAX_APPEND_ATTEMPTS:
+                raise
+            logger.info(f"Change sequence {sequence} taken concurrently, retrying")
+
+    logger.info(f"Logged change {sequence}: {item['season']} week {item['week_number']} {item['stat_type']}")
+
+    return sequence
+
+
+def last_sequence(table) -> int:
+    """
+    Read the sequence of the newest change-log entry
+
+    Args:
+        table: DynamoDB table resource
+
+    Returns:
+        int: Newest sequence (0 for an empty log)
+    """
+    newest = table.query(
+        KeyConditionExpression=Key('PK').eq(CHANGE_LOG_PARTITION),
+        ScanIndexForward=False,
+        Limit=1,
+        ConsistentRead=True
+    ).get('Items')
+    return int(newest[0]['sequence']) if newest else 0
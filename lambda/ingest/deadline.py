@@ -0,0 +1,76 @@
+"""
+NFL Tackle Leaders - Invocation Deadline
+Tracks the time left in a Lambda invocation so batch and backfill work stops
+starting new units before the timeout, plus a local stand-in context
+"""
+import os
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Any, Optional
+
+# Environment variables
+DEADLINE_RESERVE_MS = int(os.environ.get('DEADLINE_RESERVE_MS', '5000'))  # kept for hand-off and response
+
+
+class Deadline:
+    """
+    Remaining time of one invocation and the cost of its work units
+
+    A new unit is only started when the remaining time covers the slowest
+    unit seen so far plus the reserve, so a unit (and its DynamoDB writes)
+    is never cut off by the timeout. Without a Lambda context there is no
+    deadline.
+    """
+
+    def __init__(self, context: Any = None, reserve_ms: int = DEADLINE_RESERVE_MS):
+        self.context = context if hasattr(context, 'get_remaining_time_in_millis') else None
+        self.reserve = reserve_ms / 1000
+        self.slowest_unit = 0.0
+        self.units = 0
+
+    def remaining(self) -> float:
+        """Seconds left in the invocation (infinite without a context)"""
+        if self.context is None:
+            return float('inf')
+        return self.context.get_remaining_time_in_millis() / 1000
+
+    def can_start_unit(self) -> bool:
+        """
+        Decide whether there is time for one more unit
+
+        Returns:
+            bool: True if the slowest unit so far would still finish
+                before the reserve
+        """
+        return self.remaining() - self.slowest_unit > self.reserve
+
+    @contextmanager
+    def unit(self):
+        """Time one unit of work"""
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.units += 1
+            self.slowest_unit = max(self.slowest_unit, time.monotonic() - start)
+
+
+class LocalContext:
+    """
+    Stand-in for the Lambda context object when running handlers locally
+
+    The deadline starts when the context is created, so build one per
+    simulated invocation.
+    """
+
+    def __init__(self, timeout_seconds: float = 900, function_name: str = 'nfl-leaders-ingest',
+                 request_id: Optional[str] = None):
+        self.function_name = function_name
+        self.aws_request_id = request_id or str(uuid.uuid4())
+        self.invoked_function_arn = f"arn:aws:lambda:local:000000000000:function:{function_name}"
+        self.memory_limit_in_mb = 512
+        self._deadline = time.monotonic() + timeout_seconds
+
+    def get_remaining_time_in_millis(self) -> int:
+        return max(0, int((self._deadline - time.monotonic()) * 1000))
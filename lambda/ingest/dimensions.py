@@ -0,0 +1,173 @@
+"""
+NFL Tackle Leaders - Player/Team Dimensions
+Descriptive player and team attributes live in their own items, written only
+when they change; leader facts carry just the IDs
+"""
+import logging
+from typing import Dict, Any, Iterable, List, Set, Tuple
+
+from dynamodb_client import query_partition
+
+logger = logging.getLogger()
+
+# Dimension kind -> (partition key, fact ID attribute, descriptive attributes)
+DIMENSIONS = {
+    'PLAYER': ('DIM#PLAYER', 'player_id', ('player_name', 'player_short_name')),
+    'TEAM': ('DIM#TEAM', 'team_id', ('team_name', 'team_abbreviation'))
+}
+
+# Every attribute that moved from leader facts to dimension items
+DIMENSION_ATTRIBUTES = tuple(
+    attribute for _, _, attributes in DIMENSIONS.values() for attribute in attributes
+)
+
+# Dimension values already known to be stored, for the life of a warm container
+_stored: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
+# Kinds whose every stored item has been read into _stored
+_loaded_kinds: Set[str] = set()
+
+
+def dimension_key(kind: str, entity_id: str) -> Dict[str, str]:
+    """
+    Build the DynamoDB key of a dimension item
+
+    All players (and all teams) share one partition so a reader can load
+    every dimension with two queries.
+
+    Args:
+        kind: PLAYER or TEAM
+        entity_id: ESPN athlete or team ID
+
+    Returns:
+        dict: PK/SK key
+    """
+    return {'PK': DIMENSIONS[kind][0], 'SK': str(entity_id)}
+
+
+def store_dimensions(table, leader) -> int:
+    """
+    Write the leader's player and team items if they are new or changed
+
+    Args:
+        table: DynamoDB table resource
+        leader: LeaderRecord (or anything with the fact and name attributes)
+
+    Returns:
+        int: Number of dimension items written
+    """
+    written = 0
+
+    for kind, (_, id_attribute, attributes) in DIMENSIONS.items():
+        entity_id = getattr(leader, id_attribute)
+        if entity_id is None:
+            continue
+
+        values = {attribute: getattr(leader, attribute) for attribute in attributes}
+        if _stored.get((kind, entity_id)) == values:
+            continue
+
+        key = dimension_key(kind, entity_id)
+        current = table.get_item(Key=key, ProjectionExpression=', '.join(attributes)).get('Item') or {}
+        if any(current.get(attribute) != value for attribute, value in values.items()):
+            table.put_item(Item=dict(key, **values))
+            logger.info(f"Stored {kind.lower()} dimension {entity_id}: {values}")
+            written += 1
+
+        _stored[(kind, entity_id)] = values
+
+    return written
+
+
+def unknown_dimensions(table, kind: str, entity_ids: Iterable[str]) -> Set[str]:
+    """
+    IDs that have no dimension item yet
+
+    The kind's partition is read once per warm container; items written
+    since are tracked by store_dimensions and remember_dimensions.
+
+    Args:
+        table: DynamoDB table resource
+        kind: PLAYER or TEAM
+        entity_ids: ESPN athlete or team IDs
+
+    Returns:
+        set: IDs without a stored dimension item
+    """
+    if kind not in _loaded_kinds:
+        partition, _, attributes = DIMENSIONS[kind]
+        for item in query_partition(table, partition):
+            _stored.setdefault((kind, item['SK']), {attribute: item.get(attribute) for attribute in attributes})
+        _loaded_kinds.add(kind)
+
+    return {entity_id for entity_id in entity_ids if (kind, entity_id) not in _stored}
+
+
+def dimension_item(kind: str, entity_id: str, values: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build a dimension item for a batch writer
+
+    Args:
+        kind: PLAYER or TEAM
+        entity_id: ESPN athlete or team ID
+        values: Descriptive attributes
+
+    Returns:
+        dict: Item
+    """
+    return dict(dimension_key(kind, entity_id), **values)
+
+
+def remember_dimensions(dimensions: Dict[Tuple[str, str], Dict[str, Any]]):
+    """
+    Record dimension items written outside store_dimensions
+
+    Args:
+        dimensions: (kind, id) -> descriptive attributes that were stored
+    """
+    _stored.update(dimensions)
+
+
+def load_dimensions(table) -> Dict[Tuple[str, str], Dict[str, Any]]:
+    """
+    Read every player and team dimension item
+
+    Args:
+        table: DynamoDB table resource
+
+    Returns:
+        dict: (kind, id) -> descriptive attributes
+    """
+    dimensions = {}
+
+    for kind, (partition, _, attributes) in DIMENSIONS.items():
+        for item in query_partition(table, partition):
+            dimensions[(kind, item['SK'])] = {attribute: item.get(attribute) for attribute in attributes}
+
+    return dimensions
+
+
+def join_dimensions(items: Iterable[Dict[str, Any]],
+                    dimensions: Dict[Tuple[str, str], Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Fill leader items' descriptive attributes from the dimensions
+
+    Items written before the split still carry their own copies, which
+    are kept when no dimension item exists.
+
+    Args:
+        items: Raw DynamoDB leader items
+        dimensions: Output of load_dimensions
+
+    Returns:
+        list: Copies of the items with player/team names filled in
+    """
+    joined = []
+
+    for item in items:
+        item = dict(item)
+        for kind, (_, id_attribute, _) in DIMENSIONS.items():
+            item.update(dimensions.get((kind, item.get(id_attribute)), {}))
+        joined.append(item)
+
+    return joined
@@ -0,0 +1,79 @@
+"""
+NFL Tackle Leaders - Ingest DynamoDB helpers
+Paginated reads of leader and dimension items shared by the archive and
+snapshot builders
+"""
+from typing import Dict, Any, Iterable, List
+from boto3.dynamodb.conditions import Key
+
+
+def query_season_items(table, season: str) -> List[Dict[str, Any]]:
+    """
+    Read every leader item for a season from DynamoDB
+
+    Args:
+        table: DynamoDB table resource
+        season: NFL season (e.g., "2025")
+
+    Returns:
+        list: Raw DynamoDB items, following pagination
+    """
+    return _collect_pages(table.query, {
+        'KeyConditionExpression': Key('PK').eq(f"SEASON#{season}") &
+                                  Key('SK').begins_with('WEEK#')
+    })
+
+
+def query_leader_items(table, stat_types: Iterable[str]) -> List[Dict[str, Any]]:
+    """
+    Read every leader item for every season through StatTypeIndex
+
+    Only leader facts carry a top-level stat_type, so the index holds
+    nothing else: per-game player lines and change-log entries sharing the
+    table are never read (a filtered Scan is billed for every item).
+
+    Args:
+        table: DynamoDB table resource
+        stat_types: Stat types to read (e.g. TOTAL_TACKLES)
+
+    Returns:
+        list: Raw DynamoDB items, following pagination
+    """
+    items = []
+    for stat_type in stat_types:
+        items.extend(_collect_pages(table.query, {
+            'IndexName': 'StatTypeIndex',
+            'KeyConditionExpression': Key('stat_type').eq(stat_type)
+        }))
+    return items
+
+
+def query_partition(table, partition: str) -> List[Dict[str, Any]]:
+    """
+    Read every item in a partition (e.g. the DIM#PLAYER dimension items)
+
+    Args:
+        table: DynamoDB table resource
+        partition: PK value
+
+    Returns:
+        list: Raw DynamoDB items, following pagination
+    """
+    return _collect_pages(table.query, {
+        'KeyConditionExpression': Key('PK').eq(partition)
+    })
+
+
+def _collect_pages(operation, request: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Run a query/scan until LastEvaluatedKey is exhausted"""
+    items = []
+    request = dict(request)
+
+    while True:
+        response = operation(**request)
+        items.extend(response.get('Items', []))
+
+        last_key = response.get('LastEvaluatedKey')
+        if not last_key:
+            return items
+        request['ExclusiveStartKey'] = last_key
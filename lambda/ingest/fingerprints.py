@@ -0,0 +1,117 @@
+"""
+NFL Tackle Leaders - Live Mode Fingerprints
+Compact per-category digests of the last-seen leaders, used to skip
+reference resolution and writes for categories that did not change
+"""
+from datetime import datetime
+import hashlib
+import logging
+import os
+from typing import Dict, Any, Optional
+
+logger = logging.getLogger()
+
+# How many top entries of a category feed its fingerprint
+LIVE_FINGERPRINT_DEPTH = int(os.environ.get('LIVE_FINGERPRINT_DEPTH', '1'))
+
+# Warm-container copy of the stored state: {'week': int, 'fingerprints': {...}}
+_last_seen: Dict[str, Dict[str, Any]] = {}
+
+
+def state_key(season: str) -> Dict[str, str]:
+    """
+    Build the DynamoDB key of the live-mode state item
+
+    Args:
+        season: NFL season
+
+    Returns:
+        dict: PK/SK key
+    """
+    return {'PK': 'STATE#INGEST', 'SK': f"LIVE#{season}"}
+
+
+def category_fingerprints(leaders_data: Dict[str, Any], categories: Dict[str, str]) -> Dict[str, Optional[str]]:
+    """
+    Digest the top entries of each tracked category
+
+    Only the athlete ID and value of each entry are hashed, so the digest
+    changes exactly when the stored leader row would, whichever source
+    (leader_sources) served the document.
+
+    Args:
+        leaders_data: ESPN leaders document
+        categories: {stat_type: ESPN category name}
+
+    Returns:
+        dict: {stat_type: 16-char hex digest, or None if the category is missing}
+    """
+    by_name = {category.get('name'): category for category in leaders_data.get('categories', [])}
+
+    fingerprints = {}
+    for stat_type, name in categories.items():
+        category = by_name.get(name)
+        if category is None:
+            fingerprints[stat_type] = None
+            continue
+
+        digest = hashlib.blake2b(digest_size=8)
+        for leader in category.get('leaders', [])[:LIVE_FINGERPRINT_DEPTH]:
+            digest.update(str(leader.get('athlete', {}).get('id')).encode())
+            digest.update(b'|')
+            digest.update(str(leader.get('value')).encode())
+            digest.update(b';')
+        fingerprints[stat_type] = digest.hexdigest()
+
+    return fingerprints
+
+
+def load_last_seen(table, season: str, week: int) -> Dict[str, str]:
+    """
+    Get the fingerprints last written for this season and week
+
+    Args:
+        table: DynamoDB table resource
+        season: NFL season
+        week: Week being ingested (state from other weeks is ignored)
+
+    Returns:
+        dict: {stat_type: digest}, empty when nothing was written this week
+    """
+    state = _last_seen.get(season)
+    if state is None:
+        item = table.get_item(Key=state_key(season)).get('Item')
+        state = {
+            'week': int(item['week']) if item else None,
+            'fingerprints': dict(item['fingerprints']) if item else {}
+        }
+        _last_seen[season] = state
+
+    if state['week'] != week:
+        return {}
+    return state['fingerprints']
+
+
+def save_last_seen(table, season: str, week: int, fingerprints: Dict[str, str]):
+    """
+    Record the fingerprints of the leaders that were just written
+
+    Args:
+        table: DynamoDB table resource
+        season: NFL season
+        week: Week that was ingested
+        fingerprints: {stat_type: digest} for the categories written
+    """
+    current = load_last_seen(table, season, week)
+    merged = dict(current, **{k: v for k, v in fingerprints.items() if v is not None})
+
+    if merged == current:
+        return
+
+    table.put_item(Item=dict(
+        state_key(season),
+        week=week,
+        fingerprints=merged,
+        updated_at=datetime.utcnow().isoformat() + 'Z'
+    ))
+    _last_seen[season] = {'week': week, 'fingerprints': merged}
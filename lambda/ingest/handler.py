@@ -2,14 +2,30 @@
 NFL Tackle Leaders - Ingest Lambda Handler
 Fetches weekly leaders from ESPN Core API and stores in DynamoDB
 """
-from decimal import Decimal
 import json
 import os
 import logging
-from datetime import datetime
-from typing import Dict, Any, Optional
+from datetime import datetime, timezone
+from typing import Dict, Any, List, Optional, Tuple, Union
 import boto3
 import requests
+from change_log import record_change
+from deadline import Deadline
+from dimensions import DIMENSIONS, store_dimensions
+from fingerprints import LIVE_FINGERPRINT_DEPTH, category_fingerprints, load_last_seen, save_last_seen
+from leader_sources import CoreLeaderSource, LeadersUnavailable, SiteLeaderSource, fetch_leaders
+from models import LeaderRecord
+import player_stats
+from profiling import profiled
+from raw_archive import archive_body, archive_capture
+import schedule
+from search_index import update_search_index
+from season_summary import update_season_summary
+from snapshot import publish_snapshot
+from telemetry import instrumented, telemetry
+from throttling import ThrottledClient
+from tracked_stats import TRACKED_STATS
+from work_queue import get_work_queue
 
 # Configure logging
 logger = logging.getLogger()
@@ -19,123 +35,301 @@ logger.setLevel(os.environ.get('LOG_LEVEL', 'INFO'))
 TABLE_NAME = os.environ['TABLE_NAME']
 CURRENT_SEASON = os.environ['CURRENT_SEASON']
 ESPN_API_BASE_URL = os.environ['ESPN_API_BASE_URL']
+ARCHIVE_DESTINATION = os.environ.get('ARCHIVE_DESTINATION')  # local dir or s3://bucket/prefix
+RAW_ARCHIVE_DESTINATION = os.environ.get('RAW_ARCHIVE_DESTINATION')  # local dir or s3://bucket/prefix
+SNAPSHOT_LOCATION = os.environ.get('SNAPSHOT_LOCATION')  # local file or s3://bucket/key
+SCHEDULE_RULE_NAME = os.environ.get('SCHEDULE_RULE_NAME')  # set to enable adaptive scheduling
+OFF_SEASON_SCHEDULE = os.environ.get('OFF_SEASON_SCHEDULE', 'rate(7 days)')
+
+# Last regular-season week; ingesting it triggers the season archive
+FINAL_REGULAR_SEASON_WEEK = 18
+
+# Resolved athlete/team documents, kept for the life of a warm container
+REFERENCE_CACHE_SIZE = 512
+_reference_cache: Dict[str, Dict[str, Any]] = {}
+
+# ESPN client: adaptive concurrency, Retry-After and circuit breaker state
+# persist across invocations of a warm container
+espn = ThrottledClient()
+
+# Leaders sources in preference order; the site statistics API (on its own
+# client, so one source's breaker does not trip the other) hedges slow or
+# failing season-to-date fetches from the Core API. Resolved at call time by
+# get_leader_sources, so replacing `espn` also reaches the leaders fetch
+leader_sources = [
+    CoreLeaderSource(ESPN_API_BASE_URL, espn),
+    SiteLeaderSource(schedule.ESPN_SITE_API_BASE_URL, ThrottledClient())
+]
+
+# Parse time, bytes read and memory high-water of the last leaders document
+last_parse_stats: Dict[str, Any] = {}
+
+
+def get_leader_sources() -> List[Any]:
+    """
+    Return the leaders sources around the current `espn` client
+    
+    When `espn` has been replaced since the sources were built (e.g. by a
+    raw archive replay client in scripts/run_fanout.py), the Core API
+    source is rebuilt around it and used alone: the site API source's own
+    client would still reach the network.
+    
+    Returns:
+        list: Leader sources in preference order
+    """
+    global leader_sources
+    
+    if leader_sources[0].client is not espn:
+        leader_sources = [CoreLeaderSource(ESPN_API_BASE_URL, espn)]
+    return leader_sources
 
 # AWS clients
 dynamodb = boto3.resource('dynamodb')
 table = dynamodb.Table(TABLE_NAME)
 
 
+@profiled
+@instrumented
 def lambda_handler(event, context):
     """
     Main Lambda handler - fetches ESPN data and stores in DynamoDB
     
     Args:
-        event: Lambda event (can contain optional 'week' parameter)
-        context: Lambda context
+        event: Lambda event (can contain optional 'week', 'archive' and
+            'mode' parameters; mode 'live' writes only changed categories).
+            {'action': 'plan', ...} enqueues fan-out work items,
+            {'action': 'backfill', ...} ingests them inline until the
+            deadline nears, {'action': 'player_stats', ...} ingests every
+            player's defensive lines and SQS events are processed as work
+            batches.
+        context: Lambda context (its remaining time bounds batch and
+            backfill work)
     
     Returns:
         dict: Response with status and data
     """
+    deadline = Deadline(context)
+    
+    # SQS work batches report per-message failures; anything raised here
+    # fails the whole batch so it is redelivered
+    if is_queue_event(event):
+        telemetry.set_dimension('mode', 'batch')
+        return process_work_batch(event, deadline)
+    
     try:
         logger.info("Starting NFL leaders ingest")
         logger.info(f"Event: {json.dumps(event)}")
         
-        # Get week number (from event or auto-detect)
-        week_number = event.get('week') if event else None
+        event = event or {}
+        
+        # Fan-out ingest: the planner enqueues (season, week, stat) work items
+        if event.get('action') == 'plan':
+            telemetry.set_dimension('mode', 'plan')
+            return plan_ingest(event)
+        
+        # Inline backfill that hands whatever does not fit to the workers
+        if event.get('action') == 'backfill':
+            telemetry.set_dimension('mode', 'backfill')
+            return backfill(event, deadline)
+        
+        # Per-player defensive lines of the week's started games
+        if event.get('action') == 'player_stats':
+            telemetry.set_dimension('mode', 'player_stats')
+            return ingest_player_stats(event, deadline)
+        
+        # Scheduled wake-ups between game windows only need to reschedule
+        phase = None
+        if SCHEDULE_RULE_NAME and is_scheduled_event(event):
+            phase = schedule.next_poll_time(
+                schedule.get_season_calendar(CURRENT_SEASON), datetime.now(timezone.utc)
+            )[1]
+            if phase in ('idle', 'season_over'):
+                telemetry.set_dimension('mode', 'idle')
+                logger.info(f"No games in progress or recently finished ({phase}), skipping ingest")
+                return {
+                    'statusCode': 200,
+                    'body': json.dumps({
+                        'message': 'No new games to ingest',
+                        'season': CURRENT_SEASON,
+                        'next_run': schedule_next_run()
+                    })
+                }
+        
+        # Game-day polls only write categories whose leaders changed
+        live_mode = event.get('mode') == 'live' or phase in ('live', 'post_game')
+        telemetry.set_dimension('mode', 'live' if live_mode else 'full')
+        
+        # Resolve the week once so leaders, summaries and the raw archive
+        # agree on it (from event or auto-detect)
+        week_number = event.get('week')
+        if week_number is None:
+            week_number = get_current_nfl_week()
+        telemetry.set_properties(season=CURRENT_SEASON, week=week_number)
         
         # Fetch leaders from ESPN
-        leaders_data = fetch_espn_leaders()
+        with telemetry.span('fetch_leaders'):
+            leaders_data = fetch_espn_leaders(archive_week=week_number)
         
         if not leaders_data:
             raise Exception("Failed to fetch leaders data from ESPN")
         
-        # Extract tackle leader
-        tackles_leader = extract_stat_leader(leaders_data, 'totalTackles')
-        
-        # Extract sacks leader
-        sacks_leader = extract_stat_leader(leaders_data, 'sacks')
+        fingerprints = category_fingerprints(leaders_data, TRACKED_STATS)
+        if live_mode:
+            with telemetry.span('fingerprints'):
+                last_seen = load_last_seen(table, CURRENT_SEASON, week_number)
+            stat_types = [
+                stat_type for stat_type in TRACKED_STATS
+                if fingerprints[stat_type] is None or fingerprints[stat_type] != last_seen.get(stat_type)
+            ]
+            logger.info(f"Live mode: {len(stat_types)} of {len(TRACKED_STATS)} categories changed")
+        else:
+            stat_types = list(TRACKED_STATS)
+        telemetry.count('categories_skipped', len(TRACKED_STATS) - len(stat_types))
         
-        if not tackles_leader or not sacks_leader:
-            raise Exception("Failed to extract leaders from ESPN data")
+        # Extract leaders (resolving athlete/team references) for those categories
+        leaders = {}
+        with telemetry.span('extract_leaders'):
+            for stat_type in stat_types:
+                leaders[stat_type] = extract_stat_leader(leaders_data, stat_type, CURRENT_SEASON, week_number)
+                if not leaders[stat_type]:
+                    raise Exception("Failed to extract leaders from ESPN data")
         
-        # Store both leaders in DynamoDB
+        # Store leaders in DynamoDB and fold them into the season summaries
         results = []
+        summaries = []
         
-        # Store tackles leader
-        tackles_result = store_leader(
-            season=CURRENT_SEASON,
-            week=week_number,
-            stat_type='TOTAL_TACKLES',
-            leader_data=tackles_leader
-        )
-        results.append(tackles_result)
+        for leader in leaders.values():
+            results.append(store_leader(leader))
+            with telemetry.span('update_summary'):
+                summaries.append(update_season_summary(table, leader))
         
-        # Store sacks leader
-        sacks_result = store_leader(
-            season=CURRENT_SEASON,
-            week=week_number,
-            stat_type='SACKS',
-            leader_data=sacks_leader
-        )
-        results.append(sacks_result)
+        with telemetry.span('fingerprints'):
+            save_last_seen(table, CURRENT_SEASON, week_number,
+                           {stat_type: fingerprints[stat_type] for stat_type in leaders})
         
         logger.info(f"Successfully stored {len(results)} leaders")
         
+        if not results:
+            return {
+                'statusCode': 200,
+                'body': json.dumps({
+                    'message': 'No leader changes',
+                    'season': CURRENT_SEASON,
+                    'week': week_number,
+                    'mode': 'live',
+                    'parse': last_parse_stats,
+                    'leaders': [],
+                    'next_run': schedule_next_run()
+                })
+            }
+        
+        # Refresh the API's SQLite read replica now that the data changed
+        snapshot_result = None
+        if SNAPSHOT_LOCATION:
+            with telemetry.span('snapshot'):
+                snapshot_result = refresh_snapshot()
+        
+        # Archive the season as columnar history once the regular season ends
+        archive_result = None
+        if ARCHIVE_DESTINATION and (event.get('archive') or week_number >= FINAL_REGULAR_SEASON_WEEK):
+            with telemetry.span('archive'):
+                archive_result = archive_current_season()
+        
         return {
             'statusCode': 200,
             'body': json.dumps({
                 'message': 'Successfully ingested NFL leaders',
                 'season': CURRENT_SEASON,
                 'week': week_number,
-                'leaders': results
+                'mode': 'live' if live_mode else 'full',
+                'parse': last_parse_stats,
+                'leaders': results,
+                'summaries': summaries,
+                'snapshot': snapshot_result,
+                'archive': archive_result,
+                'next_run': schedule_next_run()
             })
         }
         
     except Exception as e:
+        telemetry.count('errors')
         logger.error(f"Error in lambda_handler: {str(e)}", exc_info=True)
         return {
             'statusCode': 500,
             'body': json.dumps({
-                'error': str(e)
+                'error': str(e),
+                'next_run': schedule_next_run()
             })
         }
 
 
-def fetch_espn_leaders() -> Optional[Dict[str, Any]]:
+def fetch_espn_leaders(season: Optional[str] = None, week: Optional[int] = None,
+                       archive_week: Optional[int] = None) -> Optional[Dict[str, Any]]:
     """
-    Fetch season leaders from ESPN Core API
+    Fetch leaders from ESPN (Core API, hedged with the site statistics API)
+    
+    The document is stream-parsed: only the tracked categories (and their
+    first few leaders) are built, and reading stops once they are found.
+    When the Core API is slower than usual or fails, the site API is asked
+    as well and the first complete document wins (see leader_sources).
+    Parse time, memory high-water and the winning source are kept in
+    last_parse_stats. With RAW_ARCHIVE_DESTINATION set, the complete body
+    of a Core API document is also archived.
+    
+    Args:
+        season: NFL season (defaults to CURRENT_SEASON)
+        week: Week for the single-week leaders document (None for the
+            season-to-date leaders)
+        archive_week: Week the raw response is indexed under (defaults to
+            week; the season-to-date document is indexed as the week it is
+            stored for)
     
     Returns:
-        dict: Leaders data from ESPN or None if failed
+        dict: Leaders data ({'categories': [...]}) or None if failed
     """
-    url = f"{ESPN_API_BASE_URL}/seasons/{CURRENT_SEASON}/types/2/leaders"
-    
-    logger.info(f"Fetching leaders from: {url}")
+    season = season or CURRENT_SEASON
     
     try:
-        response = requests.get(url, timeout=30)
-        response.raise_for_status()
-        data = response.json()
-        
-        logger.info(f"Successfully fetched leaders data")
-        return data
-        
-    except requests.exceptions.RequestException as e:
+        result = fetch_leaders(
+            get_leader_sources(), season, week, TRACKED_STATS.values(),
+            max_entries=max(1, LIVE_FINGERPRINT_DEPTH),
+            capture=bool(RAW_ARCHIVE_DESTINATION)
+        )
+    except LeadersUnavailable as e:
         logger.error(f"Error fetching from ESPN: {str(e)}")
         return None
+    
+    try:
+        if RAW_ARCHIVE_DESTINATION and result.source.archivable:
+            with telemetry.span('raw_archive'):
+                archive_raw(archive_capture, result.url, result.stream,
+                            archive_week if archive_week is not None else week)
+    finally:
+        result.close()
+    
+    telemetry.count('bytes_downloaded', result.stats['bytes_read'])
+    telemetry.set_properties(leaders_source=result.source.name)
+    last_parse_stats.clear()
+    last_parse_stats.update(result.stats)
+    logger.info(f"Successfully fetched leaders data: {json.dumps(result.stats)}")
+    return result.data
 
 
-def extract_stat_leader(data: Dict[str, Any], stat_name: str) -> Optional[Dict[str, Any]]:
+def extract_stat_leader(data: Dict[str, Any], stat_type: str, season: str, week: int) -> Optional[LeaderRecord]:
     """
     Extract the leader for a specific stat from ESPN data
     
     Args:
         data: ESPN API response data
-        stat_name: Name of stat (e.g., 'totalTackles', 'sacks')
+        stat_type: Tracked stat type (e.g., 'TOTAL_TACKLES', 'SACKS')
+        season: NFL season the data belongs to
+        week: Week the leader is stored under
     
     Returns:
-        dict: Leader information or None if not found
+        LeaderRecord: Leader or None if not found
     """
+    stat_name = TRACKED_STATS[stat_type]
+    
     try:
         categories = data.get('categories', [])
         
@@ -149,33 +343,25 @@ def extract_stat_leader(data: Dict[str, Any], stat_name: str) -> Optional[Dict[s
                 
                 leader = leaders[0]  # Top leader
                 
-                # Fetch athlete details
-                athlete_ref = leader.get('athlete', {}).get('$ref')
-                team_ref = leader.get('team', {}).get('$ref')
+                # Core API entries reference the athlete and team; the site
+                # API inlines them
+                athlete = leader.get('athlete', {})
+                team = leader.get('team', {})
+                athlete_ref = athlete.get('$ref')
+                team_ref = team.get('$ref')
                 
-                if not athlete_ref or not team_ref:
-                    logger.error(f"Missing refs for {stat_name} leader")
+                if not (athlete_ref or athlete.get('id')) or not (team_ref or team.get('id')):
+                    logger.error(f"Missing athlete/team for {stat_name} leader")
                     return None
                 
-                athlete_data = fetch_reference(athlete_ref)
-                team_data = fetch_reference(team_ref)
+                athlete_data = fetch_reference(athlete_ref) if athlete_ref else athlete
+                team_data = fetch_reference(team_ref) if team_ref else team
                 
                 if not athlete_data or not team_data:
                     logger.error(f"Failed to fetch athlete/team data for {stat_name}")
                     return None
                 
-                return {
-                    'stat_name': stat_name,
-                    'stat_display_name': category.get('displayName'),
-                    'value': leader.get('value'),
-                    'display_value': leader.get('displayValue'),
-                    'player_id': athlete_data.get('id'),
-                    'player_name': athlete_data.get('displayName'),
-                    'player_short_name': athlete_data.get('shortName'),
-                    'team_id': team_data.get('id'),
-                    'team_name': team_data.get('displayName'),
-                    'team_abbreviation': team_data.get('abbreviation')
-                }
+                return LeaderRecord.from_espn(season, week, stat_type, category, leader, athlete_data, team_data)
         
         logger.warning(f"Stat {stat_name} not found in categories")
         return None
@@ -187,7 +373,7 @@ def extract_stat_leader(data: Dict[str, Any], stat_name: str) -> Optional[Dict[s
 
 def fetch_reference(ref_url: str) -> Optional[Dict[str, Any]]:
     """
-    Fetch data from an ESPN reference URL
+    Fetch data from an ESPN reference URL (cached per warm container)
     
     Args:
         ref_url: ESPN API reference URL
@@ -195,78 +381,584 @@ def fetch_reference(ref_url: str) -> Optional[Dict[str, Any]]:
     Returns:
         dict: Referenced data or None if failed
     """
+    cached = _reference_cache.get(ref_url)
+    if cached is not None:
+        telemetry.count('reference_cache_hits')
+        return cached
+    telemetry.count('reference_cache_misses')
+    
     try:
-        response = requests.get(ref_url, timeout=10)
-        response.raise_for_status()
-        return response.json()
+        with telemetry.span('reference_fetch'):
+            response = espn.get(ref_url, timeout=10)
+            telemetry.count_status(response.status_code)
+            response.raise_for_status()
+            data = response.json()
+        telemetry.count('bytes_downloaded', len(response.content))
+        
+        if RAW_ARCHIVE_DESTINATION:
+            with telemetry.span('raw_archive'):
+                archive_raw(archive_body, ref_url, response.content)
+        
+        if len(_reference_cache) >= REFERENCE_CACHE_SIZE:
+            _reference_cache.clear()
+        _reference_cache[ref_url] = data
+        return data
     except requests.exceptions.RequestException as e:
+        telemetry.count('http_failures')
         logger.error(f"Error fetching reference {ref_url}: {str(e)}")
         return None
 
 
-def store_leader(season: str, week: Optional[int], stat_type: str, 
-                leader_data: Dict[str, Any]) -> Dict[str, Any]:
+def archive_raw(archive, url: str, body, week: Optional[int] = None) -> Optional[Dict[str, Any]]:
     """
-    Store a leader in DynamoDB
+    Write a raw ESPN response to RAW_ARCHIVE_DESTINATION
     
     Args:
-        season: NFL season (e.g., "2025")
-        week: Week number (None for season total)
-        stat_type: Type of stat (TOTAL_TACKLES or SACKS)
-        leader_data: Leader information from ESPN
+        archive: archive_body (for bytes) or archive_capture (for a RawCapture)
+        url: Request URL
+        body: Response bytes or capture
+        week: Week to index under (None to take it from the URL)
     
     Returns:
-        dict: Stored item summary
-    """
-    # Determine week (use current week if not specified)
-    if week is None:
-        week = get_current_nfl_week()
-    
-    # Construct DynamoDB keys
-    pk = f"SEASON#{season}"
-    sk = f"WEEK#{week:02d}#STAT#{stat_type}"
-    
-    item = {
-    'PK': pk,
-    'SK': sk,
-    'season': season,
-    'week_number': week,
-    'stat_type': stat_type,
-    'stat_display_name': leader_data['stat_display_name'],
-    'player_id': leader_data['player_id'],
-    'player_name': leader_data['player_name'],
-    'player_short_name': leader_data['player_short_name'],
-    'team_id': leader_data['team_id'],
-    'team_name': leader_data['team_name'],
-    'team_abbreviation': leader_data['team_abbreviation'],
-    'stat_value': Decimal(str(leader_data['value'])), # Store as Decimal for DynamoDB
-    'stat_display_value': leader_data['display_value'],
-    'updated_at': datetime.utcnow().isoformat() + 'Z'
-}
-    
-    logger.info(f"Storing leader: {stat_type} - {leader_data['player_name']} ({leader_data['display_value']})")
-    
-    table.put_item(Item=item)
+        dict: Archive entry or None if archiving failed
+    """
+    try:
+        return archive(RAW_ARCHIVE_DESTINATION, url, body, week)
+    except Exception as e:
+        # The response was already parsed; losing its archive copy is not fatal
+        logger.error(f"Error archiving raw response {url}: {str(e)}")
+        return None
+
+
+def plan_ingest(event: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Planner: enqueue one (season, week, stat) work item per unit of ingest
+    
+    Args:
+        event: {'action': 'plan'} plus optional 'season', 'weeks' (list) or
+            'start_week'/'end_week', and 'stats' (defaults: current season,
+            current week, every tracked stat)
+    
+    Returns:
+        dict: Response with the number of work items enqueued
+    """
+    season, weeks, stat_types, work_items = plan_work_items(event)
+    
+    enqueued = get_work_queue().send_batch(work_items)
+    logger.info(f"Enqueued {enqueued} of {len(work_items)} work items for season {season}")
+    
+    return {
+        'statusCode': 200,
+        'body': json.dumps({
+            'message': 'Planned ingest work',
+            'season': season,
+            'weeks': weeks,
+            'stats': stat_types,
+            'enqueued': enqueued
+        })
+    }
+
+
+def plan_work_items(event: Dict[str, Any]):
+    """
+    Expand a plan/backfill event into its (season, week, stat) work items
+    
+    Args:
+        event: Event with optional 'season', 'weeks' or 'start_week'/'end_week'
+            and 'stats' (see plan_ingest)
+    
+    Returns:
+        tuple: (season, weeks, stat_types, work_items in week order)
+    
+    Raises:
+        ValueError: For stats that are not tracked
+    """
+    season = str(event.get('season', CURRENT_SEASON))
+    
+    if 'weeks' in event:
+        weeks = [int(week) for week in event['weeks']]
+    elif 'start_week' in event:
+        weeks = list(range(int(event['start_week']), int(event.get('end_week', event['start_week'])) + 1))
+    else:
+        weeks = [get_current_nfl_week()]
+    
+    stat_types = event.get('stats', list(TRACKED_STATS))
+    unknown = [stat_type for stat_type in stat_types if stat_type not in TRACKED_STATS]
+    if unknown:
+        raise ValueError(f"Unknown stats: {', '.join(unknown)}")
+    
+    work_items = [
+        {'season': season, 'week': week, 'stat_type': stat_type}
+        for week in weeks
+        for stat_type in stat_types
+    ]
+    return season, weeks, stat_types, work_items
+
+
+def backfill(event: Dict[str, Any], deadline: Deadline) -> Dict[str, Any]:
+    """
+    Backfill inline: ingest work items in order while the invocation has
+    time, then enqueue the rest for the fan-out workers
+    
+    Units are only started while the deadline allows one more (see
+    Deadline), so no write is cut off by the timeout. The enqueued work
+    items are the continuation: the workers pick them up at full
+    concurrency, and units that failed here are retried there.
+    
+    Args:
+        event: {'action': 'backfill'} plus the plan_ingest parameters
+        deadline: Invocation deadline
+    
+    Returns:
+        dict: Response with stored/continued counts and the first
+            continued work item (the cursor)
+    """
+    season, weeks, stat_types, work_items = plan_work_items(event)
+    documents = {}
+    stored = 0
+    failed = []
+    
+    for index, work_item in enumerate(work_items):
+        if not deadline.can_start_unit():
+            remaining = work_items[index:]
+            break
+        try:
+            with deadline.unit():
+                ingest_work_item(work_item, documents)
+            stored += 1
+        except Exception as e:
+            telemetry.count('errors')
+            logger.error(f"Backfill of {work_item} failed: {str(e)}")
+            failed.append(work_item)
+    else:
+        remaining = []
+    
+    continuation = failed + remaining
+    enqueued = get_work_queue().send_batch(continuation) if continuation else 0
+    telemetry.count('units_deferred', len(remaining))
+    logger.info(f"Backfill of season {season}: {stored} stored inline, {len(failed)} failed, "
+                f"{len(remaining)} left at {deadline.remaining():.1f}s remaining; {enqueued} enqueued")
+    
+    if stored and not continuation and SNAPSHOT_LOCATION:
+        with telemetry.span('snapshot'):
+            refresh_snapshot()
+    
+    return {
+        'statusCode': 200,
+        'body': json.dumps({
+            'message': 'Backfilled inline' if not continuation else 'Backfill continued on the work queue',
+            'season': season,
+            'weeks': weeks,
+            'stats': stat_types,
+            'stored': stored,
+            'failed': len(failed),
+            'continued': enqueued,
+            'cursor': remaining[0] if remaining else None
+        })
+    }
+
+
+def ingest_player_stats(event: Dict[str, Any], deadline: Deadline) -> Dict[str, Any]:
+    """
+    Ingest the defensive line of every player who played in a week's games
+    
+    Only games in progress or final are read, and games whose final lines
+    are already stored are skipped unless 'full' is set, so polling during
+    a game window refetches just the live games. Each game is one deadline
+    unit; games without time left (and games that failed) are enqueued as
+    {'season', 'week', 'event_id'} work items for the fan-out workers.
+    
+    Args:
+        event: {'action': 'player_stats'} plus optional 'season', 'week'
+            (defaults: current season and week) and 'full'
+        deadline: Invocation deadline
+    
+    Returns:
+        dict: Response with game, player and line counts
+    """
+    season = str(event.get('season', CURRENT_SEASON))
+    week = int(event.get('week') or get_current_nfl_week())
+    
+    with telemetry.span('player_stats_games'):
+        games = player_stats.week_games(espn, ESPN_API_BASE_URL, season, week)
+    final = set() if event.get('full') else player_stats.load_final_games(table, season, week)
+    selected = [
+        game for game in games
+        if game['state'] in player_stats.PLAYED_STATES and game['event_id'] not in final
+    ]
+    
+    totals = {'players': 0, 'failed': 0, 'written': 0, 'removed': 0, 'unchanged': 0, 'dimensions': 0}
+    named_players = {}
+    ingested = 0
+    failed = []
+    for index, game in enumerate(selected):
+        if not deadline.can_start_unit():
+            remaining = selected[index:]
+            break
+        try:
+            with deadline.unit():
+                counts = ingest_player_game(season, week, game)
+            ingested += 1
+        except Exception as e:
+            telemetry.count('errors')
+            logger.error(f"Player stats of game {game['event_id']} failed: {str(e)}")
+            failed.append(game)
+            counts = e.counts if isinstance(e, player_stats.IncompleteGame) else {}
+        for name in totals:
+            totals[name] += counts.get(name, 0)
+        named_players.update(counts.get('named_players', {}))
+    else:
+        remaining = []
+    
+    # New players from every game go into the search index in one update
+    if named_players:
+        index_search_players(named_players)
+    
+    continuation = [
+        {'season': season, 'week': week, 'event_id': game['event_id']}
+        for game in failed + remaining
+    ]
+    enqueued = get_work_queue().send_batch(continuation) if continuation else 0
+    telemetry.count('units_deferred', len(remaining))
+    logger.info(f"Player stats of season {season} week {week}: {ingested} of {len(selected)} games "
+                f"({len(games) - len(selected)} not started or already final), {totals['written']} lines "
+                f"written, {totals['removed']} removed, {totals['unchanged']} unchanged; "
+                f"{enqueued} games enqueued")
     
     return {
-        'stat_type': stat_type,
-        'player': leader_data['player_name'],
-        'team': leader_data['team_abbreviation'],
-        'value': leader_data['display_value']
+        'statusCode': 200,
+        'body': json.dumps({
+            'message': 'Ingested player stats' if not continuation else 'Player stats continued on the work queue',
+            'season': season,
+            'week': week,
+            'games': len(games),
+            'skipped': len(games) - len(selected),
+            'ingested': ingested,
+            'failed': len(failed),
+            'continued': enqueued,
+            'players': totals['players'],
+            'lines_written': totals['written'],
+            'lines_removed': totals['removed'],
+            'lines_unchanged': totals['unchanged'],
+            'dimensions_written': totals['dimensions']
+        })
     }
 
 
+def ingest_player_game(season: str, week: int, game: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Store one game's player lines and, once it is final, mark it done
+    
+    Args:
+        season: NFL season
+        week: Week number
+        game: Game from player_stats.week_games/fetch_game
+    
+    Returns:
+        dict: player_stats.ingest_game counts
+    
+    Raises:
+        player_stats.IncompleteGame: If any player's statistics could not
+            be fetched (the lines that were fetched are stored; the game
+            is retried whole)
+    """
+    with telemetry.span('player_stats_game'):
+        counts = player_stats.ingest_game(table, espn, season, week, game)
+    telemetry.count('player_games')
+    telemetry.count('players_fetched', counts['fetched'])
+    
+    if counts['failed']:
+        raise player_stats.IncompleteGame(
+            f"{counts['failed']} of {counts['players']} player statistics failed", counts
+        )
+    if game['state'] == 'post':
+        player_stats.mark_final_games(table, season, week, {game['event_id']})
+    return counts
+
+
+def process_work_batch(event: Dict[str, Any], deadline: Optional[Deadline] = None) -> Dict[str, Any]:
+    """
+    Worker: store the leader for each (season, week, stat) message in an SQS batch
+    
+    Each (season, week) leaders document is fetched once per batch. Failed
+    messages are reported individually so SQS retries only those. Messages
+    the deadline leaves no time for are put back on the queue (without
+    counting against their receive limit) rather than started.
+    
+    Args:
+        event: SQS event with 'Records'
+        deadline: Invocation deadline (none when omitted)
+    
+    Returns:
+        dict: {'batchItemFailures': [{'itemIdentifier': messageId}, ...]}
+    """
+    deadline = deadline or Deadline()
+    records = event['Records']
+    failures = []
+    documents = {}
+    stored = 0
+    deferred = []
+    
+    for index, record in enumerate(records):
+        if not deadline.can_start_unit():
+            deferred = records[index:]
+            break
+        try:
+            with deadline.unit():
+                ingest_work_item(json.loads(record['body']), documents)
+            stored += 1
+        except Exception as e:
+            telemetry.count('errors')
+            logger.error(f"Work item {record.get('messageId')} failed: {str(e)}")
+            failures.append({'itemIdentifier': record['messageId']})
+    
+    if deferred:
+        failures.extend(defer_records(deferred))
+    
+    logger.info(f"Processed work batch: {stored} stored, {len(failures)} failed, {len(deferred)} deferred")
+    
+    # Whichever batch sees the queue empty publishes the snapshot; racing
+    # final batches each publish, which is harmless
+    if stored and SNAPSHOT_LOCATION:
+        try:
+            if get_work_queue().pending() == 0:
+                with telemetry.span('snapshot'):
+                    refresh_snapshot()
+        except Exception as e:
+            logger.error(f"Error checking work queue depth: {str(e)}")
+    
+    return {'batchItemFailures': failures}
+
+
+def ingest_work_item(work_item: Dict[str, Any], documents: Dict[Any, Any]) -> Union[LeaderRecord, Dict[str, Any]]:
+    """
+    Store the leader of one (season, week, stat) work item, or the player
+    lines of one (season, week, event_id) game
+    
+    Args:
+        work_item: {'season', 'week', 'stat_type'} or {'season', 'week', 'event_id'}
+        documents: (season, week) -> leaders document, shared by the
+            items of one invocation so each document is fetched once
+    
+    Returns:
+        LeaderRecord: Stored leader (a game's line counts for player stats)
+    
+    Raises:
+        Exception: If the document could not be fetched or the leader extracted
+    """
+    season = str(work_item['season'])
+    week = int(work_item['week'])
+    
+    if 'event_id' in work_item:
+        game = player_stats.fetch_game(espn, ESPN_API_BASE_URL, str(work_item['event_id']))
+        counts = ingest_player_game(season, week, game)
+        if counts['named_players']:
+            index_search_players(counts['named_players'])
+        return counts
+    stat_type = work_item['stat_type']
+    
+    if (season, week) not in documents:
+        with telemetry.span('fetch_leaders'):
+            documents[(season, week)] = fetch_espn_leaders(season, week)
+    leaders_data = documents[(season, week)]
+    if not leaders_data:
+        raise Exception(f"Failed to fetch leaders for season {season} week {week}")
+    
+    with telemetry.span('extract_leaders'):
+        leader = extract_stat_leader(leaders_data, stat_type, season, week)
+    if not leader:
+        raise Exception(f"Failed to extract {stat_type} leader for season {season} week {week}")
+    
+    store_leader(leader)
+    with telemetry.span('update_summary'):
+        update_season_summary(table, leader)
+    return leader
+
+
+def defer_records(records: list) -> list:
+    """
+    Put unstarted SQS messages back on the work queue as new messages
+    
+    Args:
+        records: SQS records that were not started
+    
+    Returns:
+        list: batchItemFailures for the records that could not be re-enqueued
+            (SQS redelivers those instead)
+    """
+    telemetry.count('units_deferred', len(records))
+    try:
+        enqueued = get_work_queue().send_batch([json.loads(record['body']) for record in records])
+    except Exception as e:
+        logger.error(f"Error re-enqueueing {len(records)} deferred work items: {str(e)}")
+        enqueued = 0
+    
+    if enqueued == len(records):
+        return []
+    # send_batch does not say which messages failed; redelivering all of
+    # them is safe because storing a leader is idempotent
+    return [{'itemIdentifier': record['messageId']} for record in records]
+
+
+def store_leader(leader: LeaderRecord) -> Dict[str, Any]:
+    """
+    Store a leader in DynamoDB
+    
+    The fact holds IDs and values; the player and team names go to their
+    dimension items, which are only rewritten when they change. Facts that
+    differ from the stored row are appended to the change log first.
+    
+    Args:
+        leader: Leader record (season, week and stat form the key)
+    
+    Returns:
+        dict: Stored item summary (with the change sequence, if any)
+    """
+    logger.info(f"Storing leader: {leader.stat_type} - {leader.player_name} ({leader.display_value})")
+    
+    item = leader.to_item()
+    with telemetry.span('store_dimensions'):
+        dimensions_written = store_dimensions(table, leader)
+    if dimensions_written:
+        index_search_players({leader.player_id: (leader.player_name, leader.player_short_name)})
+    with telemetry.span('record_change'):
+        sequence = record_change(table, item)
+    with telemetry.span('put_leader'):
+        table.put_item(Item=item)
+    
+    # Unchanged dimensions are skipped; the fact is always rewritten, and
+    # only a changed fact adds a change-log entry
+    telemetry.count('items_written', 1 + dimensions_written + (sequence is not None))
+    telemetry.count('items_skipped', len(DIMENSIONS) - dimensions_written + (sequence is None))
+    
+    return dict(leader.to_result(), change_sequence=sequence)
+
+
+def index_search_players(players: Dict[str, Tuple[Optional[str], Optional[str]]]):
+    """
+    Add new or renamed players to the /search prefix index
+    
+    A failure is logged rather than raised: the players are already
+    stored, and the next new player (or scripts/build_search_index.py)
+    brings the index up to date.
+    
+    Args:
+        players: Player ID -> (name, short name) of the dimensions just written
+    """
+    try:
+        with telemetry.span('search_index'):
+            added = update_search_index(table, players)
+        telemetry.count('search_index_updates', added)
+    except Exception as e:
+        telemetry.count('errors')
+        logger.error(f"Error updating search index for {len(players)} players: {str(e)}")
+
+
+def refresh_snapshot() -> Optional[Dict[str, Any]]:
+    """
+    Rebuild and publish the SQLite snapshot served by the API Lambda
+    
+    Returns:
+        dict: Snapshot summary or None if publishing failed
+    """
+    try:
+        return publish_snapshot(table, SNAPSHOT_LOCATION, TRACKED_STATS)
+    except Exception as e:
+        # Leaders are already stored; the API keeps serving the previous snapshot
+        logger.error(f"Error publishing snapshot: {str(e)}", exc_info=True)
+        return None
+
+
+def archive_current_season() -> Optional[Dict[str, Any]]:
+    """
+    Write the current season's history to the columnar archive
+    
+    Returns:
+        dict: Archive summary or None if archiving failed
+    """
+    try:
+        # Imported lazily: pyarrow ships in a layer and is only needed here
+        from archive import archive_season
+        
+        return archive_season(table, CURRENT_SEASON, ARCHIVE_DESTINATION)
+    except Exception as e:
+        logger.error(f"Error archiving season {CURRENT_SEASON}: {str(e)}", exc_info=True)
+        return None
+
+
 def get_current_nfl_week() -> int:
     """
-    Estimate current NFL week based on date
+    Determine the current NFL week from the ESPN season calendar
+    
+    Falls back to a date-based estimate when the calendar is unavailable.
+    
+    Returns:
+        int: Current week (1-18)
+    """
+    now = datetime.now(timezone.utc)
+    calendar = schedule.get_season_calendar(CURRENT_SEASON, now)
+    return schedule.current_week(calendar, CURRENT_SEASON, now)
+
+
+def is_queue_event(event) -> bool:
+    """
+    Check whether the invocation is an SQS work batch
+    
+    Args:
+        event: Lambda event
+    
+    Returns:
+        bool: True for SQS event source mapping batches
+    """
+    records = event.get('Records') if event else None
+    return bool(records) and records[0].get('eventSource') == 'aws:sqs'
+
+
+def is_scheduled_event(event) -> bool:
+    """
+    Check whether the invocation came from the EventBridge schedule
+    
+    Args:
+        event: Lambda event
+    
+    Returns:
+        bool: True for EventBridge scheduled events
+    """
+    return bool(event) and event.get('source') == 'aws.events'
+
+
+def schedule_next_run() -> Optional[Dict[str, Any]]:
+    """
+    Reschedule the ingest rule around the game calendar
     
     Returns:
-        int: Estimated current week (1-18)
+        dict: Next run time, phase and expression, or None when disabled/failed
     """
-    # Simple estimation: Week 1 starts ~first week of September
-    # For production, you'd want a more robust calculation
-    # For now, return Week 15 as default (mid-December)
-    return 15
+    if not SCHEDULE_RULE_NAME:
+        return None
+    
+    try:
+        with telemetry.span('reschedule'):
+            now = datetime.now(timezone.utc)
+            calendar = schedule.get_season_calendar(CURRENT_SEASON, now)
+            run_at, phase = schedule.next_poll_time(calendar, now)
+            
+            if run_at is None:
+                expression = OFF_SEASON_SCHEDULE
+            else:
+                expression = schedule.rate_expression(run_at, now)
+            
+            schedule.reschedule(SCHEDULE_RULE_NAME, expression)
+        
+        return {
+            'run_at': run_at.isoformat() if run_at else None,
+            'phase': phase,
+            'schedule_expression': expression
+        }
+    except Exception as e:
+        # The rule keeps recurring at its previous interval, so ingest still runs
+        logger.error(f"Error rescheduling ingest: {str(e)}", exc_info=True)
+        return None
 
 
 # For local testing
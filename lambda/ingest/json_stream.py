@@ -0,0 +1,138 @@
+"""
+NFL Tackle Leaders - Streaming ESPN JSON Extraction
+Event-based parse that keeps only the configured categories (and their
+first few entries) and stops reading once they have all been seen
+"""
+import json
+import logging
+import resource
+import time
+from typing import Dict, Any, Iterable, Optional, Tuple
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+logger = logging.getLogger()
+
+
+class CountingReader:
+    """File-like wrapper that counts the bytes read from a stream"""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.bytes_read = 0
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self.stream.read(size)
+        self.bytes_read += len(chunk)
+        return chunk
+
+
+def extract_categories(stream, names: Iterable[str], array_path: str = 'categories',
+                       entries_key: str = 'leaders',
+                       max_entries: Optional[int] = None) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Pull the named categories out of an ESPN document without building the rest
+
+    Works for the leaders documents (categories[].leaders[]) and athlete
+    statistics pages (splits.categories[].stats[]).
+
+    Args:
+        stream: Binary file-like object (e.g. requests' response.raw)
+        names: Category names to keep
+        array_path: Dotted path of the categories array
+        entries_key: Key of each category's entry list
+        max_entries: Keep only the first N entries of each category
+
+    Returns:
+        tuple: ({'categories': [...kept categories, in document order]},
+                {'parse_seconds', 'bytes_read', 'stopped_early', 'max_rss_mb'})
+
+    Raises:
+        ValueError: If the document is not valid JSON
+    """
+    start = time.perf_counter()
+    reader = CountingReader(stream)
+    wanted = set(names)
+
+    if ijson is None:
+        # Whole-document fallback (same result, unbounded memory)
+        document = json.load(reader)
+        node = document
+        for key in array_path.split('.'):
+            node = node.get(key, {}) if isinstance(node, dict) else {}
+        categories = [
+            dict(category, **{entries_key: category.get(entries_key, [])[:max_entries]})
+            for category in (node if isinstance(node, list) else [])
+            if category.get('name') in wanted
+        ]
+        stopped_early = False
+    else:
+        try:
+            categories, stopped_early = _stream_categories(reader, wanted, array_path, entries_key, max_entries)
+        except ijson.JSONError as e:
+            raise ValueError(f"Invalid JSON from ESPN: {str(e)}") from e
+
+    stats = {
+        'parse_seconds': round(time.perf_counter() - start, 4),
+        'bytes_read': reader.bytes_read,
+        'stopped_early': stopped_early,
+        'max_rss_mb': round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+    }
+    return {'categories': categories}, stats
+
+
+def _stream_categories(reader, wanted: set, array_path: str, entries_key: str,
+                       max_entries: Optional[int]):
+    """Event loop behind extract_categories (returns categories, stopped early)"""
+    item_prefix = f"{array_path}.item"
+    name_prefix = f"{item_prefix}.name"
+    entry_prefix = f"{item_prefix}.{entries_key}.item"
+
+    remaining = set(wanted)
+    categories = []
+    builder = None          # ObjectBuilder for the category being read
+    name = None
+    skip_category = False
+    entries = 0
+    skip_entry = False
+
+    for prefix, event, value in ijson.parse(reader, use_float=True):
+        if prefix == item_prefix:
+            if event == 'start_map':
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+                name, skip_category, entries, skip_entry = None, False, 0, False
+                continue
+            if event == 'end_map':
+                if not skip_category and name in remaining:
+                    builder.event(event, value)
+                    categories.append(builder.value)
+                    remaining.discard(name)
+                    if not remaining:
+                        return categories, True
+                builder = None
+                continue
+
+        if builder is None or skip_category:
+            continue
+
+        if prefix == name_prefix and event == 'string':
+            name = value
+            if name not in remaining:
+                skip_category = True
+                continue
+
+        if prefix == entry_prefix and event == 'start_map':
+            entries += 1
+            skip_entry = max_entries is not None and entries > max_entries
+        if skip_entry:
+            if prefix == entry_prefix and event == 'end_map':
+                skip_entry = False
+            continue
+
+        builder.event(event, value)
+
+    return categories, False
@@ -0,0 +1,360 @@
+"""
+NFL Tackle Leaders - Leaders Sources
+The ESPN Core API and site statistics API as interchangeable leaders sources,
+normalized to the same document, with hedged fetching: when the primary has
+not answered within its usual latency, the alternate is asked as well and
+the first valid document wins
+"""
+import logging
+import math
+import os
+import re
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+from json_stream import extract_categories
+from raw_archive import RawCapture
+from telemetry import telemetry
+
+logger = logging.getLogger()
+
+# Environment variables
+LEADERS_HEDGE_ENABLED = os.environ.get('LEADERS_HEDGE_ENABLED', 'true').lower() == 'true'
+LEADERS_HEDGE_PERCENTILE = float(os.environ.get('LEADERS_HEDGE_PERCENTILE', '95'))
+LEADERS_HEDGE_DEFAULT_DELAY = float(os.environ.get('LEADERS_HEDGE_DEFAULT_DELAY', '2.0'))  # seconds
+
+# Latency samples kept per source (per warm container), and how many are
+# needed before the percentile replaces the default hedge delay
+LATENCY_WINDOW = 50
+MIN_LATENCY_SAMPLES = 5
+
+# Never hedge sooner than this, however fast the primary has been
+MIN_HEDGE_DELAY = 0.05
+
+REQUEST_TIMEOUT = 30
+
+ATHLETE_ID_PATTERN = re.compile(r'/athletes/(\d+)')
+
+# Attempts outlive a hedged fetch only until their response is closed
+_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix='leaders')
+
+
+class LeadersUnavailable(Exception):
+    """No source produced a valid leaders document"""
+
+
+class LatencyTracker:
+    """Recent time-to-document samples of one source"""
+
+    def __init__(self, window: int = LATENCY_WINDOW, percentile: float = LEADERS_HEDGE_PERCENTILE,
+                 default_delay: float = LEADERS_HEDGE_DEFAULT_DELAY):
+        self.samples = deque(maxlen=window)
+        self.percentile = percentile
+        self.default_delay = default_delay
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float):
+        with self._lock:
+            self.samples.append(seconds)
+
+    def hedge_delay(self) -> float:
+        """
+        How long to wait for this source before hedging
+
+        Returns:
+            float: Seconds (the configured percentile of recent samples, or
+                the default delay until there are enough of them)
+        """
+        with self._lock:
+            if len(self.samples) < MIN_LATENCY_SAMPLES:
+                return self.default_delay
+            ordered = sorted(self.samples)
+        rank = max(1, math.ceil(self.percentile / 100 * len(ordered)))
+        return max(MIN_HEDGE_DELAY, ordered[rank - 1])
+
+
+class LeaderSource:
+    """
+    One API that serves leaders documents
+
+    Subclasses build the URL and normalize the response to the Core API
+    shape: {'categories': [{'name', 'displayName', 'leaders': [{'value',
+    'displayValue', 'athlete', 'team'}]}]}, where athlete and team are
+    either {'$ref', 'id'} (resolved later) or inline documents.
+    """
+
+    name = 'source'
+    archivable = False  # raw_archive indexes Core API URLs only
+
+    def __init__(self, base_url: str, client):
+        self.base_url = base_url
+        self.client = client
+        self.latency = LatencyTracker()
+
+    def url(self, season: str, week: Optional[int]) -> Optional[str]:
+        """Leaders document URL, or None if this source cannot serve the request"""
+        raise NotImplementedError
+
+    def parse(self, stream, names: Iterable[str], max_entries: int) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Stream-parse a response into the normalized document and parse stats"""
+        raise NotImplementedError
+
+
+class CoreLeaderSource(LeaderSource):
+    """ESPN Core API leaders (season-to-date or single week; athletes/teams are $refs)"""
+
+    name = 'core'
+    archivable = True
+
+    def url(self, season: str, week: Optional[int]) -> Optional[str]:
+        if week is None:
+            return f"{self.base_url}/seasons/{season}/types/2/leaders"
+        return f"{self.base_url}/seasons/{season}/types/2/weeks/{week}/leaders"
+
+    def parse(self, stream, names: Iterable[str], max_entries: int) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        data, stats = extract_categories(stream, names, max_entries=max_entries)
+        for category in data['categories']:
+            for entry in category.get('leaders', []):
+                athlete = entry.get('athlete') or {}
+                match = ATHLETE_ID_PATTERN.search(athlete.get('$ref') or '')
+                if match and 'id' not in athlete:
+                    athlete['id'] = match.group(1)
+        return data, stats
+
+
+class SiteLeaderSource(LeaderSource):
+    """ESPN site statistics API (season-to-date only; athletes and teams inline)"""
+
+    name = 'site'
+
+    def url(self, season: str, week: Optional[int]) -> Optional[str]:
+        if week is not None:
+            return None
+        return f"{self.base_url}/statistics?season={season}&seasontype=2"
+
+    def parse(self, stream, names: Iterable[str], max_entries: int) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        data, stats = extract_categories(stream, names, array_path='stats.categories', max_entries=max_entries)
+        categories = []
+        for category in data['categories']:
+            leaders = []
+            for entry in category.get('leaders', []):
+                athlete = entry.get('athlete') or {}
+                team = entry.get('team') or athlete.get('team') or {}
+                # Facts are keyed by both ids, so a leader missing either
+                # rejects the document and the hedge falls through to Core
+                if _entity_id(athlete) is None or _entity_id(team) is None:
+                    raise ValueError(f"{self.name} leaders document has a {category.get('name')} "
+                                     f"leader without an athlete or team id")
+                leaders.append({
+                    'value': entry.get('value'),
+                    'displayValue': entry.get('displayValue'),
+                    'athlete': {
+                        'id': _entity_id(athlete),
+                        'displayName': athlete.get('displayName'),
+                        'shortName': athlete.get('shortName')
+                    },
+                    'team': {
+                        'id': _entity_id(team),
+                        'displayName': team.get('displayName'),
+                        'abbreviation': team.get('abbreviation')
+                    }
+                })
+            categories.append({
+                'name': category.get('name'),
+                'displayName': category.get('displayName'),
+                'leaders': leaders
+            })
+        return {'categories': categories}, stats
+
+
+class LeadersFetch:
+    """A fetched, parsed leaders document and the still-open response behind it"""
+
+    def __init__(self, source: LeaderSource, url: str, data: Dict[str, Any], stats: Dict[str, Any],
+                 response, stream, seconds: float):
+        self.source = source
+        self.url = url
+        self.data = data
+        self.stats = stats
+        self.response = response
+        self.stream = stream
+        self.seconds = seconds
+
+    def close(self):
+        self.response.close()
+
+
+class _Attempt:
+    """One source's in-flight fetch; cancel() closes its response"""
+
+    def __init__(self, source: LeaderSource):
+        self.source = source
+        self.started = time.monotonic()
+        self.response = None
+        self.cancelled = False
+        self._lock = threading.Lock()
+
+    def attach(self, response):
+        with self._lock:
+            self.response = response
+            cancelled = self.cancelled
+        if cancelled:
+            response.close()
+            raise LeadersUnavailable(f"{self.source.name} fetch cancelled")
+
+    def cancel(self):
+        with self._lock:
+            self.cancelled = True
+            response = self.response
+        if response is not None:
+            response.close()
+
+
+def fetch_leaders(sources: List[LeaderSource], season: str, week: Optional[int], names: Iterable[str],
+                  max_entries: int, capture: bool = False) -> LeadersFetch:
+    """
+    Fetch a leaders document, hedging the primary source with the others
+
+    The first source that serves the request is the primary. If it has not
+    produced a valid document within its hedge delay (or fails before
+    then), the remaining sources are asked as well; the first valid
+    document wins and the other attempts are closed. Sources that cannot
+    serve the request (the site API has no single-week leaders) are
+    skipped.
+
+    Args:
+        sources: Sources in preference order
+        season: NFL season
+        week: Single week, or None for season-to-date
+        names: Category names that must all be present
+        max_entries: Entries kept per category
+        capture: Wrap archivable responses in a RawCapture
+
+    Returns:
+        LeadersFetch: Winning document (the caller archives and closes it)
+
+    Raises:
+        LeadersUnavailable: If every source failed
+    """
+    names = list(names)
+    candidates = [source for source in sources if source.url(season, week)]
+    if not candidates:
+        raise LeadersUnavailable(f"No leaders source serves season {season} week {week}")
+    errors = []
+
+    primary = candidates[0]
+    if len(candidates) == 1 or not LEADERS_HEDGE_ENABLED:
+        try:
+            return _fetch(_Attempt(primary), season, week, names, max_entries, capture)
+        except Exception as e:
+            _record_failure(primary, e, errors)
+            raise LeadersUnavailable(errors[0]) from e
+
+    primary_attempt = _Attempt(primary)
+    primary_future = _executor.submit(_fetch, primary_attempt, season, week, names, max_entries, capture)
+    attempts = {primary_future: primary_attempt}
+
+    done, pending = wait(attempts, timeout=primary.latency.hedge_delay())
+    winner = _first_valid(done, attempts, errors)
+
+    if winner is None:
+        telemetry.count('leaders_hedged')
+        logger.info(f"Hedging {'failed' if done else 'slow'} {primary.name} leaders request "
+                    f"with {', '.join(source.name for source in candidates[1:])}")
+        for source in candidates[1:]:
+            attempt = _Attempt(source)
+            future = _executor.submit(_fetch, attempt, season, week, names, max_entries, capture)
+            attempts[future] = attempt
+            pending.add(future)
+
+        while winner is None and pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            winner = _first_valid(done, attempts, errors)
+
+    # A primary that lost is still observed: its elapsed time is a lower
+    # bound, and dropping it would bias the percentile towards hedging sooner
+    if primary_future in pending:
+        primary.latency.observe(time.monotonic() - primary_attempt.started)
+
+    for future in pending:
+        attempts[future].cancel()
+        future.add_done_callback(_close_result)
+
+    if winner is None:
+        raise LeadersUnavailable('; '.join(errors))
+    if winner.source is not primary:
+        telemetry.count('leaders_hedge_wins')
+    return winner
+
+
+def _fetch(attempt: _Attempt, season: str, week: Optional[int], names: List[str],
+           max_entries: int, capture: bool) -> LeadersFetch:
+    """Fetch and parse one source's document, checking every category is present"""
+    source = attempt.source
+    url = source.url(season, week)
+    logger.info(f"Fetching leaders from {source.name}: {url}")
+
+    with telemetry.span('leaders_request'):
+        response = source.client.get(url, timeout=REQUEST_TIMEOUT, stream=True)
+    telemetry.count_status(response.status_code)
+    attempt.attach(response)
+
+    try:
+        response.raise_for_status()
+        response.raw.decode_content = True
+        stream = RawCapture(response.raw) if capture and source.archivable else response.raw
+        # Headers arrive with the response; the body is read while parsing
+        with telemetry.span('leaders_parse'):
+            data, stats = source.parse(stream, names, max_entries)
+
+        found = {category.get('name') for category in data['categories'] if category.get('leaders')}
+        missing = [name for name in names if name not in found]
+        if missing:
+            raise ValueError(f"{source.name} leaders document is missing {missing}")
+    except Exception:
+        response.close()
+        raise
+
+    seconds = time.monotonic() - attempt.started
+    source.latency.observe(seconds)
+    return LeadersFetch(source, url, data, dict(stats, source=source.name), response, stream, seconds)
+
+
+def _first_valid(done, attempts: Dict[Any, _Attempt], errors: List[str]) -> Optional[LeadersFetch]:
+    """Return the first successful result among finished attempts, recording the failures"""
+    winner = None
+    for future in done:
+        try:
+            result = future.result()
+        except Exception as e:
+            # Any failure (HTTP, truncated or incomplete document) falls
+            # through to the other sources
+            if not attempts[future].cancelled:
+                _record_failure(attempts[future].source, e, errors)
+            continue
+        if winner is None:
+            winner = result
+        else:
+            result.close()
+    return winner
+
+
+def _record_failure(source: LeaderSource, error: Exception, errors: List[str]):
+    """Count and log a source that failed to produce a document"""
+    telemetry.count('http_failures')
+    errors.append(f"{source.name}: {str(error)}")
+    logger.warning(f"Leaders source {source.name} failed: {str(error)}")
+
+
+def _close_result(future):
+    """Close the response of an attempt that finished after losing"""
+    if not future.cancelled() and future.exception() is None:
+        future.result().close()
+
+
+def _entity_id(entity: Dict[str, Any]) -> Optional[str]:
+    """An inline athlete/team ID as a string (None when ESPN left it out)"""
+    entity_id = entity.get('id')
+    return str(entity_id) if entity_id not in (None, '') else None
@@ -0,0 +1,131 @@
+"""
+NFL Tackle Leaders - Ingest Models
+Compact leader record built once from ESPN JSON and serialized straight to
+the DynamoDB fact shape
+"""
+from datetime import datetime
+from decimal import Decimal
+from typing import Dict, Any, Optional
+
+
+class LeaderRecord:
+    """One stat leader for a (season, week, stat)"""
+
+    __slots__ = (
+        'season', 'week', 'stat_type', 'stat_display_name',
+        'player_id', 'player_name', 'player_short_name',
+        'team_id', 'team_name', 'team_abbreviation',
+        'value', 'display_value', 'updated_at'
+    )
+
+    def __init__(self, season: str, week: int, stat_type: str, stat_display_name: str,
+                 player_id: str, player_name: str, player_short_name: str,
+                 team_id: str, team_name: str, team_abbreviation: str,
+                 value: Decimal, display_value: str, updated_at: Optional[str] = None):
+        self.season = season
+        self.week = week
+        self.stat_type = stat_type
+        self.stat_display_name = stat_display_name
+        self.player_id = player_id
+        self.player_name = player_name
+        self.player_short_name = player_short_name
+        self.team_id = team_id
+        self.team_name = team_name
+        self.team_abbreviation = team_abbreviation
+        self.value = value
+        self.display_value = display_value
+        self.updated_at = updated_at
+
+    @classmethod
+    def from_espn(cls, season: str, week: int, stat_type: str, category: Dict[str, Any],
+                  entry: Dict[str, Any], athlete: Dict[str, Any], team: Dict[str, Any]) -> 'LeaderRecord':
+        """
+        Build a record from an ESPN leaders category entry and its resolved references
+
+        Args:
+            season: NFL season
+            week: Week number
+            stat_type: Stored stat type (e.g. TOTAL_TACKLES)
+            category: ESPN leaders category (for displayName)
+            entry: Category leader entry (value/displayValue)
+            athlete: Resolved athlete document
+            team: Resolved team document
+
+        Returns:
+            LeaderRecord: Record with the value as a Decimal
+        """
+        return cls(
+            season, week, stat_type, category.get('displayName'),
+            athlete.get('id'), athlete.get('displayName'), athlete.get('shortName'),
+            team.get('id'), team.get('displayName'), team.get('abbreviation'),
+            Decimal(str(entry.get('value'))), entry.get('displayValue')
+        )
+
+    @classmethod
+    def from_item(cls, item: Dict[str, Any]) -> 'LeaderRecord':
+        """
+        Build a record from a (deserialized) DynamoDB leader item
+
+        Player/team names are only present on items joined with their
+        dimensions (or written before the dimension split).
+
+        Args:
+            item: Leader item
+
+        Returns:
+            LeaderRecord: Record
+        """
+        return cls(
+            season=item['season'],
+            week=int(item['week_number']),
+            stat_type=item['stat_type'],
+            stat_display_name=item['stat_display_name'],
+            player_id=item['player_id'],
+            player_name=item.get('player_name'),
+            player_short_name=item.get('player_short_name'),
+            team_id=item['team_id'],
+            team_name=item.get('team_name'),
+            team_abbreviation=item.get('team_abbreviation'),
+            value=item['stat_value'],
+            display_value=item['stat_display_value'],
+            updated_at=item.get('updated_at')
+        )
+
+    def to_item(self) -> Dict[str, Any]:
+        """
+        Serialize to the DynamoDB leader fact (stamping updated_at)
+
+        Player and team names are stored once in dimension items
+        (dimensions.store_dimensions), not on every fact.
+
+        Returns:
+            dict: Item for put_item
+        """
+        self.updated_at = datetime.utcnow().isoformat() + 'Z'
+        return {
+            'PK': f"SEASON#{self.season}",
+            'SK': f"WEEK#{self.week:02d}#STAT#{self.stat_type}",
+            'season': self.season,
+            'week_number': self.week,
+            'stat_type': self.stat_type,
+            'stat_display_name': self.stat_display_name,
+            'player_id': self.player_id,
+            'team_id': self.team_id,
+            'stat_value': self.value,
+            'stat_display_value': self.display_value,
+            'updated_at': self.updated_at
+        }
+
+    def to_result(self) -> Dict[str, Any]:
+        """
+        Serialize to the short form reported in the ingest response
+
+        Returns:
+            dict: stat_type, player, team and display value
+        """
+        return {
+            'stat_type': self.stat_type,
+            'player': self.player_name,
+            'team': self.team_abbreviation,
+            'value': self.display_value
+        }
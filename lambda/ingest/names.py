@@ -0,0 +1 @@
+../shared/names.py
\ No newline at end of file
@@ -0,0 +1,435 @@
+"""
+NFL Tackle Leaders - Player Defensive Stats
+Bulk ingestion of every player's per-game defensive line: only games that
+have started and players who played in them are fetched (with bounded
+concurrency), and only lines that changed are written, in batches, along with
+the player/team dimensions of anyone not stored before
+"""
+from datetime import datetime
+from decimal import Decimal
+import logging
+import os
+from typing import Dict, Any, List, Optional, Set, Tuple
+from boto3.dynamodb.conditions import Key
+from dimensions import DIMENSIONS, dimension_item, remember_dimensions, unknown_dimensions
+from telemetry import telemetry
+
+logger = logging.getLogger()
+
+# Environment variables
+PLAYER_STATS_CONCURRENCY = int(os.environ.get('PLAYER_STATS_CONCURRENCY', '16'))
+
+# Stored attribute -> (ESPN statistics category, stat name)
+DEFENSIVE_STATS = {
+    'tackles': ('defensive', 'totalTackles'),
+    'solo_tackles': ('defensive', 'soloTackles'),
+    'sacks': ('defensive', 'sacks'),
+    'tackles_for_loss': ('defensive', 'tacklesForLoss'),
+    'qb_hits': ('defensive', 'QBHits'),
+    'interceptions': ('defensiveInterceptions', 'interceptions'),
+    'forced_fumbles': ('general', 'fumblesForced')
+}
+
+# Dimension kind -> athlete/team document fields of its descriptive
+# attributes (as LeaderRecord.from_espn reads them)
+DIMENSION_FIELDS = {
+    'PLAYER': ('displayName', 'shortName'),
+    'TEAM': ('displayName', 'abbreviation')
+}
+
+# Game states whose rosters have played (ESPN status.type.state)
+PLAYED_STATES = ('in', 'post')
+
+REQUEST_TIMEOUT = 10
+
+
+class IncompleteGame(Exception):
+    """Some players' statistics of a game could not be fetched"""
+
+    def __init__(self, message: str, counts: Dict[str, Any]):
+        super().__init__(message)
+        self.counts = counts
+
+
+def line_partition(season: str, week: int) -> str:
+    """
+    Partition holding a week's player lines
+
+    Lines sit outside the SEASON# partitions and carry no stat_type (so
+    stay out of StatTypeIndex), so leader queries never read them; a
+    week's ~1,500 lines are one query.
+
+    Args:
+        season: NFL season
+        week: Week number
+
+    Returns:
+        str: PK value
+    """
+    return f"PLAYERSTATS#{season}#{week:02d}"
+
+
+def state_key(season: str, week: int) -> Dict[str, str]:
+    """DynamoDB key of the week's player-stats state (games already final when ingested)"""
+    return {'PK': 'STATE#INGEST', 'SK': f"PLAYERSTATS#{season}#{week:02d}"}
+
+
+def week_games(client, base_url: str, season: str, week: int,
+               concurrency: int = PLAYER_STATS_CONCURRENCY) -> List[Dict[str, Any]]:
+    """
+    List a week's games with their state and competitor rosters
+
+    Args:
+        client: ThrottledClient
+        base_url: ESPN Core API base URL
+        season: NFL season
+        week: Week number
+        concurrency: Event documents fetched at once
+
+    Returns:
+        list: {'event_id', 'state', 'competitors': [{'team_id', 'team',
+            'roster'}]} per game, in schedule order (team and roster are
+            document URLs)
+
+    Raises:
+        requests.exceptions.RequestException: If the week or a game could
+            not be fetched
+    """
+    response = client.get(f"{base_url}/seasons/{season}/types/2/weeks/{week}/events?limit=100",
+                          timeout=REQUEST_TIMEOUT)
+    telemetry.count_status(response.status_code)
+    response.raise_for_status()
+    event_urls = [item['$ref'] for item in response.json().get('items', [])]
+
+    games = {}
+    for url, result in client.get_many(event_urls, concurrency, REQUEST_TIMEOUT):
+        games[url] = parse_game(client, _json(result))
+    return [games[url] for url in event_urls]
+
+
+def fetch_game(client, base_url: str, event_id: str) -> Dict[str, Any]:
+    """
+    Fetch one game (for a work item that names it)
+
+    Args:
+        client: ThrottledClient
+        base_url: ESPN Core API base URL
+        event_id: ESPN event ID
+
+    Returns:
+        dict: Game as returned by week_games
+    """
+    return parse_game(client, _json(client.get(f"{base_url}/events/{event_id}", timeout=REQUEST_TIMEOUT)))
+
+
+def parse_game(client, event: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduce an event document to its ID, state and competitor teams and rosters"""
+    competition = (event.get('competitions') or [{}])[0]
+    status = competition.get('status') or {}
+    if '$ref' in status:
+        status = _json(client.get(status['$ref'], timeout=REQUEST_TIMEOUT))
+
+    return {
+        'event_id': str(event.get('id')),
+        'state': status.get('type', {}).get('state'),
+        'competitors': [
+            {
+                'team_id': str(competitor.get('id')),
+                'team': competitor.get('team', {}).get('$ref'),
+                'roster': competitor.get('roster', {}).get('$ref')
+            }
+            for competitor in competition.get('competitors', [])
+        ]
+    }
+
+
+def ingest_game(table, client, season: str, week: int, game: Dict[str, Any],
+                concurrency: int = PLAYER_STATS_CONCURRENCY) -> Dict[str, Any]:
+    """
+    Store the defensive lines of everyone who played in one game
+
+    Rosters give the players who played; their game statistics are
+    fetched concurrently, and lines that differ from the stored ones are
+    batch-written. Players with no defensive stats are not stored, and a
+    stored line that a stat correction brought back to zero is deleted.
+    Players and teams of stored lines that have no dimension item yet get
+    one in the same batch.
+
+    Args:
+        table: DynamoDB table resource
+        client: ThrottledClient
+        season: NFL season
+        week: Week number
+        game: Game from week_games/fetch_game
+        concurrency: Statistics documents fetched at once
+
+    Returns:
+        dict: players, fetched, failed, written, removed, unchanged and
+            dimensions counts, plus named_players (player ID -> (name,
+            short name) of the new player dimensions)
+    """
+    rosters = [competitor['roster'] for competitor in game['competitors'] if competitor['roster']]
+    players = {}
+    athletes = {}
+    for url, result in client.get_many(rosters, concurrency, REQUEST_TIMEOUT):
+        team_id = next(c['team_id'] for c in game['competitors'] if c['roster'] == url)
+        for entry in _json(result).get('entries', []):
+            statistics = entry.get('statistics', {}).get('$ref')
+            if not entry.get('didNotPlay') and statistics:
+                player_id = str(entry.get('playerId'))
+                players[statistics] = (player_id, team_id)
+                athletes[player_id] = entry.get('athlete', {}).get('$ref')
+
+    lines = {}
+    failed = 0
+    with telemetry.span('player_stats_fetch'):
+        for url, result in client.get_many(players, concurrency, REQUEST_TIMEOUT):
+            try:
+                line = defensive_line(_json(result))
+            except Exception as e:
+                failed += 1
+                logger.warning(f"Player statistics {url} failed: {str(e)}")
+                continue
+            player_id, team_id = players[url]
+            # None: no defensive stats (a line stored earlier is deleted)
+            lines[player_id] = None
+            if any(line.values()):
+                lines[player_id] = line_item(season, week, game['event_id'], player_id, team_id, line)
+
+    stored = {item['player_id']: item for item in load_game_lines(table, season, week, game['event_id'])}
+    changed = [
+        item for player_id, item in lines.items()
+        if item is not None and not _same_line(item, stored.get(player_id))
+    ]
+    zeroed = [stored[player_id] for player_id, item in lines.items() if item is None and player_id in stored]
+
+    with telemetry.span('player_stats_dimensions'):
+        dimensions = new_dimensions(
+            table, client,
+            {player_id: athletes[player_id] for player_id, item in lines.items() if item is not None},
+            {competitor['team_id']: competitor['team'] for competitor in game['competitors']},
+            concurrency
+        )
+    with telemetry.span('player_stats_write'):
+        write_lines(table, changed, zeroed, [
+            dimension_item(kind, entity_id, values) for (kind, entity_id), values in dimensions.items()
+        ])
+    remember_dimensions(dimensions)
+
+    unchanged = sum(1 for item in lines.values() if item is not None) - len(changed)
+    telemetry.count('player_lines_written', len(changed))
+    telemetry.count('player_lines_removed', len(zeroed))
+    telemetry.count('player_lines_unchanged', unchanged)
+    telemetry.count('dimensions_written', len(dimensions))
+    return {
+        'players': len(players),
+        'fetched': len(players) - failed,
+        'failed': failed,
+        'written': len(changed),
+        'removed': len(zeroed),
+        'unchanged': unchanged,
+        'dimensions': len(dimensions),
+        'named_players': {
+            entity_id: (values['player_name'], values['player_short_name'])
+            for (kind, entity_id), values in dimensions.items() if kind == 'PLAYER'
+        }
+    }
+
+
+def new_dimensions(table, client, players: Dict[str, Optional[str]], teams: Dict[str, Optional[str]],
+                   concurrency: int = PLAYER_STATS_CONCURRENCY) -> Dict[Tuple[str, str], Dict[str, Any]]:
+    """
+    Read the names of players and teams that have no dimension item yet
+
+    Athlete and team documents are only fetched for unknown IDs, so each
+    player costs one extra request the first time a line of theirs is
+    stored. A document that fails is skipped; its ID stays unknown and is
+    retried with the next game it appears in.
+
+    Args:
+        table: DynamoDB table resource
+        client: ThrottledClient
+        players: Player ID -> athlete document URL
+        teams: Team ID -> team document URL
+        concurrency: Documents fetched at once
+
+    Returns:
+        dict: (kind, id) -> descriptive attributes to store
+    """
+    refs = {}
+    for kind, entities in (('PLAYER', players), ('TEAM', teams)):
+        for entity_id in unknown_dimensions(table, kind, entities):
+            if entities[entity_id]:
+                refs[entities[entity_id]] = (kind, entity_id)
+
+    dimensions = {}
+    for url, result in client.get_many(refs, concurrency, REQUEST_TIMEOUT):
+        kind, entity_id = refs[url]
+        try:
+            document = _json(result)
+        except Exception as e:
+            logger.warning(f"{kind.title()} document {url} failed: {str(e)}")
+            continue
+        dimensions[(kind, entity_id)] = {
+            attribute: document.get(field)
+            for attribute, field in zip(DIMENSIONS[kind][2], DIMENSION_FIELDS[kind])
+        }
+    return dimensions
+
+
+def defensive_line(document: Dict[str, Any]) -> Dict[str, Decimal]:
+    """
+    Pick the defensive stats out of a player's game statistics document
+
+    Args:
+        document: ESPN statistics document (splits.categories[].stats[])
+
+    Returns:
+        dict: attribute -> value (0 for stats the document lacks)
+    """
+    values = {}
+    for category in document.get('splits', {}).get('categories', []):
+        for stat in category.get('stats', []):
+            values[(category.get('name'), stat.get('name'))] = stat.get('value')
+
+    return {
+        attribute: Decimal(str(values.get(source) or 0))
+        for attribute, source in DEFENSIVE_STATS.items()
+    }
+
+
+def line_item(season: str, week: int, event_id: str, player_id: str, team_id: str,
+              line: Dict[str, Decimal]) -> Dict[str, Any]:
+    """
+    Build the DynamoDB item of one player's game line
+
+    Args:
+        season: NFL season
+        week: Week number
+        event_id: ESPN event ID
+        player_id: ESPN athlete ID
+        team_id: ESPN team ID
+        line: defensive_line output
+
+    Returns:
+        dict: Item (names come from the DIM#PLAYER/DIM#TEAM dimensions,
+            which ingest_game writes for players and teams new to them)
+    """
+    return dict(
+        {
+            'PK': line_partition(season, week),
+            'SK': f"GAME#{event_id}#PLAYER#{player_id}",
+            'season': season,
+            'week_number': week,
+            'event_id': event_id,
+            'player_id': player_id,
+            'team_id': team_id
+        },
+        **line
+    )
+
+
+def load_game_lines(table, season: str, week: int, event_id: str) -> List[Dict[str, Any]]:
+    """
+    Read the stored lines of one game
+
+    Args:
+        table: DynamoDB table resource
+        season: NFL season
+        week: Week number
+        event_id: ESPN event ID
+
+    Returns:
+        list: Line items
+    """
+    items = []
+    request = {
+        'KeyConditionExpression': Key('PK').eq(line_partition(season, week)) &
+                                  Key('SK').begins_with(f"GAME#{event_id}#")
+    }
+    while True:
+        response = table.query(**request)
+        items.extend(response.get('Items', []))
+        if not response.get('LastEvaluatedKey'):
+            return items
+        request['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+
+def write_lines(table, items: List[Dict[str, Any]], removed: List[Dict[str, Any]] = (),
+                dimensions: List[Dict[str, Any]] = ()):
+    """
+    Batch-write line items and delete removed ones (25 requests per
+    BatchWriteItem, unprocessed requests retried)
+
+    Args:
+        table: DynamoDB table resource
+        items: Line items to put
+        removed: Stored line items to delete
+        dimensions: Dimension items to put alongside
+    """
+    if not items and not removed and not dimensions:
+        return
+
+    updated_at = datetime.utcnow().isoformat() + 'Z'
+    with table.batch_writer(overwrite_by_pkeys=['PK', 'SK']) as batch:
+        for item in items:
+            batch.put_item(Item=dict(item, updated_at=updated_at))
+        for item in removed:
+            batch.delete_item(Key={'PK': item['PK'], 'SK': item['SK']})
+        for item in dimensions:
+            batch.put_item(Item=item)
+
+
+def load_final_games(table, season: str, week: int) -> Set[str]:
+    """
+    Games of a week that were already final when their lines were stored
+
+    Args:
+        table: DynamoDB table resource
+        season: NFL season
+        week: Week number
+
+    Returns:
+        set: Event IDs (skipped by incremental runs)
+    """
+    item = table.get_item(Key=state_key(season, week)).get('Item') or {}
+    return set(item.get('final_events', set()))
+
+
+def mark_final_games(table, season: str, week: int, event_ids: Set[str]):
+    """
+    Record games whose final lines are stored (an atomic set ADD, so
+    concurrent workers do not overwrite each other)
+
+    Args:
+        table: DynamoDB table resource
+        season: NFL season
+        week: Week number
+        event_ids: Final games just ingested
+    """
+    if event_ids:
+        table.update_item(
+            Key=state_key(season, week),
+            UpdateExpression='ADD final_events :events SET updated_at = :now',
+            ExpressionAttributeValues={
+                ':events': set(event_ids),
+                ':now': datetime.utcnow().isoformat() + 'Z'
+            }
+        )
+
+
+def _same_line(item: Dict[str, Any], stored: Optional[Dict[str, Any]]) -> bool:
+    """Whether a stored line already has the new values"""
+    return stored is not None and all(
+        stored.get(attribute) == item[attribute] for attribute in ('team_id', *DEFENSIVE_STATS)
+    )
+
+
+def _json(result) -> Dict[str, Any]:
+    """Body of a get/get_many result, raising for exceptions and error statuses"""
+    if isinstance(result, Exception):
+        raise result
+    telemetry.count_status(result.status_code)
+    telemetry.count('bytes_downloaded', len(result.content))
+    result.raise_for_status()
+    return result.json()
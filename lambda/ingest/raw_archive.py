@@ -0,0 +1,386 @@
+"""
+NFL Tackle Leaders - Raw ESPN Response Archive
+Stores every raw ESPN response gzip-compressed and content-addressed (local
+or S3), indexed by (season, week, endpoint), and replays them offline
+"""
+import gzip
+import hashlib
+import io
+import logging
+import re
+import zlib
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple
+import boto3
+from botocore.exceptions import ClientError
+import requests
+
+logger = logging.getLogger()
+
+OBJECT_PREFIX = 'objects'
+INDEX_PREFIX = 'index'
+
+# .../seasons/2025/<endpoint>; weekly documents carry .../weeks/5/...
+SEASON_PATTERN = re.compile(r'/seasons/(\d{4})/([^?#]*)')
+WEEK_PATTERN = re.compile(r'(?:^|/)weeks/(\d+)(?:/|$)')
+WEEKLY_LEADERS_PATTERN = re.compile(r'^types/(\d+)/weeks/\d+/leaders$')
+
+READ_CHUNK_BYTES = 64 * 1024
+
+# S3 object keys this container has stored or seen stored (bodies are
+# immutable, so they are never written again)
+STORED_OBJECTS_SIZE = 4096
+_stored_objects = set()
+
+
+class RawCapture:
+    """
+    File-like tee that hashes and gzip-compresses a stream as it is read
+
+    Lets the streaming parser read the response once while the archive
+    gets the complete body (finish() drains whatever the parser left).
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.bytes_read = 0
+        self._hash = hashlib.sha256()
+        self._gzip = zlib.compressobj(6, zlib.DEFLATED, 31)  # gzip container, mtime 0
+        self._chunks = []
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self.stream.read(size)
+        if chunk:
+            self.bytes_read += len(chunk)
+            self._hash.update(chunk)
+            self._chunks.append(self._gzip.compress(chunk))
+        return chunk
+
+    def finish(self) -> Tuple[str, bytes]:
+        """
+        Read the rest of the stream and close out the compressed copy
+
+        Returns:
+            tuple: (sha256 hex digest of the raw body, gzip payload)
+        """
+        while self.read(READ_CHUNK_BYTES):
+            pass
+        self._chunks.append(self._gzip.flush())
+        return self._hash.hexdigest(), b''.join(self._chunks)
+
+
+def locate(url: str, week: Optional[int] = None) -> Optional[Tuple[str, int, str]]:
+    """
+    Map an ESPN Core API URL to its archive (season, week, endpoint)
+
+    Args:
+        url: ESPN URL (query string ignored)
+        week: Week to index under; defaults to the URL's week, or 0 for
+            season-scoped documents (athletes, teams, season leaders)
+
+    Returns:
+        tuple: (season, week, endpoint) or None for non-season URLs
+    """
+    match = SEASON_PATTERN.search(url)
+    if not match:
+        return None
+
+    season, endpoint = match.group(1), match.group(2).strip('/')
+    if week is None:
+        week_match = WEEK_PATTERN.search(endpoint)
+        week = int(week_match.group(1)) if week_match else 0
+
+    return season, week, endpoint
+
+
+def archive_body(destination: str, url: str, body: bytes,
+                 week: Optional[int] = None) -> Optional[Dict[str, Any]]:
+    """
+    Archive a fully read response body
+
+    Args:
+        destination: Local directory or "s3://bucket/prefix"
+        url: Request URL
+        body: Raw (uncompressed) response body
+        week: Week to index under (see locate)
+
+    Returns:
+        dict: Archive entry or None if the URL is not season-scoped
+    """
+    digest = hashlib.sha256(body).hexdigest()
+    payload = gzip.compress(body, mtime=0)
+    return store(destination, url, digest, payload, len(body), week)
+
+
+def archive_capture(destination: str, url: str, capture: RawCapture,
+                    week: Optional[int] = None) -> Optional[Dict[str, Any]]:
+    """
+    Archive a streamed response captured with RawCapture
+
+    Args:
+        destination: Local directory or "s3://bucket/prefix"
+        url: Request URL
+        capture: Capture wrapped around the response stream
+        week: Week to index under (see locate)
+
+    Returns:
+        dict: Archive entry or None if the URL is not season-scoped
+    """
+    digest, payload = capture.finish()
+    return store(destination, url, digest, payload, capture.bytes_read, week)
+
+
+def store(destination: str, url: str, digest: str, payload: bytes, raw_bytes: int,
+          week: Optional[int] = None) -> Optional[Dict[str, Any]]:
+    """
+    Write a compressed body under its digest and add an index entry for it
+
+    Bodies are immutable, so an unchanged response (the usual case when
+    polling) only adds a zero-byte index entry: an existing body is not
+    written again (on S3 a HEAD, skipped for bodies this container already
+    stored, replaces the PUT).
+
+    Args:
+        destination: Local directory or "s3://bucket/prefix"
+        url: Request URL
+        digest: sha256 hex digest of the raw body
+        payload: gzip-compressed body
+        raw_bytes: Uncompressed size
+        week: Week to index under (see locate)
+
+    Returns:
+        dict: Archive entry (season, week, endpoint, digest, sizes) or None
+    """
+    location = locate(url, week)
+    if location is None:
+        logger.debug(f"Not archiving non-season URL {url}")
+        return None
+
+    season, week, endpoint = location
+    fetched_at = datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%S%fZ')
+    object_key = _object_key(digest)
+    index_key = f"{_index_prefix(season)}week={week:02d}/{endpoint}/{fetched_at}_{digest}"
+
+    if destination.startswith('s3://'):
+        bucket, _, prefix = destination[len('s3://'):].partition('/')
+        s3 = boto3.client('s3')
+        key = _join(prefix, object_key)
+        if f"{bucket}/{key}" not in _stored_objects:
+            if not _object_exists(s3, bucket, key):
+                s3.put_object(Bucket=bucket, Key=key, Body=payload, ContentType='application/gzip')
+            if len(_stored_objects) >= STORED_OBJECTS_SIZE:
+                _stored_objects.clear()
+            _stored_objects.add(f"{bucket}/{key}")
+        s3.put_object(Bucket=bucket, Key=_join(prefix, index_key), Body=b'')
+    else:
+        root = Path(destination)
+        object_path = root / object_key
+        if not object_path.exists():
+            object_path.parent.mkdir(parents=True, exist_ok=True)
+            object_path.write_bytes(payload)
+        index_path = root / index_key
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        index_path.touch()
+
+    return {
+        'season': season,
+        'week': week,
+        'endpoint': endpoint,
+        'digest': digest,
+        'bytes': raw_bytes,
+        'compressed_bytes': len(payload)
+    }
+
+
+class RawArchive:
+    """Read side of the archive: latest body per (season, week, endpoint)"""
+
+    def __init__(self, destination: str):
+        self.destination = destination
+        self._indexes: Dict[str, Dict[Tuple[int, str], str]] = {}
+        self._bodies: Dict[str, bytes] = {}
+
+        if destination.startswith('s3://'):
+            self.bucket, _, self.prefix = destination[len('s3://'):].partition('/')
+            self.s3 = boto3.client('s3')
+        else:
+            self.root = Path(destination)
+
+    def index(self, season: str) -> Dict[Tuple[int, str], str]:
+        """
+        Load a season's index (listed once, then cached)
+
+        Args:
+            season: NFL season
+
+        Returns:
+            dict: (week, endpoint) -> digest of the latest response
+        """
+        if season in self._indexes:
+            return self._indexes[season]
+
+        prefix = _index_prefix(season)
+        if self.destination.startswith('s3://'):
+            paginator = self.s3.get_paginator('list_objects_v2')
+            keys = [
+                obj['Key'][len(_join(self.prefix, prefix)):]
+                for page in paginator.paginate(Bucket=self.bucket, Prefix=_join(self.prefix, prefix))
+                for obj in page.get('Contents', [])
+            ]
+        else:
+            base = self.root / prefix
+            keys = [path.relative_to(base).as_posix() for path in base.rglob('*') if path.is_file()] \
+                if base.exists() else []
+
+        latest: Dict[Tuple[int, str], Tuple[str, str]] = {}
+        for key in keys:
+            week_part, _, rest = key.partition('/')
+            endpoint, _, entry = rest.rpartition('/')
+            fetched_at, _, digest = entry.partition('_')
+            location = (int(week_part[len('week='):]), endpoint)
+            if location not in latest or fetched_at > latest[location][0]:
+                latest[location] = (fetched_at, digest)
+
+        self._indexes[season] = {location: digest for location, (_, digest) in latest.items()}
+        return self._indexes[season]
+
+    def weeks(self, season: str) -> list:
+        """Weeks (excluding season-scoped week 0) that have archived responses"""
+        return sorted({week for week, _ in self.index(season) if week})
+
+    def lookup(self, url: str, week: Optional[int] = None) -> Optional[str]:
+        """
+        Find the digest of the archived response for a URL
+
+        Prefers the entry indexed under week (e.g. the season-to-date
+        leaders document stored as that week), then the URL's own week,
+        then season-scoped entries. A weekly leaders document that was never
+        fetched falls back to the season leaders document stored as that week.
+
+        Args:
+            url: ESPN URL
+            week: Week being reprocessed
+
+        Returns:
+            str: Digest or None if the URL was never archived
+        """
+        location = locate(url)
+        if location is None:
+            return None
+
+        season, url_week, endpoint = location
+        index = self.index(season)
+        for candidate in (week, url_week, 0):
+            if candidate is not None and (candidate, endpoint) in index:
+                return index[(candidate, endpoint)]
+
+        weekly = WEEKLY_LEADERS_PATTERN.match(endpoint)
+        if weekly:
+            return index.get((url_week, f"types/{weekly.group(1)}/leaders"))
+        return None
+
+    def read(self, digest: str) -> bytes:
+        """
+        Read and decompress an archived body (cached by digest)
+
+        Args:
+            digest: Body digest
+
+        Returns:
+            bytes: Raw response body
+        """
+        if digest not in self._bodies:
+            key = _object_key(digest)
+            if self.destination.startswith('s3://'):
+                payload = self.s3.get_object(Bucket=self.bucket, Key=_join(self.prefix, key))['Body'].read()
+            else:
+                payload = (self.root / key).read_bytes()
+            self._bodies[digest] = gzip.decompress(payload)
+        return self._bodies[digest]
+
+    def client(self, week: Optional[int] = None) -> 'ReplayClient':
+        """
+        Build an offline stand-in for the ESPN client
+
+        Args:
+            week: Week being reprocessed (see lookup)
+
+        Returns:
+            ReplayClient: Serves archived responses
+        """
+        return ReplayClient(self, week)
+
+
+class ReplayClient:
+    """
+    Serves archived responses through the ThrottledClient interface
+
+    URLs that were never archived get a 404, so callers take the same
+    error paths they would against ESPN.
+    """
+
+    def __init__(self, archive: RawArchive, week: Optional[int] = None):
+        self.archive = archive
+        self.week = week
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, url: str, timeout: Optional[float] = None, budget: Optional[float] = None,
+            **kwargs) -> requests.Response:
+        """
+        Return the archived response for a URL
+
+        Args:
+            url: ESPN URL
+            timeout: Ignored
+            budget: Ignored
+            **kwargs: Ignored (stream=True works: raw is a byte stream)
+
+        Returns:
+            requests.Response: 200 with the archived body, or 404
+        """
+        response = requests.Response()
+        response.url = url
+        digest = self.archive.lookup(url, self.week)
+
+        if digest is None:
+            self.misses += 1
+            response.status_code = 404
+            response.reason = 'Not in raw archive'
+            response.raw = io.BytesIO(b'')
+        else:
+            self.hits += 1
+            response.status_code = 200
+            response.reason = 'OK'
+            response.headers['Content-Type'] = 'application/json'
+            response.raw = io.BytesIO(self.archive.read(digest))
+
+        return response
+
+
+def _object_exists(s3, bucket: str, key: str) -> bool:
+    """HEAD an S3 object (False when it does not exist)"""
+    try:
+        s3.head_object(Bucket=bucket, Key=key)
+        return True
+    except ClientError as e:
+        if e.response['Error']['Code'] in ('404', 'NoSuchKey', 'NotFound'):
+            return False
+        raise
+
+
+def _object_key(digest: str) -> str:
+    """Content-addressed key of a body"""
+    return f"{OBJECT_PREFIX}/{digest[:2]}/{digest}.json.gz"
+
+
+def _index_prefix(season: str) -> str:
+    """Index prefix of a season"""
+    return f"{INDEX_PREFIX}/season={season}/"
+
+
+def _join(prefix: str, key: str) -> str:
+    """Join an S3 key prefix and a key"""
+    prefix = prefix.strip('/')
+    return f"{prefix}/{key}" if prefix else key
@@ -0,0 +1,277 @@
+"""
+NFL Tackle Leaders - Game-Schedule-Aware Scheduling
+Reads the ESPN season calendar and decides when ingest should run next
+"""
+from datetime import datetime, timedelta, timezone, date
+import json
+import logging
+import math
+import os
+from typing import Dict, Any, List, Optional, Tuple
+import boto3
+import requests
+
+logger = logging.getLogger()
+
+# Environment variables
+ESPN_SITE_API_BASE_URL = os.environ.get(
+    'ESPN_SITE_API_BASE_URL', 'https://site.api.espn.com/apis/site/v2/sports/football/nfl'
+)
+CALENDAR_CACHE_PATH = os.environ.get('CALENDAR_CACHE_PATH', '/tmp/nfl_calendar.json')
+CALENDAR_TTL_HOURS = int(os.environ.get('CALENDAR_TTL_HOURS', '24'))
+
+# Polling policy
+GAME_DURATION = timedelta(hours=3, minutes=30)
+POST_GAME_WINDOW = timedelta(hours=12)      # stat corrections trickle in overnight
+LIVE_POLL_INTERVAL = timedelta(minutes=5)
+POST_GAME_POLL_INTERVAL = timedelta(hours=1)
+MAX_IDLE_INTERVAL = timedelta(hours=24)     # re-read the calendar at least daily
+
+REGULAR_SEASON_WEEKS = 18
+
+# Warm-container cache
+_calendar_cache: Dict[str, Dict[str, Any]] = {}
+
+
+def fetch_season_calendar(season: str) -> Dict[str, Any]:
+    """
+    Fetch every regular-season kickoff from the ESPN scoreboard in one call
+
+    Args:
+        season: NFL season (e.g., "2025")
+
+    Returns:
+        dict: {'season', 'fetched_at', 'games': [{'week', 'kickoff'}]}
+    """
+    url = f"{ESPN_SITE_API_BASE_URL}/scoreboard"
+    params = {
+        'dates': f"{season}0801-{int(season) + 1}0131",
+        'seasontype': 2,
+        'limit': 1000
+    }
+
+    logger.info(f"Fetching season calendar from: {url}")
+    response = requests.get(url, params=params, timeout=30)
+    response.raise_for_status()
+
+    games = []
+    for event in response.json().get('events', []):
+        week = event.get('week', {}).get('number')
+        kickoff = event.get('date')
+        if week and kickoff:
+            games.append({'week': int(week), 'kickoff': _parse_time(kickoff).isoformat()})
+
+    games.sort(key=lambda game: game['kickoff'])
+
+    return {
+        'season': season,
+        'fetched_at': datetime.now(timezone.utc).isoformat(),
+        'games': games
+    }
+
+
+def get_season_calendar(season: str, now: Optional[datetime] = None) -> Optional[Dict[str, Any]]:
+    """
+    Return the season calendar from memory, /tmp or ESPN (in that order)
+
+    Args:
+        season: NFL season
+        now: Current time (defaults to UTC now)
+
+    Returns:
+        dict: Calendar or None if it could not be loaded
+    """
+    now = now or datetime.now(timezone.utc)
+
+    calendar = _calendar_cache.get(season)
+    if calendar is None and os.path.exists(CALENDAR_CACHE_PATH):
+        try:
+            with open(CALENDAR_CACHE_PATH) as f:
+                cached = json.load(f)
+            if cached.get('season') == season:
+                calendar = cached
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable calendar cache: {str(e)}")
+
+    if calendar is not None and now - _parse_time(calendar['fetched_at']) < timedelta(hours=CALENDAR_TTL_HOURS):
+        _calendar_cache[season] = calendar
+        return calendar
+
+    try:
+        calendar = fetch_season_calendar(season)
+    except (requests.exceptions.RequestException, ValueError) as e:
+        # A stale calendar is still far better than none
+        logger.error(f"Error fetching season calendar: {str(e)}")
+        return calendar
+
+    _calendar_cache[season] = calendar
+    try:
+        with open(CALENDAR_CACHE_PATH, 'w') as f:
+            json.dump(calendar, f)
+    except OSError as e:
+        logger.warning(f"Could not cache calendar: {str(e)}")
+
+    return calendar
+
+
+def current_week(calendar: Optional[Dict[str, Any]], season: str, now: datetime) -> int:
+    """
+    Determine the NFL week whose games are the most recent ones
+
+    Args:
+        calendar: Season calendar (None to estimate from the date)
+        season: NFL season
+        now: Current time
+
+    Returns:
+        int: Week number (1-18)
+    """
+    if calendar and calendar['games']:
+        started = [game['week'] for game in calendar['games'] if _parse_time(game['kickoff']) <= now]
+        return max(started) if started else 1
+
+    return estimate_week(season, now)
+
+
+def estimate_week(season: str, now: datetime) -> int:
+    """
+    Estimate the week from the date when no calendar is available
+
+    Week 1 kicks off the Thursday after Labor Day (first Monday of September)
+    and a new week starts every Tuesday.
+
+    Args:
+        season: NFL season
+        now: Current time
+
+    Returns:
+        int: Week number (1-18)
+    """
+    september_first = date(int(season), 9, 1)
+    labor_day = september_first + timedelta(days=(7 - september_first.weekday()) % 7)
+    week_one_tuesday = labor_day + timedelta(days=1)
+
+    weeks_elapsed = (now.date() - week_one_tuesday).days // 7 + 1
+    return max(1, min(REGULAR_SEASON_WEEKS, weeks_elapsed))
+
+
+def game_windows(calendar: Dict[str, Any]) -> List[Tuple[datetime, datetime]]:
+    """
+    Merge kickoffs into non-overlapping live game windows
+
+    Args:
+        calendar: Season calendar
+
+    Returns:
+        list: Sorted (start, end) pairs
+    """
+    windows = []
+    for game in calendar['games']:
+        start = _parse_time(game['kickoff'])
+        end = start + GAME_DURATION
+        if windows and start <= windows[-1][1]:
+            windows[-1] = (windows[-1][0], max(windows[-1][1], end))
+        else:
+            windows.append((start, end))
+    return windows
+
+
+def next_poll_time(calendar: Optional[Dict[str, Any]], now: datetime) -> Tuple[Optional[datetime], str]:
+    """
+    Decide when ingest should run next
+
+    Polls every LIVE_POLL_INTERVAL while games are on, every
+    POST_GAME_POLL_INTERVAL for POST_GAME_WINDOW after they end, and
+    otherwise sleeps until the next kickoff (re-checking at least daily).
+
+    Args:
+        calendar: Season calendar (None falls back to the daily check)
+        now: Current time
+
+    Returns:
+        tuple: (next run time or None when the season is over, phase name)
+    """
+    if not calendar or not calendar['games']:
+        return now + MAX_IDLE_INTERVAL, 'unknown'
+
+    windows = game_windows(calendar)
+
+    for start, end in windows:
+        if start <= now < end:
+            return now + LIVE_POLL_INTERVAL, 'live'
+
+    for start, end in reversed(windows):
+        if end <= now < end + POST_GAME_WINDOW:
+            next_start = next((s for s, _ in windows if s > now), None)
+            poll_at = now + POST_GAME_POLL_INTERVAL
+            if next_start is not None and next_start < poll_at:
+                poll_at = next_start
+            return poll_at, 'post_game'
+
+    upcoming = [start for start, _ in windows if start > now]
+    if not upcoming:
+        return None, 'season_over'
+
+    return min(upcoming[0], now + MAX_IDLE_INTERVAL), 'idle'
+
+
+def rate_expression(run_at: datetime, now: datetime) -> str:
+    """
+    Build a recurring EventBridge rate expression whose next run is run_at
+
+    The rule keeps firing at that interval until it is rescheduled, so an
+    invocation that times out or crashes before rescheduling is simply run
+    again one interval later instead of leaving ingest unscheduled.
+
+    Args:
+        run_at: When to run next (rounded up to the minute)
+        now: Current time
+
+    Returns:
+        str: e.g. "rate(5 minutes)"
+    """
+    minutes = rate_minutes(run_at, now)
+    return f"rate({minutes} {'minute' if minutes == 1 else 'minutes'})"
+
+
+def rate_minutes(run_at: datetime, now: datetime) -> int:
+    """Whole minutes from now until run_at (at least EventBridge's 1-minute minimum)"""
+    return max(1, math.ceil((run_at - now).total_seconds() / 60))
+
+
+def reschedule(rule_name: str, expression: str) -> str:
+    """
+    Replace the schedule of the ingest EventBridge rule
+
+    put_rule overwrites every rule attribute, so the current Description is
+    read and passed through; an unchanged expression is not rewritten.
+
+    Args:
+        rule_name: Name of the EventBridge rule that triggers ingest
+        expression: New schedule expression (rate, or the off-season schedule)
+
+    Returns:
+        str: The schedule expression that was applied
+    """
+    events = boto3.client('events')
+    rule = events.describe_rule(Name=rule_name)
+    if rule.get('ScheduleExpression') == expression and rule.get('State') == 'ENABLED':
+        return expression
+
+    events.put_rule(
+        Name=rule_name,
+        ScheduleExpression=expression,
+        State='ENABLED',
+        Description=rule.get('Description', '')
+    )
+    logger.info(f"Rescheduled {rule_name}: {expression}")
+
+    return expression
+
+
+def _parse_time(value: str) -> datetime:
+    """Parse an ESPN/ISO timestamp (e.g. 2025-09-07T17:00Z) as aware UTC"""
+    parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
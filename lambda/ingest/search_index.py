@@ -0,0 +1,235 @@
+"""
+NFL Tackle Leaders - Player Search Index
+Prefix index over normalized player names and IDs, kept in one DynamoDB item
+for the API's /search route and updated incrementally as players appear
+"""
+import bisect
+from datetime import datetime
+import gzip
+import json
+import logging
+from typing import Dict, Any, List, Optional, Tuple
+from botocore.exceptions import ClientError
+
+from dimensions import load_dimensions
+from names import normalize_name
+
+logger = logging.getLogger()
+
+SEARCH_INDEX_KEY = {'PK': 'INDEX#SEARCH', 'SK': 'PLAYER'}
+
+# Concurrent workers race on the index item; a lost race reloads and retries
+MAX_UPDATE_ATTEMPTS = 3
+
+# The last index loaded or written by this container: {'version', 'index'}
+_cached: Dict[str, Any] = {'version': None, 'index': None}
+
+
+def name_keys(player_id: str, name: Optional[str], short_name: Optional[str]) -> List[str]:
+    """
+    Index keys of one player: the full name, each later name token onwards
+    (so "watt" and "j watt" find "T.J. Watt"), the short name and the ID
+
+    Args:
+        player_id: ESPN athlete ID
+        name: Display name
+        short_name: Short name (e.g. "T. Watt")
+
+    Returns:
+        list: Distinct keys
+    """
+    keys = {player_id}
+    for text in (name, short_name):
+        tokens = normalize_name(text).split()
+        keys.update(' '.join(tokens[start:]) for start in range(len(tokens)))
+    return sorted(keys)
+
+
+def build_index(players: Dict[str, Tuple[Optional[str], Optional[str]]]) -> Dict[str, Any]:
+    """
+    Build the index from scratch
+
+    Args:
+        players: player ID -> (name, short name)
+
+    Returns:
+        dict: {'keys': sorted keys, 'ids': player ID per key,
+            'players': {id: [name, short name]}}
+    """
+    entries = sorted(
+        (key, player_id)
+        for player_id, (name, short_name) in players.items()
+        for key in name_keys(player_id, name, short_name)
+    )
+    return {
+        'keys': [key for key, _ in entries],
+        'ids': [player_id for _, player_id in entries],
+        'players': {player_id: list(names) for player_id, names in players.items()}
+    }
+
+
+def add_players(index: Dict[str, Any], players: Dict[str, Tuple[Optional[str], Optional[str]]]) -> int:
+    """
+    Insert new or renamed players into an index in place
+
+    Keys are inserted into the sorted arrays (a renamed player's old keys
+    are removed first), so the index is never rebuilt.
+
+    Args:
+        index: Output of build_index
+        players: player ID -> (name, short name)
+
+    Returns:
+        int: Players added or renamed (0 means the index is unchanged)
+    """
+    changed = 0
+
+    for player_id, names in players.items():
+        names = list(names)
+        current = index['players'].get(player_id)
+        if current == names:
+            continue
+
+        if current is not None:
+            for key in name_keys(player_id, *current):
+                position = bisect.bisect_left(index['keys'], key)
+                while index['ids'][position] != player_id:
+                    position += 1
+                del index['keys'][position]
+                del index['ids'][position]
+
+        for key in name_keys(player_id, *names):
+            position = bisect.bisect_right(index['keys'], key)
+            index['keys'].insert(position, key)
+            index['ids'].insert(position, player_id)
+
+        index['players'][player_id] = names
+        changed += 1
+
+    return changed
+
+
+def load_index(table) -> Tuple[Optional[Dict[str, Any]], int]:
+    """
+    Read the index item
+
+    Args:
+        table: DynamoDB table resource
+
+    Returns:
+        tuple: (index or None if it was never written, version)
+    """
+    item = table.get_item(Key=SEARCH_INDEX_KEY, ConsistentRead=True).get('Item')
+    if not item:
+        return None, 0
+    return json.loads(gzip.decompress(bytes(item['index']))), int(item['version'])
+
+
+def save_index(table, index: Dict[str, Any], version: int) -> int:
+    """
+    Write the index if nobody else has written it since `version` was read
+
+    Args:
+        table: DynamoDB table resource
+        index: Index to store
+        version: Version it was built on (0 for a new item)
+
+    Returns:
+        int: New version
+
+    Raises:
+        ClientError: ConditionalCheckFailedException if the item moved on
+    """
+    condition = {'ConditionExpression': 'attribute_not_exists(PK)'} if not version else {
+        'ConditionExpression': 'version = :version',
+        'ExpressionAttributeValues': {':version': version}
+    }
+
+    item = _index_item(index, version + 1)
+    table.put_item(Item=item, **condition)
+    _cached.update(version=version + 1, index=index)
+    logger.info(f"Stored search index v{version + 1}: {item['player_count']} players, "
+                f"{item['key_count']} keys, {len(item['index'])} bytes")
+    return version + 1
+
+
+def update_search_index(table, players: Dict[str, Tuple[Optional[str], Optional[str]]]) -> int:
+    """
+    Add new or renamed players to the stored index
+
+    Players this container already indexed cost nothing; otherwise the
+    item is read, the players inserted and the item written back with an
+    optimistic version check. A table without an index item is seeded
+    from every DIM#PLAYER item.
+
+    Args:
+        table: DynamoDB table resource
+        players: player ID -> (name, short name)
+
+    Returns:
+        int: Players added or renamed
+    """
+    players = {player_id: names for player_id, names in players.items() if player_id and names[0]}
+    index = _cached['index']
+    if index is not None and all(index['players'].get(player_id) == list(names)
+                                 for player_id, names in players.items()):
+        return 0
+
+    for attempt in range(1, MAX_UPDATE_ATTEMPTS + 1):
+        index, version = load_index(table)
+        if index is None:
+            index = build_index(_dimension_players(load_dimensions(table)))
+        changed = add_players(index, players)
+        if not changed and version:
+            _cached.update(version=version, index=index)
+            return 0
+
+        try:
+            save_index(table, index, version)
+            return changed
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'ConditionalCheckFailedException' or attempt == MAX_UPDATE_ATTEMPTS:
+                raise
+            logger.info(f"Search index changed concurrently (v{version}), retrying")
+
+    return 0
+
+
+def rebuild_search_index(table) -> Dict[str, Any]:
+    """
+    Rebuild the index from every DIM#PLAYER item (e.g. after a migration)
+
+    Args:
+        table: DynamoDB table resource
+
+    Returns:
+        dict: version, players and keys of the stored index
+    """
+    index = build_index(_dimension_players(load_dimensions(table)))
+    current = table.get_item(Key=SEARCH_INDEX_KEY, ProjectionExpression='version').get('Item') or {}
+    version = int(current.get('version', 0)) + 1
+
+    table.put_item(Item=_index_item(index, version))
+    _cached.update(version=version, index=index)
+    return {'version': version, 'players': len(index['players']), 'keys': len(index['keys'])}
+
+
+def _index_item(index: Dict[str, Any], version: int) -> Dict[str, Any]:
+    """The index item: the index as gzip-compressed JSON plus its counts"""
+    return dict(
+        SEARCH_INDEX_KEY,
+        index=gzip.compress(json.dumps(index, separators=(',', ':')).encode(), mtime=0),
+        version=version,
+        player_count=len(index['players']),
+        key_count=len(index['keys']),
+        updated_at=datetime.utcnow().isoformat() + 'Z'
+    )
+
+
+def _dimension_players(dimensions: Dict[Tuple[str, str], Dict[str, Any]]) -> Dict[str, Tuple]:
+    """player ID -> (name, short name) from load_dimensions output"""
+    return {
+        entity_id: (values.get('player_name'), values.get('player_short_name'))
+        for (kind, entity_id), values in dimensions.items()
+        if kind == 'PLAYER' and values.get('player_name')
+    }
@@ -0,0 +1,206 @@
+"""
+NFL Tackle Leaders - Incremental Season Summary
+Maintains per-season, per-stat aggregates (weeks led, streaks, leader changes)
+"""
+from datetime import datetime
+import logging
+from typing import Dict, Any, List, Optional
+from botocore.exceptions import ClientError
+
+from dimensions import join_dimensions, load_dimensions
+from dynamodb_client import query_season_items
+from models import LeaderRecord
+
+logger = logging.getLogger()
+
+MAX_WRITE_ATTEMPTS = 3
+
+# Item attributes that are not part of the folded aggregate state
+NON_STATE_ATTRIBUTES = ('PK', 'SK', 'updated_at', 'previous')
+
+
+def summary_key(season: str, stat_type: str) -> Dict[str, str]:
+    """
+    Build the DynamoDB key of a season summary item
+
+    Summaries live in their own partition so season/week queries and the
+    StatTypeIndex GSI never see them.
+
+    Args:
+        season: NFL season
+        stat_type: TOTAL_TACKLES or SACKS
+
+    Returns:
+        dict: PK/SK key
+    """
+    return {'PK': f"SUMMARY#{season}", 'SK': f"STAT#{stat_type}"}
+
+
+def empty_summary(season: str, stat_type: str) -> Dict[str, Any]:
+    """
+    Create the aggregate for a season before any week is applied
+
+    Args:
+        season: NFL season
+        stat_type: TOTAL_TACKLES or SACKS
+
+    Returns:
+        dict: Empty summary state
+    """
+    return {
+        'season': season,
+        'summary_stat': stat_type,
+        'last_week': 0,
+        'weeks_tracked': 0,
+        'leader_id': None,
+        'leader_value': None,
+        'current_streak': 0,
+        'longest_streak': 0,
+        'longest_streak_player_id': None,
+        'leader_changes': 0,
+        'weeks_led': {},
+        'players': {},
+        'version': 0
+    }
+
+
+def apply_week(summary: Dict[str, Any], week: int, leader: LeaderRecord) -> Optional[Dict[str, Any]]:
+    """
+    Fold one week's #1 leader into the previous aggregate in O(1)
+
+    Re-ingesting the latest week replaces it by re-applying the week to the
+    stored pre-week state. Weeks older than the latest one cannot be folded
+    in incrementally.
+
+    Args:
+        summary: Current aggregate (as stored, including 'previous')
+        week: Week number being ingested
+        leader: The week's #1 leader
+
+    Returns:
+        dict: New aggregate, or None if the week is out of order
+    """
+    last_week = int(summary['last_week'])
+
+    if week < last_week:
+        return None
+
+    if week == last_week:
+        base = summary.get('previous') or empty_summary(summary['season'], summary['summary_stat'])
+    else:
+        base = {key: value for key, value in summary.items() if key not in NON_STATE_ATTRIBUTES}
+
+    player_id = leader.player_id
+    weeks_led = {pid: int(count) for pid, count in base['weeks_led'].items()}
+    weeks_led[player_id] = weeks_led.get(player_id, 0) + 1
+
+    players = dict(base['players'])
+    players[player_id] = {
+        'name': leader.player_name,
+        'team': leader.team_abbreviation
+    }
+
+    if base['leader_id'] == player_id:
+        current_streak = int(base['current_streak']) + 1
+        leader_changes = int(base['leader_changes'])
+    else:
+        current_streak = 1
+        leader_changes = int(base['leader_changes']) + (1 if base['leader_id'] is not None else 0)
+
+    longest_streak = int(base['longest_streak'])
+    longest_streak_player_id = base['longest_streak_player_id']
+    if current_streak > longest_streak:
+        longest_streak = current_streak
+        longest_streak_player_id = player_id
+
+    return dict(
+        base,
+        last_week=week,
+        weeks_tracked=int(base['weeks_tracked']) + 1,
+        leader_id=player_id,
+        leader_value=leader.value,
+        current_streak=current_streak,
+        longest_streak=longest_streak,
+        longest_streak_player_id=longest_streak_player_id,
+        leader_changes=leader_changes,
+        weeks_led=weeks_led,
+        players=players,
+        version=int(summary['version']) + 1,
+        previous=base
+    )
+
+
+def rebuild_summary(season: str, stat_type: str, items: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Recompute an aggregate from a full season of leader items
+
+    Only used when weeks arrive out of order (e.g. a backfill).
+
+    Args:
+        season: NFL season
+        stat_type: TOTAL_TACKLES or SACKS
+        items: DynamoDB leader items for the stat, joined with dimensions
+
+    Returns:
+        dict: Aggregate equivalent to applying every week in order
+    """
+    summary = empty_summary(season, stat_type)
+    for record in sorted(map(LeaderRecord.from_item, items), key=lambda r: r.week):
+        summary = apply_week(summary, record.week, record)
+    return summary
+
+
+def update_season_summary(table, leader: LeaderRecord) -> Dict[str, Any]:
+    """
+    Read, fold and conditionally write the season summary for a stat
+
+    Args:
+        table: DynamoDB table resource
+        leader: Leader that was just stored (its season, week and stat
+            select the summary)
+
+    Returns:
+        dict: Summary highlights for the ingest response
+    """
+    season, week, stat_type = leader.season, leader.week, leader.stat_type
+    key = summary_key(season, stat_type)
+
+    for attempt in range(MAX_WRITE_ATTEMPTS):
+        stored = table.get_item(Key=key, ConsistentRead=True).get('Item')
+        current = stored or empty_summary(season, stat_type)
+
+        summary = apply_week(current, week, leader)
+        if summary is None:
+            logger.info(f"Week {week} is older than summary week {current['last_week']}, rebuilding {stat_type}")
+            stat_items = join_dimensions(
+                [i for i in query_season_items(table, season) if i['stat_type'] == stat_type],
+                load_dimensions(table)
+            )
+            summary = dict(rebuild_summary(season, stat_type, stat_items),
+                           version=int(current['version']) + 1)
+
+        item = dict(summary, **key, updated_at=datetime.utcnow().isoformat() + 'Z')
+
+        try:
+            if stored is None:
+                table.put_item(Item=item, ConditionExpression='attribute_not_exists(PK)')
+            else:
+                table.put_item(
+                    Item=item,
+                    ConditionExpression='version = :version',
+                    ExpressionAttributeValues={':version': stored['version']}
+                )
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+                raise
+            logger.warning(f"Summary {stat_type} changed concurrently, retrying ({attempt + 1})")
+            continue
+
+        return {
+            'stat_type': stat_type,
+            'weeks_tracked': summary['weeks_tracked'],
+            'current_streak': summary['current_streak'],
+            'leader_changes': summary['leader_changes']
+        }
+
+    raise Exception(f"Could not update {stat_type} summary after {MAX_WRITE_ATTEMPTS} attempts")
@@ -0,0 +1,199 @@
+"""
+NFL Tackle Leaders - SQLite Snapshot Builder
+Materializes the leaders table into an indexed SQLite file for the API Lambda
+"""
+from decimal import Decimal
+import hashlib
+import logging
+import os
+import shutil
+import sqlite3
+import tempfile
+from pathlib import Path
+from typing import Dict, Any, Iterable, List, Optional
+import boto3
+
+from dimensions import join_dimensions, load_dimensions
+from dynamodb_client import query_leader_items
+
+logger = logging.getLogger()
+
+# Bump when the schema changes so old API containers ignore new files
+SNAPSHOT_SCHEMA_VERSION = '1'
+
+SNAPSHOT_SCHEMA = """
+CREATE TABLE leaders (
+    season             TEXT    NOT NULL,
+    week_number        INTEGER NOT NULL,
+    stat_type          TEXT    NOT NULL,
+    stat_display_name  TEXT,
+    player_id          TEXT,
+    player_name        TEXT,
+    player_short_name  TEXT,
+    team_id            TEXT,
+    team_name          TEXT,
+    team_abbreviation  TEXT,
+    stat_value         REAL,
+    stat_display_value TEXT,
+    updated_at         TEXT,
+    PRIMARY KEY (season, week_number, stat_type)
+) WITHOUT ROWID;
+
+CREATE INDEX idx_leaders_stat ON leaders (stat_type, season, week_number);
+CREATE INDEX idx_leaders_player ON leaders (player_id);
+CREATE INDEX idx_leaders_team ON leaders (team_abbreviation COLLATE NOCASE);
+
+CREATE TABLE snapshot_meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT
+) WITHOUT ROWID;
+"""
+
+LEADER_COLUMNS = [
+    'season', 'week_number', 'stat_type', 'stat_display_name',
+    'player_id', 'player_name', 'player_short_name',
+    'team_id', 'team_name', 'team_abbreviation',
+    'stat_value', 'stat_display_value', 'updated_at'
+]
+
+# Restamped on every put, so left out of the content version
+UNVERSIONED_COLUMNS = {'updated_at'}
+
+
+def build_snapshot(items: List[Dict[str, Any]], path: str) -> Dict[str, Any]:
+    """
+    Write leader items into a fresh SQLite database
+
+    Args:
+        items: Raw DynamoDB leader items (any number of seasons)
+        path: Output file path (overwritten)
+
+    Returns:
+        dict: Snapshot summary (rows, bytes, version)
+    """
+    if os.path.exists(path):
+        os.remove(path)
+
+    rows = [
+        tuple(_column_value(item, column) for column in LEADER_COLUMNS)
+        for item in items
+    ]
+    # Version is derived from content so unchanged data keeps the same version
+    versioned = [index for index, column in enumerate(LEADER_COLUMNS) if column not in UNVERSIONED_COLUMNS]
+    version = hashlib.sha256(
+        repr(sorted(tuple(row[index] for index in versioned) for row in rows)).encode()
+    ).hexdigest()[:16]
+
+    connection = sqlite3.connect(path)
+    try:
+        connection.executescript(SNAPSHOT_SCHEMA)
+        placeholders = ', '.join('?' for _ in LEADER_COLUMNS)
+        connection.executemany(
+            f"INSERT OR REPLACE INTO leaders ({', '.join(LEADER_COLUMNS)}) VALUES ({placeholders})",
+            rows
+        )
+        connection.executemany(
+            "INSERT INTO snapshot_meta (key, value) VALUES (?, ?)",
+            [('schema_version', SNAPSHOT_SCHEMA_VERSION), ('data_version', version)]
+        )
+        connection.commit()
+        connection.execute("VACUUM")
+    finally:
+        connection.close()
+
+    return {
+        'rows': len(rows),
+        'bytes': os.path.getsize(path),
+        'version': version
+    }
+
+
+def publish_snapshot(table, location: str, stat_types: Iterable[str]) -> Dict[str, Any]:
+    """
+    Build a snapshot of the whole table and publish it
+
+    Leader facts are joined with the player/team dimensions here, so the
+    snapshot rows stay fully denormalized for the API. A snapshot whose
+    data version is already published is not uploaded again, so API
+    containers only download changed data.
+
+    Args:
+        table: DynamoDB table resource
+        location: Local file path or "s3://bucket/key"
+        stat_types: Stat types to include (e.g. TOTAL_TACKLES)
+
+    Returns:
+        dict: Snapshot summary including its published location and
+            whether it was published (False when unchanged)
+    """
+    items = join_dimensions(query_leader_items(table, stat_types), load_dimensions(table))
+
+    with tempfile.TemporaryDirectory() as workdir:
+        local_path = str(Path(workdir) / 'leaders.sqlite')
+        summary = build_snapshot(items, local_path)
+
+        if summary['version'] == published_version(location):
+            logger.info(f"Snapshot {summary['version']} is already published at {location}")
+            return dict(summary, location=location, published=False)
+
+        if location.startswith('s3://'):
+            bucket, _, key = location[len('s3://'):].partition('/')
+            boto3.client('s3').upload_file(
+                local_path, bucket, key,
+                ExtraArgs={'Metadata': {
+                    'data-version': summary['version'],
+                    'schema-version': SNAPSHOT_SCHEMA_VERSION
+                }}
+            )
+        else:
+            Path(location).parent.mkdir(parents=True, exist_ok=True)
+            # Copy then rename so readers never see a half-written file
+            staging_path = f"{location}.tmp"
+            shutil.copyfile(local_path, staging_path)
+            os.replace(staging_path, location)
+
+    logger.info(f"Published snapshot {summary['version']} ({summary['rows']} rows) to {location}")
+
+    return dict(summary, location=location, published=True)
+
+
+def published_version(location: str) -> Optional[str]:
+    """
+    Read the data version of the snapshot currently published at a location
+
+    Args:
+        location: Local file path or "s3://bucket/key"
+
+    Returns:
+        str: Data version, or None if nothing (readable) is published
+    """
+    try:
+        if location.startswith('s3://'):
+            bucket, _, key = location[len('s3://'):].partition('/')
+            metadata = boto3.client('s3').head_object(Bucket=bucket, Key=key)['Metadata']
+            if metadata.get('schema-version') != SNAPSHOT_SCHEMA_VERSION:
+                return None
+            return metadata.get('data-version')
+
+        if not os.path.exists(location):
+            return None
+        connection = sqlite3.connect(f"file:{location}?mode=ro", uri=True)
+        try:
+            meta = dict(connection.execute("SELECT key, value FROM snapshot_meta").fetchall())
+        finally:
+            connection.close()
+        if meta.get('schema_version') != SNAPSHOT_SCHEMA_VERSION:
+            return None
+        return meta.get('data_version')
+    except Exception as e:
+        # Publishing again is always safe
+        logger.warning(f"Could not read the published snapshot version: {str(e)}")
+        return None
+
+
+def _column_value(item: Dict[str, Any], column: str):
+    """Convert a DynamoDB attribute into a SQLite-friendly value"""
+    value = item.get(column)
+    if isinstance(value, Decimal):
+        return int(value) if column == 'week_number' else float(value)
+    return value
@@ -0,0 +1,164 @@
+"""
+NFL Tackle Leaders - Ingest Telemetry
+Per-stage timers and counters for one invocation, emitted as a single
+CloudWatch Embedded Metric Format (EMF) record on stdout
+"""
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from functools import wraps
+from typing import Dict, Any, Callable
+
+# Environment variables
+METRICS_ENABLED = os.environ.get('METRICS_ENABLED', 'false').lower() == 'true'
+METRICS_NAMESPACE = os.environ.get('METRICS_NAMESPACE', 'NFLLeaders/Ingest')
+
+# Counter name -> CloudWatch unit (anything else is a Count)
+COUNTER_UNITS = {'bytes_downloaded': 'Bytes'}
+
+# Returned by span() while disabled, so a disabled span costs one attribute check
+_NULL_SPAN = nullcontext()
+
+
+class Telemetry:
+    """
+    Stage timings and counters of one invocation
+
+    Spans with the same name accumulate (every fetch_reference call adds to
+    reference_fetch_ms) and nested spans each count their full time, so
+    stages can be broken down further without changing their parents.
+    """
+
+    def __init__(self, enabled: bool = METRICS_ENABLED, namespace: str = METRICS_NAMESPACE,
+                 emit: Callable[[str], None] = print):
+        self.enabled = enabled
+        self.namespace = namespace
+        self.emit = emit
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Start a new invocation"""
+        self.timings: Dict[str, float] = {}
+        self.counters: Dict[str, float] = {}
+        self.dimensions: Dict[str, str] = {}
+        self.properties: Dict[str, Any] = {}
+
+    def span(self, name: str):
+        """
+        Time a stage
+
+        Args:
+            name: Stage name (emitted as <name>_ms)
+
+        Returns:
+            Context manager timing its body
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return self._span(name)
+
+    @contextmanager
+    def _span(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            with self._lock:
+                self.timings[name] = self.timings.get(name, 0.0) + elapsed_ms
+
+    def count(self, name: str, value: float = 1):
+        """
+        Add to a counter
+
+        Args:
+            name: Counter name
+            value: Amount to add
+        """
+        if self.enabled:
+            with self._lock:
+                self.counters[name] = self.counters.get(name, 0) + value
+
+    def count_status(self, status_code: int):
+        """Count an HTTP response by status class (http_2xx, http_4xx, ...)"""
+        self.count(f"http_{status_code // 100}xx")
+
+    def set_dimension(self, name: str, value: str):
+        """Set a CloudWatch dimension of this invocation's metrics"""
+        if self.enabled:
+            self.dimensions[name] = str(value)
+
+    def set_properties(self, **properties):
+        """Attach searchable, non-metric values (season, week, request ID) to the record"""
+        if self.enabled:
+            self.properties.update(properties)
+
+    def record(self) -> Dict[str, Any]:
+        """
+        Build the EMF record of this invocation
+
+        Returns:
+            dict: EMF document (metric values and properties at the top level)
+        """
+        metrics = {f"{name}_ms": round(value, 3) for name, value in self.timings.items()}
+        metrics.update(self.counters)
+
+        return dict(
+            self.properties,
+            **self.dimensions,
+            **metrics,
+            _aws={
+                'Timestamp': int(time.time() * 1000),
+                'CloudWatchMetrics': [{
+                    'Namespace': self.namespace,
+                    'Dimensions': [sorted(self.dimensions)],
+                    'Metrics': [
+                        {'Name': name, 'Unit': 'Milliseconds' if name.endswith('_ms')
+                         else COUNTER_UNITS.get(name, 'Count')}
+                        for name in metrics
+                    ]
+                }]
+            }
+        )
+
+    def flush(self):
+        """Emit the invocation's record (if anything was measured) and reset"""
+        if self.enabled and (self.timings or self.counters):
+            self.emit(json.dumps(self.record(), default=str))
+        self.reset()
+
+
+# Shared by the handler and the modules it calls
+telemetry = Telemetry()
+
+
+def instrumented(handler: Callable) -> Callable:
+    """
+    Wrap a Lambda handler so each invocation emits one EMF record
+
+    The whole invocation is timed as the 'invocation' span; the record is
+    emitted even when the handler raises.
+
+    Args:
+        handler: Lambda handler (event, context)
+
+    Returns:
+        Wrapped handler
+    """
+    @wraps(handler)
+    def wrapper(event, context):
+        if not telemetry.enabled:
+            return handler(event, context)
+
+        telemetry.reset()
+        telemetry.set_properties(request_id=getattr(context, 'aws_request_id', None))
+        try:
+            with telemetry.span('invocation'):
+                return handler(event, context)
+        finally:
+            telemetry.flush()
+
+    return wrapper
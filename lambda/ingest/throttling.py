@@ -0,0 +1,317 @@
+"""
+NFL Tackle Leaders - ESPN Request Throttling
+AIMD adaptive concurrency limit, Retry-After handling and a circuit breaker
+for calls to the ESPN APIs
+"""
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+import logging
+import os
+import random
+import threading
+import time
+from typing import Iterable, Iterator, Optional, Tuple, Union
+import requests
+
+logger = logging.getLogger()
+
+# Environment variables
+ESPN_MAX_CONCURRENCY = int(os.environ.get('ESPN_MAX_CONCURRENCY', '16'))
+ESPN_BREAKER_THRESHOLD = int(os.environ.get('ESPN_BREAKER_THRESHOLD', '5'))
+ESPN_BREAKER_RESET_SECONDS = float(os.environ.get('ESPN_BREAKER_RESET_SECONDS', '30'))
+
+# Responses that mean "slow down" rather than "this request is wrong"
+THROTTLE_STATUSES = (429, 503)
+RETRYABLE_STATUSES = (429, 500, 502, 503, 504)
+
+MAX_RETRY_AFTER_SECONDS = 60.0
+
+
+class CircuitOpenError(requests.exceptions.RequestException):
+    """Raised instead of calling ESPN while the circuit breaker is open"""
+
+
+class AdaptiveLimiter:
+    """
+    AIMD concurrency limit driven by latency and throttling
+
+    Every good response grows the limit by 1/limit (about +1 per round
+    trip of the whole window); a throttled or slow response halves it.
+    A response is slow when it takes LATENCY_TOLERANCE times the smoothed
+    baseline latency. Retry-After pauses all callers until it expires.
+    """
+
+    BACKOFF_RATIO = 0.5
+    LATENCY_TOLERANCE = 2.0
+    BASELINE_ALPHA = 0.05
+
+    def __init__(self, initial_limit: int = 4, min_limit: int = 1, max_limit: int = ESPN_MAX_CONCURRENCY):
+        self.limit = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.in_flight = 0
+        self.baseline_latency: Optional[float] = None
+        self._paused_until = 0.0
+        self._condition = threading.Condition()
+
+    def acquire(self, deadline: Optional[float] = None) -> bool:
+        """
+        Wait for a concurrency slot (and for any Retry-After pause to end)
+
+        Args:
+            deadline: time.monotonic() value to give up at
+
+        Returns:
+            bool: True if a slot was acquired
+        """
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                wait = self._paused_until - now
+                if wait <= 0 and self.in_flight < int(self.limit):
+                    self.in_flight += 1
+                    return True
+                if deadline is not None:
+                    if now >= deadline:
+                        return False
+                    wait = min(wait, deadline - now) if wait > 0 else deadline - now
+                self._condition.wait(wait if wait > 0 else None)
+
+    def release(self, latency: float, throttled: bool = False):
+        """
+        Return a slot and adjust the limit from the outcome
+
+        Args:
+            latency: Seconds the request took
+            throttled: True for 429/503 responses
+        """
+        with self._condition:
+            self.in_flight -= 1
+
+            slow = self.baseline_latency is not None and latency > self.baseline_latency * self.LATENCY_TOLERANCE
+            if throttled or slow:
+                self.limit = max(self.min_limit, self.limit * self.BACKOFF_RATIO)
+            else:
+                self.limit = min(self.max_limit, self.limit + 1.0 / self.limit)
+
+            if not throttled:
+                if self.baseline_latency is None:
+                    self.baseline_latency = latency
+                else:
+                    self.baseline_latency += self.BASELINE_ALPHA * (latency - self.baseline_latency)
+
+            self._condition.notify_all()
+
+    def pause(self, seconds: float):
+        """
+        Hold every caller for a server-requested interval
+
+        Args:
+            seconds: Retry-After interval
+        """
+        with self._condition:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._condition.notify_all()
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker
+
+    Opens after failure_threshold consecutive failures, fails fast for
+    reset_seconds, then lets a single probe through (half-open): success
+    closes the circuit, failure re-opens it.
+    """
+
+    def __init__(self, failure_threshold: int = ESPN_BREAKER_THRESHOLD,
+                 reset_seconds: float = ESPN_BREAKER_RESET_SECONDS):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.state = 'closed'
+        self.failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def before_call(self):
+        """
+        Check that a call may proceed
+
+        Raises:
+            CircuitOpenError: While open, or while a half-open probe is running
+        """
+        with self._lock:
+            if self.state == 'open':
+                if time.monotonic() - self._opened_at < self.reset_seconds:
+                    raise CircuitOpenError("ESPN circuit breaker is open")
+                self.state = 'half_open'
+                self._probing = False
+
+            if self.state == 'half_open':
+                if self._probing:
+                    raise CircuitOpenError("ESPN circuit breaker is half-open (probe in progress)")
+                self._probing = True
+
+    def record_success(self):
+        """Close the circuit after a successful call"""
+        with self._lock:
+            if self.state != 'closed':
+                logger.info("ESPN circuit breaker closed")
+            self.state = 'closed'
+            self.failures = 0
+            self._probing = False
+
+    def record_failure(self):
+        """Count a failed call, opening the circuit at the threshold"""
+        with self._lock:
+            self.failures += 1
+            if self.state == 'half_open' or self.failures >= self.failure_threshold:
+                if self.state != 'open':
+                    logger.warning(f"ESPN circuit breaker opened after {self.failures} consecutive failures")
+                self.state = 'open'
+                self._opened_at = time.monotonic()
+                self._probing = False
+
+
+class ThrottledClient:
+    """
+    requests-compatible GET for ESPN with adaptive concurrency and a breaker
+
+    Throttled and 5xx responses are retried (waiting for Retry-After when
+    given, otherwise exponential backoff with jitter) within a per-call time
+    budget; once the breaker opens, calls fail fast with CircuitOpenError.
+    """
+
+    def __init__(self, limiter: Optional[AdaptiveLimiter] = None, breaker: Optional[CircuitBreaker] = None,
+                 max_retries: int = 3, backoff_seconds: float = 0.5, session: Optional[requests.Session] = None):
+        self.limiter = limiter or AdaptiveLimiter()
+        self.breaker = breaker or CircuitBreaker()
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self.session = session or requests.Session()
+
+    def get(self, url: str, timeout: float = 10, budget: Optional[float] = None, **kwargs) -> requests.Response:
+        """
+        GET a URL through the limiter and circuit breaker
+
+        Args:
+            url: Request URL
+            timeout: Per-attempt timeout in seconds
+            budget: Total seconds allowed including retries (defaults to
+                timeout x (max_retries + 1))
+            **kwargs: Passed to requests.Session.get
+
+        Returns:
+            requests.Response: Final response (callers still raise_for_status)
+
+        Raises:
+            CircuitOpenError: When the breaker is open
+            requests.exceptions.RequestException: On connection errors/timeouts
+                after the last attempt
+        """
+        deadline = time.monotonic() + (budget if budget is not None else timeout * (self.max_retries + 1))
+
+        attempt = 0
+        while True:
+            self.breaker.before_call()
+            if not self.limiter.acquire(deadline):
+                # Counted so a half-open probe that never ran re-opens the circuit
+                self.breaker.record_failure()
+                raise requests.exceptions.Timeout(f"Timed out waiting to call {url}")
+
+            start = time.monotonic()
+            remaining = max(0.1, deadline - start)
+            try:
+                response = self.session.get(url, timeout=min(timeout, remaining), **kwargs)
+            except requests.exceptions.RequestException:
+                self.limiter.release(time.monotonic() - start, throttled=True)
+                self.breaker.record_failure()
+                if attempt >= self.max_retries or time.monotonic() >= deadline:
+                    raise
+                attempt += 1
+                self._backoff(attempt, deadline)
+                continue
+
+            throttled = response.status_code in THROTTLE_STATUSES
+            self.limiter.release(time.monotonic() - start, throttled=throttled)
+
+            if response.status_code not in RETRYABLE_STATUSES:
+                self.breaker.record_success()
+                return response
+
+            self.breaker.record_failure()
+            retry_after = parse_retry_after(response.headers.get('Retry-After'))
+            if retry_after is not None:
+                self.limiter.pause(retry_after)
+
+            if attempt >= self.max_retries:
+                return response
+
+            wait_until = time.monotonic() + (retry_after if retry_after is not None else 0)
+            if wait_until >= deadline:
+                return response
+
+            # Release the connection of a streamed response before retrying
+            response.close()
+            attempt += 1
+            if retry_after is None:
+                self._backoff(attempt, deadline)
+
+    def get_many(self, urls: Iterable[str], concurrency: int = ESPN_MAX_CONCURRENCY, timeout: float = 10,
+                 **kwargs) -> Iterator[Tuple[str, Union[requests.Response, requests.exceptions.RequestException]]]:
+        """
+        GET many URLs with at most `concurrency` requests in flight
+
+        The adaptive limit still applies on top, so fewer run at once while
+        ESPN is slow or throttling. A URL that fails yields its exception
+        instead of raising, so one bad document does not stop the rest.
+
+        Args:
+            urls: Request URLs
+            concurrency: Worker threads (upper bound on requests in flight)
+            timeout: Per-attempt timeout in seconds
+            **kwargs: Passed to get
+
+        Yields:
+            tuple: (url, response or exception) in completion order
+        """
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='espn') as executor:
+            futures = {executor.submit(self.get, url, timeout, **kwargs): url for url in urls}
+            for future in as_completed(futures):
+                try:
+                    yield futures[future], future.result()
+                except requests.exceptions.RequestException as e:
+                    yield futures[future], e
+
+    def _backoff(self, attempt: int, deadline: float):
+        """Sleep with full-jitter exponential backoff, never past the deadline"""
+        delay = random.uniform(0, self.backoff_seconds * (2 ** (attempt - 1)))
+        time.sleep(max(0.0, min(delay, deadline - time.monotonic())))
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header (delta-seconds or HTTP-date)
+
+    Args:
+        value: Header value
+
+    Returns:
+        float: Seconds to wait (capped at MAX_RETRY_AFTER_SECONDS) or None
+    """
+    if not value:
+        return None
+
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        seconds = (retry_at - datetime.now(timezone.utc)).total_seconds()
+
+    return min(max(0.0, seconds), MAX_RETRY_AFTER_SECONDS)
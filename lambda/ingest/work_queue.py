@@ -0,0 +1,214 @@
+"""
+NFL Tackle Leaders - Ingest Work Queue
+(season, week, stat) work items for fan-out ingest, backed by SQS in AWS
+and by an in-memory stand-in locally
+"""
+from collections import deque
+import json
+import logging
+import os
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Callable, Optional
+import boto3
+
+logger = logging.getLogger()
+
+# Environment variables
+WORK_QUEUE_URL = os.environ.get('WORK_QUEUE_URL')
+
+SQS_MAX_BATCH = 10
+
+
+class SqsQueue:
+    """Work queue backed by an SQS queue (consumed by the Lambda event source mapping)"""
+
+    def __init__(self, queue_url: str):
+        self.queue_url = queue_url
+        self.sqs = boto3.client('sqs')
+
+    def send_batch(self, messages: List[Dict[str, Any]]) -> int:
+        """
+        Enqueue work items
+
+        Args:
+            messages: JSON-serializable work items
+
+        Returns:
+            int: Number of messages accepted
+        """
+        sent = 0
+        for start in range(0, len(messages), SQS_MAX_BATCH):
+            chunk = messages[start:start + SQS_MAX_BATCH]
+            response = self.sqs.send_message_batch(
+                QueueUrl=self.queue_url,
+                Entries=[
+                    {'Id': str(i), 'MessageBody': json.dumps(message)}
+                    for i, message in enumerate(chunk)
+                ]
+            )
+            for failure in response.get('Failed', []):
+                logger.error(f"Failed to enqueue {chunk[int(failure['Id'])]}: {failure.get('Message')}")
+            sent += len(response.get('Successful', []))
+        return sent
+
+    def pending(self) -> int:
+        """
+        Messages waiting to be delivered (excluding in-flight batches)
+
+        Returns:
+            int: Approximate number of waiting messages
+        """
+        attributes = self.sqs.get_queue_attributes(
+            QueueUrl=self.queue_url,
+            AttributeNames=['ApproximateNumberOfMessages']
+        )['Attributes']
+        return int(attributes['ApproximateNumberOfMessages'])
+
+
+class LocalQueue:
+    """
+    In-memory stand-in for SQS plus the Lambda event source mapping
+
+    drain() delivers SQS-shaped batches to a handler, re-queues the
+    messages reported in batchItemFailures and dead-letters messages that
+    fail max_receives times, so the pipeline runs end to end without AWS.
+    """
+
+    def __init__(self, max_receives: int = 3):
+        self.max_receives = max_receives
+        self.dead_letters: List[Dict[str, Any]] = []
+        self._messages = deque()
+        self._lock = threading.Lock()
+
+    def send_batch(self, messages: List[Dict[str, Any]]) -> int:
+        """
+        Enqueue work items
+
+        Args:
+            messages: JSON-serializable work items
+
+        Returns:
+            int: Number of messages accepted
+        """
+        with self._lock:
+            for message in messages:
+                self._messages.append({
+                    'messageId': str(uuid.uuid4()),
+                    'body': json.dumps(message),
+                    'receives': 0
+                })
+        return len(messages)
+
+    def pending(self) -> int:
+        """
+        Messages waiting to be delivered (excluding in-flight batches)
+
+        Returns:
+            int: Number of waiting messages
+        """
+        with self._lock:
+            return len(self._messages)
+
+    def drain(self, handler: Callable[[Dict[str, Any], Any], Dict[str, Any]],
+              batch_size: int = SQS_MAX_BATCH, concurrency: int = 1, context: Any = None,
+              context_factory: Optional[Callable[[], Any]] = None) -> Dict[str, int]:
+        """
+        Deliver batches to the handler until the queue is empty
+
+        Args:
+            handler: Lambda handler accepting an SQS event
+            batch_size: Messages per invocation
+            concurrency: Concurrent simulated Lambda invocations
+            context: Lambda context passed to the handler
+            context_factory: Builds a fresh context per invocation instead
+                (e.g. deadline.LocalContext with a simulated timeout)
+
+        Returns:
+            dict: invocations, processed, retried and dead_lettered counts
+        """
+        stats = {'invocations': 0, 'processed': 0, 'retried': 0, 'dead_lettered': 0}
+        stats_lock = threading.Lock()
+
+        def worker():
+            while True:
+                batch = self._take(batch_size)
+                if batch is None:
+                    return
+                event = {'Records': [
+                    {
+                        'messageId': message['messageId'],
+                        'receiptHandle': message['messageId'],
+                        'body': message['body'],
+                        'attributes': {'ApproximateReceiveCount': str(message['receives'])},
+                        'eventSource': 'aws:sqs'
+                    }
+                    for message in batch
+                ]}
+
+                try:
+                    response = handler(event, context_factory() if context_factory else context) or {}
+                    failed_ids = {f['itemIdentifier'] for f in response.get('batchItemFailures', [])}
+                except Exception as e:
+                    # A crashed invocation fails the whole batch, as with SQS
+                    logger.error(f"Worker invocation failed: {str(e)}")
+                    failed_ids = {message['messageId'] for message in batch}
+
+                retried, dead = self._settle(batch, failed_ids)
+                with stats_lock:
+                    stats['invocations'] += 1
+                    stats['processed'] += len(batch) - len(failed_ids)
+                    stats['retried'] += retried
+                    stats['dead_lettered'] += dead
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            for future in [executor.submit(worker) for _ in range(concurrency)]:
+                future.result()
+
+        return stats
+
+    def _take(self, batch_size: int) -> Optional[List[Dict[str, Any]]]:
+        """Receive up to batch_size messages (None when nothing is left)"""
+        with self._lock:
+            if not self._messages:
+                return None
+            batch = [self._messages.popleft() for _ in range(min(batch_size, len(self._messages)))]
+            for message in batch:
+                message['receives'] += 1
+            return batch
+
+    def _settle(self, batch: List[Dict[str, Any]], failed_ids: set):
+        """Delete successes, re-queue or dead-letter failures"""
+        retried = dead = 0
+        with self._lock:
+            for message in batch:
+                if message['messageId'] not in failed_ids:
+                    continue
+                if message['receives'] >= self.max_receives:
+                    self.dead_letters.append(message)
+                    dead += 1
+                else:
+                    self._messages.append(message)
+                    retried += 1
+        return retried, dead
+
+
+_local_queue: Optional[LocalQueue] = None
+
+
+def get_work_queue():
+    """
+    Return the configured work queue
+
+    Returns:
+        SqsQueue when WORK_QUEUE_URL is set, otherwise a process-wide LocalQueue
+    """
+    global _local_queue
+
+    if WORK_QUEUE_URL:
+        return SqsQueue(WORK_QUEUE_URL)
+
+    if _local_queue is None:
+        _local_queue = LocalQueue()
+    return _local_queue
@@ -0,0 +1,28 @@
+"""
+NFL Tackle Leaders - Name Normalization
+The one normalization applied to player names when ingest indexes them and
+to /search queries when the API looks them up, shared by both Lambdas
+"""
+import re
+import unicodedata
+
+# Punctuation dropped inside names (T.J. -> tj, Ja'Marr -> jamarr)
+NAME_JOINERS = re.compile(r"[.'’]")
+NAME_SEPARATORS = re.compile(r'[^a-z0-9]+')
+
+
+def normalize_name(name: str) -> str:
+    """
+    Normalize a name or query for prefix matching
+
+    Accents are folded, case and punctuation dropped and whitespace
+    collapsed, so "Ja'Marr Chase", "jamarr chase" and "JAMARR  CHASE" agree.
+
+    Args:
+        name: Player name or search text
+
+    Returns:
+        str: Lowercase ASCII words separated by single spaces
+    """
+    folded = unicodedata.normalize('NFKD', name or '').encode('ascii', 'ignore').decode().lower()
+    return ' '.join(NAME_SEPARATORS.split(NAME_JOINERS.sub('', folded))).strip()
@@ -0,0 +1,267 @@
+"""
+NFL Tackle Leaders - Invocation Profiling
+Opt-in cProfile/tracemalloc capture of sampled or explicitly flagged
+invocations, written as compact artifacts (local or S3) and summarized in
+the log
+"""
+import cProfile
+import io
+import json
+import logging
+import marshal
+import os
+import pstats
+import random
+import threading
+import time
+import tracemalloc
+import uuid
+from functools import wraps
+from pathlib import Path
+from typing import Dict, Any, Callable, List
+import boto3
+
+logger = logging.getLogger()
+
+# Environment variables
+PROFILE_SAMPLE_RATE = float(os.environ.get('PROFILE_SAMPLE_RATE', '0'))  # fraction of invocations
+PROFILE_ON_REQUEST = os.environ.get('PROFILE_ON_REQUEST', 'false').lower() == 'true'
+PROFILE_MODE = os.environ.get('PROFILE_MODE', 'cpu,memory')  # what sampled invocations collect
+PROFILE_DESTINATION = os.environ.get('PROFILE_DESTINATION', '/tmp/profiles')  # local dir or s3://bucket/prefix
+PROFILE_TOP_N = int(os.environ.get('PROFILE_TOP_N', '15'))
+
+# Request opt-in: {"profile": "cpu"} in the event, or an X-Profile header on API requests
+PROFILE_EVENT_KEY = 'profile'
+PROFILE_HEADER = 'x-profile'
+
+PROFILE_KINDS = ('cpu', 'memory')
+
+# Frames kept per allocation; one keeps tracemalloc's own overhead low
+TRACEMALLOC_FRAMES = 1
+
+# Only one invocation is profiled at a time (cProfile is per interpreter
+# and /batch re-enters the API handler)
+_active = threading.Lock()
+
+
+def profiled(handler: Callable) -> Callable:
+    """
+    Wrap a Lambda handler with opt-in profiling
+
+    With no sample rate and request opt-in disabled the handler is
+    returned unwrapped, so normal traffic pays nothing. Otherwise each
+    invocation costs one random() call unless it is profiled.
+
+    Args:
+        handler: Lambda handler (event, context)
+
+    Returns:
+        Handler, wrapped when profiling can be triggered
+    """
+    if PROFILE_SAMPLE_RATE <= 0 and not PROFILE_ON_REQUEST:
+        return handler
+
+    @wraps(handler)
+    def wrapper(event, context):
+        kinds = requested_kinds(event)
+        if not kinds or not _active.acquire(blocking=False):
+            return handler(event, context)
+
+        try:
+            return run_profiled(handler, event, context, kinds)
+        finally:
+            _active.release()
+
+    return wrapper
+
+
+def requested_kinds(event) -> List[str]:
+    """
+    Decide whether (and how) to profile an invocation
+
+    Args:
+        event: Lambda event
+
+    Returns:
+        list: Profile kinds to collect ('cpu', 'memory'); empty for none
+    """
+    flag = None
+    if PROFILE_ON_REQUEST and isinstance(event, dict):
+        headers = event.get('headers') or {}
+        flag = event.get(PROFILE_EVENT_KEY) or headers.get(PROFILE_HEADER) or headers.get(PROFILE_HEADER.title())
+
+    if not flag:
+        if PROFILE_SAMPLE_RATE <= 0 or random.random() >= PROFILE_SAMPLE_RATE:
+            return []
+        flag = PROFILE_MODE
+
+    if flag is True or str(flag).lower() in ('1', 'true', 'all'):
+        return list(PROFILE_KINDS)
+    return [kind for kind in PROFILE_KINDS if kind in str(flag).lower()]
+
+
+def run_profiled(handler: Callable, event, context, kinds: List[str]):
+    """
+    Run the handler under cProfile and/or tracemalloc and report
+
+    Only the invoking thread is CPU-profiled (worker threads, such as
+    /batch sub-requests, show up as time waiting on them); allocations
+    are traced in every thread.
+
+    Args:
+        handler: Lambda handler
+        event: Lambda event
+        context: Lambda context
+        kinds: Profile kinds to collect
+
+    Returns:
+        The handler's response (API responses gain an X-Profile-Id header)
+    """
+    request_id = getattr(context, 'aws_request_id', None) or uuid.uuid4().hex[:12]
+    profile_id = f"{time.strftime('%Y%m%dT%H%M%SZ', time.gmtime())}-{request_id}"
+    profiler = cProfile.Profile() if 'cpu' in kinds else None
+    tracing = 'memory' in kinds and not tracemalloc.is_tracing()
+
+    if tracing:
+        tracemalloc.start(TRACEMALLOC_FRAMES)
+    start = time.perf_counter()
+    if profiler:
+        profiler.enable()
+    try:
+        response = handler(event, context)
+    finally:
+        if profiler:
+            profiler.disable()
+        elapsed = time.perf_counter() - start
+        memory = None
+        if tracing:
+            memory = tracemalloc.take_snapshot()
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+        try:
+            summary = {
+                'profile_id': profile_id,
+                'function': os.environ.get('AWS_LAMBDA_FUNCTION_NAME', handler.__module__),
+                'wall_ms': round(elapsed * 1000, 1),
+                'kinds': kinds
+            }
+            artifacts = {}
+            if profiler:
+                summary['hot_functions'] = hot_functions(profiler, PROFILE_TOP_N)
+                artifacts['pstats'] = _pstats_bytes(profiler)
+            if memory is not None:
+                summary['peak_traced_mb'] = round(peak / 2**20, 2)
+                summary['allocation_sites'] = allocation_sites(memory, PROFILE_TOP_N)
+            artifacts['json'] = json.dumps(summary, indent=1).encode()
+
+            summary['artifacts'] = write_artifacts(PROFILE_DESTINATION, profile_id, artifacts)
+            log_summary(summary)
+        except Exception as e:
+            # Profiling must never fail the invocation it observed
+            logger.error(f"Error writing profile {profile_id}: {str(e)}", exc_info=True)
+
+    if isinstance(response, dict) and isinstance(response.get('headers'), dict):
+        response['headers']['X-Profile-Id'] = profile_id
+    return response
+
+
+def hot_functions(profiler: cProfile.Profile, top_n: int) -> List[Dict[str, Any]]:
+    """
+    Top functions by cumulative time
+
+    Args:
+        profiler: Finished profiler
+        top_n: Number of functions
+
+    Returns:
+        list: {'function', 'calls', 'total_ms', 'cumulative_ms'} entries
+    """
+    stats = pstats.Stats(profiler, stream=io.StringIO())
+    rows = sorted(stats.stats.items(), key=lambda row: row[1][3], reverse=True)[:top_n]
+
+    return [
+        {
+            'function': f"{Path(filename).name}:{line}({name})",
+            'calls': calls,
+            'total_ms': round(total * 1000, 2),
+            'cumulative_ms': round(cumulative * 1000, 2)
+        }
+        for (filename, line, name), (_, calls, total, cumulative, _) in rows
+    ]
+
+
+def allocation_sites(snapshot: tracemalloc.Snapshot, top_n: int) -> List[Dict[str, Any]]:
+    """
+    Top source lines by memory still allocated at the end of the invocation
+
+    Args:
+        snapshot: tracemalloc snapshot
+        top_n: Number of sites
+
+    Returns:
+        list: {'site', 'kb', 'blocks'} entries
+    """
+    snapshot = snapshot.filter_traces([
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, __file__)
+    ])
+    return [
+        {
+            'site': f"{Path(stat.traceback[0].filename).name}:{stat.traceback[0].lineno}",
+            'kb': round(stat.size / 1024, 1),
+            'blocks': stat.count
+        }
+        for stat in snapshot.statistics('lineno')[:top_n]
+    ]
+
+
+def write_artifacts(destination: str, profile_id: str, artifacts: Dict[str, bytes]) -> List[str]:
+    """
+    Store a profile's artifacts as <destination>/<profile_id>.<extension>
+
+    Args:
+        destination: Local directory or "s3://bucket/prefix"
+        profile_id: Profile ID
+        artifacts: extension -> bytes (pstats for `python -m pstats`, json summary)
+
+    Returns:
+        list: Artifact locations
+    """
+    locations = []
+
+    if destination.startswith('s3://'):
+        bucket, _, prefix = destination[len('s3://'):].partition('/')
+        s3 = boto3.client('s3')
+        for extension, body in artifacts.items():
+            key = '/'.join(part for part in (prefix.strip('/'), f"{profile_id}.{extension}") if part)
+            s3.put_object(Bucket=bucket, Key=key, Body=body)
+            locations.append(f"s3://{bucket}/{key}")
+        return locations
+
+    root = Path(destination)
+    root.mkdir(parents=True, exist_ok=True)
+    for extension, body in artifacts.items():
+        path = root / f"{profile_id}.{extension}"
+        path.write_bytes(body)
+        locations.append(str(path))
+    return locations
+
+
+def log_summary(summary: Dict[str, Any]):
+    """Log a profile's hot functions and allocation sites"""
+    lines = [f"Profile {summary['profile_id']}: {summary['wall_ms']} ms wall, artifacts {summary['artifacts']}"]
+    for entry in summary.get('hot_functions', []):
+        lines.append(f"  cpu {entry['cumulative_ms']:>9.2f} ms cum {entry['total_ms']:>9.2f} ms self "
+                     f"{entry['calls']:>7} calls  {entry['function']}")
+    if 'allocation_sites' in summary:
+        lines.append(f"  memory peak {summary['peak_traced_mb']} MB traced")
+        for entry in summary['allocation_sites']:
+            lines.append(f"  mem {entry['kb']:>9.1f} KB {entry['blocks']:>7} blocks  {entry['site']}")
+    logger.info('\n'.join(lines))
+
+
+def _pstats_bytes(profiler: cProfile.Profile) -> bytes:
+    """Serialize profiler stats in the format pstats.Stats() loads"""
+    profiler.create_stats()
+    return marshal.dumps(profiler.stats)
@@ -0,0 +1,11 @@
+"""
+NFL Tackle Leaders - Tracked Stats
+The stat types ingest stores and the API serves (the StatTypeIndex
+partitions), kept in one module shared by both Lambdas
+"""
+
+# Tracked stats: stored stat_type -> ESPN leaders category name
+TRACKED_STATS = {
+    'TOTAL_TACKLES': 'totalTackles',
+    'SACKS': 'sacks'
+}
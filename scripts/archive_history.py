@@ -0,0 +1,94 @@
+"""
+Archive NFL leaders history from DynamoDB into season-partitioned Parquet files
+Reads each season once and writes <destination>/season=<year>/leaders.parquet
+"""
+import sys
+import time
+from pathlib import Path
+import boto3
+
+# Reuse the ingest Lambda's archiver
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'lambda' / 'ingest'))
+from archive import archive_season, read_archive  # noqa: E402
+
+# Configuration
+TABLE_NAME = 'nfl_weekly_leaders'
+CURRENT_SEASON = '2025'
+
+
+def parse_seasons(spec: str) -> list:
+    """
+    Parse a season list such as "2016-2025" or "2023,2025"
+
+    Args:
+        spec: Comma separated seasons and/or inclusive ranges
+
+    Returns:
+        list: Season strings in ascending order
+    """
+    seasons = set()
+    for part in spec.split(','):
+        part = part.strip()
+        if '-' in part:
+            start, end = part.split('-', 1)
+            seasons.update(str(year) for year in range(int(start), int(end) + 1))
+        elif part:
+            seasons.add(part)
+    return sorted(seasons)
+
+
+def archive_seasons(seasons: list, destination: str, table_name: str = TABLE_NAME):
+    """
+    Archive several seasons from DynamoDB
+
+    Args:
+        seasons: Seasons to archive
+        destination: Local directory or "s3://bucket/prefix"
+        table_name: DynamoDB table to read from
+    """
+    table = boto3.resource('dynamodb').Table(table_name)
+
+    print(f"Archiving {len(seasons)} season(s) to {destination}")
+    print("=" * 60)
+
+    for season in seasons:
+        result = archive_season(table, season, destination)
+        if result['rows'] == 0:
+            print(f"  ⚠ {season}: no items found")
+        else:
+            print(f"  ✓ {season}: {result['rows']} rows, {result['bytes']:,} bytes -> {result['location']}")
+
+
+def verify_archive(destination: str, seasons: list = None):
+    """
+    Read the archive back and print per-season row counts
+
+    Args:
+        destination: Local directory or "s3://bucket/prefix"
+        seasons: Seasons to read (None for all)
+    """
+    start = time.perf_counter()
+    history = read_archive(destination, seasons)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    print(f"\nRead {history.num_rows} rows in {elapsed_ms:.1f} ms")
+    counts = history.group_by('season').aggregate([('week_number', 'count')])
+    for row in sorted(counts.to_pylist(), key=lambda r: r['season']):
+        print(f"  {row['season']}: {row['week_number_count']} rows")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Archive NFL leaders history to Parquet')
+    parser.add_argument('--seasons', default=CURRENT_SEASON, help='Seasons, e.g. 2016-2025 or 2024,2025')
+    parser.add_argument('--dest', required=True, help='Local directory or s3://bucket/prefix')
+    parser.add_argument('--table', default=TABLE_NAME, help='DynamoDB table name')
+    parser.add_argument('--verify-only', action='store_true', help='Only read the archive back')
+
+    args = parser.parse_args()
+    seasons = parse_seasons(args.seasons)
+
+    if not args.verify_only:
+        archive_seasons(seasons, args.dest, args.table)
+    verify_archive(args.dest, seasons)
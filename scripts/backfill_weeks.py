@@ -1,14 +1,30 @@
 """
 Backfill historical NFL leaders data into DynamoDB
 Fetches data for all completed weeks of the current season
+
+--raw-archive keeps every raw ESPN response; --from-archive rebuilds the
+items from such an archive without calling ESPN. --snapshot-location
+republishes the API's SQLite snapshot once the weeks are stored.
 """
 import os
 import sys
 import json
 import boto3
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
-from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'lambda' / 'ingest'))
+from change_log import record_change  # noqa: E402
+from dimensions import store_dimensions  # noqa: E402
+from models import LeaderRecord  # noqa: E402
+from raw_archive import RawArchive, archive_body  # noqa: E402
+from search_index import update_search_index  # noqa: E402
+from season_summary import update_season_summary  # noqa: E402
+from snapshot import publish_snapshot  # noqa: E402
+from tracked_stats import TRACKED_STATS  # noqa: E402
+from throttling import ThrottledClient  # noqa: E402
 
 # Configuration
 TABLE_NAME = 'nfl_weekly_leaders'
@@ -19,11 +35,21 @@ ESPN_API_BASE_URL = 'https://sports.core.api.espn.com/v2/sports/football/leagues
 dynamodb = boto3.resource('dynamodb')
 table = dynamodb.Table(TABLE_NAME)
 
+# ESPN client shared by all fetch threads: backs off on 429s/slow responses
+# and fails fast once ESPN is clearly throttling us
+espn = ThrottledClient()
+
 
 def store_leader(table, season: str, week: int, stat_type: str, leader_data: dict):
     """
     Store a leader in DynamoDB
     
+    Writes the leader fact plus its player/team dimension items (only
+    when their names changed, adding a new or renamed player to the
+    search index) and change-log entry (only when the fact changed),
+    then folds the week into the season summary, the same way the
+    ingest Lambda does. Weeks older than the summary rebuild it.
+    
     Args:
         table: DynamoDB table resource
         season: NFL season
@@ -31,41 +57,36 @@ def store_leader(table, season: str, week: int, stat_type: str, leader_data: dic
         stat_type: Type of stat (TOTAL_TACKLES or SACKS)
         leader_data: Leader information
     """
-    pk = f"SEASON#{season}"
-    sk = f"WEEK#{week:02d}#STAT#{stat_type}"
-    
-    item = {
-        'PK': pk,
-        'SK': sk,
-        'season': season,
-        'week_number': week,
-        'stat_type': stat_type,
-        'stat_display_name': leader_data['stat_display_name'],
-        'player_id': leader_data['player_id'],
-        'player_name': leader_data['player_name'],
-        'player_short_name': leader_data['player_short_name'],
-        'team_id': leader_data['team_id'],
-        'team_name': leader_data['team_name'],
-        'team_abbreviation': leader_data['team_abbreviation'],
-        'stat_value': Decimal(str(leader_data['value'])),
-        'stat_display_value': leader_data['display_value'],
-        'updated_at': datetime.utcnow().isoformat() + 'Z'
-    }
+    leader = LeaderRecord(
+        season, week, stat_type, leader_data['stat_display_name'],
+        leader_data['player_id'], leader_data['player_name'], leader_data['player_short_name'],
+        leader_data['team_id'], leader_data['team_name'], leader_data['team_abbreviation'],
+        Decimal(str(leader_data['value'])), leader_data['display_value']
+    )
     
+    item = leader.to_item()
+    if store_dimensions(table, leader):
+        update_search_index(table, {leader.player_id: (leader.player_name, leader.player_short_name)})
+    record_change(table, item)
     table.put_item(Item=item)
+    update_season_summary(table, leader)
 
 
-def fetch_leaders_for_week(season: str, week: int) -> dict:
+def fetch_leaders_for_week(season: str, week: int, client=None, raw_archive: str = None) -> dict:
     """
     Fetch leaders for a specific week
     
     Args:
         season: NFL season year
         week: Week number (1-18)
+        client: ESPN client (defaults to the shared ThrottledClient; a
+            RawArchive replay client reprocesses offline)
+        raw_archive: Directory or s3:// prefix to archive raw responses to
     
     Returns:
         dict: Leaders data or None if not available
     """
+    client = client or espn
     print(f"\nFetching data for Week {week}...")
     
     # Fetch tackles leader
@@ -77,9 +98,11 @@ def fetch_leaders_for_week(season: str, week: int) -> dict:
     try:
         # Fetch tackles
         print(f"  Fetching tackles from: {tackles_url}")
-        tackles_response = requests.get(tackles_url, timeout=10)
+        tackles_response = client.get(tackles_url, timeout=10)
         tackles_response.raise_for_status()
         tackles_data = tackles_response.json()
+        if raw_archive:
+            archive_body(raw_archive, tackles_url, tackles_response.content)
         
         if 'leaders' in tackles_data and tackles_data['leaders']:
             leaders['tackles'] = extract_leader_data(tackles_data, 'TOTAL_TACKLES', 'Total Tackles')
@@ -89,9 +112,11 @@ def fetch_leaders_for_week(season: str, week: int) -> dict:
         
         # Fetch sacks
         print(f"  Fetching sacks from: {sacks_url}")
-        sacks_response = requests.get(sacks_url, timeout=10)
+        sacks_response = client.get(sacks_url, timeout=10)
         sacks_response.raise_for_status()
         sacks_data = sacks_response.json()
+        if raw_archive:
+            archive_body(raw_archive, sacks_url, sacks_response.content)
         
         if 'leaders' in sacks_data and sacks_data['leaders']:
             leaders['sacks'] = extract_leader_data(sacks_data, 'SACKS', 'Sacks')
@@ -142,7 +167,8 @@ def extract_leader_data(api_data: dict, stat_type: str, stat_display_name: str)
     }
 
 
-def backfill_season(season: str, start_week: int = 1, end_week: int = 15):
+def backfill_season(season: str, start_week: int = 1, end_week: int = 15, workers: int = 4,
+                    raw_archive: str = None, from_archive: str = None, snapshot_location: str = None):
     """
     Backfill data for multiple weeks
     
@@ -150,16 +176,33 @@ def backfill_season(season: str, start_week: int = 1, end_week: int = 15):
         season: NFL season year
         start_week: First week to backfill
         end_week: Last week to backfill
+        workers: Weeks fetched concurrently (the ESPN client's adaptive
+            limit caps in-flight requests below this when throttled)
+        raw_archive: Archive raw ESPN responses here (dir or s3://)
+        from_archive: Rebuild from this raw archive instead of ESPN
+        snapshot_location: Republish the API snapshot here (path or
+            s3:// URL) after storing
     """
-    print(f"Starting backfill for {season} season, weeks {start_week}-{end_week}")
+    print(f"Starting backfill for {season} season, weeks {start_week}-{end_week}"
+          + (f" from archive {from_archive}" if from_archive else ""))
     print("=" * 60)
     
     success_count = 0
     error_count = 0
     
-    for week in range(start_week, end_week + 1):
+    weeks = list(range(start_week, end_week + 1))
+    client = RawArchive(from_archive).client() if from_archive else espn
+    
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            (week, executor.submit(fetch_leaders_for_week, season, week, client,
+                                   None if from_archive else raw_archive))
+            for week in weeks
+        ]
+    
+    for week, future in futures:
         try:
-            leaders = fetch_leaders_for_week(season, week)
+            leaders = future.result()
             
             if not leaders:
                 print(f"  ⚠ No data found for week {week}, skipping...")
@@ -184,6 +227,10 @@ def backfill_season(season: str, start_week: int = 1, end_week: int = 15):
             print(f"  ✗ Error processing week {week}: {str(e)}")
             error_count += 1
     
+    if snapshot_location and success_count:
+        snapshot = publish_snapshot(table, snapshot_location, TRACKED_STATS)
+        print(f"  ✓ Snapshot {'published' if snapshot['published'] else 'unchanged'}: {snapshot_location}")
+    
     print("\n" + "=" * 60)
     print(f"Backfill complete!")
     print(f"  Successful: {success_count} records")
@@ -197,7 +244,13 @@ if __name__ == "__main__":
     parser.add_argument('--season', default=CURRENT_SEASON, help='NFL season year')
     parser.add_argument('--start-week', type=int, default=1, help='Starting week')
     parser.add_argument('--end-week', type=int, default=15, help='Ending week')
+    parser.add_argument('--workers', type=int, default=4, help='Weeks fetched concurrently')
+    parser.add_argument('--raw-archive', help='Archive raw ESPN responses to this dir or s3:// prefix')
+    parser.add_argument('--from-archive', help='Rebuild items from this raw archive instead of ESPN')
+    parser.add_argument('--snapshot-location', default=os.environ.get('SNAPSHOT_LOCATION'),
+                        help="Republish the API's SQLite snapshot here (path or s3:// URL)")
     
     args = parser.parse_args()
     
-    backfill_season(args.season, args.start_week, args.end_week)
\ No newline at end of file
+    backfill_season(args.season, args.start_week, args.end_week, args.workers,
+                    args.raw_archive, args.from_archive, args.snapshot_location)
\ No newline at end of file
@@ -0,0 +1,192 @@
+"""
+Benchmark the vectorized analytics module against a row-by-row baseline
+Builds a synthetic 20-season, 30-stat history and times both approaches
+
+Usage: python scripts/benchmark_analytics.py [--seasons 20] [--stats 30]
+"""
+import os
+import random
+import sys
+import time
+from decimal import Decimal
+from pathlib import Path
+
+# The API handler reads these at import time; no AWS calls are made here
+os.environ.setdefault('TABLE_NAME', 'nfl_weekly_leaders')
+os.environ.setdefault('CURRENT_SEASON', '2025')
+os.environ.setdefault('AWS_DEFAULT_REGION', 'us-east-1')
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'lambda' / 'api'))
+import analytics  # noqa: E402
+from models import LeaderRecord  # noqa: E402
+
+
+def make_history(num_seasons: int, num_stats: int, weeks: int = analytics.MAX_WEEKS) -> list:
+    """
+    Generate synthetic leader records
+
+    Args:
+        num_seasons: Number of seasons (ending at 2025)
+        num_stats: Number of stat types
+        weeks: Weeks per season
+
+    Returns:
+        list: Leader records with season-to-date cumulative values
+    """
+    rng = random.Random(42)
+    items = []
+
+    for s in range(num_seasons):
+        season = str(2025 - num_seasons + 1 + s)
+        for k in range(num_stats):
+            stat_type = f"STAT_{k:02d}"
+            rate = rng.uniform(0.5, 12.0)
+            total = 0.0
+            for week in range(1, weeks + 1):
+                total += max(0.0, rng.gauss(rate, rate / 3))
+                player_id = str(rng.randint(1, 400))
+                items.append(LeaderRecord.from_item({
+                    'PK': f"SEASON#{season}",
+                    'SK': f"WEEK#{week:02d}#STAT#{stat_type}",
+                    'season': season,
+                    'week_number': Decimal(week),
+                    'stat_type': stat_type,
+                    'stat_display_name': stat_type.title(),
+                    'player_id': player_id,
+                    'player_name': f"Player {player_id}",
+                    'player_short_name': f"P. {player_id}",
+                    'team_id': str(int(player_id) % 32),
+                    'team_name': f"Team {int(player_id) % 32}",
+                    'team_abbreviation': f"T{int(player_id) % 32:02d}",
+                    'stat_value': Decimal(str(round(total, 1))),
+                    'stat_display_value': str(round(total, 1)),
+                    'updated_at': '2025-12-16T23:00:00Z'
+                }))
+
+    return items
+
+
+def percentile(values: list, pct: float):
+    """Linear-interpolation percentile (matches NumPy's default)"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def row_by_row(items: list, season: str) -> dict:
+    """
+    Baseline: compute the same metrics in plain Python over formatted dicts
+
+    Args:
+        items: Leader records
+        season: Season to report on
+
+    Returns:
+        dict: {stat_type: {'pace': latest pace, 'p50': projection median}}
+    """
+    formatted = [(item.season, item.week, item.to_response()) for item in items]
+
+    by_stat = {}
+    for item_season, week, leader in formatted:
+        by_stat.setdefault(leader['stat_type'], {}).setdefault(item_season, {})[week] = leader['value']
+
+    reports = {}
+    for stat_type, seasons in by_stat.items():
+        current = seasons.get(season, {})
+        if not current:
+            continue
+        latest = max(current)
+
+        for week in range(1, analytics.MAX_WEEKS + 1):
+            history = [weeks[week] for weeks in seasons.values() if week in weeks]
+            [percentile(history, p) for p in analytics.BAND_PERCENTILES]
+
+        ratios = [
+            weeks[analytics.MAX_WEEKS] / weeks[latest]
+            for weeks in seasons.values()
+            if analytics.MAX_WEEKS in weeks and weeks.get(latest, 0) > 0
+        ]
+        value = current[latest]
+        reports[stat_type] = {
+            'pace': value / latest * analytics.SEASON_GAMES,
+            'p50': value * percentile(ratios, 50) if ratios else None
+        }
+
+    return reports
+
+
+def vectorized(items: list, season: str) -> dict:
+    """
+    Vectorized: build the cube once and compute every metric in batch
+
+    Args:
+        items: Leader records
+        season: Season to report on
+
+    Returns:
+        dict: {stat_type: {'pace': latest pace, 'p50': projection median}}
+    """
+    cube = analytics.build_cube(items)
+    metrics = analytics.compute_metrics(cube)
+
+    reports = {}
+    for stat_type in cube.stats:
+        report = analytics.stat_report(cube, metrics, season, stat_type)
+        if report:
+            reports[stat_type] = report['projection']
+    return reports
+
+
+def time_it(func, *args, repeat: int = 5):
+    """Return (best seconds, result) over several runs"""
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main(num_seasons: int, num_stats: int):
+    items = make_history(num_seasons, num_stats)
+    season = '2025'
+
+    print("=" * 60)
+    print(f"Analytics benchmark: {num_seasons} seasons x {num_stats} stats ({len(items):,} items)")
+    print("=" * 60)
+
+    baseline_s, baseline = time_it(row_by_row, items, season)
+    vector_s, vector = time_it(vectorized, items, season)
+
+    cube = analytics.build_cube(items)
+    compute_s, _ = time_it(analytics.compute_metrics, cube)
+
+    mismatches = [
+        stat for stat in baseline
+        if abs(baseline[stat]['pace'] - vector[stat]['pace']) > 0.01
+        or (baseline[stat]['p50'] is not None
+            and abs(baseline[stat]['p50'] - vector[stat]['p50']) > 0.01)
+    ]
+
+    print(f"  Row-by-row (to_response + loops):        {baseline_s * 1000:8.1f} ms")
+    print(f"  Vectorized (load + compute + report):    {vector_s * 1000:8.1f} ms")
+    print(f"    compute_metrics only:                  {compute_s * 1000:8.1f} ms")
+    print(f"  Speedup: {baseline_s / vector_s:.1f}x")
+    print(f"  Results match: {'yes' if not mismatches else 'NO - ' + ', '.join(mismatches)}")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Benchmark leader analytics')
+    parser.add_argument('--seasons', type=int, default=20, help='Number of synthetic seasons')
+    parser.add_argument('--stats', type=int, default=30, help='Number of synthetic stats')
+
+    args = parser.parse_args()
+    main(args.seasons, args.stats)
@@ -0,0 +1,325 @@
+"""
+End-to-end ingest benchmark against a fake ESPN server and local DynamoDB
+Runs lambda/ingest/handler.py offline (scripts/fake_espn.py for ESPN,
+scripts/local_dynamodb.py for the table) through three scenarios and reports
+wall time, ESPN HTTP calls, DynamoDB read/write units and peak memory:
+
+  cold      first invocation in a fresh container on an empty table
+            (handler import included)
+  steady    warm container polling the current week in live mode; every
+            other poll sees a new stat revision
+  backfill  multi-season SQS fan-out over every week and tracked stat
+
+Each scenario runs in its own subprocess, so caches start empty and memory
+figures are its own. --save-baseline stores the results; later runs compare
+against it and exit 1 on a regression (calls and capacity units must not
+grow; time and memory may grow by --tolerance).
+
+With --tail-ms/--tail-ratio a fraction of fake ESPN responses is slow, which
+shows what hedging the Core API with the site API does to p99 invocation time.
+
+Usage: python scripts/benchmark_ingest.py [--scenarios cold steady backfill] [--latency-ms 20]
+           [--tail-ms 2000 --tail-ratio 0.05]
+           [--baseline scripts/ingest_baseline.json] [--save-baseline]
+"""
+import json
+import math
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from fake_espn import FakeEspn
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+INGEST_DIR = SCRIPTS_DIR.parent / 'lambda' / 'ingest'
+DEFAULT_BASELINE = SCRIPTS_DIR / 'ingest_baseline.json'
+
+SCENARIOS = ('cold', 'steady', 'backfill')
+
+# Metrics that are deterministic for a given configuration: any growth is a regression
+EXACT_METRICS = ('http_calls', 'write_units', 'read_units')
+# Noisy metrics: (name, absolute slack below which growth is ignored)
+TOLERANT_METRICS = (('wall_seconds', 0.05), ('peak_python_mb', 2.0), ('max_rss_mb', 4.0))
+
+SQS_BATCH_SIZE = 10
+
+
+def run_scenario(name: str, config: dict) -> dict:
+    """
+    Run one scenario in this process (the --run child) and measure it
+
+    Args:
+        name: Scenario name
+        config: Benchmark configuration
+
+    Returns:
+        dict: Measurements for the measured phase of the scenario
+    """
+    import requests
+
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    sys.path.insert(0, str(INGEST_DIR))
+    import handler
+    from local_dynamodb import LocalTable
+
+    handler.table = LocalTable(os.environ['TABLE_NAME'])
+    control = handler.ESPN_API_BASE_URL.split('/v2/')[0] + '/_control'
+    week = config['week']
+    failures = 0
+    invocations = 0
+    durations = []
+
+    def invoke(event):
+        nonlocal failures, invocations
+        invocations += 1
+        invoke_start = time.perf_counter()
+        response = handler.lambda_handler(event, None)
+        durations.append(time.perf_counter() - invoke_start)
+        if 'batchItemFailures' in response:
+            failures += len(response['batchItemFailures'])
+        elif response['statusCode'] != 200:
+            failures += 1
+
+    if name == 'steady':
+        # Setup (not measured): the week is already ingested on a warm container
+        invoke({'week': week})
+        requests.post(f"{control}/reset", timeout=10)
+        handler.table.reset_metrics()
+        invocations = failures = 0
+        durations.clear()
+        tracemalloc.reset_peak()
+        start = time.perf_counter()
+
+        for poll in range(config['polls']):
+            if poll % 2 == 0:
+                requests.post(f"{control}/advance", timeout=10)
+            invoke({'week': week, 'mode': 'live'})
+
+    elif name == 'backfill':
+        current = int(handler.CURRENT_SEASON)
+        work_items = [
+            {'season': str(season), 'week': backfill_week, 'stat_type': stat_type}
+            for season in range(current - config['seasons'] + 1, current + 1)
+            for backfill_week in range(1, config['weeks'] + 1)
+            for stat_type in handler.TRACKED_STATS
+        ]
+
+        # The final batch would check the SQS queue depth before publishing;
+        # publish once at the end instead
+        snapshot_location, handler.SNAPSHOT_LOCATION = handler.SNAPSHOT_LOCATION, None
+        for offset in range(0, len(work_items), SQS_BATCH_SIZE):
+            invoke({'Records': [
+                {'messageId': str(offset + i), 'eventSource': 'aws:sqs', 'body': json.dumps(item)}
+                for i, item in enumerate(work_items[offset:offset + SQS_BATCH_SIZE])
+            ]})
+        handler.SNAPSHOT_LOCATION = snapshot_location
+        if snapshot_location:
+            handler.refresh_snapshot()
+
+    else:
+        invoke({'week': week})
+
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    durations.sort()
+
+    return dict(
+        handler.table.metrics(),
+        wall_seconds=round(elapsed, 3),
+        invoke_p99_seconds=round(durations[math.ceil(len(durations) * 0.99) - 1], 3) if durations else None,
+        invocations=invocations,
+        failures=failures,
+        peak_python_mb=round(peak / 2**20, 1),
+        max_rss_mb=round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+    )
+
+
+def run_suite(config: dict, scenarios: list) -> dict:
+    """
+    Start the fake ESPN server and run each scenario in a subprocess
+
+    Args:
+        config: Benchmark configuration
+        scenarios: Scenario names to run
+
+    Returns:
+        dict: scenario -> measurements (including ESPN request counts)
+    """
+    fake = FakeEspn(
+        categories=config['categories'], leaders=config['leaders'],
+        reference_padding=config['reference_padding'],
+        latency_ms=config['latency_ms'], week=config['week'],
+        tail_ms=config['tail_ms'], tail_ratio=config['tail_ratio']
+    )
+    base_url = fake.start()
+    results = {}
+
+    try:
+        for name in scenarios:
+            fake.reset_stats()
+            fake.revision = 0
+
+            with tempfile.TemporaryDirectory() as workdir:
+                env = dict(
+                    {key: value for key, value in os.environ.items()
+                     if key not in ('ARCHIVE_DESTINATION', 'RAW_ARCHIVE_DESTINATION', 'SCHEDULE_RULE_NAME')},
+                    TABLE_NAME='nfl_weekly_leaders',
+                    CURRENT_SEASON=config['season'],
+                    ESPN_API_BASE_URL=base_url,
+                    ESPN_SITE_API_BASE_URL=fake.site_base_url,
+                    SNAPSHOT_LOCATION=str(Path(workdir) / 'leaders.sqlite'),
+                    CALENDAR_CACHE_PATH=str(Path(workdir) / 'calendar.json'),
+                    AWS_DEFAULT_REGION=os.environ.get('AWS_DEFAULT_REGION', 'us-east-1'),
+                    LOG_LEVEL='WARNING'
+                )
+                output = subprocess.check_output(
+                    [sys.executable, __file__, '--run', name, json.dumps(config)], env=env
+                )
+
+            espn = fake.stats()
+            results[name] = dict(
+                json.loads(output.decode().strip().splitlines()[-1]),
+                http_calls=espn['requests'],
+                http_by_kind=espn['by_kind'],
+                http_mb=round(espn['bytes_sent'] / 2**20, 2)
+            )
+    finally:
+        fake.stop()
+
+    return results
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    """
+    Find regressions against a stored baseline
+
+    Args:
+        results: This run's results
+        baseline: Stored results
+        tolerance: Allowed relative growth of time and memory
+
+    Returns:
+        list: Human-readable regression descriptions
+    """
+    regressions = []
+
+    for name, result in results.items():
+        before = baseline.get(name)
+        if before is None:
+            continue
+
+        for metric in EXACT_METRICS:
+            if metric in before and result[metric] > before[metric]:
+                regressions.append(f"{name}: {metric} {before[metric]} -> {result[metric]}")
+
+        for metric, slack in TOLERANT_METRICS:
+            if metric not in before:
+                continue
+            limit = max(before[metric] * (1 + tolerance), before[metric] + slack)
+            if result[metric] > limit:
+                regressions.append(
+                    f"{name}: {metric} {before[metric]} -> {result[metric]} "
+                    f"(+{result[metric] / max(before[metric], 1e-9) - 1:.0%}, allowed +{tolerance:.0%})"
+                )
+
+    return regressions
+
+
+def main(config: dict, scenarios: list, baseline_path: Path, save_baseline: bool, tolerance: float):
+    print("=" * 78)
+    print(f"Ingest benchmark: season {config['season']} week {config['week']}, "
+          f"{config['categories']} categories x {config['leaders']} leaders, "
+          f"{config['latency_ms']:g} ms ESPN latency"
+          + (f" ({config['tail_ratio']:.0%} +{config['tail_ms']:g} ms)" if config['tail_ratio'] else ''))
+    print("=" * 78)
+
+    results = run_suite(config, scenarios)
+
+    print(f"{'scenario':<10}{'wall s':>8}{'p99 s':>7}{'invokes':>9}{'HTTP':>7}{'HTTP MiB':>10}"
+          f"{'WCU':>8}{'RCU':>8}{'py peak MiB':>13}{'RSS MiB':>9}")
+    for name, r in results.items():
+        print(f"{name:<10}{r['wall_seconds']:>8.2f}{r['invoke_p99_seconds']:>7.2f}{r['invocations']:>9}"
+              f"{r['http_calls']:>7}{r['http_mb']:>10.2f}"
+              f"{r['write_units']:>8g}{r['read_units']:>8g}{r['peak_python_mb']:>13.1f}{r['max_rss_mb']:>9.1f}")
+        detail = ', '.join(f"{count} {kind}" for kind, count in sorted(r['http_by_kind'].items()))
+        print(f"{'':<10}ESPN: {detail}; DynamoDB: "
+              f"{', '.join(f'{count} {op}' for op, count in sorted(r['operations'].items()))}")
+        if r['failures']:
+            print(f"{'':<10}FAILURES: {r['failures']}")
+
+    exit_code = 0
+    if baseline_path.exists() and not save_baseline:
+        stored = json.loads(baseline_path.read_text())
+        if stored.get('config') != config:
+            print(f"\nBaseline {baseline_path} was recorded with a different configuration; not comparing")
+        else:
+            regressions = compare(results, stored['results'], tolerance)
+            print(f"\nAgainst baseline {baseline_path}: "
+                  f"{'no regressions' if not regressions else f'{len(regressions)} regression(s)'}")
+            for regression in regressions:
+                print(f"  REGRESSION {regression}")
+            exit_code = 1 if regressions else 0
+
+    if save_baseline:
+        baseline_path.write_text(json.dumps({
+            'config': config,
+            'recorded_at': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+            'results': results
+        }, indent=2, sort_keys=True) + '\n')
+        print(f"\nSaved baseline to {baseline_path}")
+
+    if any(r['failures'] for r in results.values()):
+        exit_code = 1
+    return exit_code
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Benchmark the ingest Lambda offline')
+    parser.add_argument('--scenarios', nargs='+', choices=SCENARIOS, default=list(SCENARIOS),
+                        help='Scenarios to run')
+    parser.add_argument('--season', default='2025', help='Current season')
+    parser.add_argument('--week', type=int, default=10, help='Week ingested by cold/steady')
+    parser.add_argument('--polls', type=int, default=10, help='Live polls in the steady scenario')
+    parser.add_argument('--seasons', type=int, default=2, help='Seasons in the backfill scenario')
+    parser.add_argument('--weeks', type=int, default=18, help='Weeks per backfilled season')
+    parser.add_argument('--categories', type=int, default=40, help='Categories per leaders document')
+    parser.add_argument('--leaders', type=int, default=50, help='Leaders per category')
+    parser.add_argument('--reference-padding', type=int, default=2048,
+                        help='Filler bytes in each athlete/team document')
+    parser.add_argument('--latency-ms', type=float, default=20.0, help='Fake ESPN latency per response')
+    parser.add_argument('--tail-ms', type=float, default=0.0, help='Extra latency of tail responses')
+    parser.add_argument('--tail-ratio', type=float, default=0.0, help='Fraction of responses that get --tail-ms')
+    parser.add_argument('--baseline', type=Path, default=DEFAULT_BASELINE, help='Baseline file')
+    parser.add_argument('--save-baseline', action='store_true', help='Store these results as the baseline')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='Allowed relative growth of wall time and memory')
+    parser.add_argument('--run', nargs=2, metavar=('SCENARIO', 'CONFIG'), help=argparse.SUPPRESS)
+
+    args = parser.parse_args()
+    if args.run:
+        print(json.dumps(run_scenario(args.run[0], json.loads(args.run[1]))))
+    else:
+        config = {
+            'season': args.season,
+            'week': args.week,
+            'polls': args.polls,
+            'seasons': args.seasons,
+            'weeks': args.weeks,
+            'categories': args.categories,
+            'leaders': args.leaders,
+            'reference_padding': args.reference_padding,
+            'latency_ms': args.latency_ms,
+            'tail_ms': args.tail_ms,
+            'tail_ratio': args.tail_ratio
+        }
+        sys.exit(main(config, args.scenarios, args.baseline, args.save_baseline, args.tolerance))
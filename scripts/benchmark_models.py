@@ -0,0 +1,212 @@
+"""
+Benchmark the slotted LeaderRecord models against the previous ad-hoc dicts
+Measures memory per leader and parse/serialize throughput over a large
+synthetic multi-season history
+
+Usage: python scripts/benchmark_models.py [--seasons 20] [--stats 30] [--depth 10]
+"""
+import importlib.util
+import random
+import time
+import tracemalloc
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+
+LAMBDA_DIR = Path(__file__).resolve().parent.parent / 'lambda'
+
+
+def load_module(name: str, path: Path):
+    """Import a module by path (both Lambdas have a models.py)"""
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+ingest_models = load_module('ingest_models', LAMBDA_DIR / 'ingest' / 'models.py')
+api_models = load_module('api_models', LAMBDA_DIR / 'api' / 'models.py')
+
+
+def make_espn_leaders(num_seasons: int, num_stats: int, depth: int, weeks: int = 18) -> list:
+    """
+    Generate synthetic ESPN leader entries with resolved athlete/team documents
+
+    Args:
+        num_seasons: Number of seasons (ending at 2025)
+        num_stats: Number of stat categories
+        depth: Leaders per category per week
+        weeks: Weeks per season
+
+    Returns:
+        list: (season, week, stat_type, category, entry, athlete, team) tuples
+    """
+    rng = random.Random(7)
+    teams = [
+        {'id': str(t), 'displayName': f"Team {t}", 'abbreviation': f"T{t:02d}", 'location': 'City'}
+        for t in range(32)
+    ]
+    athletes = [
+        {'id': str(a), 'displayName': f"Player {a}", 'shortName': f"P. {a}", 'position': {'abbreviation': 'LB'}}
+        for a in range(2000)
+    ]
+
+    rows = []
+    for s in range(num_seasons):
+        season = str(2025 - num_seasons + 1 + s)
+        for k in range(num_stats):
+            category = {'name': f"stat{k}", 'displayName': f"Stat {k}", 'leaders': []}
+            for week in range(1, weeks + 1):
+                for _ in range(depth):
+                    value = round(rng.uniform(0, 150), 1)
+                    athlete = athletes[rng.randrange(len(athletes))]
+                    entry = {'value': value, 'displayValue': str(value),
+                             'athlete': {'$ref': f"http://espn/athletes/{athlete['id']}"}}
+                    rows.append((season, week, f"STAT_{k:02d}", category, entry,
+                                 athlete, teams[int(athlete['id']) % 32]))
+    return rows
+
+
+def legacy_extract(season, week, stat_type, category, entry, athlete, team) -> dict:
+    """Previous ingest path: ESPN -> leader dict -> DynamoDB item"""
+    leader_data = {
+        'stat_name': category.get('name'),
+        'stat_display_name': category.get('displayName'),
+        'value': entry.get('value'),
+        'display_value': entry.get('displayValue'),
+        'player_id': athlete.get('id'),
+        'player_name': athlete.get('displayName'),
+        'player_short_name': athlete.get('shortName'),
+        'team_id': team.get('id'),
+        'team_name': team.get('displayName'),
+        'team_abbreviation': team.get('abbreviation')
+    }
+    leader = dict(leader_data, value=Decimal(str(leader_data['value'])))  # season summary copy
+    return {
+        'PK': f"SEASON#{season}",
+        'SK': f"WEEK#{week:02d}#STAT#{stat_type}",
+        'season': season,
+        'week_number': week,
+        'stat_type': stat_type,
+        'stat_display_name': leader_data['stat_display_name'],
+        'player_id': leader_data['player_id'],
+        'player_name': leader_data['player_name'],
+        'player_short_name': leader_data['player_short_name'],
+        'team_id': leader_data['team_id'],
+        'team_name': leader_data['team_name'],
+        'team_abbreviation': leader_data['team_abbreviation'],
+        'stat_value': leader['value'],
+        'stat_display_value': leader_data['display_value'],
+        'updated_at': datetime.utcnow().isoformat() + 'Z'
+    }
+
+
+def record_extract(season, week, stat_type, category, entry, athlete, team) -> dict:
+    """Current ingest path: ESPN -> LeaderRecord -> DynamoDB item"""
+    return ingest_models.LeaderRecord.from_espn(season, week, stat_type, category, entry, athlete, team).to_item()
+
+
+def legacy_format(attributes: dict, deserializer=TypeDeserializer()) -> dict:
+    """Previous API path: TypeDeserializer -> item dict -> response dict"""
+    item = {key: deserializer.deserialize(value) for key, value in attributes.items()}
+    stat_value = item['stat_value']
+    if isinstance(stat_value, Decimal):
+        stat_value = int(stat_value) if stat_value % 1 == 0 else float(stat_value)
+    return {
+        'stat_type': item['stat_type'],
+        'stat_name': item['stat_display_name'],
+        'player': {'id': item['player_id'], 'name': item['player_name'], 'short_name': item['player_short_name']},
+        'team': {'id': item['team_id'], 'name': item['team_name'], 'abbreviation': item['team_abbreviation']},
+        'value': stat_value,
+        'display_value': item['stat_display_value'],
+        'updated_at': item['updated_at']
+    }
+
+
+def record_format(attributes: dict) -> dict:
+    """Current API path: attribute map -> LeaderRecord -> response dict"""
+    return api_models.LeaderRecord.from_attribute_map(attributes).to_response()
+
+
+def measure_memory(build) -> int:
+    """Bytes allocated (and still held) by build()"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return after - before
+
+
+def time_it(func, rows, repeat: int = 3) -> float:
+    """Best wall time of applying func to every row"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for row in rows:
+            func(*row) if isinstance(row, tuple) else func(row)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main(num_seasons: int, num_stats: int, depth: int):
+    espn_rows = make_espn_leaders(num_seasons, num_stats, depth)
+    count = len(espn_rows)
+
+    serializer = TypeSerializer()
+    # Denormalized items (names on every leader) so both API paths see the same input
+    items = [legacy_extract(*row) for row in espn_rows]
+    attribute_maps = [{key: serializer.serialize(value) for key, value in item.items()} for item in items]
+
+    print("=" * 72)
+    print(f"Model benchmark: {num_seasons} seasons x {num_stats} stats x 18 weeks x {depth} deep "
+          f"({count:,} leaders)")
+    print("=" * 72)
+
+    deserializer = TypeDeserializer()
+    dict_bytes = measure_memory(lambda: [
+        {key: deserializer.deserialize(value) for key, value in attributes.items()}
+        for attributes in attribute_maps
+    ])
+    record_bytes = measure_memory(lambda: [
+        api_models.LeaderRecord.from_attribute_map(attributes) for attributes in attribute_maps
+    ])
+
+    print("Memory held per leader (API working set)")
+    print(f"  deserialized item dicts: {dict_bytes / count:8.0f} B   ({dict_bytes / 2**20:7.1f} MiB)")
+    print(f"  LeaderRecord (__slots__): {record_bytes / count:7.0f} B   ({record_bytes / 2**20:7.1f} MiB)")
+    print(f"  reduction: {dict_bytes / record_bytes:.1f}x")
+    print()
+
+    legacy_ingest = time_it(legacy_extract, espn_rows)
+    record_ingest = time_it(record_extract, espn_rows)
+    legacy_api = time_it(legacy_format, attribute_maps)
+    record_api = time_it(record_format, attribute_maps)
+
+    mismatched = sum(
+        1 for attributes in attribute_maps[:1000]
+        if legacy_format(attributes) != record_format(attributes)
+    )
+
+    print("Throughput (leaders/second)")
+    print(f"  ingest  ESPN -> item   dicts: {count / legacy_ingest:>10,.0f}   records: {count / record_ingest:>10,.0f}"
+          f"   ({legacy_ingest / record_ingest:.1f}x)")
+    print(f"  api     item -> JSON   dicts: {count / legacy_api:>10,.0f}   records: {count / record_api:>10,.0f}"
+          f"   ({legacy_api / record_api:.1f}x)")
+    print(f"  API responses identical: {'yes' if not mismatched else f'NO ({mismatched} differ)'}")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Benchmark leader record models')
+    parser.add_argument('--seasons', type=int, default=20, help='Number of synthetic seasons')
+    parser.add_argument('--stats', type=int, default=30, help='Number of synthetic stats')
+    parser.add_argument('--depth', type=int, default=10, help='Leaders per stat per week')
+
+    args = parser.parse_args()
+    main(args.seasons, args.stats, args.depth)
@@ -0,0 +1,212 @@
+"""
+Player defensive stats ingest benchmark against a fake ESPN server and local DynamoDB
+Runs the ingest Lambda's {'action': 'player_stats'} mode offline
+(scripts/fake_espn.py for ESPN, scripts/local_dynamodb.py for the table) and
+reports wall time, the slowest invocation against the Lambda timeout, ESPN
+HTTP calls, DynamoDB read/write units and lines written:
+
+  final   cold ingest of a completed week on an empty table: every game,
+          every player who played
+  repoll  the same completed week polled again: every game is already
+          final, so nothing but the game list is read
+  live    the current week polled during its game window: final games are
+          ingested once, then each poll refetches only the games in
+          progress and writes only the lines that changed
+
+Each invocation gets a LocalContext with --timeout, so a week that does not
+fit shows up as games continued on the (local) work queue rather than as a
+timeout. Each scenario runs in its own subprocess, so caches start empty.
+
+Usage: python scripts/benchmark_player_stats.py [--scenarios final repoll live] [--athletes 1700]
+           [--latency-ms 20] [--concurrency 16] [--timeout 120]
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from fake_espn import FakeEspn
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+INGEST_DIR = SCRIPTS_DIR.parent / 'lambda' / 'ingest'
+
+SCENARIOS = ('final', 'repoll', 'live')
+
+# Lambda's hard ceiling, for the headroom column
+LAMBDA_MAX_TIMEOUT = 900
+
+
+def run_scenario(name: str, config: dict) -> dict:
+    """
+    Run one scenario in this process (the --run child) and measure it
+
+    Args:
+        name: Scenario name
+        config: Benchmark configuration
+
+    Returns:
+        dict: Measurements for the measured phase of the scenario
+    """
+    import requests
+
+    sys.path.insert(0, str(INGEST_DIR))
+    import handler
+    from deadline import LocalContext
+    from local_dynamodb import LocalTable
+
+    handler.table = LocalTable(os.environ['TABLE_NAME'])
+    control = handler.ESPN_API_BASE_URL.split('/v2/')[0] + '/_control'
+    week = config['week'] if name == 'live' else config['week'] - 1
+    totals = {'invocations': 0, 'failures': 0, 'continued': 0, 'lines_written': 0, 'players': 0}
+    durations = []
+
+    def invoke(event):
+        totals['invocations'] += 1
+        start = time.perf_counter()
+        response = handler.lambda_handler(event, LocalContext(config['timeout']))
+        durations.append(time.perf_counter() - start)
+        if response['statusCode'] != 200:
+            totals['failures'] += 1
+            return
+        body = json.loads(response['body'])
+        totals['failures'] += body['failed']
+        totals['continued'] += body['continued']
+        totals['lines_written'] += body['lines_written']
+        totals['players'] += body['players']
+
+    event = {'action': 'player_stats', 'week': week}
+    if name == 'repoll':
+        # Setup (not measured): the completed week is already ingested
+        handler.lambda_handler(event, LocalContext(config['timeout']))
+        requests.post(f"{control}/reset", timeout=10)
+        handler.table.reset_metrics()
+
+    start = time.perf_counter()
+    invoke(event)
+    if name == 'live':
+        for _ in range(config['polls']):
+            requests.post(f"{control}/advance", timeout=10)
+            invoke(event)
+    elapsed = time.perf_counter() - start
+
+    return dict(
+        handler.table.metrics(),
+        **totals,
+        wall_seconds=round(elapsed, 3),
+        max_invoke_seconds=round(max(durations), 3)
+    )
+
+
+def run_suite(config: dict, scenarios: list) -> dict:
+    """
+    Start the fake ESPN server and run each scenario in a subprocess
+
+    Args:
+        config: Benchmark configuration
+        scenarios: Scenario names to run
+
+    Returns:
+        dict: scenario -> measurements (including ESPN request counts)
+    """
+    fake = FakeEspn(athletes=config['athletes'], latency_ms=config['latency_ms'], week=config['week'])
+    base_url = fake.start()
+    results = {}
+
+    try:
+        for name in scenarios:
+            fake.reset_stats()
+            fake.revision = 0
+
+            with tempfile.TemporaryDirectory() as workdir:
+                env = dict(
+                    {key: value for key, value in os.environ.items()
+                     if key not in ('ARCHIVE_DESTINATION', 'RAW_ARCHIVE_DESTINATION', 'SCHEDULE_RULE_NAME',
+                                    'SNAPSHOT_LOCATION', 'WORK_QUEUE_URL')},
+                    TABLE_NAME='nfl_weekly_leaders',
+                    CURRENT_SEASON=config['season'],
+                    ESPN_API_BASE_URL=base_url,
+                    ESPN_SITE_API_BASE_URL=fake.site_base_url,
+                    CALENDAR_CACHE_PATH=str(Path(workdir) / 'calendar.json'),
+                    PLAYER_STATS_CONCURRENCY=str(config['concurrency']),
+                    AWS_DEFAULT_REGION=os.environ.get('AWS_DEFAULT_REGION', 'us-east-1'),
+                    LOG_LEVEL='WARNING'
+                )
+                output = subprocess.check_output(
+                    [sys.executable, __file__, '--run', name, json.dumps(config)], env=env
+                )
+
+            espn = fake.stats()
+            results[name] = dict(
+                json.loads(output.decode().strip().splitlines()[-1]),
+                http_calls=espn['requests'],
+                http_by_kind=espn['by_kind'],
+                http_mb=round(espn['bytes_sent'] / 2**20, 2)
+            )
+    finally:
+        fake.stop()
+
+    return results
+
+
+def main(config: dict, scenarios: list) -> int:
+    print("=" * 78)
+    print(f"Player stats benchmark: season {config['season']} week {config['week']}, "
+          f"{config['athletes']} athletes, {config['latency_ms']:g} ms ESPN latency, "
+          f"{config['concurrency']} concurrent fetches, {config['timeout']:g} s timeout")
+    print("=" * 78)
+
+    results = run_suite(config, scenarios)
+
+    print(f"{'scenario':<9}{'wall s':>8}{'max inv s':>11}{'invokes':>9}{'HTTP':>7}{'HTTP MiB':>10}"
+          f"{'players':>9}{'lines':>7}{'WCU':>8}{'RCU':>8}{'continued':>11}")
+    for name, r in results.items():
+        print(f"{name:<9}{r['wall_seconds']:>8.2f}{r['max_invoke_seconds']:>11.2f}{r['invocations']:>9}"
+              f"{r['http_calls']:>7}{r['http_mb']:>10.2f}{r['players']:>9}{r['lines_written']:>7}"
+              f"{r['write_units']:>8g}{r['read_units']:>8g}{r['continued']:>11}")
+        detail = ', '.join(f"{count} {kind}" for kind, count in sorted(r['http_by_kind'].items()))
+        print(f"{'':<9}ESPN: {detail}; DynamoDB: "
+              f"{', '.join(f'{count} {op}' for op, count in sorted(r['operations'].items()))}")
+        if r['failures']:
+            print(f"{'':<9}FAILURES: {r['failures']}")
+
+    slowest = max(r['max_invoke_seconds'] for r in results.values())
+    print(f"\nSlowest invocation {slowest:.2f} s: {slowest / config['timeout']:.0%} of the "
+          f"{config['timeout']:g} s timeout, {slowest / LAMBDA_MAX_TIMEOUT:.1%} of Lambda's "
+          f"{LAMBDA_MAX_TIMEOUT} s maximum")
+
+    return 1 if any(r['failures'] or r['continued'] for r in results.values()) else 0
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Benchmark player defensive stats ingest offline')
+    parser.add_argument('--scenarios', nargs='+', choices=SCENARIOS, default=list(SCENARIOS),
+                        help='Scenarios to run')
+    parser.add_argument('--season', default='2025', help='Current season')
+    parser.add_argument('--week', type=int, default=10,
+                        help='Current week (live); final/repoll use the week before')
+    parser.add_argument('--polls', type=int, default=5, help='Polls after the first in the live scenario')
+    parser.add_argument('--athletes', type=int, default=1700, help='Active players in the fake league')
+    parser.add_argument('--latency-ms', type=float, default=20.0, help='Fake ESPN latency per response')
+    parser.add_argument('--concurrency', type=int, default=16, help='PLAYER_STATS_CONCURRENCY')
+    parser.add_argument('--timeout', type=float, default=120.0, help='Simulated Lambda timeout in seconds')
+    parser.add_argument('--run', nargs=2, metavar=('SCENARIO', 'CONFIG'), help=argparse.SUPPRESS)
+
+    args = parser.parse_args()
+    if args.run:
+        print(json.dumps(run_scenario(args.run[0], json.loads(args.run[1]))))
+    else:
+        config = {
+            'season': args.season,
+            'week': args.week,
+            'polls': args.polls,
+            'athletes': args.athletes,
+            'latency_ms': args.latency_ms,
+            'concurrency': args.concurrency,
+            'timeout': args.timeout
+        }
+        sys.exit(main(config, args.scenarios))
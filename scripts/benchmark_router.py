@@ -0,0 +1,173 @@
+"""
+Benchmark the API route table against the old if/elif routing chain
+Times path matching for a realistic browser request mix and counts the data
+accesses the handler makes for it, with OPTIONS/HEAD answered by the router
+versus routed to the GET handlers (what the method-blind chain did)
+
+Usage: python scripts/benchmark_router.py [--page-views 200]
+"""
+import logging
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+# The API handler reads these at import time; no AWS calls are made here
+os.environ.setdefault('TABLE_NAME', 'nfl_weekly_leaders')
+os.environ.setdefault('CURRENT_SEASON', '2025')
+os.environ.setdefault('AWS_DEFAULT_REGION', 'us-east-1')
+os.environ['WARMUP_ON_INIT'] = 'false'
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'lambda' / 'api'))
+import handler  # noqa: E402
+
+STATS = ['TOTAL_TACKLES', 'SACKS', 'INTERCEPTIONS', 'PASSES_DEFENDED', 'FORCED_FUMBLES']
+
+
+def browser_mix(page_views: int) -> list:
+    """
+    Build the requests a cross-origin dashboard generates
+
+    Each page view fetches /current, the season summary, a few stat
+    histories and an analytics report with Content-Type: application/json,
+    so every distinct URL is preceded by an OPTIONS preflight (browsers
+    cache those for seconds at most without Access-Control-Max-Age).
+    Uptime checks add HEAD requests.
+
+    Args:
+        page_views: Dashboard loads to simulate
+
+    Returns:
+        list: (method, path) requests in arrival order
+    """
+    rng = random.Random(7)
+    requests = []
+
+    for view in range(page_views):
+        paths = ['/current', '/season/summary'] + [f"/stat/{stat}" for stat in rng.sample(STATS, 3)]
+        paths.append(f"/analytics/{rng.choice(STATS)}")
+        if rng.random() < 0.3:
+            paths.append(f"/week/{rng.randint(1, 18)}")
+        for path in paths:
+            requests.append(('OPTIONS', path))
+            requests.append(('GET', path))
+        if view % 10 == 0:
+            requests += [('HEAD', '/health'), ('HEAD', '/current')]
+
+    return requests
+
+
+def legacy_route(path: str) -> str:
+    """The previous routing chain, reduced to returning the route name"""
+    if path == '/current' or path == '/':
+        return 'current'
+    elif path.startswith('/week/'):
+        week_str = path.split('/')[-1]
+        try:
+            int(week_str)
+            return 'week'
+        except ValueError:
+            return 'bad_week'
+    elif path == '/season':
+        return 'season'
+    elif path == '/season/summary':
+        return 'summary'
+    elif path.startswith('/stat/'):
+        path.split('/')[-1].upper()
+        return 'stat'
+    elif path.startswith('/analytics/'):
+        path.split('/')[-1].upper()
+        return 'analytics'
+    elif path == '/changes':
+        return 'changes'
+    elif path == '/batch':
+        return 'batch'
+    elif path == '/health':
+        return 'health'
+    return 'not_found'
+
+
+def time_routing(route, paths: list, repeat: int = 5) -> float:
+    """Return the best per-request routing time in microseconds"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for path in paths:
+            route(path)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best / len(paths) * 1e6
+
+
+def count_data_access(requests: list) -> dict:
+    """
+    Run requests through lambda_handler with the data layer replaced by counters
+
+    Response caching is disabled so each routed request does its data access.
+
+    Args:
+        requests: (method, path) requests
+
+    Returns:
+        dict: data-access calls
+    """
+    counts = {'queries': 0}
+    empty_cube = handler.analytics.build_cube([])
+
+    def query(func, *args):
+        counts['queries'] += 1
+        return []
+
+    def analytics_data():
+        counts['queries'] += 1
+        return empty_cube, handler.analytics.compute_metrics(empty_cube)
+
+    original = handler.shared_query, handler.load_analytics, handler.RESPONSE_CACHE_SECONDS
+    handler.shared_query, handler.load_analytics, handler.RESPONSE_CACHE_SECONDS = query, analytics_data, 0
+    try:
+        for method, path in requests:
+            handler.lambda_handler({'requestContext': {'http': {'method': method}}, 'rawPath': path}, None)
+    finally:
+        handler.shared_query, handler.load_analytics, handler.RESPONSE_CACHE_SECONDS = original
+
+    return counts
+
+
+def main(page_views: int):
+    logging.getLogger().setLevel(logging.WARNING)
+    requests = browser_mix(page_views)
+    paths = [path for _, path in requests]
+    by_method = {}
+    for method, _ in requests:
+        by_method[method] = by_method.get(method, 0) + 1
+
+    print("=" * 70)
+    print(f"Router benchmark: {page_views} page views, {len(requests):,} requests "
+          f"({', '.join(f'{n} {m}' for m, n in sorted(by_method.items()))})")
+    print("=" * 70)
+
+    mismatches = [path for path in set(paths) if handler.match_route(path) is None]
+    legacy_us = time_routing(legacy_route, paths)
+    table_us = time_routing(handler.match_route, paths)
+    print(f"  Path matching, if/elif chain:    {legacy_us:6.2f} us/request")
+    print(f"  Path matching, route table:      {table_us:6.2f} us/request")
+    print(f"  Unrouted paths: {len(mismatches)}")
+
+    # The old chain ignored the method, so OPTIONS/HEAD did a GET's work
+    legacy = count_data_access([('GET', path) for _, path in requests])
+    routed = count_data_access(requests)
+    avoided = legacy['queries'] - routed['queries']
+    print(f"\n  Data accesses, method-blind:     {legacy['queries']:6,}")
+    print(f"  Data accesses, route table:      {routed['queries']:6,}")
+    print(f"  Avoided: {avoided:,} ({avoided / max(legacy['queries'], 1):.0%})")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Benchmark API routing')
+    parser.add_argument('--page-views', type=int, default=200, help='Dashboard loads to simulate')
+
+    args = parser.parse_args()
+    main(args.page_views)
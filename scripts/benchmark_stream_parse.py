@@ -0,0 +1,155 @@
+"""
+Benchmark streaming category extraction against whole-document JSON parsing
+Generates a large ESPN-shaped leaders document and measures parse time and
+peak memory for response.json()-style parsing vs lambda/ingest/json_stream.py
+
+Each mode runs in a fresh subprocess so ru_maxrss is its own high-water mark.
+
+Usage: python scripts/benchmark_stream_parse.py [--categories 60] [--leaders 400]
+"""
+import json
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+INGEST_DIR = Path(__file__).resolve().parent.parent / 'lambda' / 'ingest'
+TRACKED = ['totalTackles', 'sacks']
+
+
+def make_document(path: Path, num_categories: int, num_leaders: int):
+    """
+    Write a synthetic season leaders document with inlined athletes
+
+    The tracked categories sit in the middle so the streaming parser has
+    to skip untracked ones on both sides.
+
+    Args:
+        path: Output file
+        num_categories: Total categories
+        num_leaders: Leaders per category
+    """
+    rng = random.Random(3)
+    names = [f"category{i}" for i in range(num_categories)]
+    names[num_categories // 3] = TRACKED[0]
+    names[num_categories // 2] = TRACKED[1]
+
+    document = {
+        '$ref': 'http://sports.core.api.espn.com/v2/sports/football/leagues/nfl/seasons/2025/types/2/leaders',
+        'id': '0',
+        'name': 'Season Leaders',
+        'categories': [
+            {
+                'name': name,
+                'displayName': name.title(),
+                'shortDisplayName': name[:4],
+                'abbreviation': name[:3].upper(),
+                'leaders': [
+                    {
+                        'displayValue': str(value),
+                        'value': value,
+                        'rel': ['athlete'],
+                        'athlete': {
+                            '$ref': f"http://sports.core.api.espn.com/v2/sports/football/leagues/nfl/seasons/2025/athletes/{aid}",
+                            'id': str(aid),
+                            'displayName': f"Player {aid}",
+                            'headshot': {'href': f"https://a.espncdn.com/i/headshots/nfl/players/full/{aid}.png"},
+                            'position': {'abbreviation': 'LB', 'displayName': 'Linebacker'}
+                        },
+                        'team': {'$ref': f"http://sports.core.api.espn.com/v2/sports/football/leagues/nfl/seasons/2025/teams/{aid % 32}"},
+                        'statistics': {'$ref': f"http://sports.core.api.espn.com/v2/sports/football/leagues/nfl/seasons/2025/types/2/athletes/{aid}/statistics"}
+                    }
+                    for value, aid in sorted(
+                        ((round(rng.uniform(0, 150), 1), rng.randrange(5000)) for _ in range(num_leaders)),
+                        reverse=True
+                    )
+                ]
+            }
+            for name in names
+        ]
+    }
+
+    with open(path, 'w') as f:
+        json.dump(document, f)
+
+
+def run_mode(mode: str, path: str):
+    """Parse the document once in this process and print stats as JSON"""
+    sys.path.insert(0, str(INGEST_DIR))
+    import json_stream
+
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    with open(path, 'rb') as f:
+        if mode == 'whole':
+            document = json.load(f)
+            kept = [c for c in document['categories'] if c['name'] in TRACKED]
+            del document
+        else:
+            kept = json_stream.extract_categories(f, TRACKED, max_entries=1)[0]['categories']
+
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    print(json.dumps({
+        'seconds': elapsed,
+        'peak_python_mb': peak / 2**20,
+        'max_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        'leaders': [c['leaders'][0]['athlete']['id'] for c in kept]
+    }))
+
+
+def main(num_categories: int, num_leaders: int):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'leaders.json'
+        make_document(path, num_categories, num_leaders)
+        size_mb = path.stat().st_size / 2**20
+
+        print("=" * 70)
+        print(f"Stream parse benchmark: {num_categories} categories x {num_leaders} leaders "
+              f"({size_mb:.1f} MiB document)")
+        print("=" * 70)
+
+        # Interpreter + imports baseline, so the deltas below are the parse itself
+        baseline = json.loads(subprocess.check_output(
+            [sys.executable, '-c',
+             'import resource, json, sys; sys.path.insert(0, sys.argv[1]); import json_stream; '
+             'print(json.dumps(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024))',
+             str(INGEST_DIR)]
+        ))
+
+        results = {}
+        for mode in ('whole', 'stream'):
+            results[mode] = json.loads(subprocess.check_output(
+                [sys.executable, __file__, '--run', mode, str(path)]
+            ))
+
+        print(f"{'mode':<26}{'parse ms':>10}{'python peak MiB':>17}{'RSS over base MiB':>19}")
+        for mode, label in (('whole', 'json.load + filter'), ('stream', 'json_stream (2 categories)')):
+            r = results[mode]
+            print(f"{label:<26}{r['seconds'] * 1000:>10.1f}{r['peak_python_mb']:>17.1f}"
+                  f"{r['max_rss_mb'] - baseline:>19.1f}")
+
+        same = results['whole']['leaders'] == results['stream']['leaders']
+        print(f"\nSame leaders extracted: {'yes' if same else 'NO'}")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Benchmark streaming ESPN JSON extraction')
+    parser.add_argument('--categories', type=int, default=60, help='Categories in the document')
+    parser.add_argument('--leaders', type=int, default=400, help='Leaders per category')
+    parser.add_argument('--run', nargs=2, metavar=('MODE', 'PATH'), help=argparse.SUPPRESS)
+
+    args = parser.parse_args()
+    if args.run:
+        run_mode(*args.run)
+    else:
+        main(args.categories, args.leaders)
@@ -0,0 +1,204 @@
+"""
+Benchmark ESPN fetches against a fake server that throttles
+Compares naive fixed-delay retries with the adaptive limiter/circuit breaker
+used by the ingest Lambda (lambda/ingest/throttling.py)
+
+The fake server allows RATE requests/second (token bucket), answers 429 with
+Retry-After beyond that, slows down as concurrent requests pile up, and bans
+clients that keep hammering while throttled (every request gets 429 for
+BAN_SECONDS).
+
+Usage: python scripts/benchmark_throttling.py [--requests 600] [--threads 16] [--rate 60]
+"""
+import json
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import requests
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'lambda' / 'ingest'))
+from throttling import AdaptiveLimiter, CircuitBreaker, ThrottledClient  # noqa: E402
+
+
+class FakeEspn:
+    """Rate-limited, load-sensitive stand-in for the ESPN Core API"""
+
+    BURST = 10
+    BASE_LATENCY = 0.010
+    LATENCY_PER_IN_FLIGHT = 0.004
+    ABUSE_THRESHOLD = 20      # rejected requests per second before a ban
+    BAN_SECONDS = 2.0
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.tokens = float(self.BURST)
+        self.refilled_at = time.monotonic()
+        self.banned_until = 0.0
+        self.recent_rejections = []
+        self.in_flight = 0
+        self.counts = {'requests': 0, 'ok': 0, 'throttled': 0, 'bans': 0}
+        self.lock = threading.Lock()
+
+    def admit(self):
+        """Return (status, retry_after) for an incoming request"""
+        with self.lock:
+            now = time.monotonic()
+            self.counts['requests'] += 1
+            self.tokens = min(self.BURST, self.tokens + (now - self.refilled_at) * self.rate)
+            self.refilled_at = now
+
+            if now < self.banned_until:
+                self.counts['throttled'] += 1
+                return 429, self.banned_until - now
+
+            if self.tokens >= 1:
+                self.tokens -= 1
+                self.in_flight += 1
+                self.counts['ok'] += 1
+                return 200, None
+
+            self.counts['throttled'] += 1
+            self.recent_rejections = [t for t in self.recent_rejections if now - t < 1.0] + [now]
+            if len(self.recent_rejections) > self.ABUSE_THRESHOLD:
+                self.banned_until = now + self.BAN_SECONDS
+                self.recent_rejections = []
+                self.counts['bans'] += 1
+                return 429, self.BAN_SECONDS
+            return 429, 1.0 / self.rate
+
+    def latency(self) -> float:
+        with self.lock:
+            return self.BASE_LATENCY + self.LATENCY_PER_IN_FLIGHT * self.in_flight
+
+    def done(self):
+        with self.lock:
+            self.in_flight -= 1
+
+
+def start_server(fake: FakeEspn) -> ThreadingHTTPServer:
+    """Serve the fake API on an ephemeral localhost port"""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET(self):
+            status, retry_after = fake.admit()
+            if status == 200:
+                time.sleep(fake.latency())
+                fake.done()
+                body = json.dumps({'id': self.path.rsplit('/', 1)[-1], 'displayName': 'Player'}).encode()
+            else:
+                body = b'{"error": "Too Many Requests"}'
+
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            if retry_after is not None:
+                self.send_header('Retry-After', f"{retry_after:.2f}")
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def naive_fetch(session: requests.Session, url: str, retries: int = 10, delay: float = 0.05) -> bool:
+    """Fixed-delay retries that ignore Retry-After (the old behaviour plus a retry loop)"""
+    for _ in range(retries + 1):
+        try:
+            response = session.get(url, timeout=10)
+            if response.status_code == 200:
+                return True
+        except requests.exceptions.RequestException:
+            pass
+        time.sleep(delay)
+    return False
+
+
+def adaptive_fetch(client: ThrottledClient, url: str) -> bool:
+    """Fetch through the limiter/breaker; open-circuit calls fail fast"""
+    try:
+        return client.get(url, timeout=10, budget=30).status_code == 200
+    except requests.exceptions.RequestException:
+        return False
+
+
+def run(name: str, fetch, num_requests: int, threads: int, rate: float) -> dict:
+    """Run one scenario against a fresh fake server"""
+    fake = FakeEspn(rate)
+    server = start_server(fake)
+    base = f"http://127.0.0.1:{server.server_address[1]}/athletes"
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        results = list(executor.map(lambda i: fetch(f"{base}/{i}"), range(num_requests)))
+    elapsed = time.perf_counter() - start
+
+    server.shutdown()
+    server.server_close()
+
+    succeeded = sum(results)
+    return {
+        'name': name,
+        'seconds': elapsed,
+        'succeeded': succeeded,
+        'failed': num_requests - succeeded,
+        'goodput': succeeded / elapsed,
+        'sent': fake.counts['requests'],
+        'throttled': fake.counts['throttled'],
+        'bans': fake.counts['bans']
+    }
+
+
+def main(num_requests: int, threads: int, rate: float):
+    print("=" * 86)
+    print(f"Throttling benchmark: {num_requests} fetches, {threads} threads, server allows {rate:g} req/s")
+    print("=" * 86)
+
+    thread_sessions = threading.local()
+
+    def naive(url):
+        if not hasattr(thread_sessions, 'session'):
+            thread_sessions.session = requests.Session()
+        return naive_fetch(thread_sessions.session, url)
+
+    client = ThrottledClient(
+        limiter=AdaptiveLimiter(max_limit=threads),
+        breaker=CircuitBreaker(failure_threshold=threads * 2, reset_seconds=2.0),
+        max_retries=5
+    )
+
+    results = [
+        run('naive retries', naive, num_requests, threads, rate),
+        run('adaptive + breaker', lambda url: adaptive_fetch(client, url), num_requests, threads, rate)
+    ]
+
+    print(f"{'client':<20}{'wall s':>8}{'ok':>7}{'failed':>8}{'goodput/s':>11}{'sent':>8}{'429s':>8}{'bans':>6}")
+    for r in results:
+        print(f"{r['name']:<20}{r['seconds']:>8.1f}{r['succeeded']:>7}{r['failed']:>8}{r['goodput']:>11.1f}"
+              f"{r['sent']:>8}{r['throttled']:>8}{r['bans']:>6}")
+
+    print()
+    print(f"Adaptive limit settled at {client.limiter.limit:.1f} concurrent requests; "
+          f"breaker {client.breaker.state}")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Benchmark ESPN throttling behaviour')
+    parser.add_argument('--requests', type=int, default=600, help='Fetches to perform')
+    parser.add_argument('--threads', type=int, default=16, help='Concurrent callers')
+    parser.add_argument('--rate', type=float, default=60, help='Requests/second the fake server allows')
+
+    args = parser.parse_args()
+    main(args.requests, args.threads, args.rate)
@@ -0,0 +1,75 @@
+"""
+Rebuild the player search index from every DIM#PLAYER item
+Ingest keeps the index up to date as new players are stored; run this once on
+tables whose players were stored before the index existed (or after
+scripts/normalize_dimensions.py), then --query to try it
+
+Usage: python scripts/build_search_index.py [--table nfl_weekly_leaders] [--dry-run] [--query watt]
+"""
+import bisect
+import gzip
+import json
+import sys
+import time
+from pathlib import Path
+
+import boto3
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'lambda' / 'ingest'))
+from dimensions import load_dimensions  # noqa: E402
+from names import normalize_name  # noqa: E402
+from search_index import build_index, load_index, rebuild_search_index  # noqa: E402
+
+TABLE_NAME = 'nfl_weekly_leaders'
+
+# DynamoDB's item size limit
+MAX_ITEM_BYTES = 400 * 1024
+
+
+def lookup(index: dict, query: str, limit: int = 10) -> list:
+    """Prefix lookup (as the API's search.search_players does)"""
+    prefix = normalize_name(query)
+    results, position = [], bisect.bisect_left(index['keys'], prefix)
+    while position < len(index['keys']) and len(results) < limit and index['keys'][position].startswith(prefix):
+        if index['ids'][position] not in results:
+            results.append(index['ids'][position])
+        position += 1
+    return results
+
+
+def main(table_name: str, dry_run: bool, query: str):
+    table = boto3.resource('dynamodb').Table(table_name)
+
+    if dry_run:
+        players = {
+            entity_id: (values.get('player_name'), values.get('player_short_name'))
+            for (kind, entity_id), values in load_dimensions(table).items()
+            if kind == 'PLAYER' and values.get('player_name')
+        }
+        index = build_index(players)
+        size = len(gzip.compress(json.dumps(index, separators=(',', ':')).encode()))
+        print(f"{len(players)} players, {len(index['keys'])} keys, {size:,} bytes compressed "
+              f"({size / MAX_ITEM_BYTES:.0%} of the item limit)")
+    else:
+        print(f"Stored search index: {rebuild_search_index(table)}")
+        index = load_index(table)[0]
+
+    if query:
+        start = time.perf_counter()
+        ids = lookup(index, query)
+        elapsed = time.perf_counter() - start
+        print(f"'{query}' -> {len(ids)} players in {elapsed * 1e6:.1f} us")
+        for player_id in ids:
+            print(f"  {player_id}  {index['players'][player_id][0]}")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Rebuild the player search prefix index')
+    parser.add_argument('--table', default=TABLE_NAME, help='DynamoDB table name')
+    parser.add_argument('--dry-run', action='store_true', help='Only build and size the index')
+    parser.add_argument('--query', help='Search the index for this prefix afterwards')
+
+    args = parser.parse_args()
+    main(args.table, args.dry_run, args.query)
@@ -0,0 +1,572 @@
+"""
+Local fake of the ESPN Core API for offline ingest runs and benchmarks
+Serves synthetic season/weekly leaders, athlete and team documents, the
+week's games with their rosters and per-player game statistics, and the site
+API's season statistics (the hedging alternate) with configurable size,
+latency and tail latency, and counts the requests it answers
+
+Point the ingest Lambda at it with ESPN_API_BASE_URL=<printed base URL> and
+ESPN_SITE_API_BASE_URL=<printed site URL>.
+POST /_control/advance changes every leader value (a new stat revision),
+POST /_control/week?week=N moves the season-to-date document (and the games
+in progress) to week N and GET /_control/stats returns request counts.
+
+Usage: python scripts/fake_espn.py [--port 8765] [--latency-ms 50] [--tail-ms 2000 --tail-ratio 0.05]
+           [--categories 40] [--leaders 50]
+"""
+import json
+import random
+import sys
+import threading
+import time
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+API_PREFIX = '/v2/sports/football/leagues/nfl'
+SITE_API_PREFIX = '/apis/site/v2/sports/football/nfl'
+
+# Categories the ingest tracks; the rest are filler the parser has to skip
+TRACKED_CATEGORIES = ['totalTackles', 'sacks']
+
+NUM_TEAMS = 32
+GAMES_PER_WEEK = NUM_TEAMS // 2
+FIRST_ATHLETE_ID = 3000000
+DOCUMENT_CACHE_SIZE = 64
+
+
+class QuietServer(ThreadingHTTPServer):
+    """Threaded server that ignores clients hanging up mid-response"""
+
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        if not isinstance(sys.exc_info()[1], (BrokenPipeError, ConnectionResetError)):
+            super().handle_error(request, client_address)
+
+
+class FakeEspn:
+    """Synthetic ESPN data plus the HTTP server that serves it"""
+
+    def __init__(self, categories: int = 40, leaders: int = 50, athletes: int = 1500,
+                 reference_padding: int = 2048, latency_ms: float = 0.0, jitter_ms: float = 0.0,
+                 week: int = 1, seed: int = 11, tail_ms: float = 0.0, tail_ratio: float = 0.0):
+        self.num_categories = max(categories, len(TRACKED_CATEGORIES))
+        self.num_leaders = leaders
+        self.num_athletes = athletes
+        self.reference_padding = reference_padding
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.tail_ms = tail_ms          # extra latency of a tail_ratio fraction of responses
+        self.tail_ratio = tail_ratio
+        self.week = week
+        self.revision = 0
+        self.seed = seed
+
+        # Tracked categories sit among the filler, not at the front
+        self.categories = [f"category{i}" for i in range(self.num_categories)]
+        for i, name in enumerate(TRACKED_CATEGORIES):
+            self.categories[(i + 1) * self.num_categories // (len(TRACKED_CATEGORIES) + 1)] = name
+
+        self.requests: Dict[str, int] = {}
+        self.bytes_sent = 0
+        self._lock = threading.Lock()
+        self._documents: 'OrderedDict[Tuple, Tuple[bytes, str]]' = OrderedDict()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self.base_url: Optional[str] = None
+        self.site_base_url: Optional[str] = None
+
+    def start(self, host: str = '127.0.0.1', port: int = 0) -> str:
+        """
+        Serve on a background thread
+
+        Args:
+            host: Interface to bind
+            port: Port (0 picks a free one)
+
+        Returns:
+            str: Base URL to use as ESPN_API_BASE_URL
+        """
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                fake._handle(self, 'GET')
+
+            def do_POST(self):
+                fake._handle(self, 'POST')
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = QuietServer((host, port), Handler)
+        threading.Thread(target=self._server.serve_forever, name='fake-espn', daemon=True).start()
+        self.base_url = f"http://{host}:{self._server.server_address[1]}{API_PREFIX}"
+        self.site_base_url = f"http://{host}:{self._server.server_address[1]}{SITE_API_PREFIX}"
+        return self.base_url
+
+    def stop(self):
+        """Shut the server down"""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Request counts by document kind since the last reset"""
+        with self._lock:
+            return {
+                'requests': sum(self.requests.values()),
+                'by_kind': dict(self.requests),
+                'bytes_sent': self.bytes_sent
+            }
+
+    def reset_stats(self):
+        """Zero the request counters"""
+        with self._lock:
+            self.requests.clear()
+            self.bytes_sent = 0
+
+    def advance(self) -> int:
+        """Publish a new stat revision (every leader value changes)"""
+        with self._lock:
+            self.revision += 1
+            return self.revision
+
+    def document(self, path: str) -> Tuple[int, Optional[Dict[str, Any]], str]:
+        """
+        Build the document for an API path
+
+        Args:
+            path: Path below API_PREFIX (e.g. /seasons/2025/athletes/3000001)
+
+        Returns:
+            tuple: (status, document or None, kind)
+        """
+        parts = path.strip('/').split('/')
+        if len(parts) >= 2 and parts[0] == 'events':
+            return self.event_path_document(parts[1:])
+        if len(parts) < 2 or parts[0] != 'seasons' or not parts[1].isdigit():
+            return 404, None, 'unknown'
+
+        season, rest = parts[1], parts[2:]
+        if len(rest) == 5 and rest[:3] == ['types', '2', 'weeks'] and rest[3].isdigit() and rest[4] == 'events':
+            return 200, self.week_events_document(season, int(rest[3])), 'week_events'
+        if rest == ['types', '2', 'leaders']:
+            return 200, self.leaders_document(season, None), 'season_leaders'
+        if len(rest) == 5 and rest[:3] == ['types', '2', 'weeks'] and rest[3].isdigit() and rest[4] == 'leaders':
+            return 200, self.leaders_document(season, int(rest[3])), 'weekly_leaders'
+        if len(rest) == 2 and rest[0] == 'athletes' and rest[1].isdigit():
+            athlete_id = int(rest[1])
+            if FIRST_ATHLETE_ID <= athlete_id < FIRST_ATHLETE_ID + self.num_athletes:
+                return 200, self.athlete_document(season, athlete_id), 'athlete'
+        if len(rest) == 2 and rest[0] == 'teams' and rest[1].isdigit() and 1 <= int(rest[1]) <= NUM_TEAMS:
+            return 200, self.team_document(season, int(rest[1])), 'team'
+
+        return 404, None, 'unknown'
+
+    def event_path_document(self, parts: list) -> Tuple[int, Optional[Dict[str, Any]], str]:
+        """
+        Documents below /events/<id>: the event, a competitor's roster and a
+        rostered player's game statistics
+
+        Args:
+            parts: Path segments after 'events'
+
+        Returns:
+            tuple: (status, document or None, kind)
+        """
+        game = self._decode_event(parts[0])
+        if game is None:
+            return 404, None, 'unknown'
+        season, week, number = game
+        home, away = self._game_teams(week, number)
+
+        if len(parts) == 1:
+            return 200, self.event_document(season, week, number), 'event'
+        if len(parts) < 6 or parts[1:3] != ['competitions', parts[0]] or parts[3] != 'competitors' \
+                or not parts[4].isdigit() or int(parts[4]) not in (home, away) or parts[5] != 'roster':
+            return 404, None, 'unknown'
+        team_id = int(parts[4])
+
+        if len(parts) == 6:
+            return 200, self.roster_document(season, week, number, team_id), 'roster'
+        if len(parts) == 9 and parts[6].isdigit() and parts[7:] == ['statistics', '0']:
+            athlete_id = int(parts[6])
+            if self._team_of(athlete_id) == team_id and athlete_id - FIRST_ATHLETE_ID in range(self.num_athletes):
+                return 200, self.player_game_statistics(season, week, number, athlete_id), 'player_game_stats'
+        return 404, None, 'unknown'
+
+    def week_events_document(self, season: str, week: int) -> Dict[str, Any]:
+        """The week's games as $refs (every team plays every week)"""
+        return {
+            'count': GAMES_PER_WEEK,
+            'pageIndex': 1,
+            'pageSize': 100,
+            'pageCount': 1,
+            'items': [
+                {'$ref': self._ref(f"events/{self._event_id(season, week, number)}")}
+                for number in range(GAMES_PER_WEEK)
+            ]
+        }
+
+    def event_document(self, season: str, week: int, number: int) -> Dict[str, Any]:
+        """One game: competitors with roster $refs and an inline status"""
+        event_id = self._event_id(season, week, number)
+        state = self._game_state(season, week, number)
+        return {
+            '$ref': self._ref(f"events/{event_id}"),
+            'id': event_id,
+            'name': f"Game {number} of week {week}",
+            'week': {'number': week},
+            'competitions': [{
+                'id': event_id,
+                'status': {'type': {'state': state, 'completed': state == 'post'}},
+                'competitors': [
+                    {
+                        'id': str(team_id),
+                        'homeAway': side,
+                        'team': {'$ref': self._ref(f"seasons/{season}/teams/{team_id}")},
+                        'roster': {'$ref': self._ref(
+                            f"events/{event_id}/competitions/{event_id}/competitors/{team_id}/roster"
+                        )}
+                    }
+                    for side, team_id in zip(('home', 'away'), self._game_teams(week, number))
+                ]
+            }]
+        }
+
+    def roster_document(self, season: str, week: int, number: int, team_id: int) -> Dict[str, Any]:
+        """A competitor's game roster; about one player in ten did not play"""
+        event_id = self._event_id(season, week, number)
+        played = self._game_state(season, week, number) != 'pre'
+        entries = []
+        for athlete_id in range(FIRST_ATHLETE_ID, FIRST_ATHLETE_ID + self.num_athletes):
+            if self._team_of(athlete_id) != team_id:
+                continue
+            did_not_play = not played or random.Random(f"{self.seed}:{event_id}:{athlete_id}:dnp").random() < 0.1
+            entries.append({
+                'playerId': athlete_id,
+                'didNotPlay': did_not_play,
+                'athlete': {'$ref': self._ref(f"seasons/{season}/athletes/{athlete_id}")},
+                'statistics': {'$ref': self._ref(
+                    f"events/{event_id}/competitions/{event_id}/competitors/{team_id}/roster/{athlete_id}/statistics/0"
+                )}
+            })
+        return {'competitor': {'id': str(team_id)}, 'entries': entries}
+
+    def player_game_statistics(self, season: str, week: int, number: int, athlete_id: int) -> Dict[str, Any]:
+        """
+        A player's line for one game (defenders have defensive stats,
+        everyone else zeros); lines of games in progress move with each
+        revision
+
+        Returns:
+            dict: ESPN-shaped splits.categories[].stats[] document (padded)
+        """
+        event_id = self._event_id(season, week, number)
+        state = self._game_state(season, week, number)
+        revision = self.revision if state == 'in' else 0
+        rng = random.Random(f"{self.seed}:{event_id}:{athlete_id}:{revision}")
+        defender = athlete_id // NUM_TEAMS % 2 == 0  # half of every roster
+
+        def stat(name, high, scale=1.0):
+            value = round(rng.randint(0, high) * scale, 1) if defender else 0.0
+            return {'name': name, 'displayName': name, 'value': value, 'displayValue': f"{value:g}"}
+
+        tackles = stat('totalTackles', 12)
+        return {
+            '$ref': self._ref(f"events/{event_id}/competitions/{event_id}/competitors/"
+                              f"{self._team_of(athlete_id)}/roster/{athlete_id}/statistics/0"),
+            'splits': {
+                'id': '0',
+                'name': 'All Splits',
+                'categories': [
+                    {'name': 'general', 'stats': [stat('fumblesForced', 1), stat('gamesPlayed', 1)]},
+                    {'name': 'passing', 'stats': [stat('passingYards', 0)]},
+                    {'name': 'defensive', 'stats': [
+                        tackles, stat('soloTackles', int(tackles['value'])), stat('sacks', 4, 0.5),
+                        stat('tacklesForLoss', 3), stat('QBHits', 3), stat('passesDefended', 2)
+                    ]},
+                    {'name': 'defensiveInterceptions', 'stats': [stat('interceptions', 1)]}
+                ]
+            },
+            'notes': 'x' * self.reference_padding
+        }
+
+    def leaders_document(self, season: str, week: Optional[int]) -> Dict[str, Any]:
+        """
+        Leaders document: season-to-date through the current week, or one week
+
+        Each category has a fixed pool of athletes with their own rates, so
+        leaders persist for stretches and change now and then, like ESPN's.
+
+        Args:
+            season: NFL season
+            week: Single week, or None for season-to-date
+
+        Returns:
+            dict: ESPN-shaped leaders document with $ref athletes and teams
+        """
+        categories = []
+
+        for name in self.categories:
+            categories.append({
+                'name': name,
+                'displayName': name[0].upper() + name[1:],
+                'shortDisplayName': name[:4].upper(),
+                'abbreviation': name[:3].upper(),
+                'leaders': [
+                    {
+                        'displayValue': f"{value:g}",
+                        'value': value,
+                        'rel': ['athlete'],
+                        'athlete': {'$ref': self._ref(f"seasons/{season}/athletes/{athlete_id}")},
+                        'team': {'$ref': self._ref(f"seasons/{season}/teams/{self._team_of(athlete_id)}")},
+                        'statistics': {
+                            '$ref': self._ref(f"seasons/{season}/types/2/athletes/{athlete_id}/statistics")
+                        }
+                    }
+                    for value, athlete_id in self._entries(season, name, week)
+                ]
+            })
+
+        scope = 'Season Leaders' if week is None else f"Week {week} Leaders"
+        return {
+            '$ref': self._ref(f"seasons/{season}/types/2/leaders" if week is None
+                              else f"seasons/{season}/types/2/weeks/{week}/leaders"),
+            'id': '0',
+            'name': scope,
+            'abbreviation': 'Any',
+            'categories': categories
+        }
+
+    def site_document(self, path: str, query: Dict[str, list]) -> Tuple[int, Optional[Dict[str, Any]], str]:
+        """
+        Site API season statistics: the season-to-date leaders with athletes
+        and teams inline instead of $refs
+
+        Args:
+            path: Path below SITE_API_PREFIX (only /statistics is served)
+            query: Parsed query string (season=YYYY)
+
+        Returns:
+            tuple: (status, document or None, kind)
+        """
+        season = query.get('season', [''])[0]
+        if path.strip('/') != 'statistics' or not season.isdigit():
+            return 404, None, 'unknown'
+
+        categories = []
+        for name in self.categories:
+            categories.append({
+                'name': name,
+                'displayName': name[0].upper() + name[1:],
+                'shortDisplayName': name[:4].upper(),
+                'abbreviation': name[:3].upper(),
+                'leaders': [
+                    {
+                        'displayValue': f"{value:g}",
+                        'value': value,
+                        'athlete': self._site_athlete(athlete_id)
+                    }
+                    for value, athlete_id in self._entries(season, name, None)
+                ]
+            })
+
+        return 200, {'stats': {'id': '0', 'name': 'NFL Statistics', 'categories': categories}}, 'site_statistics'
+
+    def athlete_document(self, season: str, athlete_id: int) -> Dict[str, Any]:
+        """Athlete document (padded to reference_padding bytes of filler)"""
+        number = athlete_id - FIRST_ATHLETE_ID
+        return {
+            '$ref': self._ref(f"seasons/{season}/athletes/{athlete_id}"),
+            'id': str(athlete_id),
+            'firstName': 'Player',
+            'lastName': str(number),
+            'displayName': f"Player {number}",
+            'shortName': f"P. {number}",
+            'position': {'abbreviation': 'LB', 'displayName': 'Linebacker'},
+            'team': {'$ref': self._ref(f"seasons/{season}/teams/{self._team_of(athlete_id)}")},
+            'headshot': {'href': f"https://a.espncdn.com/i/headshots/nfl/players/full/{athlete_id}.png"},
+            'notes': 'x' * self.reference_padding
+        }
+
+    def team_document(self, season: str, team_id: int) -> Dict[str, Any]:
+        """Team document (padded to reference_padding bytes of filler)"""
+        return {
+            '$ref': self._ref(f"seasons/{season}/teams/{team_id}"),
+            'id': str(team_id),
+            'location': f"City {team_id}",
+            'name': f"Team {team_id}",
+            'displayName': f"City {team_id} Team {team_id}",
+            'abbreviation': f"T{team_id:02d}",
+            'notes': 'x' * self.reference_padding
+        }
+
+    def _handle(self, request: BaseHTTPRequestHandler, method: str):
+        """Serve one request"""
+        url = urlsplit(request.path)
+
+        if url.path.startswith('/_control/'):
+            return self._control(request, method, url.path[len('/_control/'):], parse_qs(url.query))
+
+        if method != 'GET' or not url.path.startswith((API_PREFIX, SITE_API_PREFIX)):
+            return self._send(request, 404, b'{"error": "not found"}')
+
+        site = url.path.startswith(SITE_API_PREFIX)
+        path = url.path[len(SITE_API_PREFIX if site else API_PREFIX):]
+        key = (site, path, url.query if site else '', self.week, self.revision)
+        with self._lock:
+            cached = self._documents.get(key)
+            if cached is not None:
+                self._documents.move_to_end(key)
+
+        if cached is not None:
+            status, (body, kind) = 200, cached
+        else:
+            status, document, kind = self.site_document(path, parse_qs(url.query)) if site else self.document(path)
+            body = json.dumps(document if document is not None else {'error': 'not found'}).encode()
+            if status == 200:
+                with self._lock:
+                    self._documents[key] = (body, kind)
+                    if len(self._documents) > DOCUMENT_CACHE_SIZE:
+                        self._documents.popitem(last=False)
+
+        delay = self.latency_ms + (random.uniform(0, self.jitter_ms) if self.jitter_ms else 0)
+        if self.tail_ratio and random.random() < self.tail_ratio:
+            delay += self.tail_ms
+        if delay > 0:
+            time.sleep(delay / 1000)
+
+        with self._lock:
+            self.requests[kind] = self.requests.get(kind, 0) + 1
+            self.bytes_sent += len(body)
+        self._send(request, status, body)
+
+    def _control(self, request: BaseHTTPRequestHandler, method: str, action: str, query: Dict[str, list]):
+        """Serve a /_control/ request"""
+        if action == 'stats':
+            result = self.stats()
+        elif action == 'advance' and method == 'POST':
+            result = {'revision': self.advance()}
+        elif action == 'week' and method == 'POST' and query.get('week', [''])[0].isdigit():
+            self.week = int(query['week'][0])
+            result = {'week': self.week}
+        elif action == 'reset' and method == 'POST':
+            self.reset_stats()
+            result = self.stats()
+        else:
+            return self._send(request, 404, b'{"error": "unknown control action"}')
+
+        self._send(request, 200, json.dumps(result).encode())
+
+    def _send(self, request: BaseHTTPRequestHandler, status: int, body: bytes):
+        """Write a JSON response"""
+        request.send_response(status)
+        request.send_header('Content-Type', 'application/json')
+        request.send_header('Content-Length', str(len(body)))
+        request.end_headers()
+        try:
+            request.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            # The streaming parser stops reading once it has what it needs
+            request.close_connection = True
+
+    def _entries(self, season: str, name: str, week: Optional[int]) -> list:
+        """(value, athlete_id) leader entries of a category, best first"""
+        through = self.week if week is None else week
+        pool = random.Random(f"{self.seed}:{season}:{name}")
+        rates = [
+            (FIRST_ATHLETE_ID + pool.randrange(self.num_athletes), pool.uniform(0.2, 9.0))
+            for _ in range(self.num_leaders)
+        ]
+        noise = random.Random(f"{self.seed}:{season}:{name}:{through}:{week is None}:{self.revision}")
+
+        entries = []
+        for athlete_id, rate in rates:
+            weeks = through if week is None else 1
+            value = round(max(0.0, rate * weeks + noise.gauss(0, rate) + self.revision * 0.5), 1)
+            entries.append((value, athlete_id))
+        entries.sort(reverse=True)
+        return entries
+
+    def _site_athlete(self, athlete_id: int) -> Dict[str, Any]:
+        """Inline athlete (with team) as the site API embeds it"""
+        number = athlete_id - FIRST_ATHLETE_ID
+        team_id = self._team_of(athlete_id)
+        return {
+            'id': str(athlete_id),
+            'displayName': f"Player {number}",
+            'shortName': f"P. {number}",
+            'position': {'abbreviation': 'LB'},
+            'team': {
+                'id': str(team_id),
+                'displayName': f"City {team_id} Team {team_id}",
+                'abbreviation': f"T{team_id:02d}"
+            }
+        }
+
+    def _ref(self, path: str) -> str:
+        """Absolute $ref URL on this server"""
+        return f"{self.base_url}/{path}?lang=en&region=us"
+
+    def _event_id(self, season: str, week: int, number: int) -> str:
+        """Event ID encoding season, week and game number"""
+        return f"4{season}{week:02d}{number:02d}"
+
+    def _decode_event(self, event_id: str) -> Optional[Tuple[str, int, int]]:
+        """(season, week, game number) of an event ID, or None"""
+        if len(event_id) != 9 or not event_id.isdigit() or event_id[0] != '4':
+            return None
+        season, week, number = event_id[1:5], int(event_id[5:7]), int(event_id[7:9])
+        return (season, week, number) if 1 <= week <= 18 and number < GAMES_PER_WEEK else None
+
+    def _game_teams(self, week: int, number: int) -> Tuple[int, int]:
+        """(home, away) team IDs of a game; pairings rotate weekly"""
+        order = [(team + week) % NUM_TEAMS + 1 for team in range(NUM_TEAMS)]
+        return order[2 * number], order[2 * number + 1]
+
+    def _game_state(self, season: str, week: int, number: int) -> str:
+        """pre/in/post: weeks before the current one are final; in the
+        current week the first half of the games are final, the next
+        quarter in progress and the rest not started"""
+        if week != self.week:
+            return 'post' if week < self.week else 'pre'
+        if number < GAMES_PER_WEEK // 2:
+            return 'post'
+        return 'in' if number < GAMES_PER_WEEK * 3 // 4 else 'pre'
+
+    def _team_of(self, athlete_id: int) -> int:
+        """Team an athlete plays for"""
+        return athlete_id % NUM_TEAMS + 1
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Serve a fake ESPN Core API')
+    parser.add_argument('--host', default='127.0.0.1', help='Interface to bind')
+    parser.add_argument('--port', type=int, default=8765, help='Port to listen on')
+    parser.add_argument('--latency-ms', type=float, default=0.0, help='Added latency per response')
+    parser.add_argument('--jitter-ms', type=float, default=0.0, help='Extra random latency per response')
+    parser.add_argument('--tail-ms', type=float, default=0.0, help='Extra latency of tail responses')
+    parser.add_argument('--tail-ratio', type=float, default=0.0, help='Fraction of responses that get --tail-ms')
+    parser.add_argument('--categories', type=int, default=40, help='Categories per leaders document')
+    parser.add_argument('--leaders', type=int, default=50, help='Leaders per category')
+    parser.add_argument('--athletes', type=int, default=1500, help='Distinct athletes')
+    parser.add_argument('--reference-padding', type=int, default=2048,
+                        help='Filler bytes in each athlete/team document')
+    parser.add_argument('--week', type=int, default=1, help='Week the season-to-date leaders run through')
+
+    args = parser.parse_args()
+    fake = FakeEspn(args.categories, args.leaders, args.athletes, args.reference_padding,
+                    args.latency_ms, args.jitter_ms, args.week, tail_ms=args.tail_ms, tail_ratio=args.tail_ratio)
+    print(f"Fake ESPN Core API at {fake.start(args.host, args.port)}, site API at {fake.site_base_url} (Ctrl-C to stop)")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        fake.stop()
@@ -0,0 +1,408 @@
+"""
+Load-test the API Lambda per route as the table grows
+Seeds an in-memory DynamoDB table (scripts/local_dynamodb.py) with synthetic
+seasons through the ingest code, then drives lambda/api/handler.py with a
+weighted route mix from many threads and reports throughput and
+p50/p95/p99 latency per route for each data size
+
+--compare REV [REV] runs the same load against two git revisions (the
+second defaults to the working tree) and exits 1 when a route's p95 or the
+throughput regresses by more than --tolerance.
+
+Usage: python scripts/loadtest_api.py [--sizes 1x2 5x10 20x30] [--threads 8] [--requests 2000]
+           [--backend dynamodb|snapshot] [--compare HEAD~1 [HEAD]]
+"""
+import inspect
+import json
+import math
+import os
+import pickle
+import random
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from decimal import Decimal
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCRIPTS_DIR.parent
+WORKING_TREE = 'WORKTREE'
+
+CURRENT_SEASON = '2025'
+CURRENT_WEEK = 10
+WEEKS = 18
+TRACKED = ['TOTAL_TACKLES', 'SACKS']
+
+# Route template -> weight (a dashboard-heavy read mix)
+ROUTE_MIX = {
+    '/current': 30,
+    '/season/summary': 15,
+    '/stat/{stat}': 20,
+    '/week/{week}': 10,
+    '/season': 6,
+    '/season?team={team}': 4,
+    '/analytics/{stat}': 8,
+    '/changes?since={sequence}': 7,
+    '/search?q={name}': 5
+}
+
+# Regressions smaller than this are noise whatever the ratio
+MIN_LATENCY_DELTA_MS = 0.2
+
+
+def seed(tree: Path, seasons: int, stats: int, snapshot_path: str) -> dict:
+    """
+    Write synthetic history through the ingest code of a tree (the --seed child)
+
+    Leaders are sticky with occasional changes, so summaries, streaks and
+    the change log look like a real season's.
+
+    Args:
+        tree: Repository tree whose lambda/ingest writes the items
+        seasons: Seasons ending at CURRENT_SEASON (the current one runs
+            through CURRENT_WEEK)
+        stats: Stat types (the two tracked ones plus synthetic STAT_NN)
+        snapshot_path: Where to publish a SQLite snapshot ('' for none)
+
+    Returns:
+        dict: Table items keyed by (PK, SK)
+    """
+    sys.path.insert(0, str(tree / 'lambda' / 'ingest'))
+    import handler
+    from models import LeaderRecord
+    from season_summary import update_season_summary
+    from local_dynamodb import LocalTable
+
+    handler.table = LocalTable(os.environ['TABLE_NAME'])
+    stat_types = (TRACKED + [f"STAT_{k:02d}" for k in range(stats)])[:stats]
+    rng = random.Random(f"{seasons}x{stats}")
+
+    for season in range(int(CURRENT_SEASON) - seasons + 1, int(CURRENT_SEASON) + 1):
+        last_week = CURRENT_WEEK if str(season) == CURRENT_SEASON else WEEKS
+        for stat_type in stat_types:
+            candidates = [str(rng.randrange(3000000, 3001500)) for _ in range(6)]
+            leader, total = candidates[0], Decimal(0)
+            for week in range(1, last_week + 1):
+                if rng.random() < 0.3:
+                    leader = rng.choice(candidates)
+                total += Decimal(str(round(rng.uniform(2, 12), 1)))
+                team_id = str(int(leader) % 32 + 1)
+                record = LeaderRecord(
+                    str(season), week, stat_type, stat_type.replace('_', ' ').title(),
+                    leader, f"Player {leader}", f"P. {leader}",
+                    team_id, f"Team {team_id}", f"T{int(team_id):02d}",
+                    total, str(total)
+                )
+                handler.store_leader(record)
+                update_season_summary(handler.table, record)
+
+    if snapshot_path:
+        from snapshot import publish_snapshot
+        if 'stat_types' in inspect.signature(publish_snapshot).parameters:
+            publish_snapshot(handler.table, snapshot_path, stat_types)
+        else:
+            # Trees from before the snapshot read leaders through StatTypeIndex
+            publish_snapshot(handler.table, snapshot_path)
+
+    return handler.table.items
+
+
+def run_load(tree: Path, items_path: str, config: dict) -> dict:
+    """
+    Drive lambda_handler from many threads (the --load child)
+
+    Every route is requested once before timing, so caches are warm as in
+    a busy container.
+
+    Args:
+        tree: Repository tree whose lambda/api serves the requests
+        items_path: Pickled seed items
+        config: Load configuration (threads, requests, stats)
+
+    Returns:
+        dict: Throughput and per-route latency percentiles
+    """
+    sys.path.insert(0, str(tree / 'lambda' / 'api'))
+    import handler
+    import dynamodb_client
+    from local_dynamodb import LocalClient, LocalTable
+
+    table = LocalTable(os.environ['TABLE_NAME'])
+    with open(items_path, 'rb') as f:
+        table.load_items(pickle.load(f))
+    dynamodb_client.table = table
+    dynamodb_client.client = LocalClient(table)
+
+    stat_types = (TRACKED + [f"STAT_{k:02d}" for k in range(config['stats'])])[:config['stats']]
+    sequence = max((int(sk[len('SEQ#'):]) for pk, sk in table.items if pk == 'CHANGELOG'), default=0)
+    templates, weights = list(ROUTE_MIX), list(ROUTE_MIX.values())
+
+    def request(template: str, rng: random.Random):
+        path = template.format(
+            # /stat only serves the tracked stats; /analytics covers them all
+            stat=rng.choice(TRACKED if template.startswith('/stat/') else stat_types),
+            week=rng.randint(1, CURRENT_WEEK),
+            team=f"T{rng.randint(1, 32):02d}",
+            sequence=max(0, int(sequence) - rng.randint(1, 100)),
+            # Seeded players are "Player <id>": a prefix of an ID or last name
+            name=str(rng.randrange(3000000, 3001500))[:rng.randint(3, 7)]
+        )
+        raw_path, _, query = path.partition('?')
+        event = {
+            'requestContext': {'http': {'method': 'GET'}},
+            'rawPath': raw_path,
+            'queryStringParameters': dict(pair.split('=') for pair in query.split('&')) if query else None
+        }
+        start = time.perf_counter()
+        response = handler.lambda_handler(event, None)
+        return time.perf_counter() - start, response['statusCode']
+
+    warm = random.Random(0)
+    for template in templates:
+        request(template, warm)
+
+    samples = {template: [] for template in templates}
+    errors = {template: 0 for template in templates}
+    client_errors = {template: 0 for template in templates}
+    lock = threading.Lock()
+    per_thread = math.ceil(config['requests'] / config['threads'])
+
+    def worker(index: int):
+        rng = random.Random(index)
+        local = []
+        for template in rng.choices(templates, weights, k=per_thread):
+            local.append((template,) + request(template, rng))
+        with lock:
+            for template, seconds, status in local:
+                samples[template].append(seconds)
+                errors[template] += status >= 500
+                client_errors[template] += 400 <= status < 500
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(config['threads'])]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    total = sum(len(latencies) for latencies in samples.values())
+    return {
+        'items': len(table.items),
+        'requests': total,
+        'seconds': round(elapsed, 3),
+        'throughput': round(total / elapsed, 1),
+        'routes': {
+            template: dict(
+                count=len(latencies),
+                errors=errors[template],
+                client_errors=client_errors[template],
+                **{f"p{p}_ms": round(percentile(latencies, p) * 1000, 3) for p in (50, 95, 99)}
+            )
+            for template, latencies in samples.items() if latencies
+        }
+    }
+
+
+def percentile(values: list, pct: float) -> float:
+    """Nearest-rank percentile"""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+def export_tree(revision: str, workdir: Path) -> Path:
+    """
+    Get a revision's lambda/ directory (the working tree is used in place)
+
+    Args:
+        revision: git revision or WORKING_TREE
+        workdir: Scratch directory
+
+    Returns:
+        Path: Tree root containing lambda/
+    """
+    if revision == WORKING_TREE:
+        return REPO_ROOT
+
+    tree = workdir / f"tree-{len(list(workdir.glob('tree-*')))}"
+    tree.mkdir()
+    archive = subprocess.run(['git', 'archive', revision, 'lambda'], cwd=REPO_ROOT,
+                             check=True, capture_output=True).stdout
+    subprocess.run(['tar', '-x', '-C', str(tree)], input=archive, check=True)
+    return tree
+
+
+def run_child(mode: str, tree: Path, args: list, env: dict) -> str:
+    """Run this script as a child in a fresh interpreter and return its last output line"""
+    output = subprocess.check_output([sys.executable, __file__, mode, str(tree)] + args, env=env)
+    return output.decode().strip().splitlines()[-1]
+
+
+def run_revision(revision: str, sizes: list, config: dict, workdir: Path) -> dict:
+    """
+    Seed and load-test every data size against one revision
+
+    Args:
+        revision: git revision or WORKING_TREE
+        sizes: (seasons, stats) pairs
+        config: Load configuration
+        workdir: Scratch directory
+
+    Returns:
+        dict: "SxT" -> run_load results
+    """
+    tree = export_tree(revision, workdir)
+    results = {}
+
+    for seasons, stats in sizes:
+        size = f"{seasons}x{stats}"
+        items_path = workdir / f"{revision.replace('/', '_')}-{size}.pickle"
+        snapshot_path = str(workdir / f"{revision.replace('/', '_')}-{size}.sqlite") \
+            if config['backend'] == 'snapshot' else ''
+        env = dict(
+            {key: value for key, value in os.environ.items() if key != 'SNAPSHOT_LOCATION'},
+            TABLE_NAME='nfl_weekly_leaders',
+            CURRENT_SEASON=CURRENT_SEASON,
+            ESPN_API_BASE_URL='http://localhost.invalid/v2/sports/football/leagues/nfl',
+            AWS_DEFAULT_REGION=os.environ.get('AWS_DEFAULT_REGION', 'us-east-1'),
+            WARMUP_ON_INIT='false',
+            SNAPSHOT_DIR=str(workdir),
+            LOG_LEVEL='WARNING'
+        )
+
+        seed_start = time.perf_counter()
+        run_child('--seed', tree, [str(seasons), str(stats), snapshot_path, str(items_path)], env)
+        seed_seconds = time.perf_counter() - seed_start
+
+        if snapshot_path:
+            env['SNAPSHOT_LOCATION'] = snapshot_path
+        results[size] = dict(
+            json.loads(run_child('--load', tree, [str(items_path), json.dumps(dict(config, stats=stats))], env)),
+            seed_seconds=round(seed_seconds, 1)
+        )
+
+    return results
+
+
+def print_results(label: str, results: dict):
+    """Print one revision's per-size, per-route table"""
+    print(f"\n{label}")
+    for size, result in results.items():
+        print(f"  {size:<7} {result['items']:>7,} items  {result['throughput']:>8,.0f} req/s  "
+              f"({result['requests']:,} requests in {result['seconds']:.2f}s; seeded in {result['seed_seconds']}s)")
+        print(f"    {'route':<28}{'count':>7}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'4xx':>6}{'5xx':>6}")
+        for template, route in result['routes'].items():
+            print(f"    {template:<28}{route['count']:>7}{route['p50_ms']:>9.2f}{route['p95_ms']:>9.2f}"
+                  f"{route['p99_ms']:>9.2f}{route['client_errors']:>6}{route['errors']:>6}")
+
+
+def compare(base: dict, head: dict, tolerance: float) -> list:
+    """
+    Print per-route p95 and throughput changes and collect regressions
+
+    Args:
+        base: Results of the base revision
+        head: Results of the revision under test
+        tolerance: Allowed relative slowdown
+
+    Returns:
+        list: Regression descriptions
+    """
+    regressions = []
+    print(f"\n{'size':<7}{'route':<28}{'base p95':>10}{'head p95':>10}{'change':>9}")
+
+    for size, result in head.items():
+        before = base.get(size)
+        if before is None:
+            continue
+
+        for template, route in result['routes'].items():
+            old = before['routes'].get(template)
+            if old is None or old['errors'] or route['errors']:
+                # Routes missing or failing on either side are not comparable
+                continue
+            change = route['p95_ms'] / old['p95_ms'] - 1 if old['p95_ms'] else 0.0
+            flag = ''
+            if change > tolerance and route['p95_ms'] - old['p95_ms'] > MIN_LATENCY_DELTA_MS:
+                flag = '  REGRESSION'
+                regressions.append(f"{size} {template}: p95 {old['p95_ms']} -> {route['p95_ms']} ms")
+            print(f"{size:<7}{template:<28}{old['p95_ms']:>10.2f}{route['p95_ms']:>10.2f}{change:>+9.0%}{flag}")
+
+        change = result['throughput'] / before['throughput'] - 1
+        flag = ''
+        if change < -tolerance:
+            flag = '  REGRESSION'
+            regressions.append(f"{size} throughput: {before['throughput']} -> {result['throughput']} req/s")
+        print(f"{size:<7}{'throughput (req/s)':<28}{before['throughput']:>10,.0f}{result['throughput']:>10,.0f}"
+              f"{change:>+9.0%}{flag}")
+
+    return regressions
+
+
+def main(sizes: list, config: dict, revisions: list, tolerance: float, output: Path):
+    print("=" * 78)
+    print(f"API load test: {config['threads']} threads, {config['requests']:,} requests per size, "
+          f"{config['backend']} backend")
+    print("=" * 78)
+
+    results = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        for revision in revisions:
+            results[revision] = run_revision(revision, sizes, config, Path(workdir))
+            print_results('working tree' if revision == WORKING_TREE else revision, results[revision])
+
+    if output:
+        output.write_text(json.dumps({'config': config, 'results': results}, indent=2) + '\n')
+        print(f"\nWrote {output}")
+
+    if len(revisions) < 2:
+        return 0
+
+    regressions = compare(results[revisions[0]], results[revisions[1]], tolerance)
+    print(f"\n{len(regressions)} regression(s) beyond +{tolerance:.0%}" if regressions else "\nNo regressions")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] in ('--seed', '--load'):
+        sys.path.insert(0, str(SCRIPTS_DIR))
+        mode, tree = sys.argv[1], Path(sys.argv[2])
+        if mode == '--seed':
+            seasons, stats, snapshot_path, items_path = sys.argv[3:7]
+            items = seed(tree, int(seasons), int(stats), snapshot_path)
+            with open(items_path, 'wb') as f:
+                pickle.dump(items, f)
+            print(len(items))
+        else:
+            print(json.dumps(run_load(tree, sys.argv[3], json.loads(sys.argv[4]))))
+        sys.exit(0)
+
+    import argparse
+
+    def size(value: str):
+        seasons, _, stats = value.partition('x')
+        if not (seasons.isdigit() and stats.isdigit() and 1 <= int(seasons) <= 20 and 2 <= int(stats) <= 30):
+            raise argparse.ArgumentTypeError(f"{value}: expected SEASONSxSTATS with 1-20 seasons and 2-30 stats")
+        return int(seasons), int(stats)
+
+    parser = argparse.ArgumentParser(description='Load-test API routes against synthetic data')
+    parser.add_argument('--sizes', nargs='+', type=size, default=[(1, 2), (5, 10), (20, 30)],
+                        help='Data sizes as SEASONSxSTATS')
+    parser.add_argument('--threads', type=int, default=8, help='Concurrent request threads')
+    parser.add_argument('--requests', type=int, default=2000, help='Requests per data size')
+    parser.add_argument('--backend', choices=('dynamodb', 'snapshot'), default='dynamodb',
+                        help='Serve reads from DynamoDB or a published SQLite snapshot')
+    parser.add_argument('--compare', nargs='+', metavar='REV',
+                        help='Base revision and optional head revision (default: working tree)')
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help='Allowed p95/throughput slowdown in compare mode')
+    parser.add_argument('--output', type=Path, help='Write raw results as JSON')
+
+    args = parser.parse_args()
+    revisions = [WORKING_TREE]
+    if args.compare:
+        revisions = (args.compare + [WORKING_TREE])[:2]
+    sys.exit(main(args.sizes, {'threads': args.threads, 'requests': args.requests, 'backend': args.backend},
+                  revisions, args.tolerance, args.output))
@@ -0,0 +1,618 @@
+"""
+In-memory stand-in for a DynamoDB Table resource with capacity metering
+Implements the subset of get_item/put_item/update_item/query/scan and
+batch_writer the Lambdas use (boto3 conditions or string expressions, StatTypeIndex), with
+DynamoDB's item-size rules for read and write units; LocalClient gives the
+low-level client view the API Lambda queries through
+
+Items go through boto3's TypeSerializer on write, so values DynamoDB would
+reject (floats, empty sets) fail here too, and reads return Decimals.
+"""
+import bisect
+import math
+import operator
+import re
+import threading
+from typing import Dict, Any, List, Optional, Tuple, Union
+
+from boto3.dynamodb.conditions import ConditionBase
+from boto3.dynamodb.types import Binary, TypeDeserializer, TypeSerializer
+from botocore.exceptions import ClientError
+
+PAGE_BYTES = 1024 * 1024
+READ_UNIT_BYTES = 4096
+WRITE_UNIT_BYTES = 1024
+BATCH_WRITE_ITEMS = 25
+
+# Global secondary indexes of the leaders table (terraform/modules/dynamodb):
+# name -> (hash key, range key); items missing either are not indexed
+TABLE_INDEXES = {'StatTypeIndex': ('stat_type', 'week_number')}
+
+_serializer = TypeSerializer()
+_deserializer = TypeDeserializer()
+
+UPDATE_CLAUSE_PATTERN = re.compile(r'\b(SET|ADD|REMOVE)\s+', re.IGNORECASE)
+AND_PATTERN = re.compile(r'\s+AND\s+', re.IGNORECASE)
+FUNCTION_PATTERN = re.compile(r'^(begins_with|contains)\(\s*([#\w]+)\s*,\s*(:\w+)\s*\)$')
+EXISTS_PATTERN = re.compile(r'^(attribute_exists|attribute_not_exists)\(\s*([#\w]+)\s*\)$')
+COMPARISON_PATTERN = re.compile(r'^([#\w]+)\s*(=|<>|<=|>=|<|>)\s*(:\w+)$')
+
+COMPARISONS = {
+    '=': operator.eq, '<>': operator.ne,
+    '<': operator.lt, '<=': operator.le,
+    '>': operator.gt, '>=': operator.ge
+}
+
+Condition = Union[ConditionBase, str]
+
+
+def item_size(item: Dict[str, Any]) -> int:
+    """
+    DynamoDB item size: attribute name bytes plus value bytes
+
+    Args:
+        item: Deserialized item
+
+    Returns:
+        int: Bytes
+    """
+    return sum(len(name.encode()) + _value_size(value) for name, value in item.items())
+
+
+def _value_size(value) -> int:
+    """Size of one attribute value"""
+    if isinstance(value, str):
+        return len(value.encode())
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if isinstance(value, Binary):
+        return len(value.value)
+    if isinstance(value, bool) or value is None:
+        return 1
+    if isinstance(value, dict):
+        return 3 + sum(len(name.encode()) + _value_size(v) + 1 for name, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return 3 + sum(_value_size(v) + 1 for v in value)
+    if isinstance(value, (set, frozenset)):
+        return sum(_value_size(v) for v in value)
+    digits = str(value).lstrip('-').replace('.', '').lstrip('0') or '0'
+    return (len(digits) + 1) // 2 + 1
+
+
+class LocalTable:
+    """
+    Single-table DynamoDB stand-in (PK/SK primary key)
+
+    Consumed capacity is accumulated in read_units/write_units and
+    operation counts in operations.
+    """
+
+    def __init__(self, name: str = 'nfl_weekly_leaders', indexes: Optional[Dict[str, Tuple[str, str]]] = None):
+        self.name = name
+        self.indexes = TABLE_INDEXES if indexes is None else indexes
+        self.items: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self.read_units = 0.0
+        self.write_units = 0.0
+        self.operations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._invalidate()
+
+    @property
+    def table_name(self) -> str:
+        return self.name
+
+    def metrics(self) -> Dict[str, Any]:
+        """Consumed capacity and operation counts since the last reset"""
+        return {
+            'read_units': round(self.read_units, 1),
+            'write_units': round(self.write_units, 1),
+            'operations': dict(self.operations),
+            'items': len(self.items)
+        }
+
+    def reset_metrics(self):
+        """Zero the capacity and operation counters (items are kept)"""
+        with self._lock:
+            self.read_units = 0.0
+            self.write_units = 0.0
+            self.operations.clear()
+
+    def get_item(self, Key: Dict[str, Any], ProjectionExpression: Optional[str] = None,
+                 ExpressionAttributeNames: Optional[Dict[str, str]] = None,
+                 ConsistentRead: bool = False, **kwargs) -> Dict[str, Any]:
+        with self._lock:
+            item = self.items.get(self._key(Key))
+            self._count('get_item')
+            self._read(item_size(item) if item else 0, ConsistentRead)
+
+        if item is None:
+            return {}
+        return {'Item': self._project(_copy(item), ProjectionExpression, ExpressionAttributeNames)}
+
+    def put_item(self, Item: Dict[str, Any], ConditionExpression: Optional[str] = None,
+                 ExpressionAttributeNames: Optional[Dict[str, str]] = None,
+                 ExpressionAttributeValues: Optional[Dict[str, Any]] = None, **kwargs) -> Dict[str, Any]:
+        item = _copy(Item)
+        key = self._key(item)
+
+        with self._lock:
+            current = self.items.get(key)
+            self._count('put_item')
+            self._write(max(item_size(item), item_size(current) if current else 0))
+            self._check(current, ConditionExpression, ExpressionAttributeNames, ExpressionAttributeValues)
+            self.items[key] = item
+            self._invalidate()
+
+        return {}
+
+    def update_item(self, Key: Dict[str, Any], UpdateExpression: str,
+                    ConditionExpression: Optional[str] = None,
+                    ExpressionAttributeNames: Optional[Dict[str, str]] = None,
+                    ExpressionAttributeValues: Optional[Dict[str, Any]] = None,
+                    ReturnValues: str = 'NONE', **kwargs) -> Dict[str, Any]:
+        names = ExpressionAttributeNames or {}
+        values = _copy(ExpressionAttributeValues or {})
+        key = self._key(Key)
+
+        with self._lock:
+            current = self.items.get(key)
+            self._count('update_item')
+            try:
+                self._check(current, ConditionExpression, names, values)
+            except ClientError:
+                self._write(item_size(current) if current else 0)
+                raise
+
+            item = _copy(current) if current else _copy(Key)
+            updated = []
+            clauses = UPDATE_CLAUSE_PATTERN.split(UpdateExpression)[1:]
+            for action, body in zip(clauses[::2], clauses[1::2]):
+                action = action.upper()
+                for part in filter(None, (p.strip() for p in body.split(','))):
+                    if action == 'REMOVE':
+                        item.pop(names.get(part, part), None)
+                        continue
+                    name, _, placeholder = part.partition('=' if action == 'SET' else ' ')
+                    name, placeholder = names.get(name.strip(), name.strip()), placeholder.strip()
+                    if action == 'SET':
+                        item[name] = values[placeholder]
+                    elif isinstance(values[placeholder], (set, frozenset)):
+                        item[name] = set(item.get(name, set())) | values[placeholder]
+                    else:
+                        item[name] = item.get(name, 0) + values[placeholder]
+                    updated.append(name)
+
+            self._write(max(item_size(item), item_size(current) if current else 0))
+            self.items[key] = _copy(item)
+            self._invalidate()
+
+        if ReturnValues == 'ALL_NEW':
+            return {'Attributes': item}
+        if ReturnValues == 'UPDATED_NEW':
+            return {'Attributes': {name: item[name] for name in updated if name in item}}
+        return {}
+
+    def query(self, KeyConditionExpression: Condition, FilterExpression: Optional[Condition] = None,
+              IndexName: Optional[str] = None, ScanIndexForward: bool = True, Limit: Optional[int] = None,
+              ExclusiveStartKey: Optional[Dict[str, Any]] = None, ConsistentRead: bool = False,
+              ProjectionExpression: Optional[str] = None,
+              ExpressionAttributeNames: Optional[Dict[str, str]] = None,
+              ExpressionAttributeValues: Optional[Dict[str, Any]] = None,
+              ReturnConsumedCapacity: str = 'NONE', **kwargs) -> Dict[str, Any]:
+        items, response = self.select(
+            'query', KeyConditionExpression, FilterExpression, IndexName, ScanIndexForward, Limit,
+            ExclusiveStartKey, ConsistentRead, ExpressionAttributeNames, ExpressionAttributeValues,
+            ReturnConsumedCapacity
+        )
+        response['Items'] = [self._project(_copy(item), ProjectionExpression, ExpressionAttributeNames)
+                             for item in items]
+        return response
+
+    def scan(self, FilterExpression: Optional[Condition] = None, IndexName: Optional[str] = None,
+             Limit: Optional[int] = None, ExclusiveStartKey: Optional[Dict[str, Any]] = None,
+             ConsistentRead: bool = False, ProjectionExpression: Optional[str] = None,
+             ExpressionAttributeNames: Optional[Dict[str, str]] = None,
+             ExpressionAttributeValues: Optional[Dict[str, Any]] = None,
+             ReturnConsumedCapacity: str = 'NONE', **kwargs) -> Dict[str, Any]:
+        items, response = self.select(
+            'scan', None, FilterExpression, IndexName, True, Limit,
+            ExclusiveStartKey, ConsistentRead, ExpressionAttributeNames, ExpressionAttributeValues,
+            ReturnConsumedCapacity
+        )
+        response['Items'] = [self._project(_copy(item), ProjectionExpression, ExpressionAttributeNames)
+                             for item in items]
+        return response
+
+    def batch_writer(self, overwrite_by_pkeys: Optional[List[str]] = None) -> 'LocalBatchWriter':
+        """Buffered puts flushed as BatchWriteItem calls (as boto3's Table.batch_writer)"""
+        return LocalBatchWriter(self)
+
+    def batch_write(self, items: List[Dict[str, Any]], delete_keys: List[Dict[str, Any]] = ()):
+        """One BatchWriteItem call: each item is metered as a put, each key as a delete"""
+        with self._lock:
+            self._count('batch_write_item')
+            for item in items:
+                item = _copy(item)
+                current = self.items.get(self._key(item))
+                self._write(max(item_size(item), item_size(current) if current else 0))
+                self.items[self._key(item)] = item
+            for key in delete_keys:
+                current = self.items.pop(self._key(key), None)
+                self._write(item_size(current) if current else 0)
+            self._invalidate()
+
+    def load_items(self, items: Dict[Tuple[str, str], Dict[str, Any]]):
+        """Replace the table contents (e.g. with a pickled seed)"""
+        with self._lock:
+            self.items = items
+            self._invalidate()
+
+    def select(self, operation: str, key_condition: Optional[Condition], filter_expression: Optional[Condition],
+               index_name: Optional[str], forward: bool, limit: Optional[int], start_key: Optional[Dict[str, Any]],
+               consistent: bool, names: Optional[Dict[str, str]], values: Optional[Dict[str, Any]],
+               return_capacity: str = 'NONE') -> Tuple[list, dict]:
+        """
+        Read one page of a query or scan: up to Limit items or 1 MB examined, then filter
+
+        Queries only look at the matching key range of one partition
+        (cached in sort order between writes), like DynamoDB.
+
+        Returns:
+            tuple: (stored items, response without Items)
+        """
+        names, values = names or {}, values or {}
+        hash_name, range_name = self._key_names(index_name)
+
+        with self._lock:
+            self._count(operation)
+            if key_condition is None:
+                entries = self._sorted(index_name)
+            else:
+                terms = _key_terms(key_condition, names, values)
+                partition = [operands[0] for op, name, operands in terms if name == hash_name and op == '=']
+                if not partition:
+                    raise ClientError({'Error': {'Code': 'ValidationException',
+                                                 'Message': f"Query condition missed key schema element: {hash_name}"}},
+                                      'Query')
+                entries = self._range(index_name, partition[0],
+                                      [(op, operands) for op, name, operands in terms if name == range_name])
+
+            if not forward:
+                entries = entries[::-1]
+            if start_key:
+                start = self._order(index_name)(start_key)
+                entries = [(position, item) for position, item in entries
+                           if (position > start if forward else position < start)]
+
+            examined, examined_bytes, last_item = [], 0, None
+            for _, item in entries:
+                if (limit is not None and len(examined) >= limit) or examined_bytes >= PAGE_BYTES:
+                    last_item = examined[-1]
+                    break
+                examined.append(item)
+                examined_bytes += item_size(item)
+            units = self._read(examined_bytes, consistent)
+
+        items = [item for item in examined
+                 if filter_expression is None or _matches(filter_expression, item, names, values)]
+        response = {'Count': len(items), 'ScannedCount': len(examined)}
+        if return_capacity != 'NONE':
+            response['ConsumedCapacity'] = {'TableName': self.name, 'CapacityUnits': units}
+        if last_item is not None:
+            key_names = ('PK', 'SK') + (self.indexes[index_name] if index_name else ())
+            response['LastEvaluatedKey'] = {name: last_item[name] for name in key_names}
+        return items, response
+
+    def wire(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        """Wire-format view of a stored item (cached until the next write)"""
+        key = self._key(item)
+        wire = self._wire_items.get(key)
+        if wire is None:
+            wire = self._wire_items[key] = _serialize(item)
+        return wire
+
+    def _key_names(self, index_name: Optional[str]) -> Tuple[str, str]:
+        """(hash, range) key attribute names of the table or an index"""
+        if index_name is None:
+            return 'PK', 'SK'
+        if index_name not in self.indexes:
+            raise ClientError({'Error': {'Code': 'ValidationException',
+                                         'Message': f"The table does not have the index {index_name}"}}, 'Query')
+        return self.indexes[index_name]
+
+    def _order(self, index_name: Optional[str]):
+        """Sort key of items in the table or an index"""
+        if index_name is None:
+            return self._key
+        hash_name, range_name = self._key_names(index_name)
+        return lambda item: (item[hash_name], item[range_name], item['PK'], item['SK'])
+
+    def _sorted(self, index_name: Optional[str]) -> List[Tuple]:
+        """Every item of the table or (sparse) index in sort order"""
+        cached = self._sorted_cache.get(index_name)
+        if cached is None:
+            names = self._key_names(index_name)
+            order = self._order(index_name)
+            cached = self._sorted_cache[index_name] = sorted(
+                (order(item), item) for item in self.items.values() if all(name in item for name in names)
+            )
+        return cached
+
+    def _range(self, index_name: Optional[str], hash_value, range_terms: List[Tuple]) -> List[Tuple]:
+        """Entries of one partition whose range key satisfies the key condition"""
+        partitions = self._partition_cache.get(index_name)
+        if partitions is None:
+            hash_name, range_name = self._key_names(index_name)
+            partitions = self._partition_cache[index_name] = {}
+            for position, item in self._sorted(index_name):
+                entries, keys = partitions.setdefault(item[hash_name], ([], []))
+                entries.append((position, item))
+                keys.append(item[range_name])
+
+        entries, keys = partitions.get(hash_value, ([], []))
+        low, high = 0, len(keys)
+        for op, operands in range_terms:
+            if op == 'begins_with':
+                low = max(low, bisect.bisect_left(keys, operands[0]))
+                high = min(high, bisect.bisect_left(keys, operands[0] + '\U0010ffff'))
+            elif op == 'BETWEEN':
+                low = max(low, bisect.bisect_left(keys, operands[0]))
+                high = min(high, bisect.bisect_right(keys, operands[1]))
+            elif op in ('=', '>=', '>'):
+                low = max(low, (bisect.bisect_left if op == '>=' or op == '=' else bisect.bisect_right)(keys, operands[0]))
+                if op == '=':
+                    high = min(high, bisect.bisect_right(keys, operands[0]))
+            elif op in ('<', '<='):
+                high = min(high, (bisect.bisect_left if op == '<' else bisect.bisect_right)(keys, operands[0]))
+            else:
+                raise NotImplementedError(f"Unsupported key condition on the range key: {op}")
+
+        return entries[low:high]
+
+    def _invalidate(self):
+        """Drop the sort-order and wire-format caches after a write"""
+        self._sorted_cache = {}
+        self._partition_cache = {}
+        self._wire_items = {}
+
+    def _check(self, current, expression: Optional[str], names, values):
+        """Evaluate a ConditionExpression against the stored item"""
+        if expression and not _matches(expression, current or {}, names or {}, values or {}):
+            raise ClientError(
+                {'Error': {'Code': 'ConditionalCheckFailedException', 'Message': 'The conditional request failed'}},
+                'PutItem'
+            )
+
+    def _project(self, item: Dict[str, Any], projection: Optional[str], names) -> Dict[str, Any]:
+        """Apply a ProjectionExpression of top-level attribute names"""
+        if not projection:
+            return item
+        wanted = {(names or {}).get(name.strip(), name.strip()) for name in projection.split(',')}
+        return {name: value for name, value in item.items() if name in wanted}
+
+    def _key(self, item: Dict[str, Any]) -> Tuple[str, str]:
+        return item['PK'], item['SK']
+
+    def _count(self, operation: str):
+        self.operations[operation] = self.operations.get(operation, 0) + 1
+
+    def _read(self, size: int, consistent: bool) -> float:
+        units = max(1, math.ceil(size / READ_UNIT_BYTES))
+        units = units if consistent else units / 2
+        self.read_units += units
+        return units
+
+    def _write(self, size: int):
+        self.write_units += max(1, math.ceil(size / WRITE_UNIT_BYTES))
+
+
+class LocalBatchWriter:
+    """
+    Stand-in for boto3's BatchWriter: puts and deletes are buffered and
+    sent BATCH_WRITE_ITEMS at a time, with a later request for the same key
+    replacing the buffered one
+    """
+
+    def __init__(self, table: LocalTable):
+        self.table = table
+        self.buffer: Dict[Tuple[str, str], Optional[Dict[str, Any]]] = {}  # None: delete
+
+    def put_item(self, Item: Dict[str, Any]):
+        self._add(self.table._key(Item), Item)
+
+    def delete_item(self, Key: Dict[str, Any]):
+        self._add(self.table._key(Key), None)
+
+    def flush(self):
+        requests = list(self.buffer.items())
+        self.buffer.clear()
+        for start in range(0, len(requests), BATCH_WRITE_ITEMS):
+            chunk = requests[start:start + BATCH_WRITE_ITEMS]
+            self.table.batch_write(
+                [item for _, item in chunk if item is not None],
+                [{'PK': key[0], 'SK': key[1]} for key, item in chunk if item is None]
+            )
+
+    def _add(self, key: Tuple[str, str], item: Optional[Dict[str, Any]]):
+        self.buffer[key] = item
+        if len(self.buffer) >= BATCH_WRITE_ITEMS:
+            self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.flush()
+
+
+class LocalClient:
+    """
+    Low-level client view of a LocalTable
+
+    Takes and returns wire-format attribute values ({'S': ...}), like
+    boto3.client('dynamodb'); TableName is ignored.
+    """
+
+    def __init__(self, table: LocalTable):
+        self.table = table
+
+    def get_item(self, TableName: Optional[str] = None, Key: Optional[Dict[str, Any]] = None,
+                 ConsistentRead: bool = False, ReturnConsumedCapacity: str = 'NONE', **request) -> Dict[str, Any]:
+        key = _deserialize(Key)
+        response = self.table.get_item(Key=key, ConsistentRead=ConsistentRead, **request)
+        if ReturnConsumedCapacity != 'NONE':
+            # Billed on the whole item, whatever the projection
+            stored = self.table.items.get(self.table._key(key))
+            units = max(1, math.ceil((item_size(stored) if stored else 0) / READ_UNIT_BYTES))
+            response['ConsumedCapacity'] = {
+                'TableName': self.table.name,
+                'CapacityUnits': units if ConsistentRead else units / 2
+            }
+        if 'Item' in response:
+            response['Item'] = _serialize(response['Item'])
+        return response
+
+    def query(self, TableName: Optional[str] = None, KeyConditionExpression: Optional[str] = None,
+              **request) -> Dict[str, Any]:
+        return self._select('query', KeyConditionExpression, **request)
+
+    def scan(self, TableName: Optional[str] = None, **request) -> Dict[str, Any]:
+        return self._select('scan', None, **request)
+
+    def _select(self, operation: str, key_condition: Optional[str], FilterExpression: Optional[str] = None,
+                IndexName: Optional[str] = None, ScanIndexForward: bool = True, Limit: Optional[int] = None,
+                ExclusiveStartKey: Optional[Dict[str, Any]] = None, ConsistentRead: bool = False,
+                ProjectionExpression: Optional[str] = None, ExpressionAttributeNames: Optional[Dict[str, str]] = None,
+                ExpressionAttributeValues: Optional[Dict[str, Any]] = None,
+                ReturnConsumedCapacity: str = 'NONE', **kwargs) -> Dict[str, Any]:
+        items, response = self.table.select(
+            operation, key_condition, FilterExpression, IndexName, ScanIndexForward, Limit,
+            _deserialize(ExclusiveStartKey) if ExclusiveStartKey else None, ConsistentRead,
+            ExpressionAttributeNames, _deserialize(ExpressionAttributeValues or {}), ReturnConsumedCapacity
+        )
+        response['Items'] = [
+            self.table._project(self.table.wire(item), ProjectionExpression, ExpressionAttributeNames)
+            for item in items
+        ]
+        if 'LastEvaluatedKey' in response:
+            response['LastEvaluatedKey'] = _serialize(response['LastEvaluatedKey'])
+        return response
+
+
+def _deserialize(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Deserialize a wire-format item"""
+    return {name: _deserializer.deserialize(value) for name, value in item.items()}
+
+
+def _serialize(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Serialize an item to wire format"""
+    return {name: _serializer.serialize(value) for name, value in item.items()}
+
+
+def _copy(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Round-trip through the DynamoDB wire format (validates and copies)"""
+    return {name: _deserializer.deserialize(_serializer.serialize(value)) for name, value in item.items()}
+
+
+def _matches(condition: Condition, item: Dict[str, Any],
+             names: Optional[Dict[str, str]] = None, values: Optional[Dict[str, Any]] = None) -> bool:
+    """
+    Evaluate a condition against an item
+
+    Args:
+        condition: boto3 Key/Attr condition, or a string expression of
+            AND-joined comparisons, begins_with/contains and
+            attribute_exists/attribute_not_exists terms
+        item: Deserialized item
+        names: ExpressionAttributeNames (string expressions)
+        values: Deserialized ExpressionAttributeValues (string expressions)
+
+    Returns:
+        bool: True if the item satisfies the condition
+    """
+    if isinstance(condition, str):
+        return all(_matches_term(term.strip(), item, names or {}, values or {})
+                   for term in AND_PATTERN.split(condition.strip()))
+
+    expression = condition.get_expression()
+    operator_name, operands = expression['operator'], expression['values']
+
+    if operator_name == 'AND':
+        return all(_matches(operand, item) for operand in operands)
+    if operator_name == 'OR':
+        return any(_matches(operand, item) for operand in operands)
+    if operator_name == 'NOT':
+        return not _matches(operands[0], item)
+
+    return _test(operator_name, item, operands[0].name, *operands[1:])
+
+
+def _matches_term(term: str, item: Dict[str, Any], names: Dict[str, str], values: Dict[str, Any]) -> bool:
+    """Evaluate one term of a string expression"""
+    for pattern in (FUNCTION_PATTERN, EXISTS_PATTERN):
+        match = pattern.match(term)
+        if match:
+            function, name = match.group(1), names.get(match.group(2), match.group(2))
+            return _test(function, item, name, *(values[p] for p in match.groups()[2:]))
+
+    match = COMPARISON_PATTERN.match(term)
+    if match:
+        name, comparison, placeholder = match.groups()
+        return _test(comparison, item, names.get(name, name), values[placeholder])
+
+    raise NotImplementedError(f"LocalTable cannot evaluate expression term: {term}")
+
+
+def _key_terms(condition: Condition, names: Dict[str, str], values: Dict[str, Any]) -> List[Tuple]:
+    """
+    Split a KeyConditionExpression into (operator, attribute, operands) terms
+
+    Args:
+        condition: boto3 Key condition or string expression
+        names: ExpressionAttributeNames (string expressions)
+        values: Deserialized ExpressionAttributeValues (string expressions)
+
+    Returns:
+        list: One term per key attribute condition
+    """
+    if isinstance(condition, str):
+        terms = []
+        for term in AND_PATTERN.split(condition.strip()):
+            match = FUNCTION_PATTERN.match(term.strip()) or COMPARISON_PATTERN.match(term.strip())
+            if not match:
+                raise NotImplementedError(f"LocalTable cannot evaluate key condition term: {term}")
+            if match.re is FUNCTION_PATTERN:
+                function, name, placeholder = match.groups()
+            else:
+                name, function, placeholder = match.groups()
+            terms.append((function, names.get(name, name), (values[placeholder],)))
+        return terms
+
+    expression = condition.get_expression()
+    if expression['operator'] == 'AND':
+        return [term for operand in expression['values'] for term in _key_terms(operand, names, values)]
+    operands = expression['values']
+    return [(expression['operator'], operands[0].name, tuple(operands[1:]))]
+
+
+def _test(operator_name: str, item: Dict[str, Any], name: str, *operands) -> bool:
+    """Apply one operator to an item attribute"""
+    if operator_name == 'attribute_exists':
+        return name in item
+    if operator_name == 'attribute_not_exists':
+        return name not in item
+
+    value = item.get(name)
+    if value is None:
+        return False
+    if operator_name == 'begins_with':
+        return isinstance(value, str) and value.startswith(operands[0])
+    if operator_name == 'contains':
+        return operands[0] in value
+    if operator_name == 'BETWEEN':
+        return operands[0] <= value <= operands[1]
+    try:
+        return COMPARISONS[operator_name](value, operands[0])
+    except TypeError:
+        # DynamoDB comparisons across types are simply false
+        return False
@@ -0,0 +1,83 @@
+"""
+Move player/team names off existing leader items into dimension items
+One-time migration for tables written before the dimension split: writes
+the DIM#PLAYER / DIM#TEAM items, then removes the names from each fact
+
+Usage: python scripts/normalize_dimensions.py [--table nfl_weekly_leaders] [--dry-run] [--stats TOTAL_TACKLES SACKS]
+"""
+import sys
+from decimal import Decimal
+from pathlib import Path
+
+import boto3
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'lambda' / 'ingest'))
+from dimensions import DIMENSION_ATTRIBUTES, store_dimensions  # noqa: E402
+from dynamodb_client import query_leader_items  # noqa: E402
+from models import LeaderRecord  # noqa: E402
+from tracked_stats import TRACKED_STATS  # noqa: E402
+
+TABLE_NAME = 'nfl_weekly_leaders'
+
+
+def item_size(item: dict) -> int:
+    """
+    Approximate DynamoDB item size (what read/write units are billed on)
+
+    Args:
+        item: Deserialized item
+
+    Returns:
+        int: Bytes (attribute names plus values)
+    """
+    size = 0
+    for name, value in item.items():
+        size += len(name.encode())
+        if isinstance(value, str):
+            size += len(value.encode())
+        elif isinstance(value, (int, Decimal)):
+            size += len(str(value).lstrip('-').replace('.', '')) // 2 + 1
+        else:
+            size += 1
+    return size
+
+
+def main(table_name: str, dry_run: bool, stat_types: list):
+    table = boto3.resource('dynamodb').Table(table_name)
+    items = query_leader_items(table, stat_types)
+    denormalized = [item for item in items if any(name in item for name in DIMENSION_ATTRIBUTES)]
+
+    before = sum(item_size(item) for item in items)
+    after = sum(
+        item_size({name: value for name, value in item.items() if name not in DIMENSION_ATTRIBUTES})
+        for item in items
+    )
+
+    print(f"{len(items)} leader items, {len(denormalized)} still carry player/team names")
+    print(f"Fact bytes: {before:,} -> {after:,} ({after / max(before, 1):.0%}); "
+          f"average item {before / max(len(items), 1):.0f} B -> {after / max(len(items), 1):.0f} B")
+
+    if dry_run or not denormalized:
+        return
+
+    dimensions_written = 0
+    for item in denormalized:
+        dimensions_written += store_dimensions(table, LeaderRecord.from_item(item))
+        table.update_item(
+            Key={'PK': item['PK'], 'SK': item['SK']},
+            UpdateExpression='REMOVE ' + ', '.join(DIMENSION_ATTRIBUTES)
+        )
+
+    print(f"Wrote {dimensions_written} dimension items and normalized {len(denormalized)} facts")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Move leader names into dimension items')
+    parser.add_argument('--table', default=TABLE_NAME, help='DynamoDB table name')
+    parser.add_argument('--dry-run', action='store_true', help='Only report the size change')
+    parser.add_argument('--stats', nargs='+', default=list(TRACKED_STATS), help='Stat types stored in the table')
+
+    args = parser.parse_args()
+    main(args.table, args.dry_run, args.stats)
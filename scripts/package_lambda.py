@@ -7,6 +7,9 @@ import subprocess
 import sys
 from pathlib import Path
 
+# Modules bundled into every function (linked into each function dir for local runs)
+SHARED_DIR = Path(__file__).resolve().parent.parent / "lambda" / "shared"
+
 def package_lambda(function_dir: str):
     """Package a Lambda function with its dependencies"""
     function_path = Path(function_dir)
@@ -31,10 +34,16 @@ def package_lambda(function_dir: str):
             "--quiet"
         ], check=True)
     
-    # Copy function code
+    # Copy function code (symlinks point into lambda/shared, copied below)
     print(f"   Copying function code...")
     for file in function_path.glob("*.py"):
-        shutil.copy(file, package_dir)
+        if not file.is_symlink():
+            shutil.copy(file, package_dir)
+    
+    # Copy modules shared by every function (profiling, tracked stats, name normalization)
+    for file in SHARED_DIR.glob("*.py"):
+        if file.name != "__init__.py":
+            shutil.copy(file, package_dir)
     
     # Create zip file
     zip_path = function_path / f"{function_name}.zip"
@@ -0,0 +1,111 @@
+"""
+Run the planner/worker ingest pipeline locally
+Plans (season, week, stat) work items onto an in-memory queue and drains it
+through the ingest handler with concurrent simulated workers
+
+Usage:
+    python scripts/run_fanout.py --season 2025 --weeks 1-10 --concurrency 4
+    python scripts/run_fanout.py --season 2025 --weeks 1-18 --inline --timeout 30
+    python scripts/run_fanout.py --season 2025 --from-archive ./raw-archive
+
+--from-archive reprocesses archived raw ESPN responses (RAW_ARCHIVE_DESTINATION
+layout, local or s3://) instead of calling ESPN; --weeks defaults to every
+archived week.
+
+--inline starts with an {'action': 'backfill'} invocation, which ingests work
+items itself until its deadline nears and enqueues the rest; --timeout gives
+every simulated invocation a Lambda context with that many seconds, so batch
+workers also stop starting work items near the deadline and re-enqueue them.
+
+Requires TABLE_NAME (and AWS credentials for that table); WORK_QUEUE_URL
+must be unset so the local queue is used.
+"""
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault('TABLE_NAME', 'nfl_weekly_leaders')
+os.environ.setdefault('CURRENT_SEASON', '2025')
+os.environ.setdefault('ESPN_API_BASE_URL', 'https://sports.core.api.espn.com/v2/sports/football/leagues/nfl')
+os.environ.pop('WORK_QUEUE_URL', None)
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'lambda' / 'ingest'))
+import handler  # noqa: E402
+from deadline import LocalContext  # noqa: E402
+from raw_archive import RawArchive  # noqa: E402
+from work_queue import get_work_queue  # noqa: E402
+
+
+def parse_weeks(value: str) -> list:
+    """Parse '5' or '1-10' into a list of week numbers"""
+    if '-' in value:
+        start, end = value.split('-', 1)
+        return list(range(int(start), int(end) + 1))
+    return [int(value)]
+
+
+def main(season: str, weeks: list, stats: list, batch_size: int, concurrency: int,
+         from_archive: str = None, inline: bool = False, timeout: float = None):
+    queue = get_work_queue()
+    new_context = (lambda: LocalContext(timeout)) if timeout else (lambda: None)
+
+    replay = None
+    if from_archive:
+        # Serve every ESPN request from the archive, and don't re-archive it
+        archive = RawArchive(from_archive)
+        weeks = weeks or archive.weeks(season)
+        replay = handler.espn = archive.client()
+        handler.RAW_ARCHIVE_DESTINATION = None
+        print(f"Reprocessing {len(weeks)} archived weeks of {season} from {from_archive}")
+
+    plan_event = {'action': 'backfill' if inline else 'plan', 'season': season, 'weeks': weeks}
+    if stats:
+        plan_event['stats'] = stats
+
+    start = time.perf_counter()
+    plan = handler.lambda_handler(plan_event, new_context())
+    body = json.loads(plan['body'])
+    if plan['statusCode'] != 200:
+        print(f"Planning failed: {body['error']}")
+        sys.exit(1)
+    if inline:
+        print(f"Backfilled {body['stored']} work items inline in {time.perf_counter() - start:.1f}s, "
+              f"continued {body['continued']} on the queue from {body['cursor']}")
+    else:
+        print(f"Planned {body['enqueued']} work items")
+
+    start = time.perf_counter()
+    stats = queue.drain(handler.lambda_handler, batch_size=batch_size, concurrency=concurrency,
+                        context_factory=new_context)
+    elapsed = time.perf_counter() - start
+
+    print(f"Drained in {elapsed:.1f}s with {concurrency} workers: "
+          f"{stats['invocations']} invocations, {stats['processed']} processed, "
+          f"{stats['retried']} retried, {stats['dead_lettered']} dead-lettered")
+    if replay:
+        print(f"Archive: {replay.hits} responses replayed, {replay.misses} not archived")
+    for message in queue.dead_letters:
+        print(f"  dead letter: {message['body']}")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Run fan-out ingest locally')
+    parser.add_argument('--season', default=os.environ['CURRENT_SEASON'], help='NFL season')
+    parser.add_argument('--weeks', help='Week or range, e.g. 5 or 1-10 (required unless --from-archive)')
+    parser.add_argument('--stats', nargs='*', help='Stat types (default: all tracked)')
+    parser.add_argument('--batch-size', type=int, default=10, help='Messages per worker invocation')
+    parser.add_argument('--concurrency', type=int, default=4, help='Concurrent workers')
+    parser.add_argument('--from-archive', help='Replay raw ESPN responses from this archive (dir or s3://)')
+    parser.add_argument('--inline', action='store_true',
+                        help='Start with an inline backfill invocation instead of the planner')
+    parser.add_argument('--timeout', type=float, help='Simulated Lambda timeout in seconds per invocation')
+
+    args = parser.parse_args()
+    if not args.weeks and not args.from_archive:
+        parser.error('--weeks is required unless --from-archive is given')
+    main(args.season, parse_weeks(args.weeks) if args.weeks else None, args.stats,
+         args.batch_size, args.concurrency, args.from_archive, args.inline, args.timeout)
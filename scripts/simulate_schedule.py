@@ -0,0 +1,183 @@
+"""
+Simulate ingest scheduling over a full season with a fake clock
+Compares adaptive (game-calendar-aware) polling with fixed EventBridge schedules
+
+Usage:
+    python scripts/simulate_schedule.py
+    python scripts/simulate_schedule.py --calendar /tmp/nfl_calendar.json
+"""
+import json
+import sys
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'lambda' / 'ingest'))
+import schedule  # noqa: E402
+
+
+def synthetic_calendar(season: str = '2025') -> dict:
+    """
+    Build a typical 18-week slate: TNF, three Sunday windows, SNF and MNF
+
+    Args:
+        season: NFL season
+
+    Returns:
+        dict: Calendar in the same shape as schedule.fetch_season_calendar
+    """
+    # Thursday of week 1 (the first Thursday after Labor Day), 00:20 UTC Friday
+    first_friday = datetime(int(season), 9, 1, tzinfo=timezone.utc)
+    while first_friday.weekday() != 0:
+        first_friday += timedelta(days=1)
+    first_friday += timedelta(days=4)
+
+    slate = [
+        (timedelta(hours=0, minutes=20), 1),    # Thursday night (Fri 00:20 UTC)
+        (timedelta(days=2, hours=17), 9),       # Sunday early window
+        (timedelta(days=2, hours=20, minutes=5), 2),
+        (timedelta(days=2, hours=20, minutes=25), 3),
+        (timedelta(days=3, hours=0, minutes=20), 1),   # Sunday night
+        (timedelta(days=4, hours=0, minutes=15), 1),   # Monday night
+    ]
+
+    games = []
+    for week in range(1, schedule.REGULAR_SEASON_WEEKS + 1):
+        week_start = first_friday + timedelta(weeks=week - 1)
+        for offset, count in slate:
+            for _ in range(count):
+                games.append({'week': week, 'kickoff': (week_start + offset).isoformat()})
+
+    return {
+        'season': season,
+        'fetched_at': first_friday.isoformat(),
+        'games': games
+    }
+
+
+def adaptive_polls(calendar: dict, start: datetime, end: datetime):
+    """
+    Run the adaptive scheduler against a fake clock
+
+    Args:
+        calendar: Season calendar
+        start: Simulation start (first invocation)
+        end: Simulation end
+
+    Returns:
+        tuple: (poll times, Counter of invocation phases)
+    """
+    clock = start
+    polls = []
+    phases = Counter()
+
+    while clock < end:
+        polls.append(clock)
+        run_at, phase = schedule.next_poll_time(calendar, clock)
+        phases[phase] += 1
+        if run_at is None:
+            break
+        # EventBridge rates have minute granularity, so runs land on whole minutes
+        clock += timedelta(minutes=schedule.rate_minutes(run_at, clock))
+
+    return polls, phases
+
+
+def fixed_polls(start: datetime, end: datetime, interval: timedelta, first: datetime = None):
+    """
+    Poll times for a fixed-rate or weekly cron schedule
+
+    Args:
+        start: Simulation start
+        end: Simulation end
+        interval: Time between runs
+        first: First run (defaults to start)
+
+    Returns:
+        list: Poll times
+    """
+    polls = []
+    clock = first or start
+    while clock < end:
+        polls.append(clock)
+        clock += interval
+    return polls
+
+
+def freshness(polls: list, calendar: dict) -> dict:
+    """
+    Measure how quickly final stats are picked up and how often live games are polled
+
+    Args:
+        polls: Sorted poll times
+        calendar: Season calendar
+
+    Returns:
+        dict: Invocation counts and delay statistics
+    """
+    windows = schedule.game_windows(calendar)
+    delays = []
+    live_polls = 0
+
+    poll_index = 0
+    for start, end in windows:
+        while poll_index < len(polls) and polls[poll_index] < end:
+            if polls[poll_index] >= start:
+                live_polls += 1
+            poll_index += 1
+        if poll_index < len(polls):
+            delays.append((polls[poll_index] - end).total_seconds() / 3600)
+
+    return {
+        'invocations': len(polls),
+        'live_polls': live_polls,
+        'avg_final_delay_h': sum(delays) / len(delays) if delays else float('nan'),
+        'max_final_delay_h': max(delays) if delays else float('nan')
+    }
+
+
+def main(calendar_path: str = None):
+    calendar = json.loads(Path(calendar_path).read_text()) if calendar_path else synthetic_calendar()
+    windows = schedule.game_windows(calendar)
+
+    start = windows[0][0] - timedelta(days=2)
+    end = windows[-1][1] + timedelta(days=2)
+
+    adaptive, phases = adaptive_polls(calendar, start, end)
+
+    # Existing default: cron(0 14 ? * TUE *)
+    first_tuesday = start.replace(hour=14, minute=0, second=0, microsecond=0)
+    while first_tuesday.weekday() != 1 or first_tuesday < start:
+        first_tuesday += timedelta(days=1)
+
+    scenarios = {
+        'adaptive': adaptive,
+        'weekly (Tue 14:00 UTC)': fixed_polls(start, end, timedelta(weeks=1), first_tuesday),
+        'fixed rate(1 hour)': fixed_polls(start, end, timedelta(hours=1)),
+        'fixed rate(5 minutes)': fixed_polls(start, end, timedelta(minutes=5)),
+    }
+
+    print("=" * 78)
+    print(f"Season {calendar['season']}: {len(calendar['games'])} games, {len(windows)} game windows, "
+          f"{(end - start).days} simulated days")
+    print("=" * 78)
+    print(f"{'schedule':<24}{'invocations':>12}{'live polls':>12}{'avg final delay':>16}{'max delay':>12}")
+    for name, polls in scenarios.items():
+        stats = freshness(polls, calendar)
+        print(f"{name:<24}{stats['invocations']:>12,}{stats['live_polls']:>12,}"
+              f"{stats['avg_final_delay_h']:>14.2f} h{stats['max_final_delay_h']:>10.2f} h")
+
+    print()
+    print("Adaptive invocations by phase (idle runs only reschedule, no ingest):")
+    for phase, count in phases.most_common():
+        print(f"  {phase:<12} {count:>6,}")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Simulate adaptive ingest scheduling')
+    parser.add_argument('--calendar', help='Calendar JSON (as cached by the ingest Lambda)')
+
+    args = parser.parse_args()
+    main(args.calendar)
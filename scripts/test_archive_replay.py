@@ -0,0 +1,118 @@
+"""
+Offline replay test for the raw response archive
+Ingests a week from the fake ESPN server (scripts/fake_espn.py) with
+RAW_ARCHIVE_DESTINATION set, stops the server, disables the network and
+replays the archive through scripts/run_fanout.py's --from-archive path into
+an empty local table (scripts/local_dynamodb.py). The replayed leader items
+must match the live ones, and no request may leave the process.
+
+Usage: python scripts/test_archive_replay.py [--week 5] [--athletes 200]
+"""
+import os
+import socket
+import sys
+import tempfile
+from pathlib import Path
+
+import requests.adapters
+
+from fake_espn import FakeEspn
+
+SEASON = '2025'
+
+# Restamped by every put, so never equal between two runs
+VOLATILE_FIELDS = ('updated_at',)
+
+
+class NetworkDisabled(Exception):
+    """Raised by any request or connection attempted during replay"""
+
+
+def leader_items(table) -> dict:
+    """(PK, SK) -> item of every leader fact, without volatile fields"""
+    return {
+        (item['PK'], item['SK']): {key: value for key, value in item.items() if key not in VOLATILE_FIELDS}
+        for item in table.items.values()
+        if item['PK'].startswith('SEASON#')
+    }
+
+
+def main(week: int, athletes: int) -> int:
+    fake = FakeEspn(athletes=athletes, week=week)
+    base_url = fake.start()
+    workdir = tempfile.TemporaryDirectory()
+    archive_dir = str(Path(workdir.name) / 'raw-archive')
+
+    os.environ.update(
+        TABLE_NAME='nfl_weekly_leaders',
+        CURRENT_SEASON=SEASON,
+        ESPN_API_BASE_URL=base_url,
+        ESPN_SITE_API_BASE_URL=fake.site_base_url,
+        RAW_ARCHIVE_DESTINATION=archive_dir,
+        CALENDAR_CACHE_PATH=str(Path(workdir.name) / 'calendar.json'),
+        AWS_DEFAULT_REGION=os.environ.get('AWS_DEFAULT_REGION', 'us-east-1'),
+        LOG_LEVEL='WARNING'
+    )
+    for key in ('ARCHIVE_DESTINATION', 'SCHEDULE_RULE_NAME', 'SNAPSHOT_LOCATION', 'WORK_QUEUE_URL'):
+        os.environ.pop(key, None)
+
+    import run_fanout
+    from local_dynamodb import LocalTable
+    handler = run_fanout.handler
+
+    # Live run: every response is archived
+    handler.table = LocalTable(os.environ['TABLE_NAME'])
+    run_fanout.main(SEASON, [week], None, batch_size=10, concurrency=2)
+    live = leader_items(handler.table)
+    requests_served = fake.stats()['requests']
+    fake.stop()
+
+    # Replay with a cold container and no network: new sockets are refused,
+    # and so are requests over keep-alive connections pooled by the live run
+    handler._reference_cache.clear()
+    handler.table = LocalTable(os.environ['TABLE_NAME'])
+    connect, send = socket.socket.connect, requests.adapters.HTTPAdapter.send
+    attempts = []
+
+    def refuse(target):
+        attempts.append(target)
+        raise NetworkDisabled(f"network disabled during replay: {target}")
+
+    socket.socket.connect = lambda sock, address: refuse(address)
+    requests.adapters.HTTPAdapter.send = lambda adapter, request, **kwargs: refuse(request.url)
+    try:
+        run_fanout.main(SEASON, [week], None, batch_size=10, concurrency=2, from_archive=archive_dir)
+    finally:
+        socket.socket.connect, requests.adapters.HTTPAdapter.send = connect, send
+    replayed = leader_items(handler.table)
+    workdir.cleanup()
+
+    failures = []
+    if attempts:
+        failures.append(f"replay attempted {len(attempts)} network connections, e.g. to {attempts[0]}")
+    if not live:
+        failures.append('the live run stored no leader items')
+    if replayed != live:
+        missing = sorted(set(live) - set(replayed))
+        changed = sorted(key for key in set(live) & set(replayed) if live[key] != replayed[key])
+        failures.append(f"replay differs: {len(missing)} items missing {missing[:3]}, "
+                        f"{len(changed)} changed {changed[:3]}")
+
+    print(f"Live run: {requests_served} ESPN requests, {len(live)} leader items; "
+          f"replay: {len(replayed)} leader items")
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    if not failures:
+        print("PASS: week replayed from the archive with the network disabled")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Replay an archived week with the network disabled')
+    parser.add_argument('--week', type=int, default=5, help='Week to archive and replay')
+    parser.add_argument('--athletes', type=int, default=200, help='Active players in the fake league')
+
+    args = parser.parse_args()
+    sys.exit(main(args.week, args.athletes))
@@ -18,6 +18,12 @@ locals {
     Project     = var.project_name
     Environment = var.environment
   }
+
+  # Known up front so ingest can reschedule the rule that invokes it
+  ingest_rule_name = "${var.project_name}-weekly-trigger"
+
+  # SQLite read replica built by ingest and hydrated by the API Lambda
+  snapshot_location = "s3://${module.data_bucket.bucket_name}/snapshots/leaders.sqlite"
 }
 
 # DynamoDB Table for storing NFL leaders
@@ -30,6 +36,27 @@ module "dynamodb" {
   tags = local.common_tags
 }
 
+# S3 bucket for pipeline data (season archives, SQLite snapshots)
+module "data_bucket" {
+  source = "./modules/s3_data"
+
+  bucket_name = "${var.project_name}-data"
+
+  tags = local.common_tags
+}
+
+# SQS work queue for fan-out ingest (planner enqueues, workers consume)
+module "work_queue" {
+  source = "./modules/sqs_work_queue"
+
+  queue_name                 = "${var.project_name}-ingest-work"
+  worker_lambda_name         = module.ingest_lambda.function_name
+  maximum_concurrency        = var.ingest_worker_concurrency
+  visibility_timeout_seconds = var.ingest_lambda_timeout * 6
+
+  tags = local.common_tags
+}
+
 # Ingest Lambda - Fetches data from ESPN API and stores in DynamoDB
 module "ingest_lambda" {
   source = "./modules/lambda"
@@ -44,18 +71,36 @@ module "ingest_lambda" {
   zip_file       = "${path.root}/../lambda/ingest/ingest.zip"
   create_package = false
 
+  # pyarrow for the season archive comes from a layer (e.g. AWS SDK for pandas)
+  layers = var.ingest_lambda_layers
+
   environment_variables = {
-    TABLE_NAME        = module.dynamodb.table_name
-    CURRENT_SEASON    = var.current_season
-    ESPN_API_BASE_URL = var.espn_api_base_url
-    LOG_LEVEL         = "INFO"
+    TABLE_NAME              = module.dynamodb.table_name
+    CURRENT_SEASON          = var.current_season
+    ESPN_API_BASE_URL       = var.espn_api_base_url
+    ARCHIVE_DESTINATION     = "s3://${module.data_bucket.bucket_name}/archive"
+    RAW_ARCHIVE_DESTINATION = "s3://${module.data_bucket.bucket_name}/raw"
+    SNAPSHOT_LOCATION       = local.snapshot_location
+    ESPN_SITE_API_BASE_URL  = var.espn_site_api_base_url
+    SCHEDULE_RULE_NAME      = var.enable_adaptive_schedule ? local.ingest_rule_name : ""
+    WORK_QUEUE_URL          = module.work_queue.queue_url
+    METRICS_ENABLED         = "true"
+    LOG_LEVEL               = "INFO"
   }
 
-  # Attach DynamoDB read and write permissions
-  attach_policy_arns = [
-    module.dynamodb.lambda_write_policy_arn,
-    module.dynamodb.lambda_read_policy_arn
-  ]
+  # Attach DynamoDB read and write permissions, archive/snapshot writes,
+  # work queue send/consume and (with adaptive scheduling) permission to
+  # reschedule itself
+  attach_policy_arns = concat(
+    [
+      module.dynamodb.lambda_write_policy_arn,
+      module.dynamodb.lambda_read_policy_arn,
+      module.data_bucket.lambda_write_policy_arn,
+      module.work_queue.send_policy_arn,
+      module.work_queue.consume_policy_arn
+    ],
+    var.enable_adaptive_schedule ? [module.eventbridge.reschedule_policy_arn] : []
+  )
 
   log_retention_days = 7
 
@@ -77,14 +122,18 @@ module "api_lambda" {
   create_package = false
 
   environment_variables = {
-    TABLE_NAME     = module.dynamodb.table_name
-    CURRENT_SEASON = var.current_season
-    LOG_LEVEL      = "INFO"
+    TABLE_NAME            = module.dynamodb.table_name
+    CURRENT_SEASON        = var.current_season
+    SNAPSHOT_LOCATION     = local.snapshot_location
+    WARMUP_ON_INIT        = tostring(var.api_warmup_on_init)
+    INTERNAL_ROUTES_TOKEN = var.api_internal_routes_token
+    LOG_LEVEL             = "INFO"
   }
 
-  # Attach DynamoDB read permissions
+  # Attach DynamoDB read permissions, plus snapshot reads
   attach_policy_arns = [
-    module.dynamodb.lambda_read_policy_arn
+    module.dynamodb.lambda_read_policy_arn,
+    module.data_bucket.lambda_read_policy_arn
   ]
 
   # NO Function URL - using API Gateway instead
@@ -112,11 +161,13 @@ module "api_gateway" {
 module "eventbridge" {
   source = "./modules/eventbridge"
 
-  rule_name           = "${var.project_name}-weekly-trigger"
-  description         = "Triggers NFL data ingest every Tuesday after Monday Night Football"
+  rule_name           = local.ingest_rule_name
+  description         = "Triggers NFL data ingest (rescheduled around game windows when adaptive)"
   schedule_expression = var.schedule_expression
   enabled             = var.enable_eventbridge
 
+  create_reschedule_policy = var.enable_adaptive_schedule
+
   target_lambda_arn  = module.ingest_lambda.function_arn
   target_lambda_name = module.ingest_lambda.function_name
 
@@ -74,7 +74,8 @@ resource "aws_iam_policy" "lambda_dynamodb_write" {
         Action = [
           "dynamodb:PutItem",
           "dynamodb:UpdateItem",
-          "dynamodb:DeleteItem"
+          "dynamodb:DeleteItem",
+          "dynamodb:BatchWriteItem"
         ]
         Resource = aws_dynamodb_table.nfl_leaders.arn
       }
@@ -5,6 +5,12 @@ resource "aws_cloudwatch_event_rule" "schedule" {
   state               = var.enabled ? "ENABLED" : "DISABLED"  # FIXED: Changed from is_enabled to state
 
   tags = var.tags
+
+  # With adaptive scheduling the target Lambda rewrites the expression at
+  # runtime; schedule_expression is only the initial schedule
+  lifecycle {
+    ignore_changes = [schedule_expression]
+  }
 }
 
 resource "aws_cloudwatch_event_target" "lambda" {
@@ -19,4 +25,24 @@ resource "aws_lambda_permission" "allow_eventbridge" {
   function_name = var.target_lambda_name
   principal     = "events.amazonaws.com"
   source_arn    = aws_cloudwatch_event_rule.schedule.arn
-}
\ No newline at end of file
+}
+
+# Lets the target Lambda rewrite this rule's schedule (adaptive scheduling)
+resource "aws_iam_policy" "reschedule" {
+  count       = var.create_reschedule_policy ? 1 : 0
+  name        = "${var.rule_name}-reschedule-policy"
+  description = "Allow Lambda to update the schedule of ${var.rule_name}"
+
+  policy = jsonencode({
+    Version = "2012-10-17"
+    Statement = [
+      {
+        Effect   = "Allow"
+        Action   = ["events:DescribeRule", "events:PutRule"]
+        Resource = aws_cloudwatch_event_rule.schedule.arn
+      }
+    ]
+  })
+
+  tags = var.tags
+}
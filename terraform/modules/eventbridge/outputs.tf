@@ -11,4 +11,9 @@ output "rule_arn" {
 output "rule_id" {
   description = "ID of the EventBridge rule"
   value       = aws_cloudwatch_event_rule.schedule.id
-}
\ No newline at end of file
+}
+
+output "reschedule_policy_arn" {
+  description = "ARN of the IAM policy allowing schedule updates (if created)"
+  value       = var.create_reschedule_policy ? aws_iam_policy.reschedule[0].arn : null
+}
@@ -30,6 +30,12 @@ variable "target_lambda_name" {
   type        = string
 }
 
+variable "create_reschedule_policy" {
+  description = "Create an IAM policy that lets the target rewrite the schedule"
+  type        = bool
+  default     = false
+}
+
 variable "tags" {
   description = "Tags to apply to resources"
   type        = map(string)
@@ -18,6 +18,7 @@ resource "aws_lambda_function" "function" {
   timeout         = var.timeout
   memory_size     = var.memory_size
   description     = var.description
+  layers          = var.layers
 
   environment {
     variables = var.environment_variables
@@ -48,6 +48,12 @@ variable "description" {
   default     = ""
 }
 
+variable "layers" {
+  description = "List of Lambda layer ARNs to attach"
+  type        = list(string)
+  default     = []
+}
+
 variable "environment_variables" {
   description = "Environment variables for the Lambda function"
   type        = map(string)
@@ -0,0 +1,78 @@
+# Private S3 bucket for pipeline data (columnar archives, snapshots, etc.)
+resource "aws_s3_bucket" "data" {
+  bucket = var.bucket_name
+
+  tags = var.tags
+}
+
+# Enable encryption at rest
+resource "aws_s3_bucket_server_side_encryption_configuration" "data" {
+  bucket = aws_s3_bucket.data.id
+
+  rule {
+    apply_server_side_encryption_by_default {
+      sse_algorithm = "AES256"
+    }
+  }
+}
+
+# Block public access
+resource "aws_s3_bucket_public_access_block" "data" {
+  bucket = aws_s3_bucket.data.id
+
+  block_public_acls       = true
+  block_public_policy     = true
+  ignore_public_acls      = true
+  restrict_public_buckets = true
+}
+
+# IAM policy for Lambda functions to write pipeline data
+resource "aws_iam_policy" "lambda_s3_write" {
+  name        = "${var.bucket_name}-lambda-write-policy"
+  description = "Allow Lambda to write to ${var.bucket_name}"
+
+  policy = jsonencode({
+    Version = "2012-10-17"
+    Statement = [
+      {
+        Effect = "Allow"
+        Action = [
+          "s3:PutObject",
+          "s3:GetObject"
+        ]
+        Resource = "${aws_s3_bucket.data.arn}/*"
+      },
+      {
+        Effect   = "Allow"
+        Action   = ["s3:ListBucket"]
+        Resource = aws_s3_bucket.data.arn
+      }
+    ]
+  })
+
+  tags = var.tags
+}
+
+# IAM policy for Lambda functions to read pipeline data
+resource "aws_iam_policy" "lambda_s3_read" {
+  name        = "${var.bucket_name}-lambda-read-policy"
+  description = "Allow Lambda to read from ${var.bucket_name}"
+
+  policy = jsonencode({
+    Version = "2012-10-17"
+    Statement = [
+      {
+        Effect   = "Allow"
+        Action   = ["s3:GetObject"]
+        Resource = "${aws_s3_bucket.data.arn}/*"
+      },
+      {
+        Effect   = "Allow"
+        Action   = ["s3:ListBucket"]
+        Resource = aws_s3_bucket.data.arn
+      }
+    ]
+  })
+
+  tags = var.tags
+}
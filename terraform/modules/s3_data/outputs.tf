@@ -0,0 +1,19 @@
+output "bucket_name" {
+  description = "Name of the S3 bucket"
+  value       = aws_s3_bucket.data.id
+}
+
+output "bucket_arn" {
+  description = "ARN of the S3 bucket"
+  value       = aws_s3_bucket.data.arn
+}
+
+output "lambda_write_policy_arn" {
+  description = "ARN of the IAM policy for Lambda write access"
+  value       = aws_iam_policy.lambda_s3_write.arn
+}
+
+output "lambda_read_policy_arn" {
+  description = "ARN of the IAM policy for Lambda read access"
+  value       = aws_iam_policy.lambda_s3_read.arn
+}
@@ -0,0 +1,10 @@
+variable "bucket_name" {
+  description = "Name of the S3 bucket for pipeline data"
+  type        = string
+}
+
+variable "tags" {
+  description = "Tags to apply to resources"
+  type        = map(string)
+  default     = {}
+}
@@ -0,0 +1,79 @@
+# Dead-letter queue for work items that keep failing
+resource "aws_sqs_queue" "dead_letter" {
+  name                      = "${var.queue_name}-dlq"
+  message_retention_seconds = 1209600 # 14 days
+
+  tags = var.tags
+}
+
+# Fan-out queue of (season, week, stat) ingest work items
+resource "aws_sqs_queue" "work" {
+  name                       = var.queue_name
+  visibility_timeout_seconds = var.visibility_timeout_seconds
+  message_retention_seconds  = var.message_retention_seconds
+
+  redrive_policy = jsonencode({
+    deadLetterTargetArn = aws_sqs_queue.dead_letter.arn
+    maxReceiveCount     = var.max_receive_count
+  })
+
+  tags = var.tags
+}
+
+# Deliver batches to the worker Lambda, retrying only the failed messages
+resource "aws_lambda_event_source_mapping" "worker" {
+  event_source_arn        = aws_sqs_queue.work.arn
+  function_name           = var.worker_lambda_name
+  batch_size              = var.batch_size
+  function_response_types = ["ReportBatchItemFailures"]
+
+  scaling_config {
+    maximum_concurrency = var.maximum_concurrency
+  }
+}
+
+# IAM policy for the planner to enqueue work items
+resource "aws_iam_policy" "send" {
+  name        = "${var.queue_name}-send-policy"
+  description = "Allow Lambda to enqueue work on ${var.queue_name}"
+
+  policy = jsonencode({
+    Version = "2012-10-17"
+    Statement = [
+      {
+        Effect = "Allow"
+        Action = [
+          "sqs:SendMessage",
+          "sqs:GetQueueAttributes"
+        ]
+        Resource = aws_sqs_queue.work.arn
+      }
+    ]
+  })
+
+  tags = var.tags
+}
+
+# IAM policy for the event source mapping to consume work items
+resource "aws_iam_policy" "consume" {
+  name        = "${var.queue_name}-consume-policy"
+  description = "Allow Lambda to consume work from ${var.queue_name}"
+
+  policy = jsonencode({
+    Version = "2012-10-17"
+    Statement = [
+      {
+        Effect = "Allow"
+        Action = [
+          "sqs:ReceiveMessage",
+          "sqs:DeleteMessage",
+          "sqs:ChangeMessageVisibility",
+          "sqs:GetQueueAttributes"
+        ]
+        Resource = aws_sqs_queue.work.arn
+      }
+    ]
+  })
+
+  tags = var.tags
+}
@@ -0,0 +1,24 @@
+output "queue_url" {
+  description = "URL of the work queue"
+  value       = aws_sqs_queue.work.url
+}
+
+output "queue_arn" {
+  description = "ARN of the work queue"
+  value       = aws_sqs_queue.work.arn
+}
+
+output "dead_letter_queue_url" {
+  description = "URL of the dead-letter queue"
+  value       = aws_sqs_queue.dead_letter.url
+}
+
+output "send_policy_arn" {
+  description = "ARN of the IAM policy for enqueueing work"
+  value       = aws_iam_policy.send.arn
+}
+
+output "consume_policy_arn" {
+  description = "ARN of the IAM policy for consuming work"
+  value       = aws_iam_policy.consume.arn
+}
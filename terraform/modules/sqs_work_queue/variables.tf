@@ -0,0 +1,55 @@
+variable "queue_name" {
+  description = "Name of the SQS work queue"
+  type        = string
+}
+
+variable "worker_lambda_name" {
+  description = "Name of the Lambda function that processes work batches"
+  type        = string
+}
+
+variable "batch_size" {
+  description = "Maximum messages delivered per worker invocation"
+  type        = number
+  default     = 10
+
+  validation {
+    condition     = var.batch_size >= 1 && var.batch_size <= 10
+    error_message = "Batch size must be between 1 and 10 (no batching window is configured)."
+  }
+}
+
+variable "maximum_concurrency" {
+  description = "Maximum concurrent worker invocations"
+  type        = number
+  default     = 10
+
+  validation {
+    condition     = var.maximum_concurrency >= 2 && var.maximum_concurrency <= 1000
+    error_message = "Maximum concurrency must be between 2 and 1000."
+  }
+}
+
+variable "visibility_timeout_seconds" {
+  description = "Visibility timeout (at least the worker Lambda timeout)"
+  type        = number
+  default     = 720
+}
+
+variable "message_retention_seconds" {
+  description = "How long unprocessed work items are kept"
+  type        = number
+  default     = 345600 # 4 days
+}
+
+variable "max_receive_count" {
+  description = "Delivery attempts before a work item moves to the dead-letter queue"
+  type        = number
+  default     = 3
+}
+
+variable "tags" {
+  description = "Tags to apply to resources"
+  type        = map(string)
+  default     = {}
+}
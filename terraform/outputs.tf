@@ -9,6 +9,23 @@ output "dynamodb_table_arn" {
   value       = module.dynamodb.table_arn
 }
 
+# Data bucket outputs
+output "data_bucket_name" {
+  description = "S3 bucket for pipeline data (season archives, SQLite snapshots)"
+  value       = module.data_bucket.bucket_name
+}
+
+# Work queue outputs
+output "work_queue_url" {
+  description = "SQS queue of fan-out ingest work items"
+  value       = module.work_queue.queue_url
+}
+
+output "work_dead_letter_queue_url" {
+  description = "SQS dead-letter queue for work items that kept failing"
+  value       = module.work_queue.dead_letter_queue_url
+}
+
 # Ingest Lambda outputs
 output "ingest_lambda_name" {
   description = "Name of the ingest Lambda function"
@@ -34,6 +34,12 @@ variable "espn_api_base_url" {
   default     = "https://sports.core.api.espn.com/v2/sports/football/leagues/nfl"
 }
 
+variable "espn_site_api_base_url" {
+  description = "ESPN site API base URL (season calendar / scoreboard, hedged leaders statistics)"
+  type        = string
+  default     = "https://site.api.espn.com/apis/site/v2/sports/football/nfl"
+}
+
 variable "ingest_lambda_timeout" {
   description = "Timeout for ingest Lambda function (seconds)"
   type        = number
@@ -46,6 +52,18 @@ variable "ingest_lambda_memory" {
   default     = 512
 }
 
+variable "ingest_worker_concurrency" {
+  description = "Maximum concurrent ingest workers consuming the fan-out queue"
+  type        = number
+  default     = 10
+}
+
+variable "ingest_lambda_layers" {
+  description = "Layer ARNs for the ingest Lambda (must provide pyarrow for season archives)"
+  type        = list(string)
+  default     = []
+}
+
 variable "api_lambda_timeout" {
   description = "Timeout for API Lambda function (seconds)"
   type        = number
@@ -58,12 +76,31 @@ variable "api_lambda_memory" {
   default     = 256
 }
 
+variable "api_internal_routes_token" {
+  description = "Bearer token for the API's /metrics and /debug/stats routes (empty disables them)"
+  type        = string
+  default     = ""
+  sensitive   = true
+}
+
+variable "api_warmup_on_init" {
+  description = "Prefetch /current and /season/summary during API Lambda init (bounded by WARMUP_BUDGET_SECONDS)"
+  type        = bool
+  default     = true
+}
+
 variable "schedule_expression" {
-  description = "EventBridge schedule for Lambda (cron or rate)"
+  description = "Initial EventBridge schedule for Lambda (cron or rate); later changes are ignored by the rule, which ingest rewrites at runtime"
   type        = string
   default     = "cron(0 14 ? * TUE *)" # Every Tuesday at 2 PM UTC (9 AM EST)
 }
 
+variable "enable_adaptive_schedule" {
+  description = "Let ingest reschedule itself around game windows (schedule_expression is only the initial/fallback schedule)"
+  type        = bool
+  default     = true
+}
+
 variable "enable_eventbridge" {
   description = "Enable EventBridge scheduled trigger"
   type        = bool